@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Union, Callable, List, Tuple
 import hashlib
 import platform
+import secrets
 
 from zipfile import ZipFile, BadZipFile
 
@@ -27,6 +28,10 @@ from .tools import (
     get_openpype_path_from_settings,
     get_expected_studio_version_str
 )
+from .version_validation import (
+    VersionValidator,
+    get_validator
+)
 
 
 LOG_INFO = 0
@@ -852,50 +857,39 @@ class BootstrapRepos:
             return self._validate_zip(path)
         return self._validate_dir(path)
 
-    @staticmethod
-    def _validate_zip(path: Path) -> tuple:
-        """Validate content of zip file."""
-        with ZipFile(path, "r") as zip_file:
-            # read checksums
-            try:
-                checksums_data = str(zip_file.read("checksums"))
-            except IOError:
-                # FIXME: This should be set to False sometimes in the future
-                return True, "Cannot read checksums for archive."
-
-            # split it to the list of tuples
-            checksums = [
-                tuple(line.split(":"))
-                for line in checksums_data.split("\n") if line
-            ]
+    def _get_validation_key(self) -> Union[bytes, None]:
+        """Key used to sign manifest of validated versions.
 
-            # get list of files in zip minus `checksums` file itself
-            # and turn in to set to compare against list of files
-            # from checksum file. If difference exists, something is
-            # wrong
-            files_in_zip = set(zip_file.namelist())
-            files_in_zip.remove("checksums")
-            files_in_checksum = {file[1] for file in checksums}
-            diff = files_in_zip.difference(files_in_checksum)
-            if diff:
-                return False, f"Missing files {diff}"
-
-            # calculate and compare checksums in the zip file
-            for file_checksum, file_name in checksums:
-                if platform.system().lower() == "windows":
-                    file_name = file_name.replace("/", "\\")
-                h = hashlib.sha256()
-                try:
-                    h.update(zip_file.read(file_name))
-                except FileNotFoundError:
-                    return False, f"Missing file [ {file_name} ]"
-                if h.hexdigest() != file_checksum:
-                    return False, f"Invalid checksum on {file_name}"
+        Key is stored in keyring and is created if does not exist yet.
 
-        return True, "All ok"
+        Returns:
+            bytes: Key or None if keyring is not available.
 
-    @staticmethod
-    def _validate_dir(path: Path) -> tuple:
+        """
+        try:
+            registry = OpenPypeSecureRegistry("version_validation")
+            key = registry.get_item("key", None)
+            if not key:
+                key = secrets.token_hex(32)
+                registry.set_item("key", key)
+        except Exception:  # noqa
+            self._log.debug(
+                "Keyring is not available, validated versions won't be"
+                " cached.", exc_info=True)
+            return None
+        return key.encode("utf-8")
+
+    def _get_validator(self) -> VersionValidator:
+        return get_validator(
+            self.data_dir / "validated_versions.json",
+            self._get_validation_key()
+        )
+
+    def _validate_zip(self, path: Path) -> tuple:
+        """Validate content of zip file."""
+        return self._get_validator().validate_zip(path)
+
+    def _validate_dir(self, path: Path) -> tuple:
         """Validate checksums in a given path.
 
         Args:
@@ -906,42 +900,7 @@ class BootstrapRepos:
                 and str in a tuple.
 
         """
-        checksums_file = Path(path / "checksums")
-        if not checksums_file.exists():
-            # FIXME: This should be set to False sometimes in the future
-            return True, "Cannot read checksums for archive."
-        checksums_data = checksums_file.read_text()
-        checksums = [
-            tuple(line.split(":"))
-            for line in checksums_data.split("\n") if line
-        ]
-
-        # compare file list against list of files from checksum file.
-        # If difference exists, something is wrong and we invalidate directly
-        files_in_dir = set(
-            file.relative_to(path).as_posix()
-            for file in path.iterdir() if file.is_file()
-        )
-        files_in_dir.remove("checksums")
-        files_in_checksum = {file[1] for file in checksums}
-
-        diff = files_in_dir.difference(files_in_checksum)
-        if diff:
-            return False, f"Missing files {diff}"
-
-        # calculate and compare checksums
-        for file_checksum, file_name in checksums:
-            if platform.system().lower() == "windows":
-                file_name = file_name.replace("/", "\\")
-            try:
-                current = sha256sum((path / file_name).as_posix())
-            except FileNotFoundError:
-                return False, f"Missing file [ {file_name} ]"
-
-            if file_checksum != current:
-                return False, f"Invalid checksum on {file_name}"
-
-        return True, "All ok"
+        return self._get_validator().validate_dir(path)
 
     @staticmethod
     def add_paths_from_archive(archive: Path) -> None:
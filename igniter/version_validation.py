@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+"""Validation of OpenPype versions by checksums of their files.
+
+Checksums are calculated in thread pool and files are read by chunks, zip
+members are not loaded to memory at once.
+
+Successfully validated versions are stored to manifest with size and
+modification time of validated files. Manifest is signed with key stored
+in keyring, so unchanged version is trusted without calculation of
+checksums and modified manifest is ignored.
+"""
+import os
+import json
+import time
+import hmac
+import hashlib
+import logging
+import tempfile
+from pathlib import Path
+from typing import Union, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from zipfile import ZipFile
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def hash_stream(stream) -> str:
+    """Calculate sha256 of stream content.
+
+    Args:
+        stream (io.RawIOBase): Opened binary stream.
+
+    Returns:
+        str: hex encoded sha256
+
+    """
+    h = hashlib.sha256()
+    for chunk in iter(lambda: stream.read(CHUNK_SIZE), b""):
+        h.update(chunk)
+    return h.hexdigest()
+
+
+def parse_checksums(checksums_data: str) -> List[Tuple[str, str]]:
+    """Parse content of `checksums` file.
+
+    Args:
+        checksums_data (str): Lines with checksum and relative path
+            separated by colon.
+
+    Returns:
+        list: Tuples with checksum and relative path.
+
+    """
+    output = []
+    for line in checksums_data.splitlines():
+        if line:
+            checksum, file_name = line.split(":", 1)
+            output.append((checksum, file_name))
+    return output
+
+
+class ValidationManifest:
+    """Signed manifest of validated OpenPype versions.
+
+    Version is stored with size and modification time of each validated
+    file. Version is trusted only if all stored values match and signature
+    of stored data is valid.
+
+    Args:
+        path (Path): Path to json file with manifest.
+        key (bytes): Secret key used for signing.
+
+    """
+
+    def __init__(self, path: Path, key: bytes):
+        self._path = path
+        self._key = key
+
+    def _sign(self, version_path: str, files: dict) -> str:
+        data = json.dumps([version_path, files], sort_keys=True)
+        return hmac.new(
+            self._key, data.encode("utf-8"), hashlib.sha256
+        ).hexdigest()
+
+    def _load(self) -> dict:
+        try:
+            with open(self._path, "r") as stream:
+                return json.load(stream)
+        except (IOError, ValueError):
+            return {}
+
+    def is_validated(self, version_path: str, files: dict) -> bool:
+        """Version with passed files was already validated.
+
+        Args:
+            version_path (str): Path to version directory or zip.
+            files (dict): Size and modification time by relative path.
+
+        Returns:
+            bool: Version can be trusted.
+
+        """
+        item = self._load().get(version_path)
+        if not item or item.get("files") != files:
+            return False
+        return hmac.compare_digest(
+            item.get("signature", ""), self._sign(version_path, files)
+        )
+
+    def store(self, version_path: str, files: dict) -> None:
+        """Store validated version.
+
+        Args:
+            version_path (str): Path to version directory or zip.
+            files (dict): Size and modification time by relative path.
+
+        """
+        data = {
+            path: item
+            for path, item in self._load().items()
+            if os.path.exists(path)
+        }
+        data[version_path] = {
+            "files": files,
+            "signature": self._sign(version_path, files)
+        }
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        # write to temp file first so other processes don't read
+        # incomplete manifest
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self._path.parent.as_posix(), suffix=".json")
+        with os.fdopen(fd, "w") as stream:
+            json.dump(data, stream)
+        os.replace(tmp_path, self._path.as_posix())
+
+
+class VersionValidator:
+    """Validate checksums of OpenPype version directory or zip file.
+
+    Args:
+        manifest (ValidationManifest, optional): Manifest of validated
+            versions. Checksums are always calculated if not passed.
+        max_workers (int, optional): Number of threads calculating
+            checksums.
+
+    """
+
+    def __init__(self, manifest: ValidationManifest = None,
+                 max_workers: int = None):
+        self._log = logging.getLogger(str(__class__))
+        self._manifest = manifest
+        self._max_workers = max_workers
+
+    @staticmethod
+    def _get_files_info(paths: List[Path]) -> dict:
+        output = {}
+        for path in paths:
+            stat = path.stat()
+            output[path.as_posix()] = [stat.st_size, stat.st_mtime_ns]
+        return output
+
+    def _is_validated(self, version_path: Path, files: dict) -> bool:
+        if self._manifest is None:
+            return False
+        try:
+            return self._manifest.is_validated(version_path.as_posix(), files)
+        except Exception:  # noqa
+            self._log.debug(
+                "Failed to read validation manifest.", exc_info=True)
+        return False
+
+    def _store_validated(self, version_path: Path, files: dict) -> None:
+        if self._manifest is None:
+            return
+        try:
+            self._manifest.store(version_path.as_posix(), files)
+        except Exception:  # noqa
+            self._log.debug(
+                "Failed to store validation manifest.", exc_info=True)
+
+    def _compare_checksums(self, checksums: list, hash_func) -> tuple:
+        """Calculate checksums in thread pool and compare them.
+
+        Args:
+            checksums (list): Tuples with expected checksum and file name.
+            hash_func (callable): Function calculating checksum of file
+                by its name.
+
+        Returns:
+            tuple(bool, str): returns status and reason as a bool
+                and str in a tuple.
+
+        """
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = [
+                (file_checksum, file_name,
+                 executor.submit(hash_func, file_name))
+                for file_checksum, file_name in checksums
+            ]
+            result = True, "All ok"
+            for file_checksum, file_name, future in futures:
+                try:
+                    current = future.result()
+                except (FileNotFoundError, KeyError):
+                    result = False, f"Missing file [ {file_name} ]"
+                else:
+                    if current == file_checksum:
+                        continue
+                    result = False, f"Invalid checksum on {file_name}"
+
+                # don't wait for files which were not processed yet
+                for _, _, other_future in futures:
+                    other_future.cancel()
+                break
+        return result
+
+    def validate_zip(self, path: Path) -> tuple:
+        """Validate content of zip file.
+
+        Args:
+            path (Path): Path to zip file.
+
+        Returns:
+            tuple(bool, str): returns status and reason as a bool
+                and str in a tuple.
+
+        """
+        start = time.time()
+        files = self._get_files_info([path])
+        if self._is_validated(path, files):
+            return True, "Already validated ({:.2f}s)".format(
+                time.time() - start)
+
+        with ZipFile(path, "r") as zip_file:
+            # read checksums
+            try:
+                checksums_data = zip_file.read("checksums").decode("utf-8")
+            except (IOError, KeyError):
+                # FIXME: This should be set to False sometimes in the future
+                return True, "Cannot read checksums for archive."
+
+            checksums = parse_checksums(checksums_data)
+
+            # get list of files in zip minus `checksums` file itself
+            # and turn in to set to compare against list of files
+            # from checksum file. If difference exists, something is
+            # wrong
+            files_in_zip = {
+                name for name in zip_file.namelist()
+                if not name.endswith("/")
+            }
+            files_in_zip.discard("checksums")
+            files_in_checksum = {file[1] for file in checksums}
+            diff = files_in_zip.difference(files_in_checksum)
+            if diff:
+                return False, f"Missing files {diff}"
+
+            def _hash_member(file_name):
+                with zip_file.open(file_name) as stream:
+                    return hash_stream(stream)
+
+            valid, message = self._compare_checksums(checksums, _hash_member)
+
+        if valid:
+            self._store_validated(path, files)
+        return valid, "{} ({} files in {:.2f}s)".format(
+            message, len(checksums), time.time() - start)
+
+    def validate_dir(self, path: Path) -> tuple:
+        """Validate checksums in a given path.
+
+        Args:
+            path (Path): path to folder to validate.
+
+        Returns:
+            tuple(bool, str): returns status and reason as a bool
+                and str in a tuple.
+
+        """
+        start = time.time()
+        checksums_file = Path(path / "checksums")
+        if not checksums_file.exists():
+            # FIXME: This should be set to False sometimes in the future
+            return True, "Cannot read checksums for archive."
+        checksums = parse_checksums(checksums_file.read_text())
+
+        # compare file list against list of files from checksum file.
+        # If difference exists, something is wrong and we invalidate directly
+        files_in_dir = set(
+            file.relative_to(path).as_posix()
+            for file in path.iterdir() if file.is_file()
+        )
+        files_in_dir.remove("checksums")
+        files_in_checksum = {file[1] for file in checksums}
+
+        diff = files_in_dir.difference(files_in_checksum)
+        if diff:
+            return False, f"Missing files {diff}"
+
+        # stat files before validation, file modified during validation
+        # will be validated next time
+        try:
+            files = self._get_files_info(
+                [checksums_file] + [path / file[1] for file in checksums])
+        except FileNotFoundError:
+            files = None
+        if files is not None and self._is_validated(path, files):
+            return True, "Already validated ({:.2f}s)".format(
+                time.time() - start)
+
+        def _hash_file(file_name):
+            with open(path / file_name, "rb") as stream:
+                return hash_stream(stream)
+
+        valid, message = self._compare_checksums(checksums, _hash_file)
+        if valid and files is not None:
+            self._store_validated(path, files)
+        return valid, "{} ({} files in {:.2f}s)".format(
+            message, len(checksums), time.time() - start)
+
+
+def get_validator(manifest_path: Path,
+                  key: Union[bytes, None]) -> VersionValidator:
+    """Create validator using manifest if key is available.
+
+    Args:
+        manifest_path (Path): Path to manifest json file.
+        key (bytes, optional): Key used to sign manifest.
+
+    Returns:
+        VersionValidator: Validator of OpenPype versions.
+
+    """
+    manifest = None
+    if key:
+        manifest = ValidationManifest(manifest_path, key)
+    return VersionValidator(manifest)
@@ -435,6 +435,45 @@ def unpack_project(zipfile, root, dbonly):
     PypeCommands().unpack_project(zipfile, root, dbonly)
 
 
+@main.group(help="Mongo database maintenance")
+def mongo():
+    pass
+
+
+@mongo.command(name="ensure-indexes")
+@click.option("--project", "project_names", multiple=True,
+              help="Project name (all projects are used if not passed)")
+@click.option("--kind", "kinds", multiple=True,
+              help=(
+                  "Collection kind (project, settings, logs, ftrack_events,"
+                  " webpublishes). All kinds are used if not passed."
+              ))
+def ensure_indexes(project_names, kinds):
+    """Create missing indexes in OpenPype mongo collections."""
+    PypeCommands().ensure_mongo_indexes(project_names, kinds)
+
+
+@mongo.command(name="check-indexes")
+@click.option("--project", "project_names", multiple=True,
+              help="Project name (all projects are used if not passed)")
+@click.option("--kind", "kinds", multiple=True,
+              help=(
+                  "Collection kind (project, settings, logs, ftrack_events,"
+                  " webpublishes). All kinds are used if not passed."
+              ))
+def check_indexes(project_names, kinds):
+    """Report missing indexes and explain of commonly used queries."""
+    PypeCommands().check_mongo_indexes(project_names, kinds)
+
+
+@mongo.command(name="rebuild-last-versions")
+@click.option("--project", "project_names", multiple=True,
+              help="Project name (all projects are used if not passed)")
+def rebuild_last_versions(project_names):
+    """Recalculate last version stored on subset documents."""
+    PypeCommands().rebuild_last_versions(project_names)
+
+
 @main.command()
 def interactive():
     """Interactive (Python like) console.
@@ -2,6 +2,12 @@ from .mongo import (
     OpenPypeMongoConnection,
 )
 
+from .entity_cache import (
+    entity_cache,
+    is_entity_cache_enabled,
+    invalidate_entity_cache,
+)
+
 from .entities import (
     get_projects,
     get_project,
@@ -36,6 +42,7 @@ from .entities import (
     get_representations,
     get_representation_parents,
     get_representations_parents,
+    get_representations_hierarchy,
     get_archived_representations,
 
     get_thumbnail,
@@ -59,6 +66,10 @@ from .operations import (
 __all__ = (
     "OpenPypeMongoConnection",
 
+    "entity_cache",
+    "is_entity_cache_enabled",
+    "invalidate_entity_cache",
+
     "get_projects",
     "get_project",
     "get_whole_project",
@@ -92,6 +103,7 @@ __all__ = (
     "get_representations",
     "get_representation_parents",
     "get_representations_parents",
+    "get_representations_hierarchy",
     "get_archived_representations",
 
     "get_thumbnail",
@@ -7,12 +7,15 @@ that has project name as a context (e.g. on 'ProjectEntity'?).
 """
 
 import re
+import copy
 import collections
 
 import six
 from bson.objectid import ObjectId
+from pymongo.errors import OperationFailure
 
 from .mongo import get_project_database, get_project_connection
+from .entity_cache import get_entity_cache, reduce_document_fields
 
 PatternType = type(re.compile(""))
 
@@ -68,6 +71,105 @@ def convert_ids(in_ids):
     return list(_output)
 
 
+def _find_one(
+    project_name,
+    query_filter,
+    fields,
+    entity_types,
+    entity_id=None,
+    natural_keys=None
+):
+    """Query single document with usage of entity cache if is enabled.
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        query_filter (dict[str, Any]): Mongo query filter.
+        fields (Optional[Iterable[str]]): Fields that should be returned.
+        entity_types (Iterable[str]): Types of entities matching the filter.
+        entity_id (Optional[ObjectId]): Id of queried entity.
+        natural_keys (Optional[Iterable[tuple]]): Natural keys of queried
+            entity.
+
+    Returns:
+        Union[Dict, None]: Found document.
+    """
+
+    cache = get_entity_cache(project_name)
+    conn = get_project_connection(project_name)
+    if cache is None:
+        return conn.find_one(query_filter, _prepare_fields(fields))
+
+    if fields is not None:
+        fields = set(fields)
+
+    doc = cache.get(entity_types, fields, entity_id, natural_keys)
+    if doc is not None:
+        return doc
+
+    query_fields = cache.get_query_fields(fields, entity_id, natural_keys)
+    doc = conn.find_one(query_filter, _prepare_fields(query_fields))
+    if doc is None:
+        return None
+    cache.store(doc, query_fields)
+    return reduce_document_fields(doc, fields)
+
+
+def _find(project_name, query_filter, fields, entity_types, entity_ids=None):
+    """Query documents with usage of entity cache if is enabled.
+
+    Cache is used to skip query of cached documents only if 'entity_ids' are
+    passed and are the only filter in 'query_filter' (next to type filter).
+    Otherwise all documents are queried and stored to the cache.
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        query_filter (dict[str, Any]): Mongo query filter.
+        fields (Optional[Iterable[str]]): Fields that should be returned.
+        entity_types (Iterable[str]): Types of entities matching the filter.
+        entity_ids (Optional[List[ObjectId]]): Ids of queried entities.
+
+    Returns:
+        Union[Cursor, List[Dict]]: Cursor if cache is disabled, otherwise list
+            of documents.
+    """
+
+    cache = get_entity_cache(project_name)
+    conn = get_project_connection(project_name)
+    if cache is None:
+        return conn.find(query_filter, _prepare_fields(fields))
+
+    if fields is not None:
+        fields = set(fields)
+
+    output = []
+    query_fields = cache.get_query_fields(fields)
+    if entity_ids is not None:
+        missing_ids = []
+        for entity_id in entity_ids:
+            doc = cache.get(entity_types, fields, entity_id)
+            if doc is None:
+                missing_ids.append(entity_id)
+                continue
+            output.append(doc)
+
+        if not missing_ids:
+            return output
+
+        query_filter = copy.deepcopy(query_filter)
+        query_filter["_id"] = {"$in": missing_ids}
+        for entity_id in missing_ids:
+            entity_fields = cache.get_query_fields(fields, entity_id)
+            if entity_fields is None:
+                query_fields = None
+            elif query_fields is not None:
+                query_fields |= entity_fields
+
+    for doc in conn.find(query_filter, _prepare_fields(query_fields)):
+        cache.store(doc, query_fields)
+        output.append(reduce_document_fields(doc, fields))
+    return output
+
+
 def get_projects(active=True, inactive=False, fields=None):
     """Yield all project entity documents.
 
@@ -131,8 +233,16 @@ def get_project(project_name, active=True, inactive=True, fields=None):
             {"data.active": False},
         ]
 
-    conn = get_project_connection(project_name)
-    return conn.find_one(query_filter, _prepare_fields(fields))
+    natural_keys = None
+    if active and inactive:
+        natural_keys = [("project", )]
+    return _find_one(
+        project_name,
+        query_filter,
+        fields,
+        ("project", ),
+        natural_keys=natural_keys
+    )
 
 
 def get_whole_project(project_name):
@@ -170,8 +280,9 @@ def get_asset_by_id(project_name, asset_id, fields=None):
         return None
 
     query_filter = {"type": "asset", "_id": asset_id}
-    conn = get_project_connection(project_name)
-    return conn.find_one(query_filter, _prepare_fields(fields))
+    return _find_one(
+        project_name, query_filter, fields, ("asset", ), entity_id=asset_id
+    )
 
 
 def get_asset_by_name(project_name, asset_name, fields=None):
@@ -193,8 +304,13 @@ def get_asset_by_name(project_name, asset_name, fields=None):
         return None
 
     query_filter = {"type": "asset", "name": asset_name}
-    conn = get_project_connection(project_name)
-    return conn.find_one(query_filter, _prepare_fields(fields))
+    return _find_one(
+        project_name,
+        query_filter,
+        fields,
+        ("asset", ),
+        natural_keys=[("asset", None, asset_name)]
+    )
 
 
 # NOTE this could be just public function?
@@ -263,9 +379,14 @@ def _get_assets(
             return []
         query_filter["data.visualParent"] = {"$in": parent_ids}
 
-    conn = get_project_connection(project_name)
+    # Cached documents can be used only if ids are the only filter
+    cached_ids = None
+    if asset_names is None and parent_ids is None:
+        cached_ids = asset_ids
 
-    return conn.find(query_filter, _prepare_fields(fields))
+    return _find(
+        project_name, query_filter, fields, asset_types, cached_ids
+    )
 
 
 def get_assets(
@@ -404,8 +525,9 @@ def get_subset_by_id(project_name, subset_id, fields=None):
         return None
 
     query_filters = {"type": "subset", "_id": subset_id}
-    conn = get_project_connection(project_name)
-    return conn.find_one(query_filters, _prepare_fields(fields))
+    return _find_one(
+        project_name, query_filters, fields, ("subset", ), entity_id=subset_id
+    )
 
 
 def get_subset_by_name(project_name, subset_name, asset_id, fields=None):
@@ -435,8 +557,13 @@ def get_subset_by_name(project_name, subset_name, asset_id, fields=None):
         "name": subset_name,
         "parent": asset_id
     }
-    conn = get_project_connection(project_name)
-    return conn.find_one(query_filters, _prepare_fields(fields))
+    return _find_one(
+        project_name,
+        query_filters,
+        fields,
+        ("subset", ),
+        natural_keys=[("subset", asset_id, subset_name)]
+    )
 
 
 def get_subsets(
@@ -508,8 +635,18 @@ def get_subsets(
             return []
         query_filter["$or"] = or_query
 
-    conn = get_project_connection(project_name)
-    return conn.find(query_filter, _prepare_fields(fields))
+    # Cached documents can be used only if ids are the only filter
+    cached_ids = None
+    if (
+        asset_ids is None
+        and subset_names is None
+        and names_by_asset_ids is None
+    ):
+        cached_ids = subset_ids
+
+    return _find(
+        project_name, query_filter, fields, subset_types, cached_ids
+    )
 
 
 def get_subset_families(project_name, subset_ids=None):
@@ -567,12 +704,18 @@ def get_version_by_id(project_name, version_id, fields=None):
     if not version_id:
         return None
 
+    version_types = ["version", "hero_version"]
     query_filter = {
-        "type": {"$in": ["version", "hero_version"]},
+        "type": {"$in": version_types},
         "_id": version_id
     }
-    conn = get_project_connection(project_name)
-    return conn.find_one(query_filter, _prepare_fields(fields))
+    return _find_one(
+        project_name,
+        query_filter,
+        fields,
+        version_types,
+        entity_id=version_id
+    )
 
 
 def get_version_by_name(project_name, version, subset_id, fields=None):
@@ -595,13 +738,18 @@ def get_version_by_name(project_name, version, subset_id, fields=None):
     if not subset_id:
         return None
 
-    conn = get_project_connection(project_name)
     query_filter = {
         "type": "version",
         "parent": subset_id,
         "name": version
     }
-    return conn.find_one(query_filter, _prepare_fields(fields))
+    return _find_one(
+        project_name,
+        query_filter,
+        fields,
+        ("version", ),
+        natural_keys=[("version", subset_id, version)]
+    )
 
 
 def version_is_latest(project_name, version_id):
@@ -635,7 +783,7 @@ def version_is_latest(project_name, version_id):
         return True
 
     last_version = get_last_version_by_subset_id(
-        project_name, version_doc["parent"], fields=["_id"]
+        project_name, version_doc["parent"], fields=["_id"], use_index=True
     )
     return last_version["_id"] == version_id
 
@@ -685,9 +833,14 @@ def _get_versions(
         else:
             query_filter["name"] = {"$in": versions}
 
-    conn = get_project_connection(project_name)
+    # Cached documents can be used only if ids are the only filter
+    cached_ids = None
+    if subset_ids is None and versions is None:
+        cached_ids = version_ids
 
-    return conn.find(query_filter, _prepare_fields(fields))
+    return _find(
+        project_name, query_filter, fields, version_types, cached_ids
+    )
 
 
 def get_versions(
@@ -855,7 +1008,78 @@ def get_output_link_versions(project_name, version_id, fields=None):
     return conn.find(query_filter, _prepare_fields(fields))
 
 
-def get_last_versions(project_name, subset_ids, fields=None):
+# Key on subset document where is stored id and name of last version
+#   - maintained by 'OperationsSession.commit'
+SUBSET_LAST_VERSION_KEY = "last_version"
+
+
+def _get_indexed_last_versions(project_name, subset_ids):
+    """Last versions stored on subset documents.
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        subset_ids (List[ObjectId]): Subset ids.
+
+    Returns:
+        dict[ObjectId, dict[str, Any]]: Id and name of last version by subset
+            id. Subsets without stored last version are not in output.
+    """
+
+    query_filter = {
+        "type": "subset",
+        "_id": {"$in": subset_ids},
+        SUBSET_LAST_VERSION_KEY: {"$exists": True}
+    }
+    conn = get_project_connection(project_name)
+    return {
+        subset_doc["_id"]: subset_doc[SUBSET_LAST_VERSION_KEY]
+        for subset_doc in conn.find(
+            query_filter, {SUBSET_LAST_VERSION_KEY: True}
+        )
+    }
+
+
+def aggregate_last_versions(project_name, subset_ids=None):
+    """Find id and name of last version of subsets using aggregation.
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        subset_ids (Optional[Iterable[Union[str, ObjectId]]]): Subset ids.
+            Versions of all subsets are used if 'None' is passed.
+
+    Returns:
+        dict[ObjectId, dict[str, Any]]: Id and name of last version by subset
+            id.
+    """
+
+    match_filter = {"type": "version"}
+    if subset_ids is not None:
+        subset_ids = convert_ids(subset_ids)
+        if not subset_ids:
+            return {}
+        match_filter["parent"] = {"$in": subset_ids}
+
+    aggregation_pipeline = [
+        # Find all versions of those subsets
+        {"$match": match_filter},
+        # Sorting versions all together
+        {"$sort": {"name": 1}},
+        # Group them by "parent", but only take the last
+        {"$group": {
+            "_id": "$parent",
+            "_version_id": {"$last": "$_id"},
+            "name": {"$last": "$name"}
+        }}
+    ]
+
+    conn = get_project_connection(project_name)
+    return {
+        item["_id"]: {"_id": item["_version_id"], "name": item["name"]}
+        for item in conn.aggregate(aggregation_pipeline)
+    }
+
+
+def get_last_versions(project_name, subset_ids, fields=None, use_index=False):
     """Latest versions for entered subset_ids.
 
     Args:
@@ -863,6 +1087,9 @@ def get_last_versions(project_name, subset_ids, fields=None):
         subset_ids (Iterable[Union[str, ObjectId]]): List of subset ids.
         fields (Optional[Iterable[str]]): Fields that should be returned. All
             fields are returned if 'None' is passed.
+        use_index (Optional[bool]): Use last version stored on subset
+            documents. Aggregation is used for subsets which don't have it
+            stored.
 
     Returns:
         dict[ObjectId, int]: Key is subset id and value is last version name.
@@ -891,41 +1118,34 @@ def get_last_versions(project_name, subset_ids, fields=None):
                 fields_s.remove(field)
         limit_query = len(fields_s) == 0
 
-    group_item = {
-        "_id": "$parent",
-        "_version_id": {"$last": "$_id"}
-    }
-    # Add name if name is needed (only for limit query)
-    if name_needed:
-        group_item["name"] = {"$last": "$name"}
+    last_versions_by_subset_id = {}
+    if use_index:
+        last_versions_by_subset_id = _get_indexed_last_versions(
+            project_name, subset_ids
+        )
 
-    aggregation_pipeline = [
-        # Find all versions of those subsets
-        {"$match": {
-            "type": "version",
-            "parent": {"$in": subset_ids}
-        }},
-        # Sorting versions all together
-        {"$sort": {"name": 1}},
-        # Group them by "parent", but only take the last
-        {"$group": group_item}
+    missing_subset_ids = [
+        subset_id
+        for subset_id in subset_ids
+        if subset_id not in last_versions_by_subset_id
     ]
+    if missing_subset_ids:
+        last_versions_by_subset_id.update(
+            aggregate_last_versions(project_name, missing_subset_ids)
+        )
 
-    conn = get_project_connection(project_name)
-    aggregate_result = conn.aggregate(aggregation_pipeline)
     if limit_query:
         output = {}
-        for item in aggregate_result:
-            subset_id = item["_id"]
-            item_data = {"_id": item["_version_id"], "parent": subset_id}
+        for subset_id, item in last_versions_by_subset_id.items():
+            item_data = {"_id": item["_id"], "parent": subset_id}
             if name_needed:
                 item_data["name"] = item["name"]
             output[subset_id] = item_data
         return output
 
     version_ids = [
-        doc["_version_id"]
-        for doc in aggregate_result
+        item["_id"]
+        for item in last_versions_by_subset_id.values()
     ]
 
     fields = _prepare_fields(fields, ["parent"])
@@ -940,7 +1160,9 @@ def get_last_versions(project_name, subset_ids, fields=None):
     }
 
 
-def get_last_version_by_subset_id(project_name, subset_id, fields=None):
+def get_last_version_by_subset_id(
+    project_name, subset_id, fields=None, use_index=False
+):
     """Last version for passed subset id.
 
     Args:
@@ -948,6 +1170,8 @@ def get_last_version_by_subset_id(project_name, subset_id, fields=None):
         subset_id (Union[str, ObjectId]): Id of version which should be found.
         fields (Optional[Iterable[str]]): Fields that should be returned. All
             fields are returned if 'None' is passed.
+        use_index (Optional[bool]): Use last version stored on subset
+            document.
 
     Returns:
         Union[Dict, None]: Version entity data which can be reduced to
@@ -960,7 +1184,10 @@ def get_last_version_by_subset_id(project_name, subset_id, fields=None):
         return None
 
     last_versions = get_last_versions(
-        project_name, subset_ids=[subset_id], fields=fields
+        project_name,
+        subset_ids=[subset_id],
+        fields=fields,
+        use_index=use_index
     )
     return last_versions.get(subset_id)
 
@@ -1028,12 +1255,16 @@ def get_representation_by_id(project_name, representation_id, fields=None):
     query_filter = {
         "type": {"$in": repre_types}
     }
-    if representation_id is not None:
-        query_filter["_id"] = convert_id(representation_id)
-
-    conn = get_project_connection(project_name)
+    representation_id = convert_id(representation_id)
+    query_filter["_id"] = representation_id
 
-    return conn.find_one(query_filter, _prepare_fields(fields))
+    return _find_one(
+        project_name,
+        query_filter,
+        fields,
+        repre_types,
+        entity_id=representation_id
+    )
 
 
 def get_representation_by_name(
@@ -1064,8 +1295,13 @@ def get_representation_by_name(
         "parent": version_id
     }
 
-    conn = get_project_connection(project_name)
-    return conn.find_one(query_filter, _prepare_fields(fields))
+    return _find_one(
+        project_name,
+        query_filter,
+        fields,
+        repre_types,
+        natural_keys=[("representation", version_id, representation_name)]
+    )
 
 
 def _flatten_dict(data):
@@ -1204,9 +1440,19 @@ def _get_representations(
             and_query.append(or_query)
         query_filter["$and"] = and_query
 
-    conn = get_project_connection(project_name)
-
-    return conn.find(query_filter, _prepare_fields(fields))
+    # Cached documents can be used only if ids are the only filter
+    cached_ids = None
+    if (
+        representation_names is None
+        and version_ids is None
+        and names_by_version_ids is None
+        and context_filters is None
+    ):
+        cached_ids = representation_ids
+
+    return _find(
+        project_name, query_filter, fields, repre_types, cached_ids
+    )
 
 
 def get_representations(
@@ -1302,6 +1548,217 @@ def get_archived_representations(
     )
 
 
+# Levels of hierarchy from representation to asset with entity types
+_HIERARCHY_LEVELS = (
+    ("representation", ("representation", "archived_representation")),
+    ("version", ("version", "hero_version")),
+    ("subset", ("subset", )),
+    ("asset", ("asset", )),
+)
+
+RepresentationHierarchy = collections.namedtuple(
+    "RepresentationHierarchy",
+    ("representation", "version", "subset", "asset")
+)
+
+
+def _prepare_hierarchy_fields(fields):
+    if fields is None:
+        return None
+    output = set(fields)
+    output.update(("_id", "type", "parent"))
+    return output
+
+
+def _aggregate_hierarchy(project_name, levels, entity_ids, fields_by_level):
+    """Query entities with their parents using one aggregation.
+
+    Documents of first level are matched by ids and each next level is
+    added using '$lookup' on 'parent' of previous level. Documents are reduced
+    to requested fields right after they're added.
+    """
+
+    first_key, first_types = levels[0]
+    projection = {}
+    pipeline = [
+        {"$match": {
+            "type": {"$in": list(first_types)},
+            "_id": {"$in": entity_ids}
+        }},
+        {"$project": {"_" + first_key: "$$ROOT"}},
+    ]
+    prev_key = None
+    for key, _ in levels:
+        if prev_key is not None:
+            pipeline.extend((
+                {"$lookup": {
+                    "from": project_name,
+                    "localField": "_{}.parent".format(prev_key),
+                    "foreignField": "_id",
+                    "as": "_" + key
+                }},
+                {"$unwind": {
+                    "path": "$_" + key,
+                    "preserveNullAndEmptyArrays": True
+                }},
+            ))
+
+        fields = fields_by_level.get(key)
+        if fields is None:
+            projection["_" + key] = True
+        else:
+            for field in fields:
+                projection["_{}.{}".format(key, field)] = True
+        pipeline.append({"$project": dict(projection)})
+        prev_key = key
+
+    conn = get_project_connection(project_name)
+    for item in conn.aggregate(pipeline):
+        docs = []
+        for key, entity_types in levels:
+            doc = item.get("_" + key)
+            # Parent id may point to entity of unexpected type
+            if doc is not None and doc.get("type") not in entity_types:
+                doc = None
+            docs.append(doc)
+        yield docs
+
+
+def _query_hierarchy(project_name, levels, entity_ids, fields_by_level):
+    """Query entities with their parents using one query per level."""
+
+    docs_by_id_by_level = []
+    ids = entity_ids
+    for key, entity_types in levels:
+        docs_by_id = {}
+        if ids:
+            query_filter = {
+                "type": {"$in": list(entity_types)},
+                "_id": {"$in": ids}
+            }
+            docs_by_id = {
+                doc["_id"]: doc
+                for doc in _find(
+                    project_name,
+                    query_filter,
+                    fields_by_level.get(key),
+                    entity_types,
+                    ids
+                )
+            }
+        docs_by_id_by_level.append(docs_by_id)
+        ids = list({
+            doc["parent"]
+            for doc in docs_by_id.values()
+            if doc.get("parent") is not None
+        })
+
+    for doc in docs_by_id_by_level[0].values():
+        docs = [doc]
+        for docs_by_id in docs_by_id_by_level[1:]:
+            if doc is not None:
+                doc = docs_by_id.get(doc.get("parent"))
+            docs.append(doc)
+        yield docs
+
+
+def _get_entities_hierarchy(
+    project_name, levels, entity_ids, fields_by_level, use_aggregation
+):
+    entity_ids = convert_ids(entity_ids)
+    if not entity_ids:
+        return {}
+
+    fields_by_level = {
+        key: _prepare_hierarchy_fields(fields)
+        for key, fields in fields_by_level.items()
+    }
+
+    # Use queries per level when entity cache is enabled so cached documents
+    #   are used
+    if use_aggregation and get_entity_cache(project_name) is None:
+        try:
+            return {
+                docs[0]["_id"]: docs
+                for docs in _aggregate_hierarchy(
+                    project_name, levels, entity_ids, fields_by_level
+                )
+            }
+        except OperationFailure:
+            # Database does not support used aggregation stages
+            pass
+
+    return {
+        docs[0]["_id"]: docs
+        for docs in _query_hierarchy(
+            project_name, levels, entity_ids, fields_by_level
+        )
+    }
+
+
+def get_representations_hierarchy(
+    project_name,
+    representation_ids,
+    representation_fields=None,
+    version_fields=None,
+    subset_fields=None,
+    asset_fields=None,
+    use_aggregation=True,
+    parent_level="asset"
+):
+    """Representations with their version, subset and asset.
+
+    Whole hierarchy is resolved using one aggregation with '$lookup' stages.
+    Queries per entity type are used as fallback if aggregation fails or if
+    entity cache is enabled. Hierarchy is resolved only up to
+    'parent_level', documents of higher levels are 'None'.
+
+    Fields '_id', 'type' and 'parent' are always available in documents.
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        representation_ids (Iterable[Union[str, ObjectId]]): Representation
+            ids.
+        representation_fields (Optional[Iterable[str]]): Fields of
+            representations. All fields are returned if 'None' is passed.
+        version_fields (Optional[Iterable[str]]): Fields of versions.
+        subset_fields (Optional[Iterable[str]]): Fields of subsets.
+        asset_fields (Optional[Iterable[str]]): Fields of assets.
+        use_aggregation (Optional[bool]): Use aggregation. Queries per entity
+            type are used if set to 'False'.
+        parent_level (Optional[str]): Highest queried level. One of
+            'version', 'subset' or 'asset'.
+
+    Returns:
+        dict[ObjectId, RepresentationHierarchy]: Hierarchy by representation
+            id. Missing parent documents are 'None'. Representations that
+            were not found are not in output.
+    """
+
+    level_keys = [key for key, _ in _HIERARCHY_LEVELS]
+    if parent_level not in level_keys[1:]:
+        raise ValueError("Invalid parent level {}".format(parent_level))
+    levels = _HIERARCHY_LEVELS[:level_keys.index(parent_level) + 1]
+    missing_levels = [None] * (len(_HIERARCHY_LEVELS) - len(levels))
+
+    hierarchy = _get_entities_hierarchy(
+        project_name,
+        levels,
+        representation_ids,
+        {
+            "representation": representation_fields,
+            "version": version_fields,
+            "subset": subset_fields,
+            "asset": asset_fields,
+        },
+        use_aggregation
+    )
+    return {
+        repre_id: RepresentationHierarchy(*(list(docs) + missing_levels))
+        for repre_id, docs in hierarchy.items()
+    }
+
+
 def get_representations_parents(project_name, representations):
     """Prepare parents of representation entities.
 
@@ -1317,64 +1774,35 @@ def get_representations_parents(project_name, representations):
         dict[ObjectId, tuple]: Parents by representation id.
     """
 
-    repre_docs_by_version_id = collections.defaultdict(list)
-    version_docs_by_version_id = {}
-    version_docs_by_subset_id = collections.defaultdict(list)
-    subset_docs_by_subset_id = {}
-    subset_docs_by_asset_id = collections.defaultdict(list)
     output = {}
+    version_ids = set()
     for repre_doc in representations:
-        repre_id = repre_doc["_id"]
-        version_id = repre_doc["parent"]
-        output[repre_id] = (None, None, None, None)
-        repre_docs_by_version_id[version_id].append(repre_doc)
+        output[repre_doc["_id"]] = (None, None, None, None)
+        version_ids.add(repre_doc["parent"])
 
-    version_docs = get_versions(
+    if not output:
+        return output
+
+    # Parents are resolved from versions because passed representations
+    #   don't have to be stored in database
+    parents_by_version_id = _get_entities_hierarchy(
         project_name,
-        version_ids=repre_docs_by_version_id.keys(),
-        hero=True
-    )
-    for version_doc in version_docs:
-        version_id = version_doc["_id"]
-        subset_id = version_doc["parent"]
-        version_docs_by_version_id[version_id] = version_doc
-        version_docs_by_subset_id[subset_id].append(version_doc)
-
-    subset_docs = get_subsets(
-        project_name, subset_ids=version_docs_by_subset_id.keys()
-    )
-    for subset_doc in subset_docs:
-        subset_id = subset_doc["_id"]
-        asset_id = subset_doc["parent"]
-        subset_docs_by_subset_id[subset_id] = subset_doc
-        subset_docs_by_asset_id[asset_id].append(subset_doc)
-
-    asset_docs = get_assets(
-        project_name, asset_ids=subset_docs_by_asset_id.keys()
+        _HIERARCHY_LEVELS[1:],
+        version_ids,
+        {},
+        True
     )
-    asset_docs_by_id = {
-        asset_doc["_id"]: asset_doc
-        for asset_doc in asset_docs
-    }
 
     project_doc = get_project(project_name)
 
-    for version_id, repre_docs in repre_docs_by_version_id.items():
-        asset_doc = None
-        subset_doc = None
-        version_doc = version_docs_by_version_id.get(version_id)
-        if version_doc:
-            subset_id = version_doc["parent"]
-            subset_doc = subset_docs_by_subset_id.get(subset_id)
-            if subset_doc:
-                asset_id = subset_doc["parent"]
-                asset_doc = asset_docs_by_id.get(asset_id)
-
-        for repre_doc in repre_docs:
-            repre_id = repre_doc["_id"]
-            output[repre_id] = (
-                version_doc, subset_doc, asset_doc, project_doc
-            )
+    for repre_doc in representations:
+        parents = parents_by_version_id.get(repre_doc["parent"])
+        if parents is None:
+            parents = (None, None, None)
+        version_doc, subset_doc, asset_doc = parents
+        output[repre_doc["_id"]] = (
+            version_doc, subset_doc, asset_doc, project_doc
+        )
     return output
 
 
@@ -0,0 +1,466 @@
+"""Request scoped cache of project entity documents.
+
+Cache is opt-in and is used by query functions in 'entities.py' only when
+is enabled for a project using 'entity_cache' context manager. Cache is
+scoped to the thread which opened the context, queries from other threads
+are not affected and don't see the cached documents.
+
+```python
+from openpype.client import entity_cache, get_asset_by_name
+
+with entity_cache(project_name):
+    # Only first call will query mongo
+    for _ in range(10):
+        asset_doc = get_asset_by_name(project_name, "sh010")
+```
+
+Documents are stored by their '_id' (identity map) and by natural key which
+is combination of entity type, name and parent id. When the same document
+is queried with different fields the projections are merged so the cached
+document grows and following queries can be served from the cache.
+
+Query functions return lists instead of cursors while the cache is enabled.
+
+Changes made using 'OperationsSession' invalidate changed documents in caches
+of all threads. Any other direct write to mongo during enabled cache should
+call 'invalidate_entity_cache'.
+"""
+
+import copy
+import threading
+import contextlib
+
+import six
+
+# Fields that are always queried when cache is enabled. They're needed to
+#   validate type of cached document and to create natural key.
+_CACHE_REQUIRED_FIELDS = ("_id", "type", "name", "parent")
+
+# Types of entities which have unique name under parent. Asset names are
+#   unique in whole project so parent is not part of their key.
+_NATURAL_KEY_TYPES = {
+    "asset": False,
+    "archived_asset": False,
+    "subset": True,
+    "archived_subset": True,
+    "version": True,
+    "representation": True,
+    "archived_representation": True,
+}
+
+# Caches opened by current thread by project name
+_thread_data = threading.local()
+# All opened caches of all threads, used for invalidation
+_caches_lock = threading.RLock()
+_all_caches = set()
+
+
+def _get_thread_caches():
+    caches = getattr(_thread_data, "caches_by_project_name", None)
+    if caches is None:
+        caches = {}
+        _thread_data.caches_by_project_name = caches
+    return caches
+
+
+def _field_is_covered(field, cached_fields):
+    """Is field available in document queried with cached fields.
+
+    Args:
+        field (str): Field that should be available. Can contain dot
+            for nested keys e.g. 'data.fps'.
+        cached_fields (Union[set[str], None]): Fields used for query of cached
+            document. 'None' means that whole document was queried.
+
+    Returns:
+        bool: Field is available.
+    """
+
+    if cached_fields is None:
+        return True
+
+    parts = field.split(".")
+    for idx in range(1, len(parts) + 1):
+        if ".".join(parts[:idx]) in cached_fields:
+            return True
+    return False
+
+
+def _simplify_fields(fields):
+    """Remove fields which are already covered by their parent field.
+
+    Mongo does not allow to use parent and child paths in one projection
+    e.g. 'data' and 'data.fps'.
+    """
+
+    return {
+        field
+        for field in fields
+        if "." not in field or not _field_is_covered(
+            field.rsplit(".", 1)[0], fields
+        )
+    }
+
+
+def reduce_document_fields(doc, fields, copy_doc=False):
+    """Document reduced to passed fields.
+
+    Args:
+        doc (dict[str, Any]): Source document.
+        fields (Union[Iterable[str], None]): Fields that should be in output.
+        copy_doc (Optional[bool]): Output should be a deep copy even if all
+            fields are requested.
+
+    Returns:
+        dict[str, Any]: Document with requested fields.
+    """
+
+    if fields is None:
+        if copy_doc:
+            return copy.deepcopy(doc)
+        return doc
+
+    output = {"_id": doc["_id"]}
+    for field in fields:
+        parts = field.split(".")
+        src = doc
+        found = True
+        for part in parts:
+            if not isinstance(src, dict) or part not in src:
+                found = False
+                break
+            src = src[part]
+
+        if not found:
+            continue
+
+        dst = output
+        for part in parts[:-1]:
+            dst = dst.setdefault(part, {})
+        dst[parts[-1]] = copy.deepcopy(src)
+    return output
+
+
+def _merge_documents(src_doc, new_doc):
+    """Merge new document values into cached document.
+
+    Both documents are results of query of the same entity with different
+    projections. Values from new document are used when both documents
+    contain the same key.
+    """
+
+    for key, value in new_doc.items():
+        src_value = src_doc.get(key)
+        if isinstance(value, dict) and isinstance(src_value, dict):
+            _merge_documents(src_value, value)
+        else:
+            src_doc[key] = value
+
+
+class ProjectEntityCache(object):
+    """Cache of documents for one project.
+
+    Object should not be created directly, use 'entity_cache' context manager
+    instead.
+
+    Args:
+        project_name (str): Name of project.
+    """
+
+    def __init__(self, project_name):
+        self._project_name = project_name
+        self._lock = threading.RLock()
+        # Cached item is a list with document and fields used for query
+        self._items_by_id = {}
+        self._ids_by_natural_key = {}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def project_name(self):
+        return self._project_name
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+    @staticmethod
+    def get_natural_key(entity_type, name, parent_id=None):
+        """Natural key of an entity.
+
+        Args:
+            entity_type (str): Type of entity.
+            name (Union[str, int]): Name of entity.
+            parent_id (Optional[ObjectId]): Id of parent entity.
+
+        Returns:
+            Union[tuple, None]: Key or None if entity type does not have
+                natural key.
+        """
+
+        if entity_type == "project":
+            return (entity_type, )
+
+        use_parent = _NATURAL_KEY_TYPES.get(entity_type)
+        if use_parent is None:
+            return None
+
+        if not use_parent:
+            parent_id = None
+        return (entity_type, parent_id, name)
+
+    def _get_doc_natural_key(self, doc):
+        entity_type = doc.get("type")
+        if entity_type == "project":
+            return self.get_natural_key(entity_type, None)
+        if "name" not in doc:
+            return None
+        return self.get_natural_key(
+            entity_type, doc["name"], doc.get("parent")
+        )
+
+    def _get_item(self, entity_id, natural_keys):
+        if entity_id is None:
+            for natural_key in natural_keys or []:
+                if natural_key is None:
+                    continue
+                entity_id = self._ids_by_natural_key.get(natural_key)
+                if entity_id is not None:
+                    break
+        if entity_id is None:
+            return None
+        return self._items_by_id.get(entity_id)
+
+    def get_query_fields(self, fields, entity_id=None, natural_keys=None):
+        """Fields that should be used to query document.
+
+        Fields requested by caller are extended by required fields and by
+        fields of already cached document so the result can be merged.
+
+        Args:
+            fields (Union[Iterable[str], None]): Requested fields.
+            entity_id (Optional[ObjectId]): Id of queried entity.
+            natural_keys (Optional[Iterable[tuple]]): Possible natural keys
+                of queried entity.
+
+        Returns:
+            Union[set[str], None]: Fields for query. 'None' means all fields.
+        """
+
+        if fields is None:
+            return None
+
+        output = set(fields)
+        output.update(_CACHE_REQUIRED_FIELDS)
+        with self._lock:
+            item = self._get_item(entity_id, natural_keys)
+            if item is not None:
+                cached_fields = item[1]
+                if cached_fields is None:
+                    return None
+                output |= cached_fields
+        return _simplify_fields(output)
+
+    def get(self, entity_types, fields, entity_id=None, natural_keys=None):
+        """Cached document.
+
+        Args:
+            entity_types (Iterable[str]): Allowed types of the document.
+            fields (Union[Iterable[str], None]): Requested fields.
+            entity_id (Optional[ObjectId]): Id of entity.
+            natural_keys (Optional[Iterable[tuple]]): Possible natural keys
+                of entity.
+
+        Returns:
+            Union[dict[str, Any], None]: Copy of cached document or None
+                if document is not cached with all requested fields.
+        """
+
+        if fields is not None:
+            fields = set(fields)
+
+        with self._lock:
+            item = self._get_item(entity_id, natural_keys)
+            if item is not None:
+                doc, cached_fields = item
+                if (
+                    doc.get("type") in entity_types
+                    and (
+                        fields is None and cached_fields is None
+                        or fields is not None and all(
+                            _field_is_covered(field, cached_fields)
+                            for field in fields
+                        )
+                    )
+                ):
+                    self._hits += 1
+                    return reduce_document_fields(doc, fields, True)
+            self._misses += 1
+        return None
+
+    def store(self, doc, fields):
+        """Store queried document.
+
+        Args:
+            doc (dict[str, Any]): Document received from mongo.
+            fields (Union[Iterable[str], None]): Fields used for query.
+        """
+
+        if fields is not None:
+            fields = set(fields)
+            # Document without required fields can't be validated
+            if not all(
+                field in fields
+                for field in _CACHE_REQUIRED_FIELDS
+            ):
+                return
+
+        doc = copy.deepcopy(doc)
+        entity_id = doc["_id"]
+        with self._lock:
+            item = self._items_by_id.get(entity_id)
+            if item is not None:
+                cached_doc, cached_fields = item
+                if fields is not None and cached_fields is not None:
+                    _merge_documents(cached_doc, doc)
+                    doc = cached_doc
+                    fields |= cached_fields
+                elif fields is not None:
+                    _merge_documents(cached_doc, doc)
+                    doc = cached_doc
+                    fields = None
+                self._discard_natural_key(entity_id, cached_doc)
+
+            self._items_by_id[entity_id] = [doc, fields]
+            natural_key = self._get_doc_natural_key(doc)
+            if natural_key is not None:
+                self._ids_by_natural_key[natural_key] = entity_id
+
+    def _discard_natural_key(self, entity_id, doc):
+        natural_key = self._get_doc_natural_key(doc)
+        if (
+            natural_key is not None
+            and self._ids_by_natural_key.get(natural_key) == entity_id
+        ):
+            self._ids_by_natural_key.pop(natural_key)
+
+    def invalidate(self, entity_ids=None):
+        """Remove documents from cache.
+
+        Args:
+            entity_ids (Optional[Iterable[ObjectId]]): Ids of entities to
+                remove. All documents are removed if 'None' is passed.
+        """
+
+        with self._lock:
+            if entity_ids is None:
+                self._items_by_id.clear()
+                self._ids_by_natural_key.clear()
+                return
+
+            for entity_id in entity_ids:
+                item = self._items_by_id.pop(entity_id, None)
+                if item is not None:
+                    self._discard_natural_key(entity_id, item[0])
+
+
+def get_entity_cache(project_name):
+    """Enabled entity cache for a project in current thread.
+
+    Args:
+        project_name (str): Name of project.
+
+    Returns:
+        Union[ProjectEntityCache, None]: Cache object or None if cache is not
+            enabled for the project.
+    """
+
+    item = _get_thread_caches().get(project_name)
+    if item is None:
+        return None
+    return item[0]
+
+
+def is_entity_cache_enabled(project_name):
+    """Is entity cache enabled for a project in current thread.
+
+    Args:
+        project_name (str): Name of project.
+
+    Returns:
+        bool: Cache is enabled.
+    """
+
+    return project_name in _get_thread_caches()
+
+
+def invalidate_entity_cache(project_name=None, entity_ids=None):
+    """Invalidate cached documents.
+
+    Caches of all threads are invalidated because the change is visible
+    to all of them.
+
+    Args:
+        project_name (Optional[str]): Name of project. All projects are
+            invalidated if 'None' is passed.
+        entity_ids (Optional[Iterable[Union[str, ObjectId]]]): Ids of
+            entities which were changed. All documents of project are
+            invalidated if 'None' is passed.
+    """
+
+    from .entities import convert_ids
+
+    if entity_ids is not None:
+        entity_ids = convert_ids(entity_ids)
+
+    with _caches_lock:
+        caches = [
+            cache
+            for cache in _all_caches
+            if project_name is None or cache.project_name == project_name
+        ]
+
+    for cache in caches:
+        cache.invalidate(entity_ids)
+
+
+@contextlib.contextmanager
+def entity_cache(project_name):
+    """Enable caching of entity documents of a project in the context.
+
+    Cache is used only by queries called from current thread. Contexts can
+    be nested, cache is shared by all opened contexts of the same project
+    in the thread and is cleared when last of them is closed.
+
+    Args:
+        project_name (str): Name of project.
+
+    Yields:
+        ProjectEntityCache: Cache object of the project.
+    """
+
+    if not project_name or not isinstance(project_name, six.string_types):
+        raise ValueError("Invalid project name {}".format(str(project_name)))
+
+    caches_by_project_name = _get_thread_caches()
+    item = caches_by_project_name.get(project_name)
+    if item is None:
+        item = [ProjectEntityCache(project_name), 0]
+        caches_by_project_name[project_name] = item
+        with _caches_lock:
+            _all_caches.add(item[0])
+    item[1] += 1
+
+    try:
+        yield item[0]
+
+    finally:
+        item[1] -= 1
+        if item[1] < 1:
+            caches_by_project_name.pop(project_name, None)
+            with _caches_lock:
+                _all_caches.discard(item[0])
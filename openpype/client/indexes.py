@@ -0,0 +1,388 @@
+"""Indexes of mongo collections used by OpenPype.
+
+Indexes are defined declaratively per collection kind. Each kind has
+definition of indexes and sample queries which are used to check if queries
+are covered by an index.
+
+Collection kinds:
+    project: Project collection in avalon database (one per project).
+    settings: OpenPype settings and local settings.
+    logs: Logs stored by 'Logger'.
+    ftrack_events: Ftrack events stored by ftrack event server.
+    webpublishes: Batches processed by webpublisher.
+"""
+
+import os
+import collections
+
+import pymongo
+
+from .mongo import (
+    OpenPypeMongoConnection,
+    get_project_database,
+    get_project_connection,
+)
+
+PROJECT_KIND = "project"
+SETTINGS_KIND = "settings"
+LOGS_KIND = "logs"
+FTRACK_EVENTS_KIND = "ftrack_events"
+WEBPUBLISHES_KIND = "webpublishes"
+
+# Collection names of kinds which are stored in OpenPype database
+_OPENPYPE_COLLECTION_NAMES = {
+    SETTINGS_KIND: "settings",
+    LOGS_KIND: "logs",
+    FTRACK_EVENTS_KIND: "ftrack_events",
+    WEBPUBLISHES_KIND: "webpublishes",
+}
+
+
+class MongoIndex(object):
+    """Definition of mongo index.
+
+    Args:
+        name (str): Name of index in collection.
+        keys (List[Tuple[str, int]]): Index keys with direction.
+        options (dict[str, Any]): Additional options passed to
+            'create_index' (e.g. 'sparse', 'expireAfterSeconds').
+    """
+
+    def __init__(self, name, keys, **options):
+        self.name = name
+        self.keys = [(key, direction) for key, direction in keys]
+        self.options = options
+
+    def __repr__(self):
+        return "<{} {}>".format(self.__class__.__name__, self.name)
+
+    def matches(self, index_info):
+        """Index information from mongo match the definition.
+
+        Only keys are compared so index created manually with different name
+        is considered as existing.
+
+        Args:
+            index_info (dict[str, Any]): Item from 'index_information'.
+
+        Returns:
+            bool: Index matches.
+        """
+
+        return [
+            (key, int(direction))
+            for key, direction in index_info["key"]
+        ] == self.keys
+
+    def to_index_model(self):
+        return pymongo.IndexModel(
+            self.keys, name=self.name, background=True, **self.options
+        )
+
+
+_INDEX_DEFINITIONS = {
+    PROJECT_KIND: (
+        # Children of parent by type (subsets of assets, versions
+        #   of subsets, representations of versions)
+        MongoIndex(
+            "type_parent_name",
+            [("type", 1), ("parent", 1), ("name", 1)]
+        ),
+        # Assets by name
+        MongoIndex("type_name", [("type", 1), ("name", 1)]),
+        MongoIndex(
+            "asset_visual_parent",
+            [("type", 1), ("data.visualParent", 1)]
+        ),
+        MongoIndex("input_links", [("data.inputLinks.id", 1)], sparse=True),
+        # Sync server queries
+        MongoIndex(
+            "representation_sites",
+            [("type", 1), ("files.sites.name", 1)]
+        ),
+        MongoIndex(
+            "representation_files_modified",
+            [("type", 1), ("files_modified_dt", 1)]
+        ),
+        MongoIndex(
+            "workfile_info",
+            [("type", 1), ("parent", 1), ("task_name", 1), ("filename", 1)]
+        ),
+    ),
+    SETTINGS_KIND: (
+        MongoIndex("type_version", [("type", 1), ("version", 1)]),
+        MongoIndex(
+            "project_settings",
+            [("type", 1), ("project_name", 1), ("version", 1)]
+        ),
+        MongoIndex("local_settings", [("type", 1), ("site_id", 1)]),
+    ),
+    LOGS_KIND: (
+        MongoIndex("process_id", [("process_id", 1), ("timestamp", 1)]),
+        MongoIndex("timestamp", [("timestamp", 1)]),
+    ),
+    FTRACK_EVENTS_KIND: (
+        MongoIndex(
+            "processed_stored",
+            [("pype_data.is_processed", 1), ("pype_data.stored", 1)]
+        ),
+        # Remove processed events after 3 days
+        MongoIndex(
+            "processed_ttl",
+            [("pype_data.stored", 1)],
+            expireAfterSeconds=3 * 24 * 60 * 60,
+            partialFilterExpression={"pype_data.is_processed": True}
+        ),
+    ),
+    WEBPUBLISHES_KIND: (
+        MongoIndex("batch_id", [("batch_id", 1)]),
+        MongoIndex("user", [("user", 1)]),
+        MongoIndex("status", [("status", 1)]),
+    ),
+}
+
+# Queries which are used in codebase and should not do collection scan
+_SAMPLE_QUERIES = {
+    PROJECT_KIND: (
+        {"type": "subset", "parent": {"$in": []}},
+        {"type": "version", "parent": {"$in": []}},
+        {"type": "representation", "parent": {"$in": []}},
+        {"type": "subset", "name": "", "parent": None},
+        {"type": "asset", "name": ""},
+        {"type": "version", "data.inputLinks.id": None},
+        {"type": "representation", "files.sites.name": ""},
+        {"type": "representation", "files_modified_dt": {"$gte": None}},
+    ),
+    SETTINGS_KIND: (
+        {"type": "", "version": ""},
+        {"type": "", "project_name": "", "version": ""},
+        {"type": "", "site_id": ""},
+    ),
+    LOGS_KIND: (
+        {"process_id": None},
+    ),
+    FTRACK_EVENTS_KIND: (
+        {"pype_data.is_processed": False},
+    ),
+    WEBPUBLISHES_KIND: (
+        {"batch_id": ""},
+        {"user": ""},
+        {"status": ""},
+    ),
+}
+
+
+def get_collection_kinds():
+    """Available collection kinds.
+
+    Returns:
+        List[str]: Kinds of collections with defined indexes.
+    """
+
+    return list(_INDEX_DEFINITIONS.keys())
+
+
+def get_index_definitions(collection_kind):
+    """Index definitions for a collection kind.
+
+    Args:
+        collection_kind (str): Kind of collection.
+
+    Returns:
+        List[MongoIndex]: Definitions of indexes.
+    """
+
+    if collection_kind not in _INDEX_DEFINITIONS:
+        raise ValueError(
+            "Unknown collection kind \"{}\"".format(collection_kind)
+        )
+    return list(_INDEX_DEFINITIONS[collection_kind])
+
+
+def get_collection_by_kind(collection_kind, project_name=None):
+    """Mongo collection of passed kind.
+
+    Args:
+        collection_kind (str): Kind of collection.
+        project_name (Optional[str]): Project name, required
+            for 'project' kind.
+
+    Returns:
+        pymongo.collection.Collection: Collection object.
+    """
+
+    if collection_kind == PROJECT_KIND:
+        return get_project_connection(project_name)
+
+    collection_name = _OPENPYPE_COLLECTION_NAMES.get(collection_kind)
+    if collection_name is None:
+        raise ValueError(
+            "Unknown collection kind \"{}\"".format(collection_kind)
+        )
+    database_name = os.environ["OPENPYPE_DATABASE_NAME"]
+    mongo_client = OpenPypeMongoConnection.get_mongo_client()
+    return mongo_client[database_name][collection_name]
+
+
+def get_missing_indexes(collection, collection_kind):
+    """Defined indexes which are not available in collection.
+
+    Args:
+        collection (pymongo.collection.Collection): Collection to check.
+        collection_kind (str): Kind of collection.
+
+    Returns:
+        List[MongoIndex]: Missing indexes.
+    """
+
+    indexes_info = collection.index_information().values()
+    return [
+        index
+        for index in get_index_definitions(collection_kind)
+        if not any(index.matches(info) for info in indexes_info)
+    ]
+
+
+def ensure_indexes(collection, collection_kind):
+    """Create missing indexes in a collection.
+
+    Args:
+        collection (pymongo.collection.Collection): Collection where indexes
+            are created.
+        collection_kind (str): Kind of collection.
+
+    Returns:
+        List[str]: Names of created indexes.
+    """
+
+    missing = get_missing_indexes(collection, collection_kind)
+    if not missing:
+        return []
+    return collection.create_indexes([
+        index.to_index_model()
+        for index in missing
+    ])
+
+
+def ensure_project_indexes(project_name):
+    """Create missing indexes in project collection.
+
+    Args:
+        project_name (str): Name of project.
+
+    Returns:
+        List[str]: Names of created indexes.
+    """
+
+    return ensure_indexes(
+        get_project_connection(project_name), PROJECT_KIND
+    )
+
+
+def _iter_collections(project_names=None, kinds=None):
+    if kinds is None:
+        kinds = get_collection_kinds()
+
+    for kind in kinds:
+        if kind != PROJECT_KIND:
+            yield kind, None, get_collection_by_kind(kind)
+            continue
+
+        if project_names is None:
+            project_names = [
+                name
+                for name in get_project_database().list_collection_names()
+                if name not in ("system.indexes", )
+            ]
+        for project_name in project_names:
+            yield kind, project_name, get_project_connection(project_name)
+
+
+def ensure_all_indexes(project_names=None, kinds=None):
+    """Create missing indexes in all OpenPype collections.
+
+    Args:
+        project_names (Optional[Iterable[str]]): Projects where indexes
+            should be created. All projects are used if 'None' is passed.
+        kinds (Optional[Iterable[str]]): Kinds of collections. All kinds are
+            used if 'None' is passed.
+
+    Returns:
+        dict[str, List[str]]: Created indexes by collection name.
+    """
+
+    output = collections.OrderedDict()
+    for kind, _, collection in _iter_collections(project_names, kinds):
+        output[collection.name] = ensure_indexes(collection, kind)
+    return output
+
+
+def explain_query(collection, query_filter):
+    """Explain of a find query with important information.
+
+    Args:
+        collection (pymongo.collection.Collection): Collection where query
+            is executed.
+        query_filter (dict[str, Any]): Query filter.
+
+    Returns:
+        dict[str, Any]: Winning plan stages, used index, number of examined
+            documents, keys and execution time.
+    """
+
+    explain = collection.find(query_filter).explain()
+    planner = explain.get("queryPlanner") or {}
+    stats = explain.get("executionStats") or {}
+
+    stages = []
+    index_name = None
+    stage = planner.get("winningPlan") or {}
+    while stage:
+        stages.append(stage.get("stage"))
+        if index_name is None:
+            index_name = stage.get("indexName")
+        stage = stage.get("inputStage")
+
+    return {
+        "filter": query_filter,
+        "stages": stages,
+        "index_name": index_name,
+        "collection_scan": "COLLSCAN" in stages,
+        "docs_examined": stats.get("totalDocsExamined"),
+        "keys_examined": stats.get("totalKeysExamined"),
+        "execution_time_ms": stats.get("executionTimeMillis"),
+    }
+
+
+def check_indexes(project_names=None, kinds=None):
+    """Report missing indexes and explain of queries used in codebase.
+
+    Args:
+        project_names (Optional[Iterable[str]]): Projects to check. All
+            projects are used if 'None' is passed.
+        kinds (Optional[Iterable[str]]): Kinds of collections. All kinds are
+            used if 'None' is passed.
+
+    Returns:
+        List[dict[str, Any]]: Report item per collection with missing index
+            names and explain of sample queries.
+    """
+
+    output = []
+    for kind, project_name, collection in _iter_collections(
+        project_names, kinds
+    ):
+        output.append({
+            "collection": collection.name,
+            "kind": kind,
+            "project_name": project_name,
+            "missing_indexes": [
+                index.name
+                for index in get_missing_indexes(collection, kind)
+            ],
+            "queries": [
+                explain_query(collection, query_filter)
+                for query_filter in _SAMPLE_QUERIES.get(kind) or []
+            ]
+        })
+    return output
@@ -2,8 +2,10 @@ import os
 import sys
 import time
 import logging
+import threading
 import pymongo
 import certifi
+from pymongo import monitoring
 
 from bson.json_util import (
     loads,
@@ -169,38 +171,221 @@ def validate_mongo_connection(mongo_uri):
     client.close()
 
 
+class MongoConnectionStats(object):
+    """Counters related to OpenPype mongo connections.
+
+    Counters are shared by all connections created by
+    'OpenPypeMongoConnection'.
+    """
+
+    _keys = (
+        "connections_created",
+        "validations",
+        "validation_failures",
+        "reconnects",
+        "pool_checkouts",
+        "pool_checkout_failures",
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._pool_wait_time = 0.0
+        self._pool_max_wait_time = 0.0
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._counters = {key: 0 for key in self._keys}
+            self._pool_wait_time = 0.0
+            self._pool_max_wait_time = 0.0
+
+    def increment(self, key, value=1):
+        with self._lock:
+            self._counters[key] += value
+
+    def add_pool_wait_time(self, wait_time):
+        with self._lock:
+            self._counters["pool_checkouts"] += 1
+            self._pool_wait_time += wait_time
+            if wait_time > self._pool_max_wait_time:
+                self._pool_max_wait_time = wait_time
+
+    def to_data(self):
+        """Current values of counters.
+
+        Returns:
+            dict[str, Union[int, float]]: Counters and pool wait times
+                in seconds.
+        """
+
+        with self._lock:
+            output = dict(self._counters)
+            output["pool_wait_time"] = self._pool_wait_time
+            output["pool_max_wait_time"] = self._pool_max_wait_time
+        return output
+
+
+class _PoolWaitTimeListener(monitoring.ConnectionPoolListener):
+    """Measure how long threads wait to get connection from pool."""
+
+    def __init__(self, stats):
+        self._stats = stats
+        self._thread_data = threading.local()
+
+    def connection_check_out_started(self, event):
+        self._thread_data.started = time.time()
+
+    def connection_checked_out(self, event):
+        started = getattr(self._thread_data, "started", None)
+        if started is not None:
+            self._thread_data.started = None
+            self._stats.add_pool_wait_time(time.time() - started)
+
+    def connection_check_out_failed(self, event):
+        self._thread_data.started = None
+        self._stats.increment("pool_checkout_failures")
+
+    def pool_created(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        pass
+
+    def connection_checked_in(self, event):
+        pass
+
+
+def _get_env_int(key, default=None):
+    value = os.environ.get(key)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
 class OpenPypeMongoConnection:
     """Singleton MongoDB connection.
 
     Keeps MongoDB connections by url.
+
+    Cached connection is validated with 'ping' command only when it was not
+    validated for 'validation_interval' seconds. Connection is recreated only
+    if the validation failed because server is not reachable. Pymongo client
+    is monitoring servers on its own and is reconnecting when needed, so the
+    validation is only a safety net.
+
+    Environment variables:
+        OPENPYPE_MONGO_VALIDATION_INTERVAL: Seconds between validations of
+            cached connection. Defaults to 60.
+        OPENPYPE_MONGO_MAX_POOL_SIZE: Maximum size of connection pool.
+        OPENPYPE_MONGO_MIN_POOL_SIZE: Minimum size of connection pool.
+        OPENPYPE_MONGO_WAIT_QUEUE_TIMEOUT: Milliseconds a thread waits for
+            a connection from the pool.
     """
 
     mongo_clients = {}
     log = logging.getLogger("OpenPypeMongoConnection")
+    stats = MongoConnectionStats()
+    default_validation_interval = 60
+
+    _last_validations = {}
+    _lock = threading.RLock()
+    _pool_listener = None
 
     @staticmethod
     def get_default_mongo_url():
         return os.environ["OPENPYPE_MONGO"]
 
+    @classmethod
+    def get_validation_interval(cls):
+        return _get_env_int(
+            "OPENPYPE_MONGO_VALIDATION_INTERVAL",
+            cls.default_validation_interval
+        )
+
+    @classmethod
+    def get_stats(cls):
+        """Counters of validations, reconnects and connection pool waiting.
+
+        Returns:
+            dict[str, Union[int, float]]: Current counters.
+        """
+
+        return cls.stats.to_data()
+
+    @classmethod
+    def _get_pool_listener(cls):
+        if cls._pool_listener is None:
+            cls._pool_listener = _PoolWaitTimeListener(cls.stats)
+        return cls._pool_listener
+
+    @classmethod
+    def _validate_client(cls, mongo_url, connection):
+        """Validate cached connection if validation interval passed.
+
+        Returns:
+            bool: Connection can be used.
+        """
+
+        last_validation = cls._last_validations.get(mongo_url)
+        if (
+            last_validation is not None
+            and time.time() - last_validation < cls.get_validation_interval()
+        ):
+            return True
+
+        cls.stats.increment("validations")
+        try:
+            connection.admin.command("ping")
+
+        except (
+            pymongo.errors.AutoReconnect,
+            pymongo.errors.ServerSelectionTimeoutError
+        ):
+            cls.stats.increment("validation_failures")
+            cls.log.warning(
+                "Connection to {} is not responding".format(mongo_url),
+                exc_info=True
+            )
+            return False
+
+        cls._last_validations[mongo_url] = time.time()
+        return True
+
     @classmethod
     def get_mongo_client(cls, mongo_url=None):
         if mongo_url is None:
             mongo_url = cls.get_default_mongo_url()
 
-        connection = cls.mongo_clients.get(mongo_url)
-        if connection:
-            # Naive validation of existing connection
-            try:
-                connection.server_info()
-                with connection.start_session():
-                    pass
-            except Exception:
-                connection = None
+        with cls._lock:
+            connection = cls.mongo_clients.get(mongo_url)
+            if connection is not None:
+                if cls._validate_client(mongo_url, connection):
+                    return connection
+
+                cls.stats.increment("reconnects")
+                cls.mongo_clients.pop(mongo_url, None)
+                connection.close()
 
-        if not connection:
             cls.log.debug("Creating mongo connection to {}".format(mongo_url))
             connection = cls.create_connection(mongo_url)
             cls.mongo_clients[mongo_url] = connection
+            cls._last_validations[mongo_url] = time.time()
 
         return connection
 
@@ -218,8 +403,18 @@ class OpenPypeMongoConnection:
             timeout = int(os.environ.get("AVALON_TIMEOUT") or 1000)
 
         kwargs = {
-            "serverSelectionTimeoutMS": timeout
+            "serverSelectionTimeoutMS": timeout,
+            "event_listeners": [cls._get_pool_listener()]
         }
+        for env_key, kwarg_key in (
+            ("OPENPYPE_MONGO_MAX_POOL_SIZE", "maxPoolSize"),
+            ("OPENPYPE_MONGO_MIN_POOL_SIZE", "minPoolSize"),
+            ("OPENPYPE_MONGO_WAIT_QUEUE_TIMEOUT", "waitQueueTimeoutMS"),
+        ):
+            value = _get_env_int(env_key)
+            if value is not None:
+                kwargs[kwarg_key] = value
+
         if should_add_certificate_path_to_mongo_url(mongo_url):
             kwargs["ssl_ca_certs"] = certifi.where()
 
@@ -253,6 +448,8 @@ class OpenPypeMongoConnection:
         if not valid:
             raise last_exc
 
+        cls.stats.increment("connections_created")
+
         cls.log.info("Connected to {}, delay {:.3f}s".format(
             mongo_url, time.time() - t1
         ))
@@ -9,7 +9,14 @@ from bson.objectid import ObjectId
 from pymongo import DeleteOne, InsertOne, UpdateOne
 
 from .mongo import get_project_connection
-from .entities import get_project
+from .entities import (
+    SUBSET_LAST_VERSION_KEY,
+    get_project,
+    convert_id,
+    aggregate_last_versions,
+)
+from .entity_cache import invalidate_entity_cache
+from .indexes import ensure_project_indexes
 
 REMOVED_VALUE = object()
 
@@ -281,7 +288,7 @@ def new_workfile_info_doc(
     }
 
 
-def _prepare_update_data(old_doc, new_doc, replace):
+def _prepare_update_data(old_doc, new_doc, replace, keep_keys=None):
     changes = {}
     for key, value in new_doc.items():
         if key not in old_doc or value != old_doc[key]:
@@ -289,7 +296,7 @@ def _prepare_update_data(old_doc, new_doc, replace):
 
     if replace:
         for key in old_doc.keys():
-            if key not in new_doc:
+            if key not in new_doc and (not keep_keys or key not in keep_keys):
                 changes[key] = REMOVED_VALUE
     return changes
 
@@ -301,11 +308,16 @@ def prepare_subset_update_data(old_doc, new_doc, replace=True):
 
     Empty output means that documents are identical.
 
+    Last version stored on subset document is not removed on replace as it is
+    maintained by 'OperationsSession'.
+
     Returns:
         Dict[str, Any]: Changes between old and new document.
     """
 
-    return _prepare_update_data(old_doc, new_doc, replace)
+    return _prepare_update_data(
+        old_doc, new_doc, replace, (SUBSET_LAST_VERSION_KEY, )
+    )
 
 
 def prepare_version_update_data(old_doc, new_doc, replace=True):
@@ -663,14 +675,63 @@ class OperationsSession(object):
 
         for project_name, operations in operations_by_project.items():
             bulk_writes = []
+            entity_ids = set()
             for operation in operations:
                 mongo_op = operation.to_mongo_operation()
                 if mongo_op is not None:
                     bulk_writes.append(mongo_op)
+                    entity_ids.add(operation.entity_id)
 
-            if bulk_writes:
-                collection = get_project_connection(project_name)
+            if not bulk_writes:
+                continue
+
+            collection = get_project_connection(project_name)
+            # Subsets which may have changed last version
+            subset_ids = self._get_subset_ids_to_update(
+                collection, operations
+            )
+            try:
                 collection.bulk_write(bulk_writes)
+                if subset_ids:
+                    update_last_versions(project_name, subset_ids)
+            finally:
+                # Cached documents of changed entities are not valid anymore
+                invalidate_entity_cache(project_name, entity_ids | subset_ids)
+
+    @staticmethod
+    def _get_subset_ids_to_update(collection, operations):
+        subset_ids = set()
+        version_ids = set()
+        for operation in operations:
+            if operation.entity_type != "version":
+                continue
+
+            if isinstance(operation, CreateOperation):
+                subset_id = operation.data.get("parent")
+                if subset_id:
+                    subset_ids.add(convert_id(subset_id))
+
+            elif isinstance(operation, DeleteOperation):
+                version_ids.add(operation.entity_id)
+
+            elif any(
+                key in operation.update_data
+                for key in ("name", "parent", "type")
+            ):
+                version_ids.add(operation.entity_id)
+                subset_id = operation.update_data.get("parent")
+                if subset_id and subset_id is not REMOVED_VALUE:
+                    subset_ids.add(convert_id(subset_id))
+
+        # Parents of changed versions must be queried before the change
+        if version_ids:
+            for version_doc in collection.find(
+                {"_id": {"$in": list(version_ids)}},
+                {"parent": True}
+            ):
+                if version_doc.get("parent"):
+                    subset_ids.add(version_doc["parent"])
+        return subset_ids
 
     def create_entity(self, project_name, entity_type, data):
         """Fast access to 'CreateOperation'.
@@ -708,6 +769,67 @@ class OperationsSession(object):
         return operation
 
 
+def update_last_versions(project_name, subset_ids):
+    """Recalculate last version stored on subset documents.
+
+    Subset documents have stored id and name of their last version so it is
+    not needed to find them with aggregation of all versions. Value is updated
+    by 'OperationsSession.commit' when versions are created or removed.
+
+    Args:
+        project_name (str): Name of project.
+        subset_ids (Iterable[Union[str, ObjectId]]): Ids of subsets to update.
+    """
+
+    subset_ids = {convert_id(subset_id) for subset_id in subset_ids}
+    if not subset_ids:
+        return
+
+    last_versions = aggregate_last_versions(project_name, subset_ids)
+    _write_last_versions(project_name, subset_ids, last_versions)
+
+
+def rebuild_last_versions(project_name):
+    """Recalculate last version stored on all subsets of a project.
+
+    Should be used to create the values for existing projects or to repair
+    them if versions were changed without 'OperationsSession'.
+
+    Args:
+        project_name (str): Name of project.
+
+    Returns:
+        int: Number of subsets with last version.
+    """
+
+    collection = get_project_connection(project_name)
+    subset_ids = {
+        subset_doc["_id"]
+        for subset_doc in collection.find({"type": "subset"}, {"_id": True})
+    }
+    last_versions = aggregate_last_versions(project_name)
+    _write_last_versions(project_name, subset_ids, last_versions)
+    invalidate_entity_cache(project_name, subset_ids)
+    return len(last_versions)
+
+
+def _write_last_versions(project_name, subset_ids, last_versions):
+    bulk_writes = []
+    for subset_id in subset_ids:
+        last_version = last_versions.get(subset_id)
+        if last_version is None:
+            change = {"$unset": {SUBSET_LAST_VERSION_KEY: True}}
+        else:
+            change = {"$set": {SUBSET_LAST_VERSION_KEY: last_version}}
+        bulk_writes.append(
+            UpdateOne({"_id": subset_id, "type": "subset"}, change)
+        )
+
+    collection = get_project_connection(project_name)
+    for idx in range(0, len(bulk_writes), 1000):
+        collection.bulk_write(bulk_writes[idx:idx + 1000], ordered=False)
+
+
 def create_project(project_name, project_code, library_project=False):
     """Create project using OpenPype settings.
 
@@ -764,6 +886,8 @@ def create_project(project_name, project_code, library_project=False):
     )
     op_session.commit()
 
+    ensure_project_indexes(project_name)
+
     # Load ProjectSettings for the project and save it to store all attributes
     #   and Anatomy
     try:
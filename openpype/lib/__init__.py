@@ -67,6 +67,10 @@ from .log import (
     Logger,
     PypeLogger,
 )
+from .process_scheduler import (
+    ProcessScheduler,
+    get_image_job_memory,
+)
 
 from .path_templates import (
     merge_dict,
@@ -99,6 +103,7 @@ from .python_module_tools import (
 
 from .profiles_filtering import (
     compile_list_of_regexes,
+    ProfileIndex,
     filter_profiles
 )
 
@@ -216,6 +221,9 @@ __all__ = [
     "path_to_subprocess_arg",
     "CREATE_NO_WINDOW",
 
+    "ProcessScheduler",
+    "get_image_job_memory",
+
     "env_value_to_bool",
     "get_paths_from_environ",
 
@@ -294,6 +302,7 @@ __all__ = [
 
     "compile_list_of_regexes",
 
+    "ProfileIndex",
     "filter_profiles",
 
     "TaskNotSetError",
@@ -5,6 +5,9 @@ import copy
 import inspect
 import logging
 import weakref
+import operator
+import contextlib
+import collections
 from uuid import uuid4
 try:
     from weakref import WeakMethod
@@ -16,6 +19,16 @@ class MissingEventSystem(Exception):
     pass
 
 
+def _compile_topic_regex(topic):
+    """Compile regex for topic where '*' means "any characters"."""
+    return re.compile("^{}$".format(
+        ".+".join(
+            re.escape(part)
+            for part in topic.split("*")
+        )
+    ))
+
+
 class EventCallback(object):
     """Callback registered to a topic.
 
@@ -54,14 +67,7 @@ class EventCallback(object):
         #   - it is possible to register to a partial topis 'my.event.*'
         #       - it will receive all matching event topics
         #           e.g. 'my.event.start' and 'my.event.end'
-        topic_regex_str = "^{}$".format(
-            ".+".join(
-                re.escape(part)
-                for part in topic.split("*")
-            )
-        )
-        topic_regex = re.compile(topic_regex_str)
-        self._topic_regex = topic_regex
+        self._topic_regex = _compile_topic_regex(topic)
 
         # Convert callback into references
         #   - deleted functions won't cause crashes
@@ -134,6 +140,11 @@ class EventCallback(object):
             self._log = logging.getLogger(self.__class__.__name__)
         return self._log
 
+    @property
+    def topic(self):
+        """Topic to which is callback registered."""
+        return self._topic
+
     @property
     def is_ref_valid(self):
         return self._ref_valid
@@ -171,6 +182,9 @@ class EventCallback(object):
             event(Event): Event that was triggered.
         """
 
+        self._process_event(event, True)
+
+    def _process_event(self, event, check_topic):
         # Skip if callback is not enabled or has invalid reference
         if not self._ref_valid or not self._enabled:
             return
@@ -182,7 +196,7 @@ class EventCallback(object):
             # Change state if is invalid so the callback is removed
             self._ref_valid = False
 
-        elif self.topic_matches(event.topic):
+        elif not check_topic or self.topic_matches(event.topic):
             # Try execute callback
             try:
                 if self._expect_args:
@@ -311,6 +325,16 @@ class Event(object):
         return obj
 
 
+class _TopicTrieNode(object):
+    """Node of trie with wildcard callbacks by segments of topic."""
+
+    __slots__ = ("children", "callbacks")
+
+    def __init__(self):
+        self.children = {}
+        self.callbacks = []
+
+
 class EventSystem(object):
     """Encapsulate event handling into an object.
 
@@ -318,11 +342,25 @@ class EventSystem(object):
     so it is possible to create mutltiple independent systems that have their
     topics and callbacks.
 
+    Callbacks are indexed by topic so emitted event does not have to check
+    all registered callbacks. Callbacks with topic without '*' are found by
+    exact topic, callbacks with wildcard are stored in trie by segments
+    (separated by '.') of topic before first '*'. Callbacks are triggered
+    in order of registration.
 
+    Callbacks with invalid reference are removed lazily when are found
+    during emit.
     """
 
     def __init__(self):
-        self._registered_callbacks = []
+        # Registration order of callbacks
+        self._callbacks_counter = 0
+        # Callbacks by exact topic
+        self._exact_callbacks = {}
+        # Trie of wildcard callbacks
+        self._wildcard_root = _TopicTrieNode()
+        # Stack of topics regexes and events which are coalesced
+        self._coalesce_stack = []
 
     def add_callback(self, topic, callback):
         """Register callback in event system.
@@ -338,7 +376,22 @@ class EventSystem(object):
         """
 
         callback = EventCallback(topic, callback)
-        self._registered_callbacks.append(callback)
+        self._callbacks_counter += 1
+        item = (self._callbacks_counter, callback)
+        if "*" not in topic:
+            self._exact_callbacks.setdefault(topic, []).append(item)
+            return callback
+
+        node = self._wildcard_root
+        # Only full segments before first '*' are used in trie, rest of
+        #   topic is validated by regex of callback
+        for segment in topic.split("*", 1)[0].split(".")[:-1]:
+            child = node.children.get(segment)
+            if child is None:
+                child = _TopicTrieNode()
+                node.children[segment] = child
+            node = child
+        node.callbacks.append(item)
         return callback
 
     def create_event(self, topic, data, source):
@@ -373,6 +426,77 @@ class EventSystem(object):
         event.emit()
         return event
 
+    @contextlib.contextmanager
+    def coalesce_events(self, topics):
+        """Coalesce events with passed topics emitted in the block.
+
+        Only last event of each topic and source is emitted at the end of
+        the block, in order in which were last emitted. Events with other
+        topics are emitted immediately. Can be used for high frequency
+        events where only last value matters (e.g. progress changes).
+
+        Example:
+            >>> with event_system.coalesce_events(["publish.progress.*"]):
+            ...     for idx in range(100):
+            ...         event_system.emit(
+            ...             "publish.progress.changed", {"value": idx}, None
+            ...         )
+
+        Args:
+            topics (Iterable[str]): Topics of events which are coalesced.
+                Topics may contain '*' same as topics of callbacks.
+        """
+
+        topic_regexes = [_compile_topic_regex(topic) for topic in topics]
+        pending = collections.OrderedDict()
+        level = (topic_regexes, pending)
+        self._coalesce_stack.append(level)
+        try:
+            yield
+        finally:
+            self._coalesce_stack[:] = [
+                item
+                for item in self._coalesce_stack
+                if item is not level
+            ]
+            for event in pending.values():
+                self.emit_event(event)
+
+    def _coalesce_event(self, event):
+        for topic_regexes, pending in reversed(self._coalesce_stack):
+            for topic_regex in topic_regexes:
+                if topic_regex.match(event.topic):
+                    # Move key to the end (can't use 'move_to_end' in py 2)
+                    key = (event.topic, event.source)
+                    pending.pop(key, None)
+                    pending[key] = event
+                    return True
+        return False
+
+    def _get_topic_items(self, topic):
+        """Registered callbacks which may match topic.
+
+        Returns:
+            list[tuple[list, bool]]: Lists of callback items with
+                information if topic of callbacks must be validated.
+        """
+
+        output = []
+        exact_items = self._exact_callbacks.get(topic)
+        if exact_items:
+            output.append((exact_items, False))
+
+        node = self._wildcard_root
+        if node.callbacks:
+            output.append((node.callbacks, True))
+        for segment in topic.split("."):
+            node = node.children.get(segment)
+            if node is None:
+                break
+            if node.callbacks:
+                output.append((node.callbacks, True))
+        return output
+
     def emit_event(self, event):
         """Emit event object.
 
@@ -380,14 +504,43 @@ class EventSystem(object):
             event (Event): Prepared event with topic and data.
         """
 
-        invalid_callbacks = []
-        for callback in self._registered_callbacks:
-            callback.process_event(event)
-            if not callback.is_ref_valid:
-                invalid_callbacks.append(callback)
+        if self._coalesce_stack and self._coalesce_event(event):
+            return
+
+        topic = event.topic
+        topic_items = self._get_topic_items(topic)
+        if not topic_items:
+            return
+
+        to_process = []
+        for items, is_wildcard in topic_items:
+            for item in items:
+                if not is_wildcard or item[1].topic_matches(topic):
+                    to_process.append(item)
 
-        for callback in invalid_callbacks:
-            self._registered_callbacks.remove(callback)
+        if len(topic_items) > 1:
+            to_process.sort(key=operator.itemgetter(0))
+
+        has_invalid = False
+        for _, callback in to_process:
+            callback._process_event(event, False)
+            if not callback.is_ref_valid:
+                has_invalid = True
+
+        if has_invalid:
+            self._remove_invalid_callbacks(topic, topic_items)
+
+    def _remove_invalid_callbacks(self, topic, topic_items):
+        # Lists are modified in place so they are still available in trie
+        for items, _ in topic_items:
+            items[:] = [
+                item
+                for item in items
+                if item[1].is_ref_valid
+            ]
+
+        if not self._exact_callbacks.get(topic, True):
+            self._exact_callbacks.pop(topic)
 
 
 class GlobalEventSystem:
@@ -4,6 +4,7 @@ import subprocess
 import platform
 import json
 import tempfile
+import threading
 
 from .log import Logger
 from .vendor_bin_utils import find_executable
@@ -13,6 +14,21 @@ from .openpype_version import is_running_from_build
 # MSDN process creation flag (Windows only)
 CREATE_NO_WINDOW = 0x08000000
 
+# Processes started by 'run_subprocess' are reported to callback stored
+#   per thread (used by 'ProcessScheduler' to terminate running processes)
+_thread_data = threading.local()
+
+
+def set_subprocess_callback(callback):
+    """Set callback called with each process started in current thread.
+
+    Args:
+        callback (Union[Callable[[subprocess.Popen], None], None]): Callback
+            or None to unset it.
+    """
+
+    _thread_data.process_callback = callback
+
 
 def execute(args,
             silent=False,
@@ -100,6 +116,28 @@ def run_subprocess(*args, **kwargs):
             return code.
     """
 
+    kwargs, logger = _prepare_subprocess_kwargs(kwargs)
+
+    proc = subprocess.Popen(*args, **kwargs)
+    callback = getattr(_thread_data, "process_callback", None)
+    if callback is not None:
+        callback(proc)
+
+    return _process_subprocess_output(proc, args, logger)
+
+
+def _prepare_subprocess_kwargs(kwargs):
+    """Prepare keyword arguments for Popen used in 'run_subprocess'.
+
+    Args:
+        kwargs (dict[str, Any]): Keyword arguments passed to
+            'run_subprocess'.
+
+    Returns:
+        tuple[dict[str, Any], logging.Logger]: Keyword arguments for Popen
+            and logger for output.
+    """
+
     # Modify creation flags on windows to hide console window if in UI mode
     if (
         platform.system().lower() == "windows"
@@ -132,7 +170,24 @@ def run_subprocess(*args, **kwargs):
     kwargs["stdin"] = kwargs.get("stdin", subprocess.PIPE)
     kwargs["env"] = filtered_env
 
-    proc = subprocess.Popen(*args, **kwargs)
+    return kwargs, logger
+
+
+def _process_subprocess_output(proc, args, logger):
+    """Wait for process started by 'run_subprocess' and log its output.
+
+    Args:
+        proc (subprocess.Popen): Started process.
+        args (tuple): Arguments used to start the process.
+        logger (logging.Logger): Logger for output.
+
+    Returns:
+        str: Full output of subprocess concatenated stdout and stderr.
+
+    Raises:
+        RuntimeError: Exception is raised if process finished with nonzero
+            return code.
+    """
 
     full_output = ""
     _stdout, _stderr = proc.communicate()
@@ -2,6 +2,8 @@ import os
 import logging
 import sys
 import errno
+import hashlib
+import threading
 import six
 
 from openpype.lib import create_hard_link
@@ -12,6 +14,21 @@ if sys.platform == "win32":
 else:
     from shutil import copyfile
 
+try:
+    from concurrent.futures import (
+        ThreadPoolExecutor,
+        wait as wait_futures,
+        FIRST_EXCEPTION
+    )
+except ImportError:
+    # Python 2 without 'futures' backport - transfers are sequential
+    ThreadPoolExecutor = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 
 class DuplicateDestinationError(ValueError):
     """Error raised when transfer destination already exists in queue.
@@ -23,6 +40,10 @@ class DuplicateDestinationError(ValueError):
     """
 
 
+class FileVerificationError(IOError):
+    """Error raised when transferred file does not match the source file."""
+
+
 class FileTransaction(object):
     """File transaction with rollback options.
 
@@ -49,16 +70,61 @@ class FileTransaction(object):
 
     Warning:
         Any folders created during the transfer will not be removed.
+
+    Backups and transfers are processed in a pool of threads. Number of
+    threads can be changed with 'max_workers' argument or with environment
+    variable 'OPENPYPE_FILE_TRANSACTION_WORKERS', value '1' disables
+    parallel processing.
+
+    Args:
+        log (Optional[logging.Logger]): Logger used for output.
+        allow_queue_replacements (Optional[bool]): Allow to replace source
+            of already queued destination.
+        max_workers (Optional[int]): Maximum number of threads used
+            for transfers.
+        verify (Optional[str]): Verify copied files. Can be 'VERIFY_SIZE'
+            to compare file sizes or 'VERIFY_CHECKSUM' to compare checksums
+            (xxhash is used if available).
+        progress_callback (Optional[Callable]): Called after each transfer
+            with source path, destination path, size of file in bytes,
+            number of finished transfers, number of all transfers and
+            number of transferred bytes.
     """
 
     MODE_COPY = 0
     MODE_HARDLINK = 1
-
-    def __init__(self, log=None, allow_queue_replacements=False):
+    # Try to create hardlink and copy the file if it's not possible
+    MODE_HARDLINK_OR_COPY = 2
+
+    VERIFY_SIZE = "size"
+    VERIFY_CHECKSUM = "checksum"
+
+    default_max_workers = 8
+
+    def __init__(
+        self,
+        log=None,
+        allow_queue_replacements=False,
+        max_workers=None,
+        verify=None,
+        progress_callback=None
+    ):
         if log is None:
             log = logging.getLogger("FileTransaction")
 
+        if max_workers is None:
+            max_workers = os.environ.get("OPENPYPE_FILE_TRANSACTION_WORKERS")
+            max_workers = int(max_workers or self.default_max_workers)
+
+        if verify not in (None, self.VERIFY_SIZE, self.VERIFY_CHECKSUM):
+            raise ValueError("Unknown verify mode \"{}\"".format(verify))
+
         self.log = log
+        self._max_workers = max(1, max_workers)
+        self._verify = verify
+        self._progress_callback = progress_callback
+        self._lock = threading.Lock()
+        self._progress = {"files": 0, "bytes": 0}
 
         # The transfer queue
         # todo: make this an actual FIFO queue?
@@ -78,7 +144,10 @@ class FileTransaction(object):
         Args:
             src (str): Source path.
             dst (str): Destination path.
-            mode (MODE_COPY, MODE_HARDLINK): Transfer mode.
+            mode (MODE_COPY, MODE_HARDLINK, MODE_HARDLINK_OR_COPY): Transfer
+                mode. 'MODE_HARDLINK_OR_COPY' creates hardlink and falls back
+                to copy if hardlink can't be created, e.g. when paths are
+                on different drives.
         """
 
         opts = {"mode": mode}
@@ -110,42 +179,169 @@ class FileTransaction(object):
         self._transfers[dst] = (src, opts)
 
     def process(self):
+        transfers = list(self._transfers.items())
+        same_paths = set()
+
         # Backup any existing files
-        for dst, (src, _) in self._transfers.items():
+        def _backup(dst, src):
             self.log.debug("Checking file ... {} -> {}".format(src, dst))
             path_same = self._same_paths(src, dst)
-            if path_same or not os.path.exists(dst):
-                continue
+            if path_same:
+                with self._lock:
+                    same_paths.add(dst)
+                return
+
+            if not os.path.exists(dst):
+                return
 
             # Backup original file
             # todo: add timestamp or uuid to ensure unique
             backup = dst + ".bak"
-            self._backup_to_original[backup] = dst
             self.log.debug(
                 "Backup existing file: {} -> {}".format(dst, backup))
             os.rename(dst, backup)
+            with self._lock:
+                self._backup_to_original[backup] = dst
 
-        # Copy the files to transfer
-        for dst, (src, opts) in self._transfers.items():
-            path_same = self._same_paths(src, dst)
-            if path_same:
+        self._run_tasks(
+            _backup,
+            [(dst, src) for dst, (src, _) in transfers]
+        )
+
+        to_transfer = []
+        for dst, (src, opts) in transfers:
+            if dst in same_paths:
                 self.log.debug(
                     "Source and destination are same files {} -> {}".format(
                         src, dst))
                 continue
+            to_transfer.append((src, dst, opts))
 
-            self._create_folder_for_file(dst)
+        # Create each destination folder only once
+        for dirname in sorted({
+            os.path.dirname(dst)
+            for _, dst, _ in to_transfer
+        }):
+            self._create_folder(dirname)
 
-            if opts["mode"] == self.MODE_COPY:
-                self.log.debug("Copying file ... {} -> {}".format(src, dst))
-                copyfile(src, dst)
-            elif opts["mode"] == self.MODE_HARDLINK:
+        # Copy the files to transfer
+        self._progress = {"files": 0, "bytes": 0}
+        total = len(to_transfer)
+        self._run_tasks(
+            lambda src, dst, opts: self._transfer_file(src, dst, opts, total),
+            to_transfer
+        )
+
+    def _run_tasks(self, func, args_list):
+        """Call function with each arguments in a pool of threads.
+
+        All started tasks are finished before first exception is re-raised
+        so state of transaction is known for rollback.
+        """
+
+        if (
+            ThreadPoolExecutor is None
+            or self._max_workers < 2
+            or len(args_list) < 2
+        ):
+            for args in args_list:
+                func(*args)
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(args_list))
+        )
+        try:
+            futures = [
+                executor.submit(func, *args)
+                for args in args_list
+            ]
+            wait_futures(futures, return_when=FIRST_EXCEPTION)
+            # Don't start new tasks if any of tasks failed
+            for future in futures:
+                future.cancel()
+        finally:
+            executor.shutdown(wait=True)
+
+        for future in futures:
+            if not future.cancelled() and future.exception() is not None:
+                future.result()
+
+    def _transfer_file(self, src, dst, opts, total):
+        mode = opts["mode"]
+        if mode == self.MODE_HARDLINK_OR_COPY:
+            try:
                 self.log.debug("Hardlinking file ... {} -> {}".format(
                     src, dst))
                 create_hard_link(src, dst)
+                mode = self.MODE_HARDLINK
+            except OSError as exc:
+                # Copy file if hardlink can't be created
+                # EXDEV - cross drive path
+                # EINVAL - wrong format, must be NTFS
+                if exc.errno not in (errno.EXDEV, errno.EINVAL):
+                    raise
+                mode = self.MODE_COPY
+                self.log.debug("Copying file ... {} -> {}".format(src, dst))
+                copyfile(src, dst)
+
+        elif mode == self.MODE_COPY:
+            self.log.debug("Copying file ... {} -> {}".format(src, dst))
+            copyfile(src, dst)
+
+        elif mode == self.MODE_HARDLINK:
+            self.log.debug("Hardlinking file ... {} -> {}".format(
+                src, dst))
+            create_hard_link(src, dst)
 
+        with self._lock:
             self._transferred.append(dst)
 
+        size = os.path.getsize(dst)
+        # Hardlink is the same file as source
+        if mode == self.MODE_COPY:
+            self._verify_file(src, dst, size)
+
+        with self._lock:
+            self._progress["files"] += 1
+            self._progress["bytes"] += size
+            files_done = self._progress["files"]
+            bytes_done = self._progress["bytes"]
+
+        if self._progress_callback is not None:
+            self._progress_callback(
+                src, dst, size, files_done, total, bytes_done
+            )
+
+    def _verify_file(self, src, dst, dst_size):
+        if self._verify is None:
+            return
+
+        if os.path.getsize(src) != dst_size:
+            raise FileVerificationError(
+                "Size of copied file does not match source: {} -> {}".format(
+                    src, dst))
+
+        if (
+            self._verify == self.VERIFY_CHECKSUM
+            and self._get_checksum(src) != self._get_checksum(dst)
+        ):
+            raise FileVerificationError(
+                "Checksum of copied file does not match source: {} -> {}"
+                .format(src, dst))
+
+    @staticmethod
+    def _get_checksum(path, chunk_size=1024 * 1024):
+        if xxhash is not None:
+            hasher = xxhash.xxh64()
+        else:
+            hasher = hashlib.sha1()
+
+        with open(path, "rb") as stream:
+            for chunk in iter(lambda: stream.read(chunk_size), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
     def finalize(self):
         # Delete any backed up files
         for backup in self._backup_to_original.keys():
@@ -196,7 +392,9 @@ class FileTransaction(object):
         return list(self._backup_to_original.keys())
 
     def _create_folder_for_file(self, path):
-        dirname = os.path.dirname(path)
+        self._create_folder(os.path.dirname(path))
+
+    def _create_folder(self, dirname):
         try:
             os.makedirs(dirname)
         except OSError as e:
@@ -24,6 +24,8 @@ import traceback
 import threading
 import copy
 
+from six.moves import queue
+
 from openpype.client.mongo import (
     MongoEnvNotSet,
     get_default_components,
@@ -41,6 +43,10 @@ except ImportError:
 # Check for `unicode` in builtins
 USE_UNICODE = hasattr(__builtins__, "unicode")
 
+# Markers used in queue of 'AsyncMongoHandler'
+_FLUSH_MARKER = object()
+_STOP_MARKER = object()
+
 
 class LogStreamHandler(logging.StreamHandler):
     """ StreamHandler class designed to handle utf errors in python 2.x hosts.
@@ -181,6 +187,283 @@ class MongoFormatter(logging.Formatter):
         return document
 
 
+class AsyncMongoHandler(logging.Handler):
+    """Handler storing log records to mongo in background thread.
+
+    Records are formatted to documents in thread which emitted the record
+    and added to queue. Documents are inserted with 'insert_many' by
+    background thread in batches when batch is full or after flush interval.
+
+    When queue is filled over sampling threshold only each n-th record with
+    level lower than WARNING is kept. Records are dropped when queue is full.
+    Information about dropped records is stored to mongo with next batch.
+
+    Queue is flushed on 'flush' and 'close' which is called on process exit
+    by 'logging.shutdown'.
+
+    Args:
+        get_collection (Callable[[], Collection]): Function returning mongo
+            collection where documents are stored. Called in background
+            thread.
+        batch_size (int): Maximum number of documents inserted at once.
+        flush_interval (float): Maximum number of seconds until queued
+            documents are inserted.
+        max_queue_size (int): Maximum number of documents in queue.
+        sample_rate (int): Each n-th record lower than WARNING is kept
+            when queue is filled over sampling threshold.
+        formatter (logging.Formatter): Formatter creating documents from
+            records. 'MongoFormatter' is used if not passed.
+    """
+
+    # Sampling starts when queue is filled over this ratio
+    sampling_threshold = 0.75
+
+    def __init__(
+        self,
+        get_collection,
+        batch_size=100,
+        flush_interval=1.0,
+        max_queue_size=10000,
+        sample_rate=10,
+        formatter=None,
+        level=logging.NOTSET
+    ):
+        super(AsyncMongoHandler, self).__init__(level)
+        if formatter is None:
+            formatter = MongoFormatter()
+        self.setFormatter(formatter)
+
+        self._get_collection = get_collection
+        self._collection = None
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._max_queue_size = max_queue_size
+        self._sample_rate = max(1, sample_rate)
+        self._sampling_size = int(max_queue_size * self.sampling_threshold)
+
+        self._queue = queue.Queue(max_queue_size)
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self._closed = False
+        self._stopped = False
+        self._sample_counter = 0
+
+        # Documents in queue or in batch which is being inserted
+        self._pending = 0
+        self._pending_cond = threading.Condition(threading.Lock())
+
+        self._written = 0
+        self._dropped = 0
+        self._sampled_out = 0
+        self._failed = 0
+        self._reported_dropped = 0
+        self._last_error = None
+
+    def get_metrics(self):
+        """Metrics of handler.
+
+        Returns:
+            dict[str, int]: Metrics with queue size, number of documents
+                waiting to be inserted, written, dropped because of full
+                queue, skipped by sampling and failed to be inserted.
+        """
+
+        with self._pending_cond:
+            pending = self._pending
+        return {
+            "queue_size": self._queue.qsize(),
+            "max_queue_size": self._max_queue_size,
+            "pending": pending,
+            "written": self._written,
+            "dropped": self._dropped,
+            "sampled_out": self._sampled_out,
+            "failed": self._failed,
+        }
+
+    def _start_thread(self):
+        with self._thread_lock:
+            if self._thread is not None or self._closed:
+                return
+            thread = threading.Thread(
+                target=self._run, name="AsyncMongoHandler"
+            )
+            # Process exit is not blocked, queue is flushed on
+            #   'logging.shutdown'
+            thread.daemon = True
+            thread.start()
+            self._thread = thread
+
+    def emit(self, record):
+        if self._closed:
+            return
+
+        if self._thread is None:
+            self._start_thread()
+
+        if (
+            record.levelno < logging.WARNING
+            and self._queue.qsize() >= self._sampling_size
+        ):
+            self._sample_counter += 1
+            if self._sample_counter % self._sample_rate:
+                self._sampled_out += 1
+                return
+
+        try:
+            document = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        with self._pending_cond:
+            self._pending += 1
+
+        try:
+            self._queue.put_nowait(document)
+        except queue.Full:
+            self._dropped += 1
+            self._remove_pending(1)
+
+    def _remove_pending(self, count):
+        with self._pending_cond:
+            self._pending -= count
+            if self._pending <= 0:
+                self._pending_cond.notify_all()
+
+    def _put_marker(self, marker, timeout):
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            pass
+
+    def flush(self, timeout=5.0):
+        """Wait until queued documents are inserted.
+
+        Args:
+            timeout (float): Maximum number of seconds to wait.
+        """
+
+        if self._thread is None or not self._thread.is_alive():
+            return
+
+        # Wake up background thread so queued documents are written
+        #   without waiting for flush interval
+        self._put_marker(_FLUSH_MARKER, timeout)
+        end_time = time.time() + timeout
+        with self._pending_cond:
+            while self._pending > 0:
+                remainder = end_time - time.time()
+                if remainder <= 0:
+                    break
+                self._pending_cond.wait(remainder)
+
+    def close(self):
+        """Flush queue and stop background thread."""
+        if not self._closed:
+            self.flush()
+            self._closed = True
+            thread = self._thread
+            if thread is not None and thread.is_alive():
+                self._put_marker(_STOP_MARKER, 1.0)
+                thread.join(1.0)
+        super(AsyncMongoHandler, self).close()
+
+    def _get_batch(self):
+        """Wait for documents from queue.
+
+        Returns:
+            Union[list[dict], None]: Documents to insert, None when thread
+                should stop.
+        """
+
+        document = self._queue.get()
+        if document is _STOP_MARKER:
+            return None
+        if document is _FLUSH_MARKER:
+            return []
+
+        batch = [document]
+        end_time = time.time() + self._flush_interval
+        while len(batch) < self._batch_size:
+            remainder = end_time - time.time()
+            try:
+                if remainder > 0:
+                    document = self._queue.get(timeout=remainder)
+                else:
+                    document = self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if document is _FLUSH_MARKER:
+                break
+
+            if document is _STOP_MARKER:
+                # Write current batch and stop
+                self._stopped = True
+                break
+            batch.append(document)
+        return batch
+
+    def _get_dropped_document(self):
+        dropped = self._dropped + self._sampled_out
+        count = dropped - self._reported_dropped
+        if count <= 0:
+            return None
+        self._reported_dropped = dropped
+        record = logging.LogRecord(
+            self.__class__.__name__,
+            logging.WARNING,
+            __file__,
+            0,
+            "{} log records were dropped because log queue was full".format(
+                count
+            ),
+            None,
+            None
+        )
+        try:
+            return self.format(record)
+        except Exception:
+            return None
+
+    def _write(self, documents):
+        dropped_document = self._get_dropped_document()
+        if dropped_document is not None:
+            documents.append(dropped_document)
+
+        try:
+            if self._collection is None:
+                self._collection = self._get_collection()
+            self._collection.insert_many(documents, ordered=False)
+            self._written += len(documents)
+            self._last_error = None
+
+        except Exception:
+            self._failed += len(documents)
+            error = traceback.format_exc()
+            # Print only first of the same errors
+            if error != self._last_error:
+                self._last_error = error
+                sys.stderr.write(
+                    "Failed to store logs to mongo.\n{}".format(error)
+                )
+
+    def _run(self):
+        while not self._stopped:
+            batch = self._get_batch()
+            if batch is None:
+                break
+
+            if not batch:
+                continue
+
+            count = len(batch)
+            try:
+                self._write(batch)
+            finally:
+                self._remove_pending(count)
+
+
 class Logger:
     DFT = '%(levelname)s >>> { %(name)s }: [ %(message)s ] '
     DBG = "  - { %(name)s }: [ %(message)s ] "
@@ -219,6 +502,9 @@ class Logger:
     # Logging level - OPENPYPE_LOG_LEVEL
     log_level = None
 
+    # Mongo handler shared by all loggers
+    _mongo_handler = None
+
     # Data same for all record documents
     process_data = None
     # Cached process name or ability to set different process name
@@ -237,7 +523,7 @@ class Logger:
         add_console_handler = True
 
         for handler in logger.handlers:
-            if isinstance(handler, MongoHandler):
+            if isinstance(handler, (AsyncMongoHandler, MongoHandler)):
                 add_mongo_handler = False
             elif isinstance(handler, LogStreamHandler):
                 add_console_handler = False
@@ -284,22 +570,29 @@ class Logger:
         if not cls.use_mongo_logging:
             return
 
-        components = get_default_components()
-        kwargs = {
-            "host": components["host"],
-            "database_name": cls.log_database_name,
-            "collection": cls.log_collection_name,
-            "username": components["username"],
-            "password": components["password"],
-            "capped": True,
-            "formatter": MongoFormatter()
-        }
-        if components["port"] is not None:
-            kwargs["port"] = int(components["port"])
-        if components["auth_db"]:
-            kwargs["authentication_db"] = components["auth_db"]
+        # Single handler is used for all loggers so there is only one
+        #   queue and background thread in process
+        if cls._mongo_handler is None:
+            cls._mongo_handler = AsyncMongoHandler(cls._get_log_collection)
+        return cls._mongo_handler
+
+    @classmethod
+    def _get_log_collection(cls):
+        client = cls.get_log_mongo_connection()
+        return client[cls.log_database_name][cls.log_collection_name]
+
+    @classmethod
+    def get_mongo_log_metrics(cls):
+        """Metrics of mongo logging.
+
+        Returns:
+            Union[dict[str, int], None]: Metrics of 'AsyncMongoHandler' or
+                None if mongo logging is not used.
+        """
 
-        return MongoHandler(**kwargs)
+        if cls._mongo_handler is None:
+            return None
+        return cls._mongo_handler.get_metrics()
 
     @classmethod
     def _get_console_handler(cls):
@@ -0,0 +1,260 @@
+"""Cache of metadata loaded from media files by ffprobe or oiiotool.
+
+Metadata are cached per file and kind of metadata. Cache key contains path,
+size and modification time of the file, so changed file is probed again.
+
+Cache is in-process LRU which can be extended by on-disk SQLite store
+shared by processes. Path to SQLite database can be defined with
+'OPENPYPE_MEDIA_METADATA_CACHE' environment variable. Metadata are stored
+to the database as JSON so only JSON serializable values are stored.
+"""
+
+import os
+import copy
+import json
+import sqlite3
+import threading
+import collections
+
+from .log import Logger
+
+MEDIA_METADATA_CACHE_ENV_KEY = "OPENPYPE_MEDIA_METADATA_CACHE"
+
+
+class MediaMetadataCache(object):
+    """Cache of media files metadata.
+
+    Args:
+        max_items (Optional[int]): Maximum number of items in memory.
+        db_path (Optional[str]): Path to SQLite database file.
+    """
+
+    def __init__(self, max_items=512, db_path=None):
+        self._max_items = max_items
+        self._items = collections.OrderedDict()
+        self._lock = threading.RLock()
+        self._db_path = db_path
+        self._connection = None
+        self._log = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @property
+    def log(self):
+        if self._log is None:
+            self._log = Logger.get_logger(self.__class__.__name__)
+        return self._log
+
+    @staticmethod
+    def get_file_key(path):
+        """File information used as part of cache key.
+
+        Args:
+            path (str): Path to file.
+
+        Returns:
+            Union[tuple[str, int, int], None]: Normalized path, size and
+                modification time in nanoseconds. None if file does not
+                exist.
+        """
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        mtime_ns = getattr(stat, "st_mtime_ns", None)
+        if mtime_ns is None:
+            mtime_ns = int(stat.st_mtime * 1000000000)
+        path = os.path.normpath(os.path.abspath(path))
+        return (path, stat.st_size, mtime_ns)
+
+    def get(self, kind, path):
+        """Cached metadata of a file.
+
+        Args:
+            kind (str): Kind of metadata e.g. 'ffprobe'.
+            path (str): Path to file.
+
+        Returns:
+            Union[Any, None]: Copy of cached metadata or None.
+        """
+
+        file_key = self.get_file_key(path)
+        if file_key is None:
+            return None
+
+        key = (kind, ) + file_key
+        with self._lock:
+            if key in self._items:
+                self.hits += 1
+                value = self._items.pop(key)
+                self._items[key] = value
+                return copy.deepcopy(value)
+
+            value = self._get_from_db(key)
+            if value is not None:
+                self.disk_hits += 1
+                self._set_item(key, value)
+                return copy.deepcopy(value)
+
+            self.misses += 1
+        return None
+
+    def set(self, kind, path, value):
+        """Store metadata of a file.
+
+        Args:
+            kind (str): Kind of metadata e.g. 'ffprobe'.
+            path (str): Path to file.
+            value (Any): Metadata of the file.
+        """
+
+        self.set_for_paths(kind, [path], value)
+
+    def set_for_paths(self, kind, paths, value):
+        """Store the same metadata for multiple files.
+
+        Can be used for files of an image sequence where only first file
+        was probed.
+
+        Args:
+            kind (str): Kind of metadata e.g. 'oiio_info'.
+            paths (Iterable[str]): Paths to files.
+            value (Any): Metadata of the files.
+        """
+
+        value = copy.deepcopy(value)
+        keys = []
+        for path in paths:
+            file_key = self.get_file_key(path)
+            if file_key is not None:
+                keys.append((kind, ) + file_key)
+
+        with self._lock:
+            for key in keys:
+                self._set_item(key, value)
+            self._store_to_db(keys, value)
+
+    def clear(self):
+        """Clear items in memory and reset counters."""
+
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+
+    def get_stats(self):
+        """Cache counters.
+
+        Returns:
+            dict[str, int]: Number of hits, disk hits, misses and items.
+        """
+
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "items": len(self._items),
+            }
+
+    def _set_item(self, key, value):
+        self._items.pop(key, None)
+        self._items[key] = value
+        while len(self._items) > self._max_items:
+            self._items.popitem(last=False)
+
+    def _get_connection(self):
+        if not self._db_path:
+            return None
+
+        if self._connection is None:
+            try:
+                connection = sqlite3.connect(
+                    self._db_path, check_same_thread=False
+                )
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS metadata ("
+                    " kind TEXT, path TEXT, size INTEGER,"
+                    " mtime_ns INTEGER, data TEXT,"
+                    " PRIMARY KEY (kind, path))"
+                )
+                connection.commit()
+
+            except sqlite3.Error:
+                self.log.warning(
+                    "Failed to open metadata cache \"{}\"".format(
+                        self._db_path
+                    ),
+                    exc_info=True
+                )
+                self._db_path = None
+                return None
+            self._connection = connection
+        return self._connection
+
+    def _get_from_db(self, key):
+        connection = self._get_connection()
+        if connection is None:
+            return None
+
+        kind, path, size, mtime_ns = key
+        try:
+            row = connection.execute(
+                "SELECT data FROM metadata WHERE kind = ? AND path = ?"
+                " AND size = ? AND mtime_ns = ?",
+                (kind, path, size, mtime_ns)
+            ).fetchone()
+            if row is not None:
+                return json.loads(row[0])
+
+        except (sqlite3.Error, ValueError, TypeError):
+            self.log.debug("Failed to read metadata cache", exc_info=True)
+        return None
+
+    def _store_to_db(self, keys, value):
+        connection = self._get_connection()
+        if connection is None or not keys:
+            return
+
+        try:
+            data = json.dumps(value)
+        except (TypeError, ValueError):
+            self.log.debug(
+                "Metadata can't be stored to cache database", exc_info=True
+            )
+            return
+
+        try:
+            connection.executemany(
+                "INSERT OR REPLACE INTO metadata"
+                " (kind, path, size, mtime_ns, data) VALUES (?, ?, ?, ?, ?)",
+                [key + (data, ) for key in keys]
+            )
+            connection.commit()
+
+        except sqlite3.Error:
+            self.log.debug("Failed to write metadata cache", exc_info=True)
+
+
+_media_metadata_cache = None
+_media_metadata_cache_lock = threading.Lock()
+
+
+def get_media_metadata_cache():
+    """Cache of media metadata used by transcoding functions.
+
+    Returns:
+        MediaMetadataCache: Global cache object.
+    """
+
+    global _media_metadata_cache
+    if _media_metadata_cache is None:
+        with _media_metadata_cache_lock:
+            if _media_metadata_cache is None:
+                _media_metadata_cache = MediaMetadataCache(
+                    db_path=os.environ.get(MEDIA_METADATA_CACHE_ENV_KEY)
+                )
+    return _media_metadata_cache
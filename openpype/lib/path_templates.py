@@ -182,6 +182,30 @@ class StringTemplate(object):
         result.validate()
         return result
 
+    def format_many(self, data_list, strict=False):
+        """Fill the template with each item of data list.
+
+        Template parts are parsed only once on template creation so this is
+        cheaper than creating template object for each item (e.g. each frame
+        of a sequence).
+
+        Args:
+            data_list (Iterable[dict[str, Any]]): Formatting data items.
+            strict (Optional[bool]): Validate each result, unsolved template
+                raises 'TemplateUnsolved'.
+
+        Returns:
+            List[TemplateResult]: Result for each item of data list.
+        """
+
+        output = []
+        for data in data_list:
+            result = self.format(data)
+            if strict:
+                result.validate()
+            output.append(result)
+        return output
+
     @classmethod
     def format_template(cls, template, data):
         objected_template = cls(template)
@@ -341,9 +365,25 @@ class TemplatesDict(object):
 
         return output
 
+    def _prepare_format_data(self, in_data, only_keys=True):
+        # Formatting does not change the data so shallow copy is enough
+        data = dict(in_data)
+
+        # Add environment variable to data
+        if only_keys is False:
+            for key, val in os.environ.items():
+                env_key = "$" + key
+                if env_key not in data:
+                    data[env_key] = val
+        return data
+
     def format(self, in_data, only_keys=True, strict=True):
         """ Solves templates based on entered data.
 
+        Templates are filled lazily when their dictionary (e.g. "publish")
+        is accessed for the first time. Nested values of data should not be
+        changed until results are accessed.
+
         Args:
             data (dict): Containing keys to be filled into template.
             only_keys (bool, optional): Decides if environ will be used to
@@ -354,22 +394,65 @@ class TemplatesDict(object):
                 attribute set to True so accessing unfilled keys in templates
                 will raise exceptions with explaned error.
         """
-        # Create a copy of inserted data
-        data = copy.deepcopy(in_data)
 
-        # Add environment variable to data
-        if only_keys is False:
-            for key, val in os.environ.items():
-                env_key = "$" + key
-                if env_key not in data:
-                    data[env_key] = val
-
-        solved = self._solve_dict(self.objected_templates, data)
-
-        output = TemplatesResultDict(solved)
+        data = self._prepare_format_data(in_data, only_keys)
+        output = TemplatesResultDict(
+            self.objected_templates, fill_data=data
+        )
         output.strict = strict
         return output
 
+    def get_template_by_key(self, key):
+        """Template object by key.
+
+        Args:
+            key (Union[str, Iterable[str]]): Key of template. Nested keys
+                can be separated by dot (e.g. 'publish.path') or passed
+                as list.
+
+        Returns:
+            StringTemplate: Template object.
+
+        Raises:
+            TemplateMissingKey: Template under the key does not exist.
+        """
+
+        if isinstance(key, six.string_types):
+            keys = key.split(".")
+        else:
+            keys = list(key)
+
+        value = self.objected_templates
+        for idx, subkey in enumerate(keys):
+            if not isinstance(value, dict) or subkey not in value:
+                raise TemplateMissingKey(keys[:idx + 1])
+            value = value[subkey]
+
+        if not isinstance(value, StringTemplate):
+            raise TemplateMissingKey(keys)
+        return value
+
+    def format_many(self, data_list, key, strict=True):
+        """Fill one template with each item of data list.
+
+        Only the template under the key is filled, which is much cheaper
+        than using 'format' for each item when only one template is needed
+        e.g. for each frame of a sequence.
+
+        Args:
+            data_list (Iterable[dict[str, Any]]): Formatting data items.
+            key (Union[str, Iterable[str]]): Key of template e.g.
+                'publish.path' or '["publish", "path"]'.
+            strict (Optional[bool]): Validate each result, unsolved template
+                raises 'TemplateUnsolved'.
+
+        Returns:
+            List[TemplateResult]: Result for each item of data list.
+        """
+
+        template = self.get_template_by_key(key)
+        return template.format_many(data_list, strict)
+
 
 class TemplateResult(str):
     """Result of template format with most of information in.
@@ -446,28 +529,127 @@ class TemplateResult(str):
 
 
 class TemplatesResultDict(dict):
-    """Holds and wrap TemplateResults for easy bug report."""
+    """Holds and wrap TemplateResults for easy bug report.
 
-    def __init__(self, in_data, key=None, parent=None, strict=None):
-        super(TemplatesResultDict, self).__init__()
-        for _key, _value in in_data.items():
-            if isinstance(_value, dict):
-                _value = self.__class__(_value, _key, self)
-            self[_key] = _value
+    Values can be 'StringTemplate' objects if 'fill_data' are passed. Such
+    templates are filled when their dictionary is accessed from parent
+    dictionary or using its methods, so only templates of used dictionaries
+    are filled. Plain copy or iteration does not raise on unsolved
+    templates, only access of unsolved key does in strict mode.
+
+    Args:
+        in_data (dict[str, Any]): Results or templates.
+        key (Optional[str]): Key of this dictionary in parent.
+        parent (Optional[TemplatesResultDict]): Parent result dictionary.
+        strict (Optional[bool]): Raise exception on access of unsolved
+            template.
+        fill_data (Optional[dict[str, Any]]): Data used to fill templates.
+            Children use data of their parent.
+    """
 
+    def __init__(
+        self, in_data, key=None, parent=None, strict=None, fill_data=None
+    ):
+        super(TemplatesResultDict, self).__init__()
         self.key = key
         self.parent = parent
         self.strict = strict
         if self.parent is None and strict is None:
             self.strict = True
+        self._fill_data = fill_data
+        self._has_unsolved_templates = False
+
+        for _key, _value in in_data.items():
+            if isinstance(_value, dict):
+                _value = self.__class__(_value, _key, self)
+            elif isinstance(_value, StringTemplate):
+                self._has_unsolved_templates = True
+            super(TemplatesResultDict, self).__setitem__(_key, _value)
+
+        # Templates of root are filled immediately, children are filled
+        #   when are accessed
+        if self.parent is None:
+            self._solve_templates()
+
+    def _get_fill_data(self):
+        if self._fill_data is not None or self.parent is None:
+            return self._fill_data
+        return self.parent._get_fill_data()
+
+    def _solve_templates(self):
+        """Fill all templates of this dictionary (not of children)."""
+        if not self._has_unsolved_templates:
+            return
+
+        fill_data = self._get_fill_data()
+        if fill_data is None:
+            return
+
+        for key, value in tuple(super(TemplatesResultDict, self).items()):
+            if isinstance(value, StringTemplate):
+                super(TemplatesResultDict, self).__setitem__(
+                    key, value.format(fill_data)
+                )
+        self._has_unsolved_templates = False
+
+    def _solve_children(self):
+        """Fill templates of this dictionary and of children dictionaries.
+
+        Children are filled before they're returned so their plain copy
+        contains filled templates.
+        """
+        self._solve_templates()
+        for value in super(TemplatesResultDict, self).values():
+            if isinstance(value, TemplatesResultDict):
+                value._solve_templates()
+
+    def _get_value(self, key):
+        self._solve_templates()
+        value = super(TemplatesResultDict, self).__getitem__(key)
+        if isinstance(value, TemplatesResultDict):
+            value._solve_templates()
+        return value
+
+    def __repr__(self):
+        self._solve_children()
+        return super(TemplatesResultDict, self).__repr__()
+
+    def __eq__(self, other):
+        self._solve_children()
+        return super(TemplatesResultDict, self).__eq__(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def values(self):
+        self._solve_children()
+        return super(TemplatesResultDict, self).values()
+
+    def items(self):
+        self._solve_children()
+        return super(TemplatesResultDict, self).items()
+
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+        return self._get_value(key)
+
+    def pop(self, key, *args):
+        if key in self:
+            self._get_value(key)
+        return super(TemplatesResultDict, self).pop(key, *args)
+
+    def copy(self):
+        self._solve_children()
+        return dict(super(TemplatesResultDict, self).items())
 
     def __getitem__(self, key):
-        if key not in self.keys():
+        if key not in self:
             hier = self.hierarchy()
             hier.append(key)
             raise TemplateMissingKey(hier)
 
-        value = super(TemplatesResultDict, self).__getitem__(key)
+        value = self._get_value(key)
         if isinstance(value, self.__class__):
             return value
 
@@ -703,6 +885,16 @@ class FormattingPart:
     """
     def __init__(self, template):
         self._template = template
+        # Parse the key once so formatting of the same template with
+        #   different data does not have to use regex on each call
+        key = template[1:-1]
+        existence_check = key
+        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
+        if key_padding:
+            existence_check = key_padding[0]
+        self._key = key
+        self._existence_check = existence_check
+        self._key_subdict = tuple(SUB_DICT_PATTERN.findall(existence_check))
 
     @property
     def template(self):
@@ -732,17 +924,14 @@ class FormattingPart:
             data(dict): Data that should be used for formatting.
             result(TemplatePartResult): Object where result is stored.
         """
-        key = self.template[1:-1]
+        key = self._key
         if key in result.realy_used_values:
             result.add_output(result.realy_used_values[key])
             return result
 
         # check if key expects subdictionary keys (e.g. project[name])
-        existence_check = key
-        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
-        if key_padding:
-            existence_check = key_padding[0]
-        key_subdict = list(SUB_DICT_PATTERN.findall(existence_check))
+        existence_check = self._existence_check
+        key_subdict = self._key_subdict
 
         value = data
         missing_key = False
@@ -0,0 +1,282 @@
+"""Concurrent execution of local jobs with limited resources.
+
+Scheduler is meant for publish plugins which call multiple ffmpeg or
+oiiotool processes. Jobs are started in order of submission when there is
+free worker and enough memory for the job. When any job fails, jobs which
+did not start yet are cancelled and running processes are terminated.
+
+```python
+from openpype.lib import ProcessScheduler
+
+with ProcessScheduler(logger=log) as scheduler:
+    for args in commands:
+        scheduler.submit_subprocess(args, memory=512 * 1024 * 1024)
+# All jobs are finished, first error is raised if any job failed
+```
+"""
+
+import os
+import threading
+import multiprocessing
+
+from .log import Logger
+from .execute import run_subprocess, set_subprocess_callback
+
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_FINISHED = "finished"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+
+def get_image_job_memory(width, height, channels=4, buffered_frames=8):
+    """Estimate memory used by job processing image with a resolution.
+
+    Estimation expects float pixels and few frames held in memory at once.
+
+    Args:
+        width (int): Width of image.
+        height (int): Height of image.
+        channels (Optional[int]): Number of channels.
+        buffered_frames (Optional[int]): Number of frames in memory.
+
+    Returns:
+        int: Estimated memory in bytes.
+    """
+
+    return int(width) * int(height) * channels * 4 * buffered_frames
+
+
+class ScheduledJob(object):
+    """Job added to 'ProcessScheduler'.
+
+    Args:
+        func (Callable): Function executed by job.
+        args (Iterable[Any]): Positional arguments for the function.
+        kwargs (dict[str, Any]): Keyword arguments for the function.
+        memory (int): Estimated memory used by job in bytes.
+        label (str): Label used in logs.
+    """
+
+    def __init__(self, func, args, kwargs, memory, label):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.memory = memory
+        self.label = label
+        self.state = JOB_PENDING
+        self.result = None
+        self.error = None
+        self._processes = []
+
+    def __repr__(self):
+        return "<{} {} ({})>".format(
+            self.__class__.__name__, self.label, self.state
+        )
+
+    @property
+    def done(self):
+        return self.state in (JOB_FINISHED, JOB_FAILED, JOB_CANCELLED)
+
+    def add_process(self, proc):
+        self._processes.append(proc)
+
+    def terminate(self):
+        """Terminate processes started by job which are still running."""
+
+        for proc in self._processes:
+            if proc.poll() is None:
+                try:
+                    proc.terminate()
+                except OSError:
+                    pass
+
+
+class ProcessScheduler(object):
+    """Run jobs concurrently with limited number of workers and memory.
+
+    Number of workers can be defined with 'OPENPYPE_PROCESS_WORKERS'
+    environment variable, number of cores is used by default. Available
+    memory is used as memory limit if 'psutil' is available. Job which needs
+    more memory than is the limit is started when no other job is running.
+
+    Args:
+        max_workers (Optional[int]): Maximum number of running jobs.
+        max_memory (Optional[int]): Memory limit in bytes of running jobs.
+        logger (Optional[logging.Logger]): Logger used for output.
+    """
+
+    def __init__(self, max_workers=None, max_memory=None, logger=None):
+        if max_workers is None:
+            max_workers = os.environ.get("OPENPYPE_PROCESS_WORKERS")
+            if max_workers:
+                max_workers = int(max_workers)
+            else:
+                max_workers = multiprocessing.cpu_count()
+
+        if max_memory is None:
+            try:
+                import psutil
+
+                max_memory = psutil.virtual_memory().available
+            except ImportError:
+                pass
+
+        if logger is None:
+            logger = Logger.get_logger(self.__class__.__name__)
+
+        self._max_workers = max(1, max_workers)
+        self._max_memory = max_memory
+        self._log = logger
+        self._lock = threading.Condition()
+        self._jobs = []
+        self._pending = []
+        self._running = []
+        self._error_job = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        if exc_type is not None:
+            self.cancel()
+        self.wait(raise_error=exc_type is None)
+
+    @property
+    def jobs(self):
+        return list(self._jobs)
+
+    def submit(self, func, args=None, kwargs=None, memory=None, label=None):
+        """Add job to scheduler.
+
+        Processes started by 'run_subprocess' in the function are terminated
+        if other job fails.
+
+        Args:
+            func (Callable): Function executed by job.
+            args (Optional[Iterable[Any]]): Positional arguments.
+            kwargs (Optional[dict[str, Any]]): Keyword arguments.
+            memory (Optional[int]): Estimated memory used by job in bytes.
+            label (Optional[str]): Label used in logs.
+
+        Returns:
+            ScheduledJob: Added job.
+        """
+
+        if label is None:
+            label = getattr(func, "__name__", str(func))
+        job = ScheduledJob(
+            func, args or (), kwargs or {}, memory or 0, label
+        )
+        with self._lock:
+            self._jobs.append(job)
+            if self._error_job is not None:
+                job.state = JOB_CANCELLED
+                return job
+            self._pending.append(job)
+            self._start_jobs()
+        return job
+
+    def submit_subprocess(self, args, memory=None, label=None, **kwargs):
+        """Add job running 'run_subprocess' with passed arguments.
+
+        Args:
+            args (Union[str, list[str]]): Arguments for subprocess.
+            memory (Optional[int]): Estimated memory used by job in bytes.
+            label (Optional[str]): Label used in logs.
+            **kwargs: Keyword arguments for 'run_subprocess'.
+
+        Returns:
+            ScheduledJob: Added job. Output of process is stored
+                to 'result'.
+        """
+
+        if label is None:
+            label = args if isinstance(args, str) else " ".join(args)
+        kwargs.setdefault("logger", self._log)
+        return self.submit(run_subprocess, (args, ), kwargs, memory, label)
+
+    def cancel(self):
+        """Cancel pending jobs and terminate running processes."""
+
+        with self._lock:
+            for job in self._pending:
+                job.state = JOB_CANCELLED
+            self._pending = []
+            for job in self._running:
+                job.terminate()
+            self._lock.notify_all()
+
+    def wait(self, raise_error=True):
+        """Wait until all jobs are done.
+
+        Args:
+            raise_error (Optional[bool]): Raise error of first failed job.
+
+        Returns:
+            list[ScheduledJob]: All jobs of scheduler.
+
+        Raises:
+            Exception: Error of first failed job.
+        """
+
+        with self._lock:
+            while self._pending or self._running:
+                self._lock.wait()
+            error_job = self._error_job
+
+        if raise_error and error_job is not None:
+            raise error_job.error
+        return self.jobs
+
+    def _can_start(self, job):
+        if len(self._running) >= self._max_workers:
+            return False
+
+        if not self._running or self._max_memory is None:
+            return True
+
+        used_memory = sum(running.memory for running in self._running)
+        return used_memory + job.memory <= self._max_memory
+
+    def _start_jobs(self):
+        # Jobs are started in order of submission
+        while self._pending and self._can_start(self._pending[0]):
+            job = self._pending.pop(0)
+            job.state = JOB_RUNNING
+            self._running.append(job)
+            thread = threading.Thread(target=self._run_job, args=(job, ))
+            thread.daemon = True
+            thread.start()
+
+    def _run_job(self, job):
+        self._log.debug("Starting job: {}".format(job.label))
+        set_subprocess_callback(job.add_process)
+        try:
+            job.result = job.func(*job.args, **job.kwargs)
+            state = JOB_FINISHED
+
+        except Exception as exc:
+            job.error = exc
+            state = JOB_FAILED
+
+        finally:
+            set_subprocess_callback(None)
+
+        with self._lock:
+            job.state = state
+            self._running.remove(job)
+            if state == JOB_FAILED and self._error_job is None:
+                self._log.warning(
+                    "Job failed: {}".format(job.label), exc_info=job.error
+                )
+                self._error_job = job
+                # Cancel other jobs
+                for pending_job in self._pending:
+                    pending_job.state = JOB_CANCELLED
+                self._pending = []
+                for running_job in self._running:
+                    running_job.terminate()
+            else:
+                self._start_jobs()
+            self._lock.notify_all()
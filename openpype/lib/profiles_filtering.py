@@ -1,8 +1,15 @@
 import re
 import logging
+import threading
+import collections
+
+import six
 
 log = logging.getLogger(__name__)
 
+# Characters which make value a regex instead of literal string
+_REGEX_CHARS = re.compile(r"[\\.^$*+?{}\[\]|()]")
+
 
 def compile_list_of_regexes(in_list):
     """Convert strings in entered list to compiled regex objects."""
@@ -116,6 +123,294 @@ def validate_value_by_regexes(value, in_list):
     return -1
 
 
+class ProfileIndex(object):
+    """Index of profiles for repeated filtering.
+
+    Index should be created once for profiles (e.g. from loaded settings)
+    and used for all filtering. Filters of profiles are pre-processed.
+    Values without regex special characters are compared directly and
+    profiles are bucketed by them, so profiles that can't match are not
+    validated at all. Regexes are compiled only once and results are cached
+    per passed key values.
+
+    Profiles must not be modified after index is created.
+
+    Args:
+        profiles_data (list): Profile definitions as dictionaries.
+    """
+
+    _max_cached_results = 1024
+
+    def __init__(self, profiles_data):
+        self._profiles = list(profiles_data or [])
+        # Pre-processed filters by (profile index, key)
+        self._filters = {}
+        # Buckets by key with profile indexes by literal value and profile
+        #   indexes which must be always validated
+        self._buckets = {}
+        self._results = {}
+
+    def _get_filter(self, profile_idx, key):
+        filter_key = (profile_idx, key)
+        if filter_key in self._filters:
+            return self._filters[filter_key]
+
+        in_list = self._profiles[profile_idx].get(key)
+        profile_filter = None
+        if in_list:
+            if not isinstance(in_list, (list, tuple, set)):
+                in_list = [in_list]
+
+            if "*" not in in_list:
+                literals = set()
+                regex_items = []
+                for item in in_list:
+                    if (
+                        isinstance(item, six.string_types)
+                        and not _REGEX_CHARS.search(item)
+                    ):
+                        literals.add(item)
+                    else:
+                        regex_items.append(item)
+                profile_filter = (
+                    literals, compile_list_of_regexes(regex_items)
+                )
+
+        self._filters[filter_key] = profile_filter
+        return profile_filter
+
+    def _validate_value(self, profile_idx, key, value):
+        """Same as 'validate_value_by_regexes' using pre-processed filter."""
+
+        profile_filter = self._get_filter(profile_idx, key)
+        if profile_filter is None:
+            return 0
+
+        if not value:
+            return -1
+
+        literals, regexes = profile_filter
+        if value in literals:
+            return 1
+
+        for regex in regexes:
+            if hasattr(regex, "fullmatch"):
+                result = regex.fullmatch(value)
+            else:
+                result = fullmatch(regex, value)
+            if result:
+                return 1
+        return -1
+
+    def _get_bucket(self, key):
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            return bucket
+
+        indexes_by_value = collections.defaultdict(set)
+        always_validated = set()
+        for profile_idx, profile in enumerate(self._profiles):
+            in_list = profile.get(key)
+            if not in_list:
+                always_validated.add(profile_idx)
+                continue
+
+            if not isinstance(in_list, (list, tuple, set)):
+                in_list = [in_list]
+
+            if "*" in in_list or any(
+                not isinstance(item, six.string_types)
+                or _REGEX_CHARS.search(item)
+                for item in in_list
+            ):
+                always_validated.add(profile_idx)
+                continue
+
+            for item in in_list:
+                if item:
+                    indexes_by_value[item].add(profile_idx)
+
+        bucket = (dict(indexes_by_value), always_validated)
+        self._buckets[key] = bucket
+        return bucket
+
+    def _get_candidates(self, key_values, keys_order):
+        candidates = None
+        for key in keys_order:
+            value = key_values[key]
+            indexes_by_value, always_validated = self._get_bucket(key)
+            key_candidates = always_validated
+            try:
+                literal_indexes = indexes_by_value.get(value)
+            except TypeError:
+                # Unhashable value
+                literal_indexes = None
+
+            if literal_indexes:
+                key_candidates = key_candidates | literal_indexes
+
+            if candidates is None:
+                candidates = key_candidates
+            else:
+                candidates = candidates & key_candidates
+
+            if not candidates:
+                break
+
+        if candidates is None:
+            candidates = range(len(self._profiles))
+        return sorted(candidates)
+
+    def _filter(self, key_values, keys_order, logger):
+        matching_profiles = None
+        highest_profile_points = -1
+        # Each profile get 1 point for each matching filter. Profile with most
+        # points is returned. For cases when more than one profile will match
+        # are also stored ordered lists of matching values.
+        for profile_idx in self._get_candidates(key_values, keys_order):
+            profile_points = 0
+            profile_scores = []
+
+            for key in keys_order:
+                value = key_values[key]
+                match = self._validate_value(profile_idx, key, value)
+                if match == -1:
+                    profile_points = -1
+                    break
+
+                profile_points += match
+                profile_scores.append(bool(match))
+
+            if (
+                profile_points < 0
+                or profile_points < highest_profile_points
+            ):
+                continue
+
+            if profile_points > highest_profile_points:
+                matching_profiles = []
+                highest_profile_points = profile_points
+
+            if profile_points == highest_profile_points:
+                matching_profiles.append(
+                    (self._profiles[profile_idx], profile_scores)
+                )
+
+        if not matching_profiles:
+            return None
+
+        if len(matching_profiles) > 1:
+            logger.debug("More than one profile match your setup.")
+
+        return _profile_exclusion(matching_profiles, logger)
+
+    def filter(self, key_values, keys_order=None, logger=None):
+        """Find most matching profile for entered key -> values.
+
+        Args:
+            key_values (dict): Mapping of Key <-> Value. Key is checked if is
+                available in profile and if Value is matching it's values.
+            keys_order (list, tuple): Order of keys from `key_values` which
+                matters only when multiple profiles have same score.
+            logger (logging.Logger): Optionally can be passed different
+                logger.
+
+        Returns:
+            dict/None: Return most matching profile or None if none of
+                profiles match at least one criteria.
+        """
+
+        if not self._profiles:
+            return None
+
+        if not logger:
+            logger = log
+
+        keys_order = _get_keys_order(key_values, keys_order)
+
+        cache_key = None
+        try:
+            cache_key = (
+                keys_order, tuple(key_values[key] for key in keys_order)
+            )
+            if cache_key in self._results:
+                return self._results[cache_key]
+        except TypeError:
+            # Unhashable values are not cached
+            cache_key = None
+
+        profile = self._filter(key_values, keys_order, logger)
+        if cache_key is not None:
+            if len(self._results) >= self._max_cached_results:
+                self._results.clear()
+            self._results[cache_key] = profile
+
+        if logger.isEnabledFor(logging.DEBUG):
+            log_parts = " | ".join([
+                "{}: \"{}\"".format(*item)
+                for item in key_values.items()
+            ])
+            if profile is None:
+                logger.debug(
+                    "None of profiles match your setup. {}".format(log_parts)
+                )
+            else:
+                logger.debug("Profile selected for {}: {}".format(
+                    log_parts, profile
+                ))
+        return profile
+
+
+def _get_keys_order(key_values, keys_order):
+    if not keys_order:
+        return tuple(key_values.keys())
+
+    _keys_order = list(keys_order)
+    # Make all keys from `key_values` are passed
+    for key in key_values.keys():
+        if key not in _keys_order:
+            _keys_order.append(key)
+    return tuple(_keys_order)
+
+
+class _ProfileIndexCache:
+    """Indexes of profiles used by 'filter_profiles'.
+
+    Index is reused for the same profiles object until profiles or values
+    of profiles are replaced.
+    """
+
+    max_items = 256
+    _items = collections.OrderedDict()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _get_fingerprint(profiles_data):
+        return tuple(
+            (id(profile), tuple(id(value) for value in profile.values()))
+            for profile in profiles_data
+        )
+
+    @classmethod
+    def get_index(cls, profiles_data):
+        fingerprint = cls._get_fingerprint(profiles_data)
+        key = id(profiles_data)
+        with cls._lock:
+            item = cls._items.pop(key, None)
+            # Profiles object is stored with index so id can't be reused
+            if (
+                item is None
+                or item[0] is not profiles_data
+                or item[1] != fingerprint
+            ):
+                index = ProfileIndex(profiles_data)
+                item = (profiles_data, fingerprint, index)
+            cls._items[key] = item
+            while len(cls._items) > cls.max_items:
+                cls._items.popitem(last=False)
+        return item[2]
+
+
 def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     """ Filter profiles by entered key -> values.
 
@@ -134,6 +429,9 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     profiles with same score then first in order is used (order of profiles
     matter).
 
+    Filtering uses 'ProfileIndex' which is cached for passed profiles
+    object.
+
     Args:
         profiles_data (list): Profile definitions as dictionaries.
         key_values (dict): Mapping of Key <-> Value. Key is checked if is
@@ -149,79 +447,5 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     if not profiles_data:
         return None
 
-    if not logger:
-        logger = log
-
-    if not keys_order:
-        keys_order = tuple(key_values.keys())
-    else:
-        _keys_order = list(keys_order)
-        # Make all keys from `key_values` are passed
-        for key in key_values.keys():
-            if key not in _keys_order:
-                _keys_order.append(key)
-        keys_order = tuple(_keys_order)
-
-    log_parts = " | ".join([
-        "{}: \"{}\"".format(*item)
-        for item in key_values.items()
-    ])
-
-    logger.info(
-        "Looking for matching profile for: {}".format(log_parts)
-    )
-
-    matching_profiles = None
-    highest_profile_points = -1
-    # Each profile get 1 point for each matching filter. Profile with most
-    # points is returned. For cases when more than one profile will match
-    # are also stored ordered lists of matching values.
-    for profile in profiles_data:
-        profile_points = 0
-        profile_scores = []
-
-        for key in keys_order:
-            value = key_values[key]
-            match = validate_value_by_regexes(value, profile.get(key))
-            if match == -1:
-                profile_value = profile.get(key) or []
-                logger.debug(
-                    "\"{}\" not found in \"{}\": {}".format(value, key,
-                                                            profile_value)
-                )
-                profile_points = -1
-                break
-
-            profile_points += match
-            profile_scores.append(bool(match))
-
-        if (
-            profile_points < 0
-            or profile_points < highest_profile_points
-        ):
-            continue
-
-        if profile_points > highest_profile_points:
-            matching_profiles = []
-            highest_profile_points = profile_points
-
-        if profile_points == highest_profile_points:
-            matching_profiles.append((profile, profile_scores))
-
-    if not matching_profiles:
-        logger.info(
-            "None of profiles match your setup. {}".format(log_parts)
-        )
-        return None
-
-    if len(matching_profiles) > 1:
-        logger.info(
-            "More than one profile match your setup. {}".format(log_parts)
-        )
-
-    profile = _profile_exclusion(matching_profiles, logger)
-    if profile:
-        logger.info(
-            "Profile selected: {}".format(profile)
-        )
-    return profile
+    index = _ProfileIndexCache.get_index(profiles_data)
+    return index.filter(key_values, keys_order, logger)
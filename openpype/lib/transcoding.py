@@ -1,15 +1,25 @@
 import os
 import re
+import math
 import logging
 import json
 import collections
 import tempfile
 import subprocess
 import platform
+import multiprocessing
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
+
+import clique
 
 import xml.etree.ElementTree
 
 from .execute import run_subprocess
+from .media_metadata_cache import get_media_metadata_cache
 from .vendor_bin_utils import (
     get_ffmpeg_tool_path,
     get_oiio_tools_path,
@@ -78,11 +88,38 @@ def get_transcode_temp_directory():
     )
 
 
-def get_oiio_info_for_input(filepath, logger=None, subimages=False):
+def get_oiio_info_for_input(
+    filepath, logger=None, subimages=False, use_cache=True
+):
     """Call oiiotool to get information about input and return stdout.
 
-    Stdout should contain xml format string.
+    Stdout should contain xml format string. Result is cached per file
+    size and modification time.
+
+    Args:
+        filepath (str): Path to file.
+        logger (Optional[logging.Logger]): Logger used for output.
+        subimages (Optional[bool]): Return information about all subimages.
+        use_cache (Optional[bool]): Use cached information if available.
+
+    Returns:
+        Union[dict[str, Any], list[dict[str, Any]]]: Information about
+            input or list of information about subimages.
     """
+
+    cache_kind = "oiio_info_subimages" if subimages else "oiio_info"
+    cache = get_media_metadata_cache()
+    if use_cache:
+        output = cache.get(cache_kind, filepath)
+        if output is not None:
+            return output
+
+    output = _get_oiio_info_for_input(filepath, logger, subimages)
+    cache.set(cache_kind, filepath, output)
+    return output
+
+
+def _get_oiio_info_for_input(filepath, logger, subimages):
     args = [
         get_oiio_tools_path(),
         "--info",
@@ -582,45 +619,56 @@ def convert_for_ffmpeg(
     run_subprocess(oiio_cmd, logger=logger)
 
 
-def convert_input_paths_for_ffmpeg(
-    input_paths,
-    output_dir,
-    logger=None
-):
-    """Convert source file to format supported in ffmpeg.
+def _get_oiio_convert_workers(input_info, max_workers=None):
+    """Number of oiiotool processes that can run at the same time.
 
-    Currently can convert only exrs. The input filepaths should be files
-    with same type. Information about input is loaded only from first found
-    file.
-
-    Filenames of input files are kept so make sure that output directory
-    is not the same directory as input files have.
-    - This way it can handle gaps and can keep input filenames without handling
-        frame template
+    Count is limited by number of cores and by available memory if 'psutil'
+    is available. Can be defined with 'OPENPYPE_OIIO_CONVERT_WORKERS'
+    environment variable.
 
     Args:
-        input_paths (str): Paths that should be converted. It is expected that
-            contains single file or image sequence of samy type.
-        output_dir (str): Path to directory where output will be rendered.
-            Must not be same as input's directory.
-        logger (logging.Logger): Logger used for logging.
+        input_info (dict[str, Any]): Information about input from oiiotool.
+        max_workers (Optional[int]): Maximum number of processes.
 
-    Raises:
-        ValueError: If input filepath has extension not supported by function.
-            Currently is supported only ".exr" extension.
+    Returns:
+        int: Number of processes.
     """
-    if logger is None:
-        logger = logging.getLogger(__name__)
 
-    first_input_path = input_paths[0]
-    ext = os.path.splitext(first_input_path)[1].lower()
-    if ext != ".exr":
-        raise ValueError((
-            "Function 'convert_for_ffmpeg' currently support only"
-            " \".exr\" extension. Got \"{}\"."
-        ).format(ext))
+    if max_workers is None:
+        max_workers = os.environ.get("OPENPYPE_OIIO_CONVERT_WORKERS")
+        if max_workers:
+            max_workers = int(max_workers)
+        else:
+            max_workers = multiprocessing.cpu_count()
+
+    try:
+        import psutil
+
+        # Rough estimation of memory used by one process
+        #   - input and output image with float channels
+        process_memory = (
+            input_info.get("width", 0)
+            * input_info.get("height", 0)
+            * max(input_info.get("nchannels", 4), 4)
+            * 4 * 2
+        )
+        if process_memory:
+            available = psutil.virtual_memory().available
+            max_workers = min(max_workers, available // process_memory)
+    except ImportError:
+        pass
+    return max(1, int(max_workers))
 
-    input_info = get_oiio_info_for_input(first_input_path, logger=logger)
+
+def _get_oiio_convert_args(input_info, logger):
+    """Prepare oiiotool arguments for conversion of input for ffmpeg.
+
+    Arguments are same for all frames of a sequence.
+
+    Returns:
+        Tuple[List[str], str, List[str]]: Arguments before input, input
+            argument and arguments between input and output path.
+    """
 
     # Change compression only if source compression is "dwaa" or "dwab"
     #   - they're not supported in ffmpeg
@@ -654,56 +702,168 @@ def convert_input_paths_for_ffmpeg(
         # - this option is crashing if used on multipart exrs
         input_arg += ":ch={}".format(input_channels_str)
 
-    for input_path in input_paths:
-        # Prepare subprocess arguments
-        oiio_cmd = [
-            get_oiio_tools_path(),
+    # Prepare subprocess arguments
+    head_args = [
+        get_oiio_tools_path(),
 
-            # Don't add any additional attributes
-            "--nosoftwareattrib",
-        ]
-        # Add input compression if available
-        if compression:
-            oiio_cmd.extend(["--compression", compression])
+        # Don't add any additional attributes
+        "--nosoftwareattrib",
+    ]
+    # Add input compression if available
+    if compression:
+        head_args.extend(["--compression", compression])
 
-        oiio_cmd.extend([
-            input_arg, input_path,
-            # Tell oiiotool which channels should be put to top stack
-            #   (and output)
-            "--ch", channels_arg,
-            # Use first subimage
-            "--subimage", "0"
-        ])
+    process_args = [
+        # Tell oiiotool which channels should be put to top stack
+        #   (and output)
+        "--ch", channels_arg,
+        # Use first subimage
+        "--subimage", "0"
+    ]
 
-        for attr_name, attr_value in input_info["attribs"].items():
-            if not isinstance(attr_value, str):
-                continue
+    for attr_name, attr_value in input_info["attribs"].items():
+        if not isinstance(attr_value, str):
+            continue
+
+        # Remove attributes that have string value longer than allowed
+        #   length for ffmpeg or when containing unallowed symbols
+        erase_reason = "Missing reason"
+        erase_attribute = False
+        if len(attr_value) > MAX_FFMPEG_STRING_LEN:
+            erase_reason = "has too long value ({} chars).".format(
+                len(attr_value)
+            )
+            erase_attribute = True
 
-            # Remove attributes that have string value longer than allowed
-            #   length for ffmpeg or when containing unallowed symbols
-            erase_reason = "Missing reason"
-            erase_attribute = False
-            if len(attr_value) > MAX_FFMPEG_STRING_LEN:
-                erase_reason = "has too long value ({} chars).".format(
-                    len(attr_value)
+        if not erase_attribute:
+            for char in NOT_ALLOWED_FFMPEG_CHARS:
+                if char in attr_value:
+                    erase_attribute = True
+                    erase_reason = (
+                        "contains unsupported character \"{}\"."
+                    ).format(char)
+                    break
+
+        if erase_attribute:
+            # Set attribute to empty string
+            logger.info((
+                "Removed attribute \"{}\" from metadata because {}."
+            ).format(attr_name, erase_reason))
+            process_args.extend(["--eraseattrib", attr_name])
+    return head_args, input_arg, process_args
+
+
+def _split_convert_inputs(input_paths, chunks_count):
+    """Split input paths to chunks processed by one oiiotool process.
+
+    Continuous frame ranges are converted using oiiotool's '--frames'
+    argument with '%0Nd' pattern in filenames. Other paths are processed
+    one by one.
+
+    Returns:
+        List[Tuple[Union[str, None], str]]: Frame range (or None) with
+            input path or pattern.
+    """
+
+    sequences, remainders = clique.assemble(
+        input_paths,
+        patterns=[clique.PATTERNS["frames"]],
+        minimum_items=2
+    )
+    output = [(None, path) for path in remainders]
+    for sequence in sequences:
+        # Skip patterns if characters used by oiiotool are in the path
+        if any(
+            char in sequence.head or char in sequence.tail
+            for char in ("%", "#", "@")
+        ):
+            output.extend((None, path) for path in sequence)
+            continue
+
+        if sequence.padding:
+            pattern = "{}%0{}d{}".format(
+                sequence.head, sequence.padding, sequence.tail
+            )
+        else:
+            pattern = "{}%d{}".format(sequence.head, sequence.tail)
+
+        indexes = sorted(sequence.indexes)
+        chunk_size = max(1, int(math.ceil(len(indexes) / chunks_count)))
+        chunk = []
+        for index in indexes:
+            # Split on gap or when chunk is full
+            if chunk and (
+                index != chunk[-1] + 1
+                or len(chunk) >= chunk_size
+            ):
+                output.append(
+                    ("{}-{}".format(chunk[0], chunk[-1]), pattern)
                 )
-                erase_attribute = True
-
-            if not erase_attribute:
-                for char in NOT_ALLOWED_FFMPEG_CHARS:
-                    if char in attr_value:
-                        erase_attribute = True
-                        erase_reason = (
-                            "contains unsupported character \"{}\"."
-                        ).format(char)
-                        break
-
-            if erase_attribute:
-                # Set attribute to empty string
-                logger.info((
-                    "Removed attribute \"{}\" from metadata because {}."
-                ).format(attr_name, erase_reason))
-                oiio_cmd.extend(["--eraseattrib", attr_name])
+                chunk = []
+            chunk.append(index)
+        if chunk:
+            output.append(("{}-{}".format(chunk[0], chunk[-1]), pattern))
+    return output
+
+
+def convert_input_paths_for_ffmpeg(
+    input_paths,
+    output_dir,
+    logger=None,
+    max_workers=None
+):
+    """Convert source file to format supported in ffmpeg.
+
+    Currently can convert only exrs. The input filepaths should be files
+    with same type. Information about input is loaded only from first found
+    file.
+
+    Filenames of input files are kept so make sure that output directory
+    is not the same directory as input files have.
+    - This way it can handle gaps and can keep input filenames without handling
+        frame template
+
+    Frame ranges of image sequences are split into chunks converted by
+    multiple oiiotool processes at the same time.
+
+    Args:
+        input_paths (str): Paths that should be converted. It is expected that
+            contains single file or image sequence of samy type.
+        output_dir (str): Path to directory where output will be rendered.
+            Must not be same as input's directory.
+        logger (logging.Logger): Logger used for logging.
+        max_workers (Optional[int]): Maximum number of oiiotool processes
+            running at the same time.
+
+    Raises:
+        ValueError: If input filepath has extension not supported by function.
+            Currently is supported only ".exr" extension.
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    first_input_path = input_paths[0]
+    ext = os.path.splitext(first_input_path)[1].lower()
+    if ext != ".exr":
+        raise ValueError((
+            "Function 'convert_for_ffmpeg' currently support only"
+            " \".exr\" extension. Got \"{}\"."
+        ).format(ext))
+
+    input_info = get_oiio_info_for_input(first_input_path, logger=logger)
+    head_args, input_arg, process_args = _get_oiio_convert_args(
+        input_info, logger
+    )
+
+    workers = _get_oiio_convert_workers(input_info, max_workers)
+    commands = []
+    for frames, input_path in _split_convert_inputs(input_paths, workers):
+        oiio_cmd = list(head_args)
+        if frames is not None:
+            # Frame range is expanded for '%0Nd' pattern in input and output
+            oiio_cmd.extend(["--frames", frames])
+        oiio_cmd.extend([input_arg, input_path])
+        oiio_cmd.extend(process_args)
 
         # Add last argument - path to output
         base_filename = os.path.basename(input_path)
@@ -711,19 +871,54 @@ def convert_input_paths_for_ffmpeg(
         oiio_cmd.extend([
             "-o", output_path
         ])
+        commands.append(oiio_cmd)
 
+    def _run_command(oiio_cmd):
         logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
         run_subprocess(oiio_cmd, logger=logger)
 
+    if (
+        ThreadPoolExecutor is None
+        or workers < 2
+        or len(commands) < 2
+    ):
+        for oiio_cmd in commands:
+            _run_command(oiio_cmd)
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=min(workers, len(commands))
+    ) as executor:
+        # Iterate results to re-raise first exception
+        for _ in executor.map(_run_command, commands):
+            pass
+
 
 # FFMPEG functions
-def get_ffprobe_data(path_to_file, logger=None):
+def get_ffprobe_data(path_to_file, logger=None, use_cache=True):
     """Load data about entered filepath via ffprobe.
 
+    Result is cached per file size and modification time.
+
     Args:
         path_to_file (str): absolute path
         logger (logging.Logger): injected logger, if empty new is created
+        use_cache (bool): Use cached data if available.
     """
+    cache = get_media_metadata_cache()
+    if use_cache:
+        output = cache.get("ffprobe", path_to_file)
+        if output is not None:
+            return output
+
+    output = _get_ffprobe_data(path_to_file, logger)
+    # Don't cache failed probe
+    if output.get("streams"):
+        cache.set("ffprobe", path_to_file, output)
+    return output
+
+
+def _get_ffprobe_data(path_to_file, logger):
     if not logger:
         logger = logging.getLogger(__name__)
     logger.info(
@@ -7,12 +7,17 @@ import time
 import inspect
 import logging
 import platform
+import tempfile
+import functools
 import threading
 import collections
 import traceback
 from uuid import uuid4
 from abc import ABCMeta, abstractmethod
 import six
+import appdirs
+
+from openpype.version import __version__
 
 from openpype.settings import (
     get_system_settings,
@@ -53,6 +58,8 @@ IGNORED_DEFAULT_FILENAMES = (
     "example_addons",
     "default_modules",
 )
+# Environment variable with path to cached manifest of modules
+MODULES_MANIFEST_ENV_KEY = "OPENPYPE_MODULES_MANIFEST"
 
 
 # Inherit from `object` for Python 2 hosts
@@ -61,6 +68,9 @@ class _ModuleClass(object):
 
     Object of this class can be stored to `sys.modules` and used for storing
     dynamically imported modules.
+
+    Attributes can be added with a loader which is called on first access
+    of the attribute. That allows to import modules only when are used.
     """
 
     def __init__(self, name):
@@ -71,12 +81,19 @@ class _ModuleClass(object):
         # Where modules and interfaces are stored
         super(_ModuleClass, self).__setattr__("__attributes__", dict())
         super(_ModuleClass, self).__setattr__("__defaults__", set())
+        # Loaders of attributes which were not accessed yet
+        super(_ModuleClass, self).__setattr__(
+            "__loaders__", collections.OrderedDict()
+        )
 
         super(_ModuleClass, self).__setattr__("_log", None)
 
     def __getattr__(self, attr_name):
         if attr_name not in self.__attributes__:
-            if attr_name in ("__path__", "__file__"):
+            self._load_attribute(attr_name)
+
+        if attr_name not in self.__attributes__:
+            if attr_name in ("__path__", "__file__", "__spec__"):
                 return None
             raise AttributeError("'{}' has not attribute '{}'".format(
                 self.name, attr_name
@@ -88,10 +105,14 @@ class _ModuleClass(object):
             yield module
 
     def __setattr__(self, attr_name, value):
-        if attr_name in self.__attributes__:
+        if (
+            attr_name in self.__attributes__
+            # Import system sets imported module to parent
+            and self.__attributes__[attr_name] is not value
+        ):
             self.log.warning(
                 "Duplicated name \"{}\" in {}. Overriding.".format(
-                    self.name, attr_name
+                    attr_name, self.name
                 )
             )
         self.__attributes__[attr_name] = value
@@ -110,16 +131,59 @@ class _ModuleClass(object):
             )
         return self._log
 
+    def add_lazy_attribute(self, attr_name, loader):
+        """Add attribute which is loaded on first access.
+
+        Args:
+            attr_name (str): Name of attribute.
+            loader (Callable[[], Any]): Function returning value of the
+                attribute. Attribute is not set if returns 'None'.
+        """
+
+        if attr_name in self.__attributes__ or attr_name in self.__loaders__:
+            self.log.warning(
+                "Duplicated name \"{}\" in {}. Overriding.".format(
+                    attr_name, self.name
+                )
+            )
+            self.__attributes__.pop(attr_name, None)
+        self.__loaders__[attr_name] = loader
+
+    def _load_attribute(self, attr_name):
+        loader = self.__loaders__.get(attr_name)
+        if loader is None:
+            return
+        # Loader is removed after it finished so import of the module
+        #   can access the module itself
+        value = loader()
+        self.__loaders__.pop(attr_name, None)
+        if value is not None and attr_name not in self.__attributes__:
+            self.__attributes__[attr_name] = value
+
+    def _load_attributes(self):
+        for attr_name in tuple(self.__loaders__.keys()):
+            if attr_name not in self.__attributes__:
+                self._load_attribute(attr_name)
+
     def get(self, key, default=None):
+        if key not in self.__attributes__:
+            self._load_attribute(key)
         return self.__attributes__.get(key, default)
 
     def keys(self):
-        return self.__attributes__.keys()
+        """Names of attributes including not loaded attributes."""
+        output = list(self.__attributes__.keys())
+        for attr_name in self.__loaders__.keys():
+            if attr_name not in self.__attributes__:
+                output.append(attr_name)
+        return output
 
     def values(self):
+        self._load_attributes()
         return self.__attributes__.values()
 
     def items(self):
+        self._load_attributes()
         return self.__attributes__.items()
 
 
@@ -152,11 +216,293 @@ class _InterfacesClass(_ModuleClass):
         return self.__attributes__[attr_name]
 
 
+class _LazyModulesFinder(object):
+    """Import hook for lazy loaded modules in 'openpype_modules'.
+
+    Modules are imported on first access so import statements like
+    'from openpype_modules.ftrack.lib import ...' must trigger the import
+    of the module. Module is already imported when the hook is used, the
+    hook only passes the module to import system.
+
+    Args:
+        modules_key (str): Name of module where OpenPype modules are stored.
+    """
+
+    def __init__(self, modules_key):
+        self._modules_key = modules_key
+        self._specs = {}
+
+    def _get_module(self, fullname):
+        parent_name, _, attr_name = fullname.rpartition(".")
+        if parent_name != self._modules_key:
+            return None
+
+        parent_module = sys.modules.get(parent_name)
+        if not isinstance(parent_module, _ModuleClass):
+            return None
+        return parent_module.get(attr_name)
+
+    # Python 3 import protocol
+    def find_spec(self, fullname, path=None, target=None):
+        module = self._get_module(fullname)
+        if module is None:
+            return None
+
+        import importlib.util
+
+        # Import system would create new module from spec of module
+        #   which is already in 'sys.modules'
+        sys.modules.pop(fullname, None)
+        return importlib.util.spec_from_loader(fullname, self)
+
+    def create_module(self, spec):
+        module = self._get_module(spec.name)
+        self._specs[spec.name] = getattr(module, "__spec__", None)
+        return module
+
+    def exec_module(self, module):
+        # Import system replaced spec of the module, set back the original
+        spec = module.__spec__
+        module.__spec__ = self._specs.pop(spec.name, None)
+
+    # Python 2 import protocol
+    def find_module(self, fullname, path=None):
+        if self._get_module(fullname) is not None:
+            return self
+        return None
+
+    def load_module(self, fullname):
+        module = self._get_module(fullname)
+        sys.modules[fullname] = module
+        return module
+
+
+class _ModulesManifest(object):
+    """Cached information about classes defined in OpenPype modules.
+
+    Manifest allows to decide if module must be imported without importing
+    it. Information about module is stored to json file and is valid only
+    for the same OpenPype version and modification times of the module
+    directory and its python files.
+
+    Args:
+        filepath (str): Path to json file where manifest is stored.
+    """
+
+    def __init__(self, filepath):
+        self._filepath = filepath
+        self._paths_by_name = {}
+        self._mtimes_by_path = {}
+        self._data = None
+        self._changed = False
+        self._log = None
+
+    @property
+    def log(self):
+        if self._log is None:
+            self._log = Logger.get_logger(self.__class__.__name__)
+        return self._log
+
+    def _get_data(self):
+        if self._data is not None:
+            return self._data
+
+        data = None
+        if os.path.exists(self._filepath):
+            try:
+                with open(self._filepath, "r") as stream:
+                    data = json.load(stream)
+            except Exception:
+                self.log.debug(
+                    "Failed to read modules manifest {}".format(
+                        self._filepath
+                    ),
+                    exc_info=True
+                )
+
+        if not data or data.get("version") != __version__:
+            data = {"version": __version__, "modules": {}}
+        self._data = data
+        return data
+
+    def _get_mtime(self, path):
+        mtime = self._mtimes_by_path.get(path)
+        if mtime is not None:
+            return mtime
+
+        mtime = os.path.getmtime(path)
+        if os.path.isdir(path):
+            for filename in os.listdir(path):
+                if filename.endswith(".py"):
+                    mtime = max(
+                        mtime, os.path.getmtime(os.path.join(path, filename))
+                    )
+        self._mtimes_by_path[path] = mtime
+        return mtime
+
+    def add_module(self, name, path):
+        """Add found module.
+
+        Args:
+            name (str): Name of module in 'openpype_modules'.
+            path (str): Path to module directory or file.
+        """
+
+        self._paths_by_name[name] = path
+
+    def _get_module_info(self, name, create=False):
+        path = self._paths_by_name.get(name)
+        if path is None:
+            return None
+
+        try:
+            mtime = self._get_mtime(path)
+        except OSError:
+            return None
+
+        modules_info = self._get_data()["modules"]
+        module_info = modules_info.get(path)
+        if module_info is not None and module_info["mtime"] == mtime:
+            return module_info
+
+        if not create:
+            return None
+        module_info = {"mtime": mtime}
+        modules_info[path] = module_info
+        return module_info
+
+    def _get_value(self, name, key):
+        module_info = self._get_module_info(name)
+        if module_info is None:
+            return None
+        return module_info.get(key)
+
+    def _set_value(self, name, key, value):
+        module_info = self._get_module_info(name, create=True)
+        if module_info is not None and module_info.get(key) != value:
+            module_info[key] = value
+            self._changed = True
+
+    def get_classes_info(self, name):
+        """Information about OpenPype module classes stored for module.
+
+        Args:
+            name (str): Name of module in 'openpype_modules'.
+
+        Returns:
+            Union[list[dict[str, Any]], None]: Class name, name and
+                interface names of module classes. None if information
+                is not available or is outdated.
+        """
+
+        return self._get_value(name, "classes")
+
+    def set_classes(self, name, module_classes):
+        """Store information about OpenPype module classes of module.
+
+        Args:
+            name (str): Name of module in 'openpype_modules'.
+            module_classes (list[type]): OpenPype module classes found in
+                the module.
+        """
+
+        classes_info = []
+        for module_class in module_classes:
+            module_name = getattr(module_class, "name", None)
+            if not isinstance(module_name, six.string_types):
+                module_name = None
+            interfaces = sorted({
+                cls.__name__
+                for cls in inspect.getmro(module_class)
+                if (
+                    cls is not OpenPypeInterface
+                    and issubclass(cls, OpenPypeInterface)
+                    and not issubclass(cls, OpenPypeModule)
+                )
+            })
+            classes_info.append({
+                "class_name": module_class.__name__,
+                "name": module_name,
+                "interfaces": interfaces
+            })
+        self._set_value(name, "classes", classes_info)
+
+    def has_settings_defs(self, name):
+        """Module contains settings definitions.
+
+        Args:
+            name (str): Name of module in 'openpype_modules'.
+
+        Returns:
+            Union[bool, None]: Module has settings definitions. None if
+                information is not available or is outdated.
+        """
+
+        return self._get_value(name, "settings_defs")
+
+    def set_has_settings_defs(self, name, value):
+        """Store if module contains settings definitions.
+
+        Args:
+            name (str): Name of module in 'openpype_modules'.
+            value (bool): Module has settings definitions.
+        """
+
+        self._set_value(name, "settings_defs", value)
+
+    def save(self):
+        """Store manifest to json file if anything changed."""
+
+        if not self._changed:
+            return
+
+        dirpath = os.path.dirname(self._filepath)
+        try:
+            if not os.path.exists(dirpath):
+                os.makedirs(dirpath)
+
+            # Write to temp file first so other processes don't read
+            #   incomplete file
+            fd, tmp_path = tempfile.mkstemp(dir=dirpath, suffix=".json")
+            with os.fdopen(fd, "w") as stream:
+                json.dump(self._data, stream)
+            if os.path.exists(self._filepath) and not hasattr(os, "replace"):
+                os.remove(self._filepath)
+            getattr(os, "replace", os.rename)(tmp_path, self._filepath)
+            self._changed = False
+
+        except Exception:
+            self.log.debug(
+                "Failed to store modules manifest {}".format(self._filepath),
+                exc_info=True
+            )
+
+
 class _LoadCache:
     interfaces_lock = threading.Lock()
     modules_lock = threading.Lock()
     interfaces_loaded = False
     modules_loaded = False
+    modules_manifest = None
+
+
+def get_modules_manifest_path():
+    """Path to json file with cached manifest of OpenPype modules.
+
+    Path can be changed with 'OPENPYPE_MODULES_MANIFEST' environment
+    variable.
+
+    Returns:
+        str: Path to manifest file.
+    """
+
+    path = os.environ.get(MODULES_MANIFEST_ENV_KEY)
+    if path:
+        return path
+    return os.path.join(
+        appdirs.user_data_dir("openpype", "pypeclub"),
+        "modules_manifest.json"
+    )
 
 
 def get_default_modules_dir():
@@ -299,12 +645,76 @@ def load_modules(force=False):
             time.sleep(0.1)
 
 
+def _import_module(dirpath, filename, modules_key):
+    """Import module found by '_load_modules'.
+
+    Args:
+        dirpath (str): Directory where module was found.
+        filename (str): Name of module directory or file.
+        modules_key (str): Name of module where OpenPype modules are stored.
+
+    Returns:
+        Union[types.ModuleType, None]: Imported module or None if import
+            failed.
+    """
+
+    current_dir = os.path.abspath(os.path.dirname(__file__))
+    hosts_dir = os.path.join(os.path.dirname(current_dir), "hosts")
+    is_in_current_dir = dirpath == current_dir
+    is_in_host_dir = dirpath == hosts_dir
+
+    fullpath = os.path.join(dirpath, filename)
+    basename = os.path.splitext(filename)[0]
+    try:
+        # Don't import dynamically current directory modules
+        if is_in_current_dir or is_in_host_dir:
+            if is_in_current_dir:
+                import_str = "openpype.modules.{}".format(basename)
+            else:
+                import_str = "openpype.hosts.{}".format(basename)
+            new_import_str = "{}.{}".format(modules_key, basename)
+            default_module = __import__(import_str, fromlist=("", ))
+            sys.modules[new_import_str] = default_module
+            return default_module
+
+        if os.path.isdir(fullpath):
+            return import_module_from_dirpath(dirpath, filename, modules_key)
+        return import_filepath(fullpath)
+
+    except Exception:
+        log = Logger.get_logger("ModulesLoader")
+        # Until all hosts are converted to be able use them as
+        #   modules is this error check needed
+        if is_in_host_dir:
+            log.warning(
+                "Failed to import host folder {}".format(basename),
+                exc_info=True
+            )
+            return None
+
+        if is_in_current_dir:
+            msg = "Failed to import default module '{}'.".format(basename)
+        else:
+            msg = "Failed to import module '{}'.".format(fullpath)
+        log.error(msg, exc_info=True)
+    return None
+
+
 def _load_modules():
     # Key under which will be modules imported in `sys.modules`
     modules_key = "openpype_modules"
 
     # Change `sys.modules`
     sys.modules[modules_key] = openpype_modules = _ModuleClass(modules_key)
+    # Modules are imported on first access
+    if not any(
+        isinstance(finder, _LazyModulesFinder)
+        for finder in sys.meta_path
+    ):
+        sys.meta_path.insert(0, _LazyModulesFinder(modules_key))
+
+    manifest = _ModulesManifest(get_modules_manifest_path())
+    _LoadCache.modules_manifest = manifest
 
     log = Logger.get_logger("ModulesLoader")
 
@@ -336,7 +746,6 @@ def _load_modules():
             continue
 
         is_in_current_dir = dirpath == current_dir
-        is_in_host_dir = dirpath == hosts_dir
         for filename in os.listdir(dirpath):
             # Ignore filenames
             if filename in IGNORED_FILENAMES:
@@ -367,48 +776,13 @@ def _load_modules():
 
             # TODO add more logic how to define if folder is module or not
             # - check manifest and content of manifest
-            try:
-                # Don't import dynamically current directory modules
-                if is_in_current_dir:
-                    import_str = "openpype.modules.{}".format(basename)
-                    new_import_str = "{}.{}".format(modules_key, basename)
-                    default_module = __import__(import_str, fromlist=("", ))
-                    sys.modules[new_import_str] = default_module
-                    setattr(openpype_modules, basename, default_module)
-
-                elif is_in_host_dir:
-                    import_str = "openpype.hosts.{}".format(basename)
-                    new_import_str = "{}.{}".format(modules_key, basename)
-                    # Until all hosts are converted to be able use them as
-                    #   modules is this error check needed
-                    try:
-                        default_module = __import__(
-                            import_str, fromlist=("", )
-                        )
-                        sys.modules[new_import_str] = default_module
-                        setattr(openpype_modules, basename, default_module)
-
-                    except Exception:
-                        log.warning(
-                            "Failed to import host folder {}".format(basename),
-                            exc_info=True
-                        )
-
-                elif os.path.isdir(fullpath):
-                    import_module_from_dirpath(dirpath, filename, modules_key)
-
-                else:
-                    module = import_filepath(fullpath)
-                    setattr(openpype_modules, basename, module)
-
-            except Exception:
-                if is_in_current_dir:
-                    msg = "Failed to import default module '{}'.".format(
-                        basename
-                    )
-                else:
-                    msg = "Failed to import module '{}'.".format(fullpath)
-                log.error(msg, exc_info=True)
+            openpype_modules.add_lazy_attribute(
+                basename,
+                functools.partial(
+                    _import_module, dirpath, filename, modules_key
+                )
+            )
+            manifest.add_module(basename, fullpath)
 
 
 @six.add_metaclass(ABCMeta)
@@ -533,6 +907,61 @@ class OpenPypeAddOn(OpenPypeModule):
         pass
 
 
+def _are_modules_disabled(classes_info, modules_settings):
+    """All modules from manifest are disabled in system settings.
+
+    Module is considered disabled only if its settings contain 'enabled'
+    key with 'False' value.
+
+    Args:
+        classes_info (list[dict[str, Any]]): Information about module classes
+            from modules manifest.
+        modules_settings (dict[str, Any]): Modules system settings.
+
+    Returns:
+        bool: Module classes don't have to be initialized.
+    """
+
+    for class_info in classes_info:
+        module_settings = modules_settings.get(class_info["name"])
+        if (
+            not isinstance(module_settings, dict)
+            or module_settings.get("enabled") is not False
+        ):
+            return False
+    return True
+
+
+class _ModulesByName(dict):
+    """Modules by name which initialize skipped modules on access.
+
+    Args:
+        manager (ModulesManager): Manager of modules.
+    """
+
+    def __init__(self, manager):
+        super(_ModulesByName, self).__init__()
+        self._manager = manager
+
+    def __missing__(self, key):
+        module = self._manager._initialize_skipped_module(key)
+        if module is None:
+            raise KeyError(key)
+        return module
+
+    def __contains__(self, key):
+        return (
+            super(_ModulesByName, self).__contains__(key)
+            or key in self._manager._skipped_modules
+        )
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
 class ModulesManager:
     """Manager of Pype modules helps to load and prepare them to work.
 
@@ -550,7 +979,10 @@ class ModulesManager:
 
         self.modules = []
         self.modules_by_id = {}
-        self.modules_by_name = {}
+        self.modules_by_name = _ModulesByName(self)
+        # Modules disabled in settings which were not imported
+        self._skipped_modules = {}
+        self._modules_settings = None
         # For report of time consumption
         self._report = {}
 
@@ -563,6 +995,9 @@ class ModulesManager:
     def get(self, module_name, default=None):
         """Access module by name.
 
+        Module which was skipped during initialization is imported and
+        initialized.
+
         Args:
             module_name (str): Name of module which should be returned.
             default (Any): Default output if module is not available.
@@ -586,13 +1021,22 @@ class ModulesManager:
             Union[OpenPypeModule, None]: Enabled module found by name or None.
         """
 
+        # Skipped modules are disabled
+        if module_name in self._skipped_modules:
+            return default
+
         module = self.get(module_name)
         if module is not None and module.enabled:
             return module
         return default
 
     def initialize_modules(self):
-        """Import and initialize modules."""
+        """Import and initialize modules.
+
+        Modules which are known to be disabled in system settings, based on
+        cached manifest of modules, are not imported. They're imported and
+        initialized on first access by name.
+        """
         # Make sure modules are loaded
         load_modules()
 
@@ -604,74 +1048,166 @@ class ModulesManager:
         if system_settings is None:
             system_settings = get_system_settings()
         modules_settings = system_settings["modules"]
+        self._modules_settings = modules_settings
 
         report = {}
         time_start = time.time()
         prev_start_time = time_start
 
+        manifest = _LoadCache.modules_manifest
         module_classes = []
-        for module in openpype_modules:
-            # Go through globals in `pype.modules`
-            for name in dir(module):
-                modules_item = getattr(module, name, None)
-                # Filter globals that are not classes which inherit from
-                #   OpenPypeModule
-                if (
-                    not inspect.isclass(modules_item)
-                    or modules_item is OpenPypeModule
-                    or modules_item is OpenPypeAddOn
-                    or not issubclass(modules_item, OpenPypeModule)
-                ):
-                    continue
+        for attr_name in openpype_modules.keys():
+            classes_info = manifest.get_classes_info(attr_name)
+            if (
+                classes_info is not None
+                and _are_modules_disabled(classes_info, modules_settings)
+            ):
+                for class_info in classes_info:
+                    self._skipped_modules[class_info["name"]] = attr_name
+                continue
 
-                # Check if class is abstract (Developing purpose)
-                if inspect.isabstract(modules_item):
-                    # Find abstract attributes by convention on `abc` module
-                    not_implemented = []
-                    for attr_name in dir(modules_item):
-                        attr = getattr(modules_item, attr_name, None)
-                        abs_method = getattr(
-                            attr, "__isabstractmethod__", None
-                        )
-                        if attr and abs_method:
-                            not_implemented.append(attr_name)
-
-                    # Log missing implementations
-                    self.log.warning((
-                        "Skipping abstract Class: {}."
-                        " Missing implementations: {}"
-                    ).format(name, ", ".join(not_implemented)))
-                    continue
-                module_classes.append(modules_item)
+            module = openpype_modules.get(attr_name)
+            if module is None:
+                continue
+            classes = self._get_module_classes(module)
+            manifest.set_classes(attr_name, classes)
+            module_classes.extend(classes)
+        manifest.save()
+
+        if self._skipped_modules:
+            self.log.debug("Skipped disabled modules: {}".format(
+                ", ".join(sorted(self._skipped_modules.keys()))
+            ))
 
         for modules_item in module_classes:
-            try:
-                name = modules_item.__name__
-                # Try initialize module
-                module = modules_item(self, modules_settings)
-                # Store initialized object
-                self.modules.append(module)
-                self.modules_by_id[module.id] = module
-                self.modules_by_name[module.name] = module
-                enabled_str = "X"
-                if not module.enabled:
-                    enabled_str = " "
-                self.log.debug("[{}] {}".format(enabled_str, name))
-
-                now = time.time()
-                report[module.__class__.__name__] = now - prev_start_time
-                prev_start_time = now
+            module = self._initialize_module(modules_item, modules_settings)
+            if module is None:
+                continue
 
-            except Exception:
-                self.log.warning(
-                    "Initialization of module {} failed.".format(name),
-                    exc_info=True
-                )
+            now = time.time()
+            report[module.__class__.__name__] = now - prev_start_time
+            prev_start_time = now
 
         if self._report is not None:
             report[self._report_total_key] = time.time() - time_start
             self._report["Initialization"] = report
 
+    def _get_module_classes(self, module):
+        """Find OpenPype module classes in python module.
+
+        Args:
+            module (types.ModuleType): Imported python module.
+
+        Returns:
+            list[type]: Classes which can be initialized.
+        """
+
+        module_classes = []
+        # Go through globals in `pype.modules`
+        for name in dir(module):
+            modules_item = getattr(module, name, None)
+            # Filter globals that are not classes which inherit from
+            #   OpenPypeModule
+            if (
+                not inspect.isclass(modules_item)
+                or modules_item is OpenPypeModule
+                or modules_item is OpenPypeAddOn
+                or not issubclass(modules_item, OpenPypeModule)
+            ):
+                continue
+
+            # Check if class is abstract (Developing purpose)
+            if inspect.isabstract(modules_item):
+                # Find abstract attributes by convention on `abc` module
+                not_implemented = []
+                for attr_name in dir(modules_item):
+                    attr = getattr(modules_item, attr_name, None)
+                    abs_method = getattr(
+                        attr, "__isabstractmethod__", None
+                    )
+                    if attr and abs_method:
+                        not_implemented.append(attr_name)
+
+                # Log missing implementations
+                self.log.warning((
+                    "Skipping abstract Class: {}."
+                    " Missing implementations: {}"
+                ).format(name, ", ".join(not_implemented)))
+                continue
+            module_classes.append(modules_item)
+        return module_classes
+
+    def _initialize_module(self, modules_item, modules_settings):
+        """Initialize module class and store it.
+
+        Args:
+            modules_item (type): OpenPype module class.
+            modules_settings (dict[str, Any]): Modules system settings.
+
+        Returns:
+            Union[OpenPypeModule, None]: Initialized module or None if
+                initialization failed.
+        """
+
+        name = modules_item.__name__
+        try:
+            # Try initialize module
+            module = modules_item(self, modules_settings)
+
+        except Exception:
+            self.log.warning(
+                "Initialization of module {} failed.".format(name),
+                exc_info=True
+            )
+            return None
+
+        # Store initialized object
+        self.modules.append(module)
+        self.modules_by_id[module.id] = module
+        self.modules_by_name[module.name] = module
+        enabled_str = "X"
+        if not module.enabled:
+            enabled_str = " "
+        self.log.debug("[{}] {}".format(enabled_str, name))
+        return module
+
+    def _initialize_skipped_module(self, module_name):
+        """Import and initialize module skipped during initialization.
+
+        Args:
+            module_name (str): Name of module.
+
+        Returns:
+            Union[OpenPypeModule, None]: Initialized module or None if
+                module was not skipped.
+        """
+
+        attr_name = self._skipped_modules.get(module_name)
+        if attr_name is None:
+            return None
+
+        # Remove all modules defined in the same python module
+        for name, value in tuple(self._skipped_modules.items()):
+            if value == attr_name:
+                self._skipped_modules.pop(name)
+
+        import openpype_modules
+
+        module = openpype_modules.get(attr_name)
+        if module is None:
+            return None
+
+        for modules_item in self._get_module_classes(module):
+            module = self._initialize_module(
+                modules_item, self._modules_settings
+            )
+            if module is not None and module.enabled:
+                self.log.warning((
+                    "Module \"{}\" was skipped as disabled in settings"
+                    " but is enabled."
+                ).format(module.name))
+        return dict.get(self.modules_by_name, module_name)
+
     def connect_modules(self):
         """Trigger connection with other enabled modules.
 
@@ -1027,7 +1563,9 @@ class TrayModulesManager(ModulesManager):
 
         self.modules = []
         self.modules_by_id = {}
-        self.modules_by_name = {}
+        self.modules_by_name = _ModulesByName(self)
+        self._skipped_modules = {}
+        self._modules_settings = None
         self._report = {}
 
         self.tray_manager = None
@@ -1197,7 +1735,17 @@ def get_module_settings_defs():
 
     log = Logger.get_logger("ModuleSettingsLoad")
 
-    for raw_module in openpype_modules:
+    manifest = _LoadCache.modules_manifest
+    for module_name in openpype_modules.keys():
+        # Don't import modules without settings definitions
+        if manifest.has_settings_defs(module_name) is False:
+            continue
+
+        raw_module = openpype_modules.get(module_name)
+        if raw_module is None:
+            continue
+
+        has_settings_defs = False
         for attr_name in dir(raw_module):
             attr = getattr(raw_module, attr_name)
             if (
@@ -1207,6 +1755,7 @@ def get_module_settings_defs():
             ):
                 continue
 
+            has_settings_defs = True
             if inspect.isabstract(attr):
                 # Find missing implementations by convention on `abc` module
                 not_implemented = []
@@ -1229,6 +1778,9 @@ def get_module_settings_defs():
 
             settings_defs.append(attr)
 
+        manifest.set_has_settings_defs(module_name, has_settings_defs)
+    manifest.save()
+
     return settings_defs
 
 
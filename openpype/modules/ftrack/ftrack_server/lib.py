@@ -27,6 +27,7 @@ except ImportError:
 from openpype_modules.ftrack.lib import get_ftrack_event_mongo_info
 
 from openpype.client import OpenPypeMongoConnection
+from openpype.client.indexes import ensure_indexes, FTRACK_EVENTS_KIND
 from openpype.lib import Logger
 
 TOPIC_STATUS_SERVER = "openpype.event.server.status"
@@ -112,14 +113,38 @@ class StorerEventHub(SocketBaseEventHub):
 
 
 class ProcessEventHub(SocketBaseEventHub):
+    """Event hub processing events stored in Mongo by event storer.
+
+    Processor is woken up by Mongo change stream when new event is stored.
+    Mongo is polled if change streams are not available (standalone mongo
+    server without replica set). Processed events are acknowledged in
+    batches and removed by TTL index.
+    """
     hearbeat_msg = b"processor"
 
     is_collection_created = False
     pypelog = Logger.get_logger("Session Processor")
 
+    # Poll interval when change streams are not available
+    poll_interval = 0.5
+    # Safety poll interval when change stream is running
+    watch_poll_interval = 10
+    # Acknowledge processed events in batches
+    ack_batch_size = 50
+    ack_interval = 1
+    # Remove old processed events if TTL index can't be created
+    cleanup_interval = 60 * 60
+    keep_processed_days = 3
+
     def __init__(self, *args, **kwargs):
         self.mongo_url = None
         self.dbcon = None
+        self._new_events = threading.Event()
+        self._watching = False
+        self._processed_ids = []
+        self._last_ack = time.time()
+        self._ttl_cleanup = False
+        self._last_cleanup = None
 
         super(ProcessEventHub, self).__init__(*args, **kwargs)
 
@@ -145,37 +170,95 @@ class ProcessEventHub(SocketBaseEventHub):
             self.sock.sendall(b"MongoError")
             sys.exit(0)
 
+        self._prepare_cleanup()
+        self._start_watching()
+
+    def _prepare_cleanup(self):
+        try:
+            ensure_indexes(self.dbcon, FTRACK_EVENTS_KIND)
+            self._ttl_cleanup = True
+
+        except pymongo.errors.OperationFailure:
+            self.pypelog.warning(
+                "Failed to create TTL index for processed events.",
+                exc_info=True
+            )
+
+    def _start_watching(self):
+        thread = threading.Thread(target=self._watch_new_events)
+        thread.daemon = True
+        thread.start()
+
+    def _watch_new_events(self):
+        """Wake up processing when storer stores an event."""
+        pipeline = [
+            {"$match": {"operationType": {"$in": ["insert", "replace"]}}}
+        ]
+        try:
+            with self.dbcon.watch(pipeline) as stream:
+                self._watching = True
+                for _ in stream:
+                    self._new_events.set()
+
+        except pymongo.errors.PyMongoError:
+            self.pypelog.info(
+                "Mongo change streams are not available, polling events."
+            )
+        self._watching = False
+        self._new_events.set()
+
+    def _wait_for_new_events(self):
+        timeout = self.poll_interval
+        if self._watching:
+            timeout = self.watch_poll_interval
+        self._new_events.wait(timeout)
+        self._new_events.clear()
+
     def wait(self, duration=None):
         """Overridden wait
-        Event are loaded from Mongo DB when queue is empty. Handled event is
-        set as processed in Mongo DB.
+        Event are loaded from Mongo DB when queue is empty. Handled events are
+        set as processed in Mongo DB in batches.
         """
         started = time.time()
         self.prepare_dbcon()
+        try:
+            self._wait(started, duration)
+        finally:
+            self.acknowledge_events()
+
+    def _wait(self, started, duration):
         while True:
             try:
                 event = self._event_queue.get(timeout=0.1)
             except queue.Empty:
+                # Processed events must be acknowledged before loading
+                #   so they're not loaded again
+                self.acknowledge_events()
+                self.cleanup_events()
+                # Clear before loading so events stored during loading
+                #   wake up next loop
+                self._new_events.clear()
                 if not self.load_events():
-                    time.sleep(0.5)
+                    self._wait_for_new_events()
             else:
                 try:
                     self._handle(event)
 
-                    mongo_id = event["data"].get("_event_mongo_id")
-                    if mongo_id is None:
-                        continue
-
-                    self.dbcon.update_one(
-                        {"_id": mongo_id},
-                        {"$set": {"pype_data.is_processed": True}}
-                    )
-
                 except pymongo.errors.AutoReconnect:
                     self.pypelog.error((
                         "Mongo server \"{}\" is not responding, exiting."
                     ).format(os.environ["OPENPYPE_MONGO"]))
                     sys.exit(0)
+
+                mongo_id = event["data"].get("_event_mongo_id")
+                if mongo_id is not None:
+                    self._processed_ids.append(mongo_id)
+                    if (
+                        len(self._processed_ids) >= self.ack_batch_size
+                        or time.time() - self._last_ack > self.ack_interval
+                    ):
+                        self.acknowledge_events()
+
                 # Additional special processing of events.
                 if event['topic'] == 'ftrack.meta.disconnected':
                     break
@@ -184,14 +267,49 @@ class ProcessEventHub(SocketBaseEventHub):
                 if (time.time() - started) > duration:
                     break
 
-    def load_events(self):
-        """Load not processed events sorted by stored date"""
-        ago_date = datetime.datetime.now() - datetime.timedelta(days=3)
+    def acknowledge_events(self):
+        """Set handled events as processed in Mongo DB."""
+        self._last_ack = time.time()
+        if not self._processed_ids:
+            return
+
+        processed_ids = self._processed_ids
+        self._processed_ids = []
+        try:
+            self.dbcon.update_many(
+                {"_id": {"$in": processed_ids}},
+                {"$set": {"pype_data.is_processed": True}}
+            )
+
+        except pymongo.errors.AutoReconnect:
+            self.pypelog.error((
+                "Mongo server \"{}\" is not responding, exiting."
+            ).format(os.environ["OPENPYPE_MONGO"]))
+            sys.exit(0)
+
+    def cleanup_events(self):
+        """Remove old processed events when TTL index is not available."""
+        if self._ttl_cleanup:
+            return
+
+        now = time.time()
+        if (
+            self._last_cleanup is not None
+            and now - self._last_cleanup < self.cleanup_interval
+        ):
+            return
+        self._last_cleanup = now
+
+        ago_date = datetime.datetime.utcnow() - datetime.timedelta(
+            days=self.keep_processed_days
+        )
         self.dbcon.delete_many({
             "pype_data.stored": {"$lte": ago_date},
             "pype_data.is_processed": True
         })
 
+    def load_events(self):
+        """Load not processed events sorted by stored date"""
         not_processed_events = self.dbcon.find(
             {"pype_data.is_processed": False}
         ).sort(
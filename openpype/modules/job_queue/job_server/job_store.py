@@ -0,0 +1,136 @@
+"""Persistent storage of jobs of job queue server.
+
+Store keeps data of jobs so waiting and running jobs are not lost when
+server is restarted. Default store keeps jobs only in memory.
+
+Store is defined by string passed to server:
+- empty string: jobs are kept only in memory
+- 'mongodb': jobs are stored to 'job_queue' collection of OpenPype database
+- 'sqlite:///path/to/jobs.db' or path to '.db' file: SQLite database
+"""
+
+import os
+import json
+import sqlite3
+import threading
+
+
+class JobStore:
+    """Store which does not persist jobs."""
+    def load_jobs(self):
+        """Load data of stored jobs.
+
+        Returns:
+            list[dict[str, Any]]: Data of jobs created by 'Job.to_data'.
+        """
+        return []
+
+    def save_job(self, job):
+        """Store current state of job."""
+        pass
+
+    def remove_job(self, job_id):
+        """Remove job from store."""
+        pass
+
+
+class SQLiteJobStore(JobStore):
+    """Store jobs in SQLite database file.
+
+    Args:
+        path (str): Path to database file.
+    """
+    def __init__(self, path):
+        dirpath = os.path.dirname(os.path.abspath(path))
+        if not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id TEXT PRIMARY KEY, data TEXT)"
+        )
+        self._connection.commit()
+
+    def load_jobs(self):
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT data FROM jobs"
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def save_job(self, job):
+        data = json.dumps(job.to_data())
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO jobs (id, data) VALUES (?, ?)",
+                (job.id, data)
+            )
+            self._connection.commit()
+
+    def remove_job(self, job_id):
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM jobs WHERE id = ?", (job_id, )
+            )
+            self._connection.commit()
+
+
+class MongoJobStore(JobStore):
+    """Store jobs in mongo collection.
+
+    Args:
+        collection (pymongo.collection.Collection): Collection for jobs.
+    """
+    def __init__(self, collection):
+        self._collection = collection
+
+    def load_jobs(self):
+        output = []
+        for doc in self._collection.find({}):
+            doc.pop("_id")
+            output.append(doc)
+        return output
+
+    def save_job(self, job):
+        doc = job.to_data()
+        doc["_id"] = job.id
+        self._collection.replace_one({"_id": job.id}, doc, upsert=True)
+
+    def remove_job(self, job_id):
+        self._collection.delete_one({"_id": job_id})
+
+
+def create_job_store(store_url=None):
+    """Create job store based on passed string.
+
+    Args:
+        store_url (Optional[str]): Definition of store. Value of
+            'OPENPYPE_JOB_QUEUE_STORE' environment variable is used
+            if not passed.
+
+    Returns:
+        JobStore: Store for jobs.
+    """
+    if store_url is None:
+        store_url = os.environ.get("OPENPYPE_JOB_QUEUE_STORE")
+
+    if not store_url:
+        return JobStore()
+
+    if store_url == "mongodb":
+        from openpype.client.mongo import OpenPypeMongoConnection
+
+        database_name = os.environ["OPENPYPE_DATABASE_NAME"]
+        mongo_client = OpenPypeMongoConnection.get_mongo_client()
+        return MongoJobStore(mongo_client[database_name]["job_queue"])
+
+    prefix = "sqlite:///"
+    if store_url.startswith(prefix):
+        return SQLiteJobStore(store_url[len(prefix):])
+
+    if store_url.endswith(".db"):
+        return SQLiteJobStore(store_url)
+
+    raise ValueError("Unknown job store \"{}\"".format(store_url))
@@ -1,15 +1,37 @@
+import heapq
 import datetime
+import itertools
 import collections
 from uuid import uuid4
 
+from .job_store import JobStore
+
+
+def _datetime_to_str(value):
+    if value is None:
+        return None
+    return value.isoformat()
+
+
+def _str_to_datetime(value):
+    if value is None:
+        return None
+    return datetime.datetime.fromisoformat(value)
+
 
 class Job:
     """Job related to specific host name.
 
     Data must contain everything needed to finish the job.
+
+    Job data may contain 'priority' (higher is processed sooner), 'submitter'
+    used for fair sharing of workers and 'max_retries' which is used when
+    worker processing the job is lost.
     """
     # Remove done jobs each n days to clear memory
     keep_in_memory_days = 3
+    default_priority = 50
+    default_max_retries = 3
 
     def __init__(self, host_name, data, job_id=None, created_time=None):
         if job_id is None:
@@ -24,6 +46,21 @@ class Job:
         self.data = data
         self._result_data = None
 
+        priority = data.get("priority")
+        if priority is None:
+            priority = self.default_priority
+        self.priority = int(priority)
+        self.submitter = data.get("submitter") or ""
+        max_retries = data.get("max_retries")
+        if max_retries is None:
+            max_retries = self.default_max_retries
+        self.max_retries = int(max_retries)
+        self.attempts = 0
+        # Job is not processed before this time (retry backoff)
+        self.not_before = None
+        # Lease is prolonged by heartbeats of worker
+        self.lease_expire_time = None
+
         self._started = False
         self._done = False
         self._errored = False
@@ -32,6 +69,61 @@ class Job:
 
         self._worker = None
 
+    def to_data(self):
+        """Data of job used to store the job.
+
+        Returns:
+            dict[str, Any]: Json serializable data.
+        """
+        return {
+            "id": self._id,
+            "host_name": self.host_name,
+            "data": self.data,
+            "created_time": _datetime_to_str(self._created_time),
+            "started_time": _datetime_to_str(self._started_time),
+            "done_time": _datetime_to_str(self._done_time),
+            "result": self._result_data,
+            "priority": self.priority,
+            "submitter": self.submitter,
+            "max_retries": self.max_retries,
+            "attempts": self.attempts,
+            "not_before": _datetime_to_str(self.not_before),
+            "started": self._started,
+            "done": self._done,
+            "errored": self._errored,
+            "message": self._message,
+        }
+
+    @classmethod
+    def from_data(cls, data):
+        """Create job from stored data.
+
+        Args:
+            data (dict[str, Any]): Data created by 'to_data'.
+
+        Returns:
+            Job: Job object.
+        """
+        job = cls(
+            data["host_name"],
+            data["data"],
+            data["id"],
+            _str_to_datetime(data["created_time"])
+        )
+        job._started_time = _str_to_datetime(data["started_time"])
+        job._done_time = _str_to_datetime(data["done_time"])
+        job._result_data = data["result"]
+        job.priority = data["priority"]
+        job.submitter = data["submitter"]
+        job.max_retries = data["max_retries"]
+        job.attempts = data["attempts"]
+        job.not_before = _str_to_datetime(data["not_before"])
+        job._started = data["started"]
+        job._done = data["done"]
+        job._errored = data["errored"]
+        job._message = data["message"]
+        return job
+
     def keep_in_memory(self):
         if self._done_time is None:
             return True
@@ -44,10 +136,18 @@ class Job:
     def id(self):
         return self._id
 
+    @property
+    def created_time(self):
+        return self._created_time
+
     @property
     def done(self):
         return self._done
 
+    @property
+    def worker(self):
+        return self._worker
+
     def reset(self):
         self._started = False
         self._started_time = None
@@ -55,6 +155,7 @@ class Job:
         self._done_time = None
         self._errored = False
         self._message = None
+        self.lease_expire_time = None
 
         self._worker = None
 
@@ -91,6 +192,7 @@ class Job:
         self._errored = not success
         self._message = message
         self._result_data = data
+        self.lease_expire_time = None
         if self._worker is not None:
             self._worker.set_current_job(None)
 
@@ -101,7 +203,10 @@ class Job:
         output = {
             "id": self.id,
             "worker_id": worker_id,
-            "done": self._done
+            "done": self._done,
+            "priority": self.priority,
+            "submitter": self.submitter,
+            "attempts": self.attempts,
         }
         output["message"] = self._message or None
 
@@ -126,17 +231,64 @@ class JobQueue:
     """Queue holds jobs that should be done and workers that can do them.
 
     Also asign jobs to a worker.
+
+    Waiting jobs are queued per host name and submitter. Job with highest
+    priority is assigned first, submitter with less running jobs and longer
+    time from last assigned job is preferred when priorities are the same.
+    Idle workers are indexed by host name.
+
+    When worker is lost (disconnected or lease of job expired) the job is
+    queued again with exponential backoff until 'max_retries' is reached.
+
+    Args:
+        store (Optional[JobStore]): Store where jobs are persisted.
     """
     old_jobs_check_minutes_interval = 30
-
-    def __init__(self):
+    # Lease of started job is prolonged by each heartbeat of worker
+    lease_seconds = 60
+    retry_backoff_seconds = 10
+    max_retry_backoff_seconds = 600
+    # Jobs of host without workers are failed after this time
+    missing_worker_timeout_seconds = 300
+
+    def __init__(self, store=None):
+        if store is None:
+            store = JobStore()
+        self._store = store
+        self._start_time = datetime.datetime.now()
         self._last_old_jobs_check = datetime.datetime.now()
         self._jobs_by_id = {}
-        self._job_queue_by_host_name = collections.defaultdict(
-            collections.deque
+        # Heaps of waiting jobs by host name and submitter
+        self._waiting_jobs = collections.defaultdict(
+            lambda: collections.defaultdict(list)
         )
+        # Heap of jobs waiting for retry
+        self._delayed_jobs = []
+        self._running_jobs = {}
+        self._counter = itertools.count()
+        # Order of last assigned job by submitter
+        self._last_served = {}
         self._workers_by_id = {}
         self._workers_by_host_name = collections.defaultdict(list)
+        self._idle_workers_by_host_name = collections.defaultdict(
+            collections.OrderedDict
+        )
+
+        self._load_jobs()
+
+    def _load_jobs(self):
+        for job_data in self._store.load_jobs():
+            job = Job.from_data(job_data)
+            self._jobs_by_id[job.id] = job
+            if job.done:
+                continue
+
+            # Worker of started job was lost with restart of server
+            if job.started:
+                job.reset()
+                job.attempts += 1
+                self._store.save_job(job)
+            self._push_job(job)
 
     def workers(self):
         """All currently registered workers."""
@@ -147,56 +299,262 @@ class JobQueue:
         print("Added new worker for \"{}\"".format(host_name))
         self._workers_by_id[worker.id] = worker
         self._workers_by_host_name[host_name].append(worker)
+        worker.set_state_callback(self._on_worker_state_change)
+        self._on_worker_state_change(worker)
 
     def get_worker(self, worker_id):
         return self._workers_by_id.get(worker_id)
 
-    def remove_worker(self, worker):
-        # Look if worker had assigned job to do
-        job = worker.current_job
-        if job is not None and not job.done:
-            # Reset job
-            job.set_worker(None)
-            job.reset()
-            # Add job back to queue
-            self._job_queue_by_host_name[job.host_name].appendleft(job)
-
+    def remove_worker(self, worker, message=None):
         # Remove worker from registered workers
         self._workers_by_id.pop(worker.id, None)
         host_name = worker.host_name
         if worker in self._workers_by_host_name[host_name]:
             self._workers_by_host_name[host_name].remove(worker)
+        self._idle_workers_by_host_name[host_name].pop(worker.id, None)
+        worker.set_state_callback(None)
+
+        # Look if worker had assigned job to do
+        job = worker.current_job
+        if job is not None and not job.done:
+            self._retry_job(job, message or "Worker disconnected")
 
         print("Removed worker for \"{}\"".format(host_name))
 
+    def _on_worker_state_change(self, worker):
+        if worker.id not in self._workers_by_id:
+            return
+
+        idle_workers = self._idle_workers_by_host_name[worker.host_name]
+        if worker.is_idle():
+            idle_workers[worker.id] = worker
+        else:
+            idle_workers.pop(worker.id, None)
+
+    def _push_job(self, job):
+        if job.not_before is not None:
+            heapq.heappush(
+                self._delayed_jobs,
+                (job.not_before, next(self._counter), job)
+            )
+            return
+
+        heapq.heappush(
+            self._waiting_jobs[job.host_name][job.submitter],
+            (-job.priority, next(self._counter), job)
+        )
+
+    def _release_delayed_jobs(self, now):
+        while self._delayed_jobs and self._delayed_jobs[0][0] <= now:
+            _, _, job = heapq.heappop(self._delayed_jobs)
+            if job.deleted or job.done:
+                continue
+            job.not_before = None
+            self._push_job(job)
+
+    def _pop_job(self, host_name, running_by_submitter):
+        """Pop next job of host name.
+
+        Job with highest priority is used. Submitter with less running jobs
+        and then submitter which waits longer from last assigned job is
+        preferred on same priority.
+        """
+        jobs_by_submitter = self._waiting_jobs.get(host_name)
+        if not jobs_by_submitter:
+            return None
+
+        best_key = None
+        best_heap = None
+        for submitter in tuple(jobs_by_submitter.keys()):
+            heap = jobs_by_submitter[submitter]
+            # Remove deleted jobs
+            while heap and heap[0][2].deleted:
+                heapq.heappop(heap)
+
+            if not heap:
+                jobs_by_submitter.pop(submitter)
+                continue
+
+            neg_priority, order, _ = heap[0]
+            key = (
+                neg_priority,
+                running_by_submitter[submitter],
+                self._last_served.get(submitter, -1),
+                order
+            )
+            if best_key is None or key < best_key:
+                best_key = key
+                best_heap = heap
+
+        if best_heap is None:
+            return None
+        job = heapq.heappop(best_heap)[2]
+        self._last_served[job.submitter] = next(self._counter)
+        return job
+
     def assign_jobs(self):
         """Try to assign job for each idle worker.
 
-        Error all jobs without needed worker.
+        Error jobs of hosts without workers.
         """
-        available_host_names = set()
-        for worker in self._workers_by_id.values():
-            host_name = worker.host_name
-            available_host_names.add(host_name)
-            if worker.is_idle():
-                jobs = self._job_queue_by_host_name[host_name]
-                while jobs:
-                    job = jobs.popleft()
-                    if not job.deleted:
-                        worker.set_current_job(job)
-                        break
-
-        for host_name in tuple(self._job_queue_by_host_name.keys()):
-            if host_name in available_host_names:
+        now = datetime.datetime.now()
+        self._release_delayed_jobs(now)
+
+        running_by_submitter = collections.Counter(
+            job.submitter for job in self._running_jobs.values()
+        )
+        for host_name, idle_workers in self._idle_workers_by_host_name.items():
+            while idle_workers:
+                job = self._pop_job(host_name, running_by_submitter)
+                if job is None:
+                    break
+                worker = next(iter(idle_workers.values()))
+                worker.set_current_job(job)
+                self._running_jobs[job.id] = job
+                running_by_submitter[job.submitter] += 1
+
+        self._fail_jobs_without_workers(now)
+        self._remove_old_jobs()
+
+    def _fail_jobs_without_workers(self, now):
+        timeout = datetime.timedelta(
+            seconds=self.missing_worker_timeout_seconds
+        )
+        for host_name in tuple(self._waiting_jobs.keys()):
+            if self._workers_by_host_name[host_name]:
                 continue
 
-            jobs_deque = self._job_queue_by_host_name[host_name]
+            jobs_by_submitter = self._waiting_jobs[host_name]
             message = ("Not available workers for \"{}\"").format(host_name)
-            while jobs_deque:
-                job = jobs_deque.popleft()
-                if not job.deleted:
+            for submitter in tuple(jobs_by_submitter.keys()):
+                heap = jobs_by_submitter[submitter]
+                remaining = []
+                for item in heap:
+                    job = item[2]
+                    if job.deleted:
+                        continue
+                    waiting_since = max(self._start_time, job.created_time)
+                    if now - waiting_since < timeout:
+                        remaining.append(item)
+                        continue
                     job.set_done(False, message)
-        self._remove_old_jobs()
+                    self._store.save_job(job)
+
+                if remaining:
+                    heapq.heapify(remaining)
+                    jobs_by_submitter[submitter] = remaining
+                else:
+                    jobs_by_submitter.pop(submitter)
+
+            if not jobs_by_submitter:
+                self._waiting_jobs.pop(host_name)
+
+    def job_sent(self, worker):
+        """Job of worker was sent to the worker."""
+        job = worker.current_job
+        worker.set_working()
+        if job is not None:
+            job.set_started()
+            self._store.save_job(job)
+
+    def job_done(self, worker_id, job_id, success, message, data):
+        """Worker finished job.
+
+        Result is ignored if worker does not hold the job anymore (e.g.
+        lease of the job expired and job was assigned to other worker).
+
+        Returns:
+            bool: Result of job was accepted.
+        """
+        worker = self.get_worker(worker_id)
+        job = self._jobs_by_id.get(job_id)
+        if (
+            worker is None
+            or job is None
+            or job.done
+            or worker.current_job is not job
+        ):
+            print((
+                "Ignored result of job \"{}\" from worker \"{}\" which"
+                " does not hold the job"
+            ).format(job_id, worker_id))
+            return False
+
+        worker.set_current_job(None)
+        self._running_jobs.pop(job_id, None)
+        job.set_done(success, message, data)
+        self._store.save_job(job)
+        return True
+
+    def heartbeat(self, worker_id, job_id=None):
+        """Worker is alive and works on a job.
+
+        Lease of job is prolonged.
+
+        Returns:
+            bool: Worker is registered and works on the job.
+        """
+        worker = self.get_worker(worker_id)
+        if worker is None:
+            return False
+
+        job = worker.current_job
+        if job is None or (job_id is not None and job.id != job_id):
+            return False
+
+        job.lease_expire_time = (
+            datetime.datetime.now()
+            + datetime.timedelta(seconds=self.lease_seconds)
+        )
+        return True
+
+    def check_leases(self):
+        """Remove workers with expired lease of their job.
+
+        Lease is checked only for jobs of workers which sent a heartbeat.
+
+        Returns:
+            list[Worker]: Removed workers.
+        """
+        now = datetime.datetime.now()
+        expired_workers = []
+        for job in tuple(self._running_jobs.values()):
+            if job.lease_expire_time is None or job.lease_expire_time > now:
+                continue
+            worker = job.worker
+            if worker is None:
+                self._retry_job(job, "Lease of job expired")
+                continue
+            expired_workers.append(worker)
+
+        for worker in expired_workers:
+            self.remove_worker(worker, "Lease of job expired")
+        return expired_workers
+
+    def _retry_job(self, job, message):
+        self._running_jobs.pop(job.id, None)
+        job.set_worker(None)
+        job.attempts += 1
+        if job.attempts > job.max_retries:
+            job.set_done(False, "{} (attempts: {})".format(
+                message, job.attempts
+            ))
+            self._store.save_job(job)
+            return
+
+        job.reset()
+        backoff = min(
+            self.retry_backoff_seconds * (2 ** (job.attempts - 1)),
+            self.max_retry_backoff_seconds
+        )
+        job.not_before = (
+            datetime.datetime.now() + datetime.timedelta(seconds=backoff)
+        )
+        print("Job \"{}\" will be retried in {}s: {}".format(
+            job.id, backoff, message
+        ))
+        self._store.save_job(job)
+        self._push_job(job)
 
     def get_jobs(self):
         return self._jobs_by_id.values()
@@ -209,19 +567,23 @@ class JobQueue:
         """Create new job from passed data and add it to queue."""
         job = Job(host_name, job_data)
         self._jobs_by_id[job.id] = job
-        self._job_queue_by_host_name[host_name].append(job)
+        self._store.save_job(job)
+        self._push_job(job)
         return job
 
     def _remove_old_jobs(self):
         """Once in specific time look if should remove old finished jobs."""
-        delta = datetime.datetime.now() - self._last_old_jobs_check
-        if delta.seconds < self.old_jobs_check_minutes_interval:
+        now = datetime.datetime.now()
+        delta = now - self._last_old_jobs_check
+        if delta.total_seconds() < self.old_jobs_check_minutes_interval * 60:
             return
+        self._last_old_jobs_check = now
 
         for job_id in tuple(self._jobs_by_id.keys()):
             job = self._jobs_by_id[job_id]
             if not job.keep_in_memory():
                 self._jobs_by_id.pop(job_id)
+                self._store.remove_job(job_id)
 
     def remove_job(self, job_id):
         """Delete job and eventually stop it."""
@@ -231,6 +593,8 @@ class JobQueue:
 
         job.set_deleted()
         self._jobs_by_id.pop(job.id)
+        self._running_jobs.pop(job.id, None)
+        self._store.remove_job(job.id)
 
     def get_job_status(self, job_id):
         """Job's status based on id."""
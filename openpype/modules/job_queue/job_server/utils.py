@@ -14,7 +14,7 @@ class SharedObjects:
         cls.stopped = True
 
 
-def main(port=None, host=None):
+def main(port=None, host=None, store_url=None):
     def signal_handler(sig, frame):
         print("Signal to kill process received. Termination starts.")
         SharedObjects.stop()
@@ -35,7 +35,7 @@ def main(port=None, host=None):
         return 1
 
     print("Running server {}:{}".format(host, port))
-    manager = WebServerManager(port, host)
+    manager = WebServerManager(port, host, store_url=store_url)
     manager.start_server()
 
     stopped = False
@@ -21,7 +21,8 @@ class WorkerRpc(JsonRpc):
         # Register methods
         self.add_methods(
             ("", self.register_worker),
-            ("", self.job_done)
+            ("", self.job_done),
+            ("", self.heartbeat)
         )
         asyncio.ensure_future(self._rpc_loop(), loop=self.loop)
 
@@ -43,25 +44,34 @@ class WorkerRpc(JsonRpc):
             for worker in tuple(self._job_queue.workers()):
                 if not worker.connection_is_alive():
                     self._job_queue.remove_worker(worker)
+
+            for worker in self._job_queue.check_leases():
+                await self._close_worker(worker)
+
             self._job_queue.assign_jobs()
 
             await self.send_jobs()
             await asyncio.sleep(5)
 
+    async def _close_worker(self, worker):
+        try:
+            await worker.close()
+        except Exception:
+            self.logger.debug("Failed to close worker", exc_info=True)
+
     async def job_done(self, worker_id, job_id, success, message, data):
-        worker = self._job_queue.get_worker(worker_id)
-        if worker is not None:
-            worker.set_current_job(None)
+        return self._job_queue.job_done(
+            worker_id, job_id, success, message, data
+        )
 
-        job = self._job_queue.get_job(job_id)
-        if job is not None:
-            job.set_done(success, message, data)
-        return True
+    async def heartbeat(self, worker_id, job_id=None):
+        return self._job_queue.heartbeat(worker_id, job_id)
 
     async def send_jobs(self):
         invalid_workers = []
         for worker in self._job_queue.workers():
             if worker.job_assigned() and not worker.is_working():
+                self._job_queue.job_sent(worker)
                 try:
                     await worker.send_job()
 
@@ -19,6 +19,10 @@ class WorkerClient(JsonRpcClient):
     def set_id(self, worker_id):
         self._id = worker_id
 
+    @property
+    def worker_id(self):
+        return self._id
+
     async def start_job(self, job_data):
         if self.current_job is not None:
             return False
@@ -52,6 +56,8 @@ class WorkerJobsConnection:
     as worker for specific host.
     """
     retry_time_seconds = 5
+    # Heartbeat prolongs lease of current job on server
+    heartbeat_interval_seconds = 15
 
     def __init__(self, server_url, host_name, loop=None):
         self.client = None
@@ -156,14 +162,36 @@ class WorkerJobsConnection:
         if register_worker:
             self.register_as_worker()
 
+        last_heartbeat = None
         while self._connected and self._loop.is_running():
             if self._stopped or ws.closed:
                 break
 
+            now = datetime.datetime.now()
+            if (
+                last_heartbeat is None
+                or (now - last_heartbeat).total_seconds()
+                >= self.heartbeat_interval_seconds
+            ):
+                last_heartbeat = now
+                self.send_heartbeat()
+
             await asyncio.sleep(0.3)
 
         await self._stop_cleanup()
 
+    def send_heartbeat(self):
+        """Tell server that worker is still working on current job."""
+        client = self.client
+        if client is None or client.current_job is None:
+            return
+        asyncio.ensure_future(
+            client.call(
+                "heartbeat", [client.worker_id, client.current_job["job_id"]]
+            ),
+            loop=self._loop
+        )
+
     def register_as_worker(self):
         """Register as worker ready to work on server side."""
         asyncio.ensure_future(self._register_as_worker(), loop=self._loop)
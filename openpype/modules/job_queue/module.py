@@ -27,6 +27,9 @@ workstations know where to send or receive jobs.
 ### start_server
 - start server which is handles jobs
 - it is possible to specify port and host address (default is localhost:8079)
+- jobs are kept only in memory unless job store is defined with '--store'
+    (or 'OPENPYPE_JOB_QUEUE_STORE' environment variable), e.g. 'mongodb' or
+    path to SQLite '.db' file
 
 ### start_worker
 - start worker which will process jobs
@@ -137,11 +140,29 @@ class JobQueueModule(OpenPypeModule):
     def server_url(self):
         return self._server_url
 
-    def send_job(self, host_name, job_data):
+    def send_job(self, host_name, job_data, priority=None, submitter=None):
+        """Send job to job queue server.
+
+        Args:
+            host_name (str): Host which should process the job.
+            job_data (dict[str, Any]): Data of job.
+            priority (Optional[int]): Higher priority is processed sooner.
+            submitter (Optional[str]): Submitter of job used for fair sharing
+                of workers. Current user is used if not passed.
+
+        Returns:
+            str: Job id.
+        """
         import requests
+        from openpype.lib import get_openpype_username
 
         job_data = job_data or {}
         job_data["host_name"] = host_name
+        if priority is not None:
+            job_data["priority"] = priority
+        if submitter is None:
+            submitter = get_openpype_username()
+        job_data["submitter"] = submitter
         api_path = "{}/api/jobs".format(self._server_url)
         post_request = requests.post(api_path, data=json.dumps(job_data))
         return str(post_request.content.decode())
@@ -165,10 +186,10 @@ class JobQueueModule(OpenPypeModule):
         )
 
     @classmethod
-    def start_server(cls, port=None, host=None):
+    def start_server(cls, port=None, host=None, store_url=None):
         from .job_server import main
 
-        return main(port, host)
+        return main(port, host, store_url)
 
     @classmethod
     def start_worker(cls, app_name, server_url=None):
@@ -227,8 +248,12 @@ def cli_main():
 )
 @click.option("--port", help="Server port")
 @click.option("--host", help="Server host (ip address)")
-def cli_start_server(port, host):
-    JobQueueModule.start_server(port, host)
+@click.option(
+    "--store",
+    help="Job store, 'mongodb' or path to SQLite '.db' file."
+)
+def cli_start_server(port, host, store):
+    JobQueueModule.start_server(port, host, store)
 
 
 @cli_main.command(
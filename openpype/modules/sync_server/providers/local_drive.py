@@ -1,13 +1,11 @@
 from __future__ import print_function
 import os.path
-import shutil
-import threading
-import time
 
 from openpype.lib import Logger
 from openpype.lib.local_settings import get_local_site_id
 from openpype.pipeline import Anatomy
 from .abstract_provider import AbstractProvider
+from . import transfer
 
 log = Logger.get_logger("SyncServer")
 
@@ -18,7 +16,7 @@ class LocalDriveHandler(AbstractProvider):
 
     """ Handles required operations on mounted disks with OS """
     def __init__(self, project_name, site_name, tree=None, presets=None):
-        self.presets = None
+        self.presets = presets
         self.active = False
         self.project_name = project_name
         self.site_name = site_name
@@ -51,6 +49,19 @@ class LocalDriveHandler(AbstractProvider):
         """
         # for non 'studio' sites, 'studio' is configured in Anatomy
         editable = [
+            {
+                "type": "number",
+                "key": "max_transfers",
+                "label": "Max concurrent transfers (0 for default)",
+                "minimum": 0
+            },
+            {
+                "type": "number",
+                "key": "bandwidth_limit",
+                "label": "Bandwidth limit in MB/s (0 for unlimited)",
+                "decimal": 1,
+                "minimum": 0
+            },
             {
                 "key": "root",
                 "label": "Roots",
@@ -87,22 +98,26 @@ class LocalDriveHandler(AbstractProvider):
                     overwrite=False, direction="Upload"):
         """
             Copies file from 'source_path' to 'target_path'
+
+            File is copied by chunks, interrupted copy is resumed from
+            offset stored in DB.
         """
         if not os.path.isfile(source_path):
             raise FileNotFoundError("Source file {} doesn't exist."
                                     .format(source_path))
 
-        if overwrite:
-            thread = threading.Thread(target=self._copy,
-                                      args=(source_path, target_path))
-            thread.start()
-            self._mark_progress(project_name, file, representation, server,
-                                site, source_path, target_path, direction)
-        else:
-            if os.path.exists(target_path):
+        if os.path.exists(target_path):
+            if not overwrite:
                 raise ValueError("File {} exists, set overwrite".
                                  format(target_path))
 
+            if os.path.samefile(source_path, target_path):
+                log.debug("same files, skipping")
+                return os.path.basename(target_path)
+
+        self._copy(source_path, target_path, server, project_name, file,
+                   representation, site, direction)
+
         return os.path.basename(target_path)
 
     def download_file(self, source_path, local_path,
@@ -183,41 +198,40 @@ class LocalDriveHandler(AbstractProvider):
         """
         pass
 
-    def _copy(self, source_path, target_path):
-        print("copying {}->{}".format(source_path, target_path))
-        try:
-            shutil.copy(source_path, target_path)
-        except shutil.SameFileError:
-            print("same files, skipping")
-
-    def _mark_progress(self, project_name, file, representation, server, site,
-                       source_path, target_path, direction):
-        """
-            Updates progress field in DB by values 0-1.
-
-            Compares file sizes of source and target.
-        """
-        source_file_size = os.path.getsize(source_path)
-        target_file_size = 0
-        last_tick = status_val = None
-        while source_file_size != target_file_size:
-            if not last_tick or \
-                    time.time() - last_tick >= server.LOG_PROGRESS_SEC:
-                status_val = target_file_size / source_file_size
-                last_tick = time.time()
-                log.debug(direction + "ed %d%%." % int(status_val * 100))
-                server.update_db(project_name=project_name,
-                                 new_file_id=None,
-                                 file=file,
-                                 representation=representation,
-                                 site=site,
-                                 progress=status_val
-                                 )
-            try:
-                target_file_size = os.path.getsize(target_path)
-            except FileNotFoundError:
-                pass
-            time.sleep(0.5)
+    def _copy(self, source_path, target_path, server, project_name, file,
+              representation, site, direction):
+        log.debug("copying {}->{}".format(source_path, target_path))
+        part_path = transfer.get_part_path(target_path)
+        part_size = None
+        if os.path.isfile(part_path):
+            part_size = os.path.getsize(part_path)
+        source_info = transfer.get_source_info(os.stat(source_path))
+        offset = transfer.get_resume_offset(
+            file, site, part_size, source_info
+        )
+        if offset:
+            log.debug("resuming from {} bytes".format(offset))
+
+        total_size = source_info["size"]
+        progress = transfer.TransferProgress(
+            server, project_name, file, representation, site, total_size,
+            direction, source_info
+        )
+        limiter = transfer.get_bandwidth_limiter(self.site_name, self.presets)
+        with open(source_path, "rb") as source_stream:
+            with open(part_path, "r+b" if offset else "wb") as target_stream:
+                source_stream.seek(offset)
+                target_stream.seek(offset)
+                target_stream.truncate()
+                transfer.copy_stream(
+                    source_stream,
+                    target_stream,
+                    total_size,
+                    offset,
+                    limiter=limiter,
+                    progress=progress
+                )
+        os.replace(part_path, target_path)
 
     def _normalize_site_name(self, site_name):
         """Transform user id to 'local' for Local settings"""
@@ -1,12 +1,11 @@
 import os
 import os.path
-import time
-import threading
 import platform
 
 from openpype.lib import Logger
 from openpype.settings import get_system_settings
 from .abstract_provider import AbstractProvider
+from . import transfer
 log = Logger.get_logger("SyncServer-SFTPHandler")
 
 pysftp = None
@@ -130,6 +129,19 @@ class SFTPHandler(AbstractProvider):
                 'label': "SFTP user ssh key password",
                 'type': 'text'
             },
+            {
+                "type": "number",
+                "key": "max_transfers",
+                "label": "Max concurrent transfers (0 for default)",
+                "minimum": 0
+            },
+            {
+                "type": "number",
+                "key": "bandwidth_limit",
+                "label": "Bandwidth limit in MB/s (0 for unlimited)",
+                "decimal": 1,
+                "minimum": 0
+            },
             # roots could be overridden only on Project level, User cannot
             {
                 "key": "root",
@@ -254,18 +266,52 @@ class SFTPHandler(AbstractProvider):
                 raise ValueError("File {} exists, set overwrite".
                                  format(target_path))
 
-        thread = threading.Thread(target=self._upload,
-                                  args=(source_path, target_path))
-        thread.start()
-        self._mark_progress(project_name, file, representation, server,
-                            site, source_path, target_path, "upload")
+        self._upload(source_path, target_path, server, project_name, file,
+                     representation, site)
 
         return os.path.basename(target_path)
 
-    def _upload(self, source_path, target_path):
-        print("copying {}->{}".format(source_path, target_path))
+    def _upload(self, source_path, target_path, server, project_name, file,
+                representation, site):
+        """Upload file by chunks, resume interrupted upload if possible."""
+        self.log.debug("copying {}->{}".format(source_path, target_path))
+        # fresh connection, transfers run in parallel threads
         conn = self._get_conn()
-        conn.put(source_path, target_path)
+        part_path = transfer.get_part_path(target_path)
+        part_size = None
+        if conn.isfile(part_path):
+            part_size = conn.stat(part_path).st_size
+        source_info = transfer.get_source_info(os.stat(source_path))
+        offset = transfer.get_resume_offset(
+            file, site, part_size, source_info
+        )
+        if offset:
+            self.log.debug("resuming from {} bytes".format(offset))
+            conn.truncate(part_path, offset)
+
+        total_size = source_info["size"]
+        progress = transfer.TransferProgress(
+            server, project_name, file, representation, site, total_size,
+            "Upload", source_info
+        )
+        limiter = transfer.get_bandwidth_limiter(self.site_name, self.presets)
+        with open(source_path, "rb") as source_stream:
+            with conn.open(part_path, "ab" if offset else "wb") as target:
+                # Don't wait for server response after each written chunk
+                target.set_pipelined(True)
+                source_stream.seek(offset)
+                transfer.copy_stream(
+                    source_stream,
+                    target,
+                    total_size,
+                    offset,
+                    limiter=limiter,
+                    progress=progress
+                )
+
+        if conn.isfile(target_path):
+            conn.remove(target_path)
+        conn.rename(part_path, target_path)
 
     def download_file(self, source_path, target_path,
                       server, project_name, file, representation, site,
@@ -300,18 +346,50 @@ class SFTPHandler(AbstractProvider):
                 raise ValueError("File {} exists, set overwrite".
                                  format(target_path))
 
-        thread = threading.Thread(target=self._download,
-                                  args=(source_path, target_path))
-        thread.start()
-        self._mark_progress(project_name, file, representation, server,
-                            site, source_path, target_path, "download")
+        self._download(source_path, target_path, server, project_name,
+                       file, representation, site)
 
         return os.path.basename(target_path)
 
-    def _download(self, source_path, target_path):
-        print("downloading {}->{}".format(source_path, target_path))
+    def _download(self, source_path, target_path, server, project_name,
+                  file, representation, site):
+        """Download file by chunks, resume interrupted download if possible.
+        """
+        self.log.debug("downloading {}->{}".format(source_path, target_path))
         conn = self._get_conn()
-        conn.get(source_path, target_path)
+        part_path = transfer.get_part_path(target_path)
+        part_size = None
+        if os.path.isfile(part_path):
+            part_size = os.path.getsize(part_path)
+        source_info = transfer.get_source_info(conn.stat(source_path))
+        offset = transfer.get_resume_offset(
+            file, site, part_size, source_info
+        )
+        if offset:
+            self.log.debug("resuming from {} bytes".format(offset))
+
+        total_size = source_info["size"]
+        progress = transfer.TransferProgress(
+            server, project_name, file, representation, site, total_size,
+            "Download", source_info
+        )
+        limiter = transfer.get_bandwidth_limiter(self.site_name, self.presets)
+        with conn.open(source_path, "rb") as source_stream:
+            with open(part_path, "r+b" if offset else "wb") as target:
+                source_stream.seek(offset)
+                # Request rest of file from current position in parallel
+                source_stream.prefetch(total_size)
+                target.seek(offset)
+                target.truncate()
+                transfer.copy_stream(
+                    source_stream,
+                    target,
+                    total_size,
+                    offset,
+                    limiter=limiter,
+                    progress=progress
+                )
+        os.replace(part_path, target_path)
 
     def delete_file(self, path):
         """
@@ -425,40 +503,3 @@ class SFTPHandler(AbstractProvider):
         except (paramiko.ssh_exception.SSHException,
                 pysftp.exceptions.ConnectionException):
             self.log.warning("Couldn't connect", exc_info=True)
-
-    def _mark_progress(self, project_name, file, representation, server, site,
-                       source_path, target_path, direction):
-        """
-            Updates progress field in DB by values 0-1.
-
-            Compares file sizes of source and target.
-        """
-        pass
-        if direction == "upload":
-            source_file_size = os.path.getsize(source_path)
-        else:
-            source_file_size = self.conn.stat(source_path).st_size
-
-        target_file_size = 0
-        last_tick = status_val = None
-        while source_file_size != target_file_size:
-            if not last_tick or \
-                    time.time() - last_tick >= server.LOG_PROGRESS_SEC:
-                status_val = target_file_size / source_file_size
-                last_tick = time.time()
-                self.log.debug(direction + "ed %d%%." % int(status_val * 100))
-                server.update_db(project_name=project_name,
-                                 new_file_id=None,
-                                 file=file,
-                                 representation=representation,
-                                 site=site,
-                                 progress=status_val
-                                 )
-            try:
-                if direction == "upload":
-                    target_file_size = self.conn.stat(target_path).st_size
-                else:
-                    target_file_size = os.path.getsize(target_path)
-            except FileNotFoundError:
-                pass
-            time.sleep(0.5)
@@ -0,0 +1,257 @@
+"""Chunked transfer of files used by providers.
+
+File is copied by chunks to temporary '.part' file next to target and
+renamed when transfer is finished. Number of transferred bytes is stored
+to site record of file in DB ('offset') together with progress, so failed
+transfer can continue from the offset in next sync loop. Size and
+modification time of source are stored with the offset ('offset_source')
+and transfer starts from beginning if source was changed in the meantime.
+
+Bandwidth can be limited per site. Limit is shared by all transfers of the
+site running in parallel.
+"""
+
+import time
+import threading
+
+from openpype.lib import Logger
+
+log = Logger.get_logger("SyncServer")
+
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+PART_FILE_EXT = ".part"
+
+_bandwidth_limiters = {}
+_bandwidth_limiters_lock = threading.Lock()
+
+
+class BandwidthLimiter(object):
+    """Limit throughput of transfers sharing the object.
+
+    Args:
+        bytes_per_sec (int): Maximum number of bytes per second.
+    """
+
+    def __init__(self, bytes_per_sec):
+        self.bytes_per_sec = bytes_per_sec
+        self._lock = threading.Lock()
+        self._next_time = time.time()
+
+    def consume(self, size):
+        """Wait until 'size' bytes can be transferred.
+
+        Args:
+            size (int): Number of bytes which will be transferred.
+        """
+
+        if not self.bytes_per_sec:
+            return
+
+        with self._lock:
+            now = time.time()
+            start = max(now, self._next_time)
+            self._next_time = start + (float(size) / self.bytes_per_sec)
+        wait_time = start - now
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
+def get_bandwidth_limiter(site_name, preset):
+    """Bandwidth limiter of site shared by its transfers.
+
+    Args:
+        site_name (str): Name of site.
+        preset (Union[dict[str, Any], None]): Site settings with
+            'bandwidth_limit' in MB/s. Zero means no limit.
+
+    Returns:
+        Union[BandwidthLimiter, None]: Limiter or None if bandwidth is not
+            limited.
+    """
+
+    limit = (preset or {}).get("bandwidth_limit")
+    if not limit:
+        return None
+
+    bytes_per_sec = int(limit * 1024 * 1024)
+    with _bandwidth_limiters_lock:
+        limiter = _bandwidth_limiters.get(site_name)
+        if limiter is None:
+            limiter = BandwidthLimiter(bytes_per_sec)
+            _bandwidth_limiters[site_name] = limiter
+        limiter.bytes_per_sec = bytes_per_sec
+    return limiter
+
+
+def get_part_path(target_path):
+    return target_path + PART_FILE_EXT
+
+
+def get_source_info(stat_result):
+    """Information about source file stored with transfer offset.
+
+    Args:
+        stat_result (Any): Result of 'os.stat' or stat of remote file with
+            'st_size' and 'st_mtime' attributes.
+
+    Returns:
+        dict[str, int]: Size and modification time of source.
+    """
+
+    return {
+        "size": int(stat_result.st_size),
+        "mtime": int(stat_result.st_mtime)
+    }
+
+
+def get_resume_offset(file, site_name, part_size, source_info=None):
+    """Offset from which can be transfer of file resumed.
+
+    Offset is used only if it was stored to DB by previous transfer,
+    partially transferred file is available and source file did not change
+    since the offset was stored.
+
+    Args:
+        file (dict[str, Any]): File information from representation.
+        site_name (str): Name of site where progress is stored.
+        part_size (Union[int, None]): Size of partially transferred file.
+        source_info (Optional[dict[str, int]]): Current size and
+            modification time of source from 'get_source_info'.
+
+    Returns:
+        int: Number of bytes which don't have to be transferred.
+    """
+
+    if not part_size:
+        return 0
+
+    for site in file.get("sites") or []:
+        if site.get("name") != site_name:
+            continue
+
+        if (
+            source_info is not None
+            and site.get("offset_source") != source_info
+        ):
+            return 0
+        offset = site.get("offset") or 0
+        return min(int(offset), part_size)
+    return 0
+
+
+class TransferProgress(object):
+    """Report progress of transfer to sync server.
+
+    Progress is stored each 'LOG_PROGRESS_SEC' seconds of server.
+
+    Args:
+        server (SyncServerModule): Server used to store progress.
+        project_name (str): Name of project.
+        file (dict[str, Any]): Transferred file information.
+        representation (dict[str, Any]): Representation of file.
+        site (str): Name of site where progress is stored.
+        total_size (int): Size of transferred file.
+        direction (str): Label of transfer for logs.
+        source_info (Optional[dict[str, int]]): Size and modification time
+            of source stored with offset.
+    """
+
+    def __init__(
+        self,
+        server,
+        project_name,
+        file,
+        representation,
+        site,
+        total_size,
+        direction,
+        source_info=None
+    ):
+        self.server = server
+        self.project_name = project_name
+        self.file = file
+        self.representation = representation
+        self.site = site
+        self.total_size = total_size
+        self.direction = direction
+        self.source_info = source_info
+        self._last_tick = None
+
+    def update(self, offset):
+        """Transferred bytes changed.
+
+        Args:
+            offset (int): Number of transferred bytes.
+        """
+
+        now = time.time()
+        if (
+            self._last_tick is not None
+            and now - self._last_tick < self.server.LOG_PROGRESS_SEC
+        ):
+            return
+
+        self._last_tick = now
+        progress = 1.0
+        if self.total_size:
+            progress = float(offset) / self.total_size
+        log.debug("{} {}%.".format(self.direction, int(progress * 100)))
+        self.server.update_db(
+            project_name=self.project_name,
+            new_file_id=None,
+            file=self.file,
+            representation=self.representation,
+            site=self.site,
+            progress=progress,
+            offset=offset,
+            offset_source=self.source_info
+        )
+
+
+def copy_stream(
+    source_stream,
+    target_stream,
+    total_size,
+    offset=0,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    limiter=None,
+    progress=None
+):
+    """Copy content of source stream to target stream by chunks.
+
+    Source stream must be at 'offset' position and target stream must
+    contain first 'offset' bytes of source.
+
+    Args:
+        source_stream (BinaryIO): Readable stream.
+        target_stream (BinaryIO): Writable stream.
+        total_size (int): Size of source content.
+        offset (Optional[int]): Number of already transferred bytes.
+        chunk_size (Optional[int]): Maximum size of chunk in bytes.
+        limiter (Optional[BandwidthLimiter]): Limit of throughput.
+        progress (Optional[TransferProgress]): Progress reporter.
+
+    Returns:
+        int: Number of transferred bytes.
+
+    Raises:
+        IOError: Source ended before 'total_size' was transferred.
+    """
+
+    if progress is not None:
+        progress.update(offset)
+
+    while offset < total_size:
+        size = min(chunk_size, total_size - offset)
+        if limiter is not None:
+            limiter.consume(size)
+        data = source_stream.read(size)
+        if not data:
+            raise IOError(
+                "Source ended after {} of {} bytes".format(offset, total_size)
+            )
+        target_stream.write(data)
+        offset += len(data)
+        if progress is not None:
+            progress.update(offset)
+    return offset
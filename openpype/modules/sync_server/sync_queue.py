@@ -0,0 +1,177 @@
+"""Incremental queue of representations which should be synchronized.
+
+Sync server does not query all representations of project in each loop.
+Representation documents contain 'files_modified_dt' which is set when
+files or sites of representation are changed (by integration or by sync
+server). Only representations modified since last query are loaded and
+merged into queue of pending representations.
+
+Changes made by tools which do not set the key are found by full
+reconciliation which is done periodically.
+"""
+
+import datetime
+
+from openpype.lib import Logger
+
+FILES_MODIFIED_KEY = "files_modified_dt"
+
+
+class SiteSyncQueue(object):
+    """Pending representations of a project for pair of sites.
+
+    Args:
+        project_name (str): Name of project.
+        local_site (str): Name of active site.
+        remote_site (str): Name of remote site.
+    """
+
+    def __init__(self, project_name, local_site, remote_site):
+        self.project_name = project_name
+        self.local_site = local_site
+        self.remote_site = remote_site
+        self.watermark = None
+        self.last_full_sync = None
+        self._items = {}
+
+    def __len__(self):
+        return len(self._items)
+
+    def set_representations(self, representations, full=False):
+        """Merge queried representations into queue.
+
+        Args:
+            representations (Iterable[dict[str, Any]]): Representations
+                which should be synchronized.
+            full (Optional[bool]): Representations are result of full query
+                and replace current content of queue.
+        """
+
+        if full:
+            self._items = {}
+        for repre in representations:
+            self._items[repre["_id"]] = repre
+
+    def remove(self, representation_ids):
+        """Remove representations from queue.
+
+        Args:
+            representation_ids (Iterable[ObjectId]): Representation ids.
+        """
+
+        for repre_id in representation_ids:
+            self._items.pop(repre_id, None)
+
+    def get_representations(self):
+        """Representations in queue sorted by priority.
+
+        Returns:
+            list[dict[str, Any]]: Representation documents.
+        """
+
+        return sorted(
+            self._items.values(),
+            key=lambda repre: (-repre.get("priority", 0), repre["_id"])
+        )
+
+
+class SyncRepresentationsQueue(object):
+    """Queues of representations to synchronize for each project.
+
+    Args:
+        module (SyncServerModule): Module used to query representations.
+        full_sync_interval (Optional[float]): Seconds between full
+            reconciliations of queue with database.
+        watermark_overlap (Optional[float]): Seconds subtracted from
+            watermark of last query to cover time differences between
+            machines which modify representations.
+    """
+
+    def __init__(
+        self, module, full_sync_interval=600, watermark_overlap=60
+    ):
+        self.log = Logger.get_logger(self.__class__.__name__)
+        self._module = module
+        self._full_sync_interval = datetime.timedelta(
+            seconds=full_sync_interval
+        )
+        self._watermark_overlap = datetime.timedelta(
+            seconds=watermark_overlap
+        )
+        self._queues = {}
+
+    def get_queue(self, project_name, local_site, remote_site):
+        key = (project_name, local_site, remote_site)
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = SiteSyncQueue(project_name, local_site, remote_site)
+            self._queues[key] = queue
+        return queue
+
+    def get_representations(self, project_name, local_site, remote_site):
+        """Update queue from database and return pending representations.
+
+        Args:
+            project_name (str): Name of project.
+            local_site (str): Name of active site.
+            remote_site (str): Name of remote site.
+
+        Returns:
+            list[dict[str, Any]]: Representations which should be
+                synchronized sorted by priority.
+        """
+
+        queue = self.get_queue(project_name, local_site, remote_site)
+        now = datetime.datetime.utcnow()
+        full = (
+            queue.last_full_sync is None
+            or now - queue.last_full_sync >= self._full_sync_interval
+        )
+        if full:
+            self.log.debug((
+                "Full reconciliation of sync queue for {}"
+            ).format(project_name))
+            representations = self._module.get_sync_representations(
+                project_name, local_site, remote_site
+            )
+            queue.set_representations(representations, full=True)
+            queue.last_full_sync = now
+
+        else:
+            modified_since = queue.watermark - self._watermark_overlap
+            # Documents in queue could be outdated
+            queue.remove(self._module.get_modified_representation_ids(
+                project_name, modified_since
+            ))
+            representations = self._module.get_sync_representations(
+                project_name,
+                local_site,
+                remote_site,
+                modified_since=modified_since
+            )
+            queue.set_representations(representations)
+
+        queue.watermark = now
+        return queue.get_representations()
+
+    def remove(self, project_name, local_site, remote_site,
+               representation_ids):
+        """Remove processed representations from queue.
+
+        Representations are added again when they are modified and still
+        should be synchronized.
+
+        Args:
+            project_name (str): Name of project.
+            local_site (str): Name of active site.
+            remote_site (str): Name of remote site.
+            representation_ids (Iterable[ObjectId]): Representation ids.
+        """
+
+        queue = self.get_queue(project_name, local_site, remote_site)
+        queue.remove(representation_ids)
+
+    def reset(self):
+        """Force full reconciliation of all queues in next loop."""
+
+        self._queues = {}
@@ -14,10 +14,11 @@ from openpype.pipeline import Anatomy
 from openpype.pipeline.load.utils import get_representation_path_with_anatomy
 
 from .utils import SyncStatus, ResumableError
+from .sync_queue import SyncRepresentationsQueue
 
 
 async def upload(module, project_name, file, representation, provider_name,
-                 remote_site_name, tree=None, preset=None):
+                 remote_site_name, tree=None, preset=None, executor=None):
     """
         Upload single 'file' of a 'representation' to 'provider'.
         Source url is taken from 'file' portion, where {root} placeholder
@@ -41,6 +42,8 @@ async def upload(module, project_name, file, representation, provider_name,
             have multiple sites (different accounts, credentials)
         tree (dictionary): injected memory structure for performance
         preset (dictionary): site config ('credentials_url', 'root'...)
+        executor (concurrent.futures.Executor): executor running transfers
+            of the site, default executor of loop is used if not passed
 
     """
     # create ids sequentially, upload file in parallel later
@@ -69,7 +72,7 @@ async def upload(module, project_name, file, representation, provider_name,
             raise NotADirectoryError(err)
 
     loop = asyncio.get_running_loop()
-    file_id = await loop.run_in_executor(None,
+    file_id = await loop.run_in_executor(executor,
                                          remote_handler.upload_file,
                                          local_file_path,
                                          remote_file_path,
@@ -89,7 +92,7 @@ async def upload(module, project_name, file, representation, provider_name,
 
 
 async def download(module, project_name, file, representation, provider_name,
-                   remote_site_name, tree=None, preset=None):
+                   remote_site_name, tree=None, preset=None, executor=None):
     """
         Downloads file to local folder denoted in representation.Context.
 
@@ -103,6 +106,8 @@ async def download(module, project_name, file, representation, provider_name,
             have multiple sites (different accounts, credentials)
         tree (dictionary): injected memory structure for performance
         preset (dictionary): site config ('credentials_url', 'root'...)
+        executor (concurrent.futures.Executor): executor running transfers
+            of the site, default executor of loop is used if not passed
 
         Returns:
         (string) - 'name' of local file
@@ -125,7 +130,7 @@ async def download(module, project_name, file, representation, provider_name,
     local_site = module.get_active_site(project_name)
 
     loop = asyncio.get_running_loop()
-    file_id = await loop.run_in_executor(None,
+    file_id = await loop.run_in_executor(executor,
                                          remote_handler.download_file,
                                          remote_file_path,
                                          local_file_path,
@@ -291,6 +296,8 @@ class SyncServerThread(threading.Thread):
         Separate thread running synchronization server with asyncio loop.
         Stopped when tray is closed.
     """
+    DEFAULT_MAX_TRANSFERS = 3
+
     def __init__(self, module):
         self.log = Logger.get_logger(self.__class__.__name__)
 
@@ -298,7 +305,11 @@ class SyncServerThread(threading.Thread):
         self.module = module
         self.loop = None
         self.is_running = False
-        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=3)
+        self.sync_queue = SyncRepresentationsQueue(module)
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.DEFAULT_MAX_TRANSFERS)
+        # transfers of each remote site run in separate executor
+        self._site_executors = {}
         self.timer = None
 
     def run(self):
@@ -350,11 +361,14 @@ class SyncServerThread(threading.Thread):
                     if not all([local_site, remote_site]):
                         continue
 
-                    sync_repres = self.module.get_sync_representations(
+                    sync_repres = self.sync_queue.get_representations(
                         project_name,
                         local_site,
                         remote_site
                     )
+                    # representations which were not completely processed
+                    #   stay in queue for next loop
+                    skipped_repre_ids = set()
 
                     task_files_to_process = []
                     files_processed_info = []
@@ -374,11 +388,14 @@ class SyncServerThread(threading.Thread):
                                                        presets=site_preset)
                     limit = lib.factory.get_provider_batch_limit(
                         remote_provider)
+                    site_executor = self._get_site_executor(remote_site,
+                                                            site_preset)
                     # first call to get_provider could be expensive, its
                     # building folder tree structure in memory
                     # call only if needed, eg. DO_UPLOAD or DO_DOWNLOAD
                     for sync in sync_repres:
                         if limit <= 0:
+                            skipped_repre_ids.add(sync["_id"])
                             continue
                         files = sync.get("files") or []
                         if files:
@@ -386,6 +403,7 @@ class SyncServerThread(threading.Thread):
                                 # skip already processed files
                                 file_path = file.get('path', '')
                                 if file_path in processed_file_path:
+                                    skipped_repre_ids.add(sync["_id"])
                                     continue
                                 status = self.module.check_status(
                                     file,
@@ -403,7 +421,8 @@ class SyncServerThread(threading.Thread):
                                                remote_provider,
                                                remote_site,
                                                tree,
-                                               site_preset))
+                                               site_preset,
+                                               site_executor))
                                     task_files_to_process.append(task)
                                     # store info for exception handlingy
                                     files_processed_info.append((file,
@@ -423,7 +442,8 @@ class SyncServerThread(threading.Thread):
                                                  remote_provider,
                                                  remote_site,
                                                  tree,
-                                                 site_preset))
+                                                 site_preset,
+                                                 site_executor))
                                     task_files_to_process.append(task)
 
                                     files_processed_info.append((file,
@@ -452,6 +472,17 @@ class SyncServerThread(threading.Thread):
                                               representation,
                                               site,
                                               error)
+                    self.module.flush_db_updates()
+                    self.sync_queue.remove(
+                        project_name,
+                        local_site,
+                        remote_site,
+                        [
+                            sync["_id"]
+                            for sync in sync_repres
+                            if sync["_id"] not in skipped_repre_ids
+                        ]
+                    )
 
                 duration = time.time() - start_time
                 self.log.debug("One loop took {:.2f}s".format(duration))
@@ -479,6 +510,29 @@ class SyncServerThread(threading.Thread):
                     "Unhandled except. in sync loop, stopping server",
                     exc_info=True)
 
+    def _get_site_executor(self, site_name, site_preset):
+        """
+            Returns executor for transfers of 'site_name'.
+
+            Number of parallel transfers is taken from 'max_transfers' of
+            site settings.
+        """
+        max_workers = (
+            (site_preset or {}).get("max_transfers")
+            or self.DEFAULT_MAX_TRANSFERS
+        )
+        item = self._site_executors.get(site_name)
+        if item is not None and item[0] != max_workers:
+            item[1].shutdown(wait=False)
+            item = None
+
+        if item is None:
+            executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers)
+            item = (max_workers, executor)
+            self._site_executors[site_name] = item
+        return item[1]
+
     def stop(self):
         """Sets is_running flag to false, 'check_shutdown' shuts server down"""
         self.is_running = False
@@ -504,6 +558,8 @@ class SyncServerThread(threading.Thread):
         await self.loop.shutdown_asyncgens()
         # to really make sure everything else has time to stop
         self.executor.shutdown(wait=True)
+        for _, executor in self._site_executors.values():
+            executor.shutdown(wait=True)
         await asyncio.sleep(0.07)
         self.loop.stop()
 
@@ -35,6 +35,7 @@ from .providers.local_drive import LocalDriveHandler
 from .providers import lib
 
 from .utils import time_function, SyncStatus, SiteAlreadyPresentError
+from .sync_queue import FILES_MODIFIED_KEY
 
 log = Logger.get_logger("SyncServer")
 
@@ -119,6 +120,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
 
         # some parts of code need to run sequentially, not in async
         self.lock = None
+        self._updates_buffer = None
         self._sync_system_settings = None
         # settings for all enabled projects for sync
         self._sync_project_settings = None
@@ -1338,8 +1340,13 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
             return
 
         from .sync_server import SyncServerThread
+        from .update_buffer import SyncUpdatesBuffer
 
         self.lock = threading.Lock()
+        self._updates_buffer = SyncUpdatesBuffer(
+            lambda project_name: self.connection.database[project_name],
+            flush_interval=self.LOG_PROGRESS_SEC
+        )
 
         self.sync_server_thread = SyncServerThread(self)
 
@@ -1381,6 +1388,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
             self.log.info("Stopping sync server server")
             self.sync_server_thread.is_running = False
             self.sync_server_thread.stop()
+            self.flush_db_updates()
             self.log.info("Sync server stopped")
         except Exception:
             self.log.warning(
@@ -1607,7 +1615,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         return sites.get(site, 'N/A')
 
     @time_function
-    def get_sync_representations(self, project_name, active_site, remote_site):
+    def get_sync_representations(self, project_name, active_site, remote_site,
+                                 modified_since=None):
         """
             Get representations that should be synced, these could be
             recognised by presence of document in 'files.sites', where key is
@@ -1623,6 +1632,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
                 'local_0' when working from home, 'studio' when working in the
                 studio (default)
             remote_site (string): identifier of remote site I want to sync to
+            modified_since (datetime): return only representations with
+                files modified since this time (UTC)
 
         Returns:
             (list) of dictionaries
@@ -1671,6 +1682,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
                 ]}
             ]
         }
+        if modified_since is not None:
+            match[FILES_MODIFIED_KEY] = {"$gte": modified_since}
 
         aggr = [
             {"$match": match},
@@ -1716,6 +1729,27 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
 
         return representations
 
+    def get_modified_representation_ids(self, project_name, modified_since):
+        """
+            Get ids of representations with files or sites modified since
+            'modified_since'.
+
+        Args:
+            project_name (string):
+            modified_since (datetime): time of modification (UTC)
+
+        Returns:
+            (list) of ObjectId
+        """
+        repre_docs = self.connection.database[project_name].find(
+            {
+                "type": "representation",
+                FILES_MODIFIED_KEY: {"$gte": modified_since}
+            },
+            {"_id": 1}
+        )
+        return [repre_doc["_id"] for repre_doc in repre_docs]
+
     def check_status(self, file, local_site, remote_site, config_preset):
         """
             Check synchronization status for single 'file' of single
@@ -1772,8 +1806,14 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
 
         return SyncStatus.DO_NOTHING
 
+    def flush_db_updates(self):
+        """Write buffered sync state updates of files to DB."""
+        if self._updates_buffer is not None:
+            self._updates_buffer.flush()
+
     def update_db(self, project_name, new_file_id, file, representation,
-                  site, error=None, progress=None, priority=None):
+                  site, error=None, progress=None, priority=None,
+                  offset=None, offset_source=None):
         """
             Update 'provider' portion of records in DB with success (file_id)
             or error (exception)
@@ -1788,6 +1828,9 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
             error (string): exception message
             progress (float): 0-0.99 of progress of upload/download
             priority (int): 0-100 set priority
+            offset (int): transferred bytes, used to resume transfer
+            offset_source (dict): size and mtime of source file when offset
+              was stored, transfer is not resumed if source changed
 
         Returns:
             None
@@ -1806,8 +1849,12 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
             update["$set"] = self._get_success_dict(new_file_id)
             # reset previous errors if any
             update["$unset"] = self._get_error_dict("", "", "")
+            update["$unset"]["files.$[f].sites.$[s].offset"] = ""
+            update["$unset"]["files.$[f].sites.$[s].offset_source"] = ""
         elif progress is not None:
-            update["$set"] = self._get_progress_dict(progress)
+            update["$set"] = self._get_progress_dict(
+                progress, offset, offset_source
+            )
         elif priority is not None:
             update["$set"] = self._get_priority_dict(priority, file_id)
         else:
@@ -1816,18 +1863,38 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
 
             update["$set"] = self._get_error_dict(error, tries)
 
-        arr_filter = [
-            {'s.name': site}
-        ]
-        if file_id:
-            arr_filter.append({'f._id': ObjectId(file_id)})
+        if progress is None:
+            # trigger processing of representation by sync queue
+            update["$set"][FILES_MODIFIED_KEY] = datetime.utcnow()
 
-        self.connection.database[project_name].update_one(
-            query,
-            update,
-            upsert=True,
-            array_filters=arr_filter
-        )
+        if (
+            file_id
+            and priority is None
+            and self._updates_buffer is not None
+        ):
+            # Sync state of files is written in batches
+            self._updates_buffer.add(
+                project_name,
+                representation_id,
+                file_id,
+                site,
+                update,
+                is_progress=progress is not None
+            )
+
+        else:
+            arr_filter = [
+                {'s.name': site}
+            ]
+            if file_id:
+                arr_filter.append({'f._id': ObjectId(file_id)})
+
+            self.connection.database[project_name].update_one(
+                query,
+                update,
+                upsert=True,
+                array_filters=arr_filter
+            )
 
         if progress is not None or priority is not None:
             return
@@ -1973,6 +2040,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         query = {
             "_id": ObjectId(representation_id)
         }
+        update.setdefault("$set", {})[FILES_MODIFIED_KEY] = datetime.utcnow()
 
         self.connection.database[project_name].update_one(
             query,
@@ -2279,16 +2347,22 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         _, rec = self._get_site_rec(file.get("sites", []), provider)
         return self._get_tries_count_from_rec(rec)
 
-    def _get_progress_dict(self, progress):
+    def _get_progress_dict(self, progress, offset=None, offset_source=None):
         """
             Provide progress metadata to be stored in Db.
             Used during upload/download for GUI to show.
         Args:
             progress: (float) - 0-1 progress of upload/download
+            offset: (int) - transferred bytes to resume failed transfer
+            offset_source: (dict) - size and mtime of source for offset
         Returns:
             (dictionary)
         """
         val = {"files.$[f].sites.$[s].progress": progress}
+        if offset is not None:
+            val["files.$[f].sites.$[s].offset"] = offset
+        if offset_source is not None:
+            val["files.$[f].sites.$[s].offset_source"] = offset_source
         return val
 
     def _get_priority_dict(self, priority, file_id):
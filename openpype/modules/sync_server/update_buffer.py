@@ -0,0 +1,168 @@
+"""Write-behind buffer of sync state updates of representation files.
+
+Sync server updates state of each processed file (success, error or
+progress) on representation document. Updates are collected in buffer and
+written using 'bulk_write' with one update operation per representation.
+
+Progress update is dropped when newer update of the same file and site is
+added before flush.
+"""
+
+import time
+import threading
+import collections
+
+from bson.objectid import ObjectId
+from pymongo import UpdateOne
+
+from openpype.lib import Logger
+
+
+class SyncUpdatesBuffer(object):
+    """Buffer of file site updates flushed in batches.
+
+    Buffer is flushed when 'flush' is called or when an update is added and
+    last flush happened before 'flush_interval' seconds.
+
+    Args:
+        get_collection (Callable[[str], pymongo.collection.Collection]):
+            Function returning collection of a project.
+        flush_interval (Optional[float]): Maximum age of buffered updates
+            in seconds.
+        max_updates (Optional[int]): Number of buffered file updates which
+            causes flush.
+    """
+
+    def __init__(self, get_collection, flush_interval=5, max_updates=1000):
+        self.log = Logger.get_logger(self.__class__.__name__)
+        self._get_collection = get_collection
+        self._flush_interval = flush_interval
+        self._max_updates = max_updates
+        self._lock = threading.RLock()
+        # Updates by project name and representation id
+        self._updates = collections.OrderedDict()
+        self._updates_count = 0
+        self._last_flush = time.time()
+
+    @property
+    def updates_count(self):
+        return self._updates_count
+
+    def add(
+        self,
+        project_name,
+        representation_id,
+        file_id,
+        site_name,
+        update,
+        is_progress=False
+    ):
+        """Add update of file site.
+
+        Args:
+            project_name (str): Name of project.
+            representation_id (Union[str, ObjectId]): Representation id.
+            file_id (Union[str, ObjectId]): Id of file in representation.
+            site_name (str): Name of site.
+            update (dict[str, dict[str, Any]]): Update operators with fields.
+                Keys contain array filter identifiers '$[f]' for file and
+                '$[s]' for site.
+            is_progress (Optional[bool]): Update contains only progress.
+        """
+
+        key = (ObjectId(file_id), site_name)
+        with self._lock:
+            project_updates = self._updates.setdefault(
+                project_name, collections.OrderedDict()
+            )
+            repre_updates = project_updates.setdefault(
+                ObjectId(representation_id), collections.OrderedDict()
+            )
+            current = repre_updates.get(key)
+            if current is None:
+                self._updates_count += 1
+
+            # Progress must not replace result of the file
+            elif is_progress and not current[1]:
+                return
+
+            repre_updates[key] = (update, is_progress)
+
+            if (
+                self._updates_count >= self._max_updates
+                or time.time() - self._last_flush >= self._flush_interval
+            ):
+                self.flush()
+
+    def flush(self):
+        """Write buffered updates to database.
+
+        Returns:
+            int: Number of written representation updates.
+        """
+
+        with self._lock:
+            updates = self._updates
+            self._updates = collections.OrderedDict()
+            self._updates_count = 0
+            self._last_flush = time.time()
+
+            output = 0
+            for project_name, repre_updates in updates.items():
+                operations = [
+                    self._create_operation(repre_id, file_updates)
+                    for repre_id, file_updates in repre_updates.items()
+                ]
+                if not operations:
+                    continue
+                self._get_collection(project_name).bulk_write(
+                    operations, ordered=False
+                )
+                output += len(operations)
+
+        if output:
+            self.log.debug(
+                "Written {} representation updates".format(output)
+            )
+        return output
+
+    @staticmethod
+    def _create_operation(representation_id, file_updates):
+        """Merge updates of representation files into one operation.
+
+        Each file and site gets unique array filter identifier.
+        """
+
+        site_identifiers = {}
+        array_filters = []
+        update = {}
+        for idx, item in enumerate(file_updates.items()):
+            (file_id, site_name), (file_update, _) = item
+            site_identifier = site_identifiers.get(site_name)
+            if site_identifier is None:
+                site_identifier = "s{}".format(len(site_identifiers))
+                site_identifiers[site_name] = site_identifier
+                array_filters.append(
+                    {"{}.name".format(site_identifier): site_name}
+                )
+
+            file_identifier = "f{}".format(idx)
+            array_filters.append(
+                {"{}._id".format(file_identifier): file_id}
+            )
+            for operator, fields in file_update.items():
+                operator_data = update.setdefault(operator, {})
+                for field, value in fields.items():
+                    field = (
+                        field
+                        .replace("$[f]", "$[{}]".format(file_identifier))
+                        .replace("$[s]", "$[{}]".format(site_identifier))
+                    )
+                    operator_data[field] = value
+
+        return UpdateOne(
+            {"_id": representation_id},
+            update,
+            upsert=True,
+            array_filters=array_filters
+        )
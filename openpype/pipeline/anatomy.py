@@ -11,6 +11,7 @@ import time
 from openpype.settings.lib import (
     get_local_settings,
 )
+from openpype.settings.readonly import ReadOnlyDict, to_readonly
 from openpype.settings.constants import (
     DEFAULT_PROJECT_KEY
 )
@@ -69,21 +70,33 @@ class BaseAnatomy(object):
         self._roots_obj = Roots(self)
 
     # Anatomy used as dictionary
-    # - implemented only getters returning copy
+    # - implemented only getters returning read only views, use 'to_dict'
+    #   to get modifiable copy
     def __getitem__(self, key):
-        return copy.deepcopy(self._data[key])
+        return to_readonly(self._data[key])
 
     def get(self, key, default=None):
-        return copy.deepcopy(self._data).get(key, default)
+        if key not in self._data:
+            return default
+        return self[key]
 
     def keys(self):
-        return copy.deepcopy(self._data).keys()
+        return list(self._data.keys())
 
     def values(self):
-        return copy.deepcopy(self._data).values()
+        return [self[key] for key in self._data.keys()]
 
     def items(self):
-        return copy.deepcopy(self._data).items()
+        return [(key, self[key]) for key in self._data.keys()]
+
+    def to_dict(self):
+        """Modifiable copy of anatomy data.
+
+        Returns:
+            dict[str, Any]: Copy of anatomy data.
+        """
+
+        return copy.deepcopy(self._data)
 
     def _prepare_anatomy_data(self, project_doc, root_overrides):
         """Prepare anatomy data for further processing.
@@ -118,6 +131,10 @@ class BaseAnatomy(object):
         """Wrap `format_all` method of Anatomy's `templates_obj`."""
         return self._templates_obj.format_all(*args, **kwargs)
 
+    def format_many(self, *args, **kwargs):
+        """Wrap `format_many` method of Anatomy's `templates_obj`."""
+        return self._templates_obj.format_many(*args, **kwargs)
+
     @property
     def roots(self):
         """Wrap `roots` property of Anatomy's `roots_obj`."""
@@ -445,7 +462,10 @@ class Anatomy(BaseAnatomy):
         project_cache = cls._project_cache[project_name]
         if project_cache.is_outdated:
             project_cache.update_data(get_project(project_name))
-        return copy.deepcopy(project_cache.data)
+        project_doc = project_cache.data
+        if project_doc is not None:
+            project_doc = ReadOnlyDict(project_doc)
+        return project_doc
 
     @classmethod
     def get_sync_server_addon(cls):
@@ -626,7 +646,7 @@ class AnatomyStringTemplate(StringTemplate):
 
         anatomy_templates = self.anatomy_templates
         if not data.get("root"):
-            data = copy.deepcopy(data)
+            data = dict(data)
             data["root"] = anatomy_templates.anatomy.roots
         result = StringTemplate.format(self, data)
         rootless_path = anatomy_templates.rootless_path_from_result(result)
@@ -715,7 +735,7 @@ class AnatomyTemplates(TemplatesDict):
     def default_templates(self):
         """Return default templates data with solved inner keys."""
         return self.solve_template_inner_links(
-            self.anatomy["templates"]
+            self.anatomy["templates"].to_dict()
         )
 
     def _discover(self):
@@ -978,7 +998,7 @@ class AnatomyTemplates(TemplatesDict):
         return output
 
     def format(self, data, strict=True):
-        copy_data = copy.deepcopy(data)
+        copy_data = dict(data)
         roots = self.roots
         if roots:
             copy_data["root"] = roots
@@ -13,10 +13,13 @@ from openpype.lib import (
     run_openpype_process,
     Logger
 )
+from openpype.lib.media_metadata_cache import get_media_metadata_cache
 from openpype.pipeline import Anatomy
 
 log = Logger.get_logger(__name__)
 
+_ocio_wrapper_importable = None
+
 
 @contextlib.contextmanager
 def _make_temp_json_file():
@@ -230,10 +233,47 @@ def get_data_subprocess(config_path, data_type):
 
 def compatible_python():
     """Only 3.9 or higher can directly use PyOpenColorIO in ocio_wrapper"""
-    compatible = False
-    if sys.version[0] == 3 and sys.version[1] >= 9:
-        compatible = True
-    return compatible
+    global _ocio_wrapper_importable
+    if sys.version_info[:2] < (3, 9):
+        return False
+
+    # Check if PyOpenColorIO and other requirements of wrapper can be
+    #   imported in current process
+    if _ocio_wrapper_importable is None:
+        try:
+            from ..scripts import ocio_wrapper  # noqa: F401
+            _ocio_wrapper_importable = True
+        except ImportError:
+            _ocio_wrapper_importable = False
+    return _ocio_wrapper_importable
+
+
+def get_ocio_config_data(config_path):
+    """Get all data of config
+
+    Config is loaded only once and result is cached by config path and its
+    modification time. Subprocess is used only if PyOpenColorIO can't be
+    used in current process.
+
+    Args:
+        config_path (str): path leading to config.ocio file
+
+    Returns:
+        dict: colorspaces, views, roles and file rules of config
+    """
+    cache = get_media_metadata_cache()
+    config_data = cache.get("ocio_config", config_path)
+    if config_data is not None:
+        return config_data
+
+    if compatible_python():
+        from ..scripts.ocio_wrapper import _get_config_data
+        config_data = _get_config_data(config_path)
+    else:
+        config_data = get_data_subprocess(config_path, "get_config_data")
+
+    cache.set("ocio_config", config_path, config_data)
+    return config_data
 
 
 def get_ocio_config_colorspaces(config_path):
@@ -248,11 +288,31 @@ def get_ocio_config_colorspaces(config_path):
     Returns:
         dict: colorspace and family in couple
     """
-    if compatible_python():
-        from ..scripts.ocio_wrapper import _get_colorspace_data
-        return _get_colorspace_data(config_path)
-    else:
-        return get_colorspace_data_subprocess(config_path)
+    return get_ocio_config_data(config_path)["colorspaces"]
+
+
+def get_ocio_config_roles(config_path):
+    """Get all roles of config
+
+    Args:
+        config_path (str): path leading to config.ocio file
+
+    Returns:
+        dict: role name and colorspace name in couple
+    """
+    return get_ocio_config_data(config_path)["roles"]
+
+
+def get_ocio_config_file_rules(config_path):
+    """Get file rules defined in config
+
+    Args:
+        config_path (str): path leading to config.ocio file
+
+    Returns:
+        list: file rules with name, pattern, extension, regex and colorspace
+    """
+    return get_ocio_config_data(config_path)["file_rules"]
 
 
 def get_colorspace_data_subprocess(config_path):
@@ -281,11 +341,7 @@ def get_ocio_config_views(config_path):
     Returns:
         dict: `display/viewer` and viewer data
     """
-    if compatible_python():
-        from ..scripts.ocio_wrapper import _get_views_data
-        return _get_views_data(config_path)
-    else:
-        return get_views_data_subprocess(config_path)
+    return get_ocio_config_data(config_path)["views"]
 
 
 def get_views_data_subprocess(config_path):
@@ -21,7 +21,9 @@ from openpype.client import (
     get_representations,
     get_representation_by_id,
     get_representation_by_name,
-    get_representation_parents
+    get_representation_parents,
+    get_representations_parents,
+    get_representations_hierarchy,
 )
 from openpype.lib import (
     StringTemplate,
@@ -110,59 +112,43 @@ def get_contexts_for_repre_docs(project_name, repre_docs):
     if not repre_docs:
         return contexts
 
-    repre_docs_by_id = {}
-    version_ids = set()
-    for repre_doc in repre_docs:
-        version_ids.add(repre_doc["parent"])
-        repre_docs_by_id[repre_doc["_id"]] = repre_doc
-
-    version_docs = get_versions(
-        project_name, version_ids, hero=True
+    parents_by_repre_id = get_representations_parents(
+        project_name, repre_docs
     )
 
-    version_docs_by_id = {}
     hero_version_docs = []
     versions_for_hero = set()
-    subset_ids = set()
-    for version_doc in version_docs:
-        if version_doc["type"] == "hero_version":
+    for parents in parents_by_repre_id.values():
+        version_doc = parents[0]
+        if version_doc and version_doc["type"] == "hero_version":
             hero_version_docs.append(version_doc)
             versions_for_hero.add(version_doc["version_id"])
-        version_docs_by_id[version_doc["_id"]] = version_doc
-        subset_ids.add(version_doc["parent"])
 
     if versions_for_hero:
-        _version_docs = get_versions(project_name, versions_for_hero)
+        _version_docs = get_versions(
+            project_name, versions_for_hero, fields=["data"]
+        )
         _version_data_by_id = {
             version_doc["_id"]: version_doc["data"]
             for version_doc in _version_docs
         }
 
         for hero_version_doc in hero_version_docs:
-            hero_version_id = hero_version_doc["_id"]
             version_id = hero_version_doc["version_id"]
             version_data = copy.deepcopy(_version_data_by_id[version_id])
-            version_docs_by_id[hero_version_id]["data"] = version_data
-
-    subset_docs = get_subsets(project_name, subset_ids)
-    subset_docs_by_id = {}
-    asset_ids = set()
-    for subset_doc in subset_docs:
-        subset_docs_by_id[subset_doc["_id"]] = subset_doc
-        asset_ids.add(subset_doc["parent"])
+            hero_version_doc["data"] = version_data
 
-    asset_docs = get_assets(project_name, asset_ids)
-    asset_docs_by_id = {
-        asset_doc["_id"]: asset_doc
-        for asset_doc in asset_docs
-    }
-
-    project_doc = get_project(project_name)
+    for repre_doc in repre_docs:
+        repre_id = repre_doc["_id"]
+        version_doc, subset_doc, asset_doc, project_doc = (
+            parents_by_repre_id[repre_id]
+        )
+        if not version_doc or not subset_doc or not asset_doc:
+            log.debug((
+                "Skipped representation '{}' with missing parents."
+            ).format(repre_id))
+            continue
 
-    for repre_id, repre_doc in repre_docs_by_id.items():
-        version_doc = version_docs_by_id[repre_doc["parent"]]
-        subset_doc = subset_docs_by_id[version_doc["parent"]]
-        asset_doc = asset_docs_by_id[subset_doc["parent"]]
         context = {
             "project": {
                 "name": project_doc["name"],
@@ -848,34 +834,28 @@ def filter_containers(containers, project_name):
             invalid_containers.extend(containers)
         return output
 
-    repre_docs = get_representations(
+    # Query representations with their versions at once
+    hierarchy_by_repre_id = get_representations_hierarchy(
         project_name,
-        representation_ids=repre_ids,
-        fields=["_id", "parent"]
+        repre_ids,
+        representation_fields=["_id", "parent"],
+        version_fields=["_id", "parent", "type"],
+        parent_level="version"
     )
     # Store representations by stringified representation id
     repre_docs_by_str_id = {}
-    repre_docs_by_version_id = collections.defaultdict(list)
-    for repre_doc in repre_docs:
-        repre_id = str(repre_doc["_id"])
-        version_id = repre_doc["parent"]
-        repre_docs_by_str_id[repre_id] = repre_doc
-        repre_docs_by_version_id[version_id].append(repre_doc)
-
-    # Query version docs to get it's subset ids
-    # - also query hero version to be able identify if representation
-    #   belongs to existing version
-    version_docs = get_versions(
-        project_name,
-        version_ids=repre_docs_by_version_id.keys(),
-        hero=True,
-        fields=["_id", "parent", "type"]
-    )
     verisons_by_id = {}
     versions_by_subset_id = collections.defaultdict(list)
     hero_version_ids = set()
-    for version_doc in version_docs:
+    for repre_id, hierarchy in hierarchy_by_repre_id.items():
+        repre_docs_by_str_id[str(repre_id)] = hierarchy.representation
+        version_doc = hierarchy.version
+        if version_doc is None:
+            continue
+
         version_id = version_doc["_id"]
+        if version_id in verisons_by_id:
+            continue
         # Store versions by their ids
         verisons_by_id[version_id] = version_doc
         # There's no need to query subsets for hero versions
@@ -889,7 +869,8 @@ def filter_containers(containers, project_name):
     last_versions = get_last_versions(
         project_name,
         subset_ids=versions_by_subset_id.keys(),
-        fields=["_id"]
+        fields=["_id"],
+        use_index=True
     )
     # Figure out which versions are outdated
     outdated_version_ids = set()
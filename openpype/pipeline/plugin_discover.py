@@ -1,16 +1,170 @@
 import os
+import sys
+import time
 import inspect
+import threading
 import traceback
 
 from openpype.lib import Logger
 from openpype.lib.python_module_tools import (
-    modules_from_path,
+    import_filepath,
     classes_from_module,
 )
 
 log = Logger.get_logger(__name__)
 
 
+class _CachedModule:
+    """Module imported from plugin path with state of its classes.
+
+    Plugin classes may be modified after discovery (e.g. by settings). State
+    of classes defined in the module is stored on import and restored when
+    module is used again so each discovery gets classes as were defined in
+    the file.
+    """
+
+    def __init__(self, module, file_key):
+        self.module = module
+        self.file_key = file_key
+        self._attributes_by_class = {}
+        for name in dir(module):
+            obj = getattr(module, name)
+            if (
+                inspect.isclass(obj)
+                and obj.__module__ == module.__name__
+                and obj not in self._attributes_by_class
+            ):
+                self._attributes_by_class[obj] = dict(vars(obj))
+
+    def restore(self):
+        """Restore attributes of classes to state after import."""
+
+        for cls, attributes in self._attributes_by_class.items():
+            current = vars(cls)
+            for key in set(current.keys()) - set(attributes.keys()):
+                try:
+                    delattr(cls, key)
+                except (AttributeError, TypeError):
+                    pass
+
+            for key, value in attributes.items():
+                if key in ("__dict__", "__weakref__"):
+                    continue
+                if current.get(key) is not value:
+                    try:
+                        setattr(cls, key, value)
+                    except (AttributeError, TypeError):
+                        pass
+
+
+class _PluginModulesCache:
+    """Cache of python modules imported from plugin paths.
+
+    Python files are imported again only if their modification time or size
+    changed since the last import.
+    """
+
+    _lock = threading.Lock()
+    _modules_by_path = {}
+
+    @staticmethod
+    def _get_file_key(filepath):
+        stat = os.stat(filepath)
+        return getattr(stat, "st_mtime_ns", stat.st_mtime), stat.st_size
+
+    @classmethod
+    def _get_module(cls, filepath, module_name):
+        file_key = cls._get_file_key(filepath)
+        cached = cls._modules_by_path.get(filepath)
+        if cached is not None and cached.file_key == file_key:
+            cached.restore()
+            return cached.module
+
+        module = import_filepath(filepath, module_name)
+        cls._modules_by_path[filepath] = _CachedModule(module, file_key)
+        return module
+
+    @classmethod
+    def modules_from_path(cls, folder_path):
+        """Get python scripts as modules from a path.
+
+        Same as 'modules_from_path' from 'openpype.lib.python_module_tools'
+        but unchanged files are not imported again.
+
+        Arguments:
+            folder_path (str): Path to folder containing python scripts.
+
+        Returns:
+            tuple<list, list>: First list contains tuples of path and
+                successfully imported module and second list contains tuples
+                of path and exception.
+        """
+
+        crashed = []
+        modules = []
+        output = (modules, crashed)
+        # Just skip and return empty list if path is not set
+        if not folder_path:
+            return output
+
+        # Do not allow relative imports
+        if folder_path.startswith("."):
+            log.warning((
+                "BUG: Relative paths are not allowed for security reasons. {}"
+            ).format(folder_path))
+            return output
+
+        folder_path = os.path.normpath(folder_path)
+        if not os.path.isdir(folder_path):
+            log.warning("Not a directory path: {}".format(folder_path))
+            return output
+
+        with cls._lock:
+            for filename in os.listdir(folder_path):
+                # Ignore files which start with underscore
+                if filename.startswith("_"):
+                    continue
+
+                mod_name, mod_ext = os.path.splitext(filename)
+                if not mod_ext == ".py":
+                    continue
+
+                full_path = os.path.join(folder_path, filename)
+                if not os.path.isfile(full_path):
+                    continue
+
+                try:
+                    module = cls._get_module(full_path, mod_name)
+                    modules.append((full_path, module))
+
+                except Exception:
+                    cls._modules_by_path.pop(full_path, None)
+                    crashed.append((full_path, sys.exc_info()))
+                    log.warning(
+                        "Failed to load path: \"{0}\"".format(full_path),
+                        exc_info=True
+                    )
+        return output
+
+
+def modules_from_plugin_path(folder_path):
+    """Get python scripts as modules from a plugin path.
+
+    Modules are cached and python files are imported again only if were
+    changed.
+
+    Arguments:
+        folder_path (str): Path to folder containing python scripts.
+
+    Returns:
+        tuple<list, list>: First list contains tuples of path and
+            successfully imported module and second list contains tuples
+            of path and exception.
+    """
+
+    return _PluginModulesCache.modules_from_path(folder_path)
+
+
 class DiscoverResult:
     """Result of Plug-ins discovery of a single superclass type.
 
@@ -25,6 +179,8 @@ class DiscoverResult:
         self.duplicated_plugins = []
         self.abstract_plugins = []
         self.ignored_plugins = set()
+        # Time of discovery in seconds by path
+        self.discover_time_by_path = {}
         # Store loaded modules to keep them in memory
         self._modules = set()
 
@@ -77,6 +233,13 @@ class DiscoverResult:
             for cls in self.duplicated_plugins:
                 lines.append("- {}".format(cls.__name__))
 
+        if self.discover_time_by_path and (not only_errors or full_report):
+            lines.append("*** Discovery time {:.3f}s".format(
+                sum(self.discover_time_by_path.values())
+            ))
+            for path, discover_time in self.discover_time_by_path.items():
+                lines.append("- {:.3f}s {}".format(discover_time, path))
+
         if self.crashed_file_paths or full_report:
             lines.append("*** Failed to load {} files".format(len(
                 self.crashed_file_paths
@@ -100,8 +263,9 @@ class PluginDiscoverContext(object):
     """Store and discover registered types nad registered paths to types.
 
     Keeps in memory all registered types and their paths. Paths are dynamically
-    loaded on discover so different discover calls won't return the same
-    class objects even if were loaded from same file.
+    loaded on discover. Files which did not change since previous discover
+    are not imported again, but attributes of their classes are reset
+    to state after import.
     """
 
     def __init__(self):
@@ -168,7 +332,8 @@ class PluginDiscoverContext(object):
 
         # Include plug-ins from registered paths
         for path in registered_paths:
-            modules, crashed = modules_from_path(path)
+            start_time = time.time()
+            modules, crashed = modules_from_plugin_path(path)
             for item in crashed:
                 filepath, exc_info = item
                 result.crashed_file_paths[filepath] = exc_info
@@ -194,6 +359,12 @@ class PluginDiscoverContext(object):
 
                     result.plugins.append(cls)
 
+            discover_time = time.time() - start_time
+            result.discover_time_by_path[path] = discover_time
+            log.debug("Discovered {} plugins from {} in {:.3f}s".format(
+                superclass.__name__, path, discover_time
+            ))
+
         # Store in memory last result to keep in memory loaded modules
         self._last_discovered_results[superclass] = result
         self._last_discovered_plugins[superclass] = list(
@@ -1,5 +1,6 @@
 import os
 import sys
+import time
 import types
 import inspect
 import copy
@@ -14,7 +15,6 @@ import pyblish.util
 
 from openpype.lib import (
     Logger,
-    import_filepath,
     filter_profiles
 )
 from openpype.settings import (
@@ -25,7 +25,10 @@ from openpype.pipeline import (
     tempdir,
     Anatomy
 )
-from openpype.pipeline.plugin_discover import DiscoverResult
+from openpype.pipeline.plugin_discover import (
+    DiscoverResult,
+    modules_from_plugin_path,
+)
 
 from .contants import (
     DEFAULT_PUBLISH_TEMPLATE,
@@ -292,33 +295,16 @@ def publish_plugins_discover(paths=None):
         if not os.path.isdir(path):
             continue
 
-        for fname in os.listdir(path):
-            if fname.startswith("_"):
-                continue
-
-            abspath = os.path.join(path, fname)
-
-            if not os.path.isfile(abspath):
-                continue
-
-            mod_name, mod_ext = os.path.splitext(fname)
-
-            if not mod_ext == ".py":
-                continue
+        start_time = time.time()
+        modules, crashed = modules_from_plugin_path(path)
+        for abspath, exc_info in crashed:
+            result.crashed_file_paths[abspath] = exc_info
 
-            try:
-                module = import_filepath(abspath, mod_name)
-
-                # Store reference to original module, to avoid
-                # garbage collection from collecting it's global
-                # imports, such as `import os`.
-                sys.modules[abspath] = module
-
-            except Exception as err:
-                result.crashed_file_paths[abspath] = sys.exc_info()
-
-                log.debug("Skipped: \"%s\" (%s)", mod_name, err)
-                continue
+        for abspath, module in modules:
+            # Store reference to original module, to avoid
+            # garbage collection from collecting it's global
+            # imports, such as `import os`.
+            sys.modules[abspath] = module
 
             for plugin in pyblish.plugin.plugins_from_module(module):
                 if not allow_duplicates and plugin.__name__ in plugin_names:
@@ -332,6 +318,8 @@ def publish_plugins_discover(paths=None):
                 key = "{0}.{1}".format(plugin.__module__, plugin.__name__)
                 plugins[key] = plugin
 
+        result.discover_time_by_path[path] = time.time() - start_time
+
     # Include plug-ins from registration.
     # Directly registered plug-ins take precedence.
     for plugin in pyblish.plugin.registered_plugins():
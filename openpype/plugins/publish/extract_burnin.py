@@ -13,6 +13,8 @@ from openpype import resources, PACKAGE_DIR
 from openpype.pipeline import publish
 from openpype.lib import (
     run_openpype_process,
+    ProcessScheduler,
+    get_image_job_memory,
 
     get_transcode_temp_directory,
     convert_input_paths_for_ffmpeg,
@@ -201,29 +203,49 @@ class ExtractBurnin(publish.Extractor):
             self.prepare_repre_data(instance, repre, burnin_data, temp_data)
 
             src_repre_staging_dir = repre["stagingDir"]
-            # Should convert representation source files before processing?
-            repre_files = repre["files"]
-            if isinstance(repre_files, (tuple, list)):
-                filename = repre_files[0]
-                src_filepaths = [
-                    os.path.join(src_repre_staging_dir, filename)
-                    for filename in repre_files
-                ]
+            # Review output was not rendered by 'ExtractReview' and is
+            #   rendered with burnins in single pass
+            review_ffmpeg_args = repre.get("reviewFFmpegArgs")
+            do_convert = False
+            if review_ffmpeg_args:
+                # Use values of review output, input files don't exist yet
+                burnin_data["fps"] = repre["fps"]
+                if repre.get("resolutionWidth"):
+                    burnin_data["resolution_width"] = repre["resolutionWidth"]
+                    burnin_data["resolution_height"] = (
+                        repre["resolutionHeight"]
+                    )
+
             else:
-                filename = repre_files
-                src_filepaths = [os.path.join(src_repre_staging_dir, filename)]
-
-            first_input_path = os.path.join(src_repre_staging_dir, filename)
-            # Determine if representation requires pre conversion for ffmpeg
-            do_convert = should_convert_for_ffmpeg(first_input_path)
-            # If result is None the requirement of conversion can't be
-            #   determined
-            if do_convert is None:
-                self.log.info((
-                    "Can't determine if representation requires conversion."
-                    " Skipped."
-                ))
-                continue
+                # Should convert representation source files before
+                #   processing?
+                repre_files = repre["files"]
+                if isinstance(repre_files, (tuple, list)):
+                    filename = repre_files[0]
+                    src_filepaths = [
+                        os.path.join(src_repre_staging_dir, filename)
+                        for filename in repre_files
+                    ]
+                else:
+                    filename = repre_files
+                    src_filepaths = [
+                        os.path.join(src_repre_staging_dir, filename)
+                    ]
+
+                first_input_path = os.path.join(
+                    src_repre_staging_dir, filename
+                )
+                # Determine if representation requires pre conversion for
+                #   ffmpeg
+                do_convert = should_convert_for_ffmpeg(first_input_path)
+                # If result is None the requirement of conversion can't be
+                #   determined
+                if do_convert is None:
+                    self.log.info((
+                        "Can't determine if representation requires"
+                        " conversion. Skipped."
+                    ))
+                    continue
 
             # Do conversion if needed
             #   - change staging dir of source representation
@@ -264,93 +286,89 @@ class ExtractBurnin(publish.Extractor):
             first_output = True
 
             files_to_delete = []
-            for filename_suffix, burnin_def in repre_burnin_defs.items():
-                new_repre = copy.deepcopy(repre)
-                new_repre["stagingDir"] = src_repre_staging_dir
-
-                # Keep "ftrackreview" tag only on first output
-                if first_output:
-                    first_output = False
-                elif "ftrackreview" in new_repre["tags"]:
-                    new_repre["tags"].remove("ftrackreview")
-
-                burnin_values = {}
-                for key in self.positions:
-                    value = burnin_def.get(key)
-                    if value:
-                        burnin_values[key] = value.replace(
-                            "{task}", "{task[name]}"
+            # Burnins of representation are rendered concurrently
+            with ProcessScheduler(logger=self.log) as scheduler:
+                for filename_suffix, burnin_def in repre_burnin_defs.items():
+                    new_repre = copy.deepcopy(repre)
+                    new_repre["stagingDir"] = src_repre_staging_dir
+                    new_repre.pop("reviewFFmpegArgs", None)
+                    new_repre.pop("reviewSourcePath", None)
+
+                    # Keep "ftrackreview" tag only on first output
+                    if first_output:
+                        first_output = False
+                    elif "ftrackreview" in new_repre["tags"]:
+                        new_repre["tags"].remove("ftrackreview")
+
+                    burnin_values = {}
+                    for key in self.positions:
+                        value = burnin_def.get(key)
+                        if value:
+                            burnin_values[key] = value.replace(
+                                "{task}", "{task[name]}"
+                            )
+
+                    # Remove "delete" tag from new representation
+                    if "delete" in new_repre["tags"]:
+                        new_repre["tags"].remove("delete")
+
+                    if len(repre_burnin_defs.keys()) > 1:
+                        # Update name and outputName to be
+                        # able have multiple outputs in case of more burnin
+                        #   presets
+                        # Join previous "outputName" with filename suffix
+                        new_name = "_".join(
+                            [new_repre["outputName"], filename_suffix]
                         )
+                        new_repre["name"] = new_name
+                        new_repre["outputName"] = new_name
 
-                # Remove "delete" tag from new representation
-                if "delete" in new_repre["tags"]:
-                    new_repre["tags"].remove("delete")
-
-                if len(repre_burnin_defs.keys()) > 1:
-                    # Update name and outputName to be
-                    # able have multiple outputs in case of more burnin presets
-                    # Join previous "outputName" with filename suffix
-                    new_name = "_".join(
-                        [new_repre["outputName"], filename_suffix]
+                    # Prepare paths and files for process.
+                    self.input_output_paths(
+                        repre, new_repre, temp_data, filename_suffix
                     )
-                    new_repre["name"] = new_name
-                    new_repre["outputName"] = new_name
 
-                # Prepare paths and files for process.
-                self.input_output_paths(
-                    repre, new_repre, temp_data, filename_suffix
-                )
-
-                # Data for burnin script
-                script_data = {
-                    "input": temp_data["full_input_path"],
-                    "output": temp_data["full_output_path"],
-                    "burnin_data": burnin_data,
-                    "options": copy.deepcopy(burnin_options),
-                    "values": burnin_values,
-                    "full_input_path": temp_data["full_input_paths"][0],
-                    "first_frame": temp_data["first_frame"],
-                    "ffmpeg_cmd": new_repre.get("ffmpeg_cmd", "")
-                }
-
-                self.log.debug(
-                    "script_data: {}".format(json.dumps(script_data, indent=4))
-                )
-
-                # Dump data to string
-                dumped_script_data = json.dumps(script_data)
-
-                # Store dumped json to temporary file
-                temporary_json_file = tempfile.NamedTemporaryFile(
-                    mode="w", suffix=".json", delete=False
-                )
-                temporary_json_file.write(dumped_script_data)
-                temporary_json_file.close()
-                temporary_json_filepath = temporary_json_file.name.replace(
-                    "\\", "/"
-                )
-
-                # Prepare subprocess arguments
-                args = list(executable_args)
-                args.append(temporary_json_filepath)
-                self.log.debug("Executing: {}".format(" ".join(args)))
+                    # Data for burnin script
+                    script_data = {
+                        "input": temp_data["full_input_path"],
+                        "output": temp_data["full_output_path"],
+                        "burnin_data": burnin_data,
+                        "options": copy.deepcopy(burnin_options),
+                        "values": burnin_values,
+                        "full_input_path": temp_data["full_input_paths"][0],
+                        "first_frame": temp_data["first_frame"],
+                        "ffmpeg_cmd": new_repre.get("ffmpeg_cmd", "")
+                    }
+                    if review_ffmpeg_args:
+                        script_data["review_ffmpeg_args"] = review_ffmpeg_args
+                        # Probe source of review output
+                        script_data["full_input_path"] = (
+                            repre["reviewSourcePath"]
+                        )
 
-                # Run burnin script
-                process_kwargs = {
-                    "logger": self.log
-                }
+                    self.log.debug(
+                        "script_data: {}".format(
+                            json.dumps(script_data, indent=4)
+                        )
+                    )
 
-                run_openpype_process(*args, **process_kwargs)
-                # Remove the temporary json
-                os.remove(temporary_json_filepath)
+                    scheduler.submit(
+                        self.run_burnin_script,
+                        (script_data, executable_args),
+                        memory=get_image_job_memory(
+                            repre.get("resolutionWidth") or 0,
+                            repre.get("resolutionHeight") or 0
+                        ),
+                        label=new_repre["name"]
+                    )
 
-                for filepath in temp_data["full_input_paths"]:
-                    filepath = filepath.replace("\\", "/")
-                    if filepath not in files_to_delete:
-                        files_to_delete.append(filepath)
+                    for filepath in temp_data["full_input_paths"]:
+                        filepath = filepath.replace("\\", "/")
+                        if filepath not in files_to_delete:
+                            files_to_delete.append(filepath)
 
-                # Add new representation to instance
-                instance.data["representations"].append(new_repre)
+                    # Add new representation to instance
+                    instance.data["representations"].append(new_repre)
 
             # Cleanup temp staging dir after procesisng of output definitions
             if do_convert:
@@ -372,6 +390,61 @@ class ExtractBurnin(publish.Extractor):
                     os.remove(filepath)
                     self.log.debug("Removed: \"{}\"".format(filepath))
 
+    def run_burnin_script(self, script_data, executable_args):
+        """Run burnin script with prepared data.
+
+        Script is executed in current process if it can be imported to avoid
+        startup of new OpenPype process.
+
+        Args:
+            script_data (dict[str, Any]): Data for burnin script.
+            executable_args (list[str]): Arguments to run the script in
+                new OpenPype process.
+        """
+
+        try:
+            from openpype.scripts import otio_burnin
+
+        except Exception:
+            # Dependencies of the script may not be available in host
+            self.log.debug(
+                "Burnin script can't be imported in current process.",
+                exc_info=True
+            )
+            otio_burnin = None
+
+        if otio_burnin is not None:
+            self.log.debug("Running burnin script in current process")
+            otio_burnin.burnins_from_script_data(copy.deepcopy(script_data))
+            return
+
+        # Dump data to string
+        dumped_script_data = json.dumps(script_data)
+
+        # Store dumped json to temporary file
+        temporary_json_file = tempfile.NamedTemporaryFile(
+            mode="w", suffix=".json", delete=False
+        )
+        temporary_json_file.write(dumped_script_data)
+        temporary_json_file.close()
+        temporary_json_filepath = temporary_json_file.name.replace(
+            "\\", "/"
+        )
+
+        # Prepare subprocess arguments
+        args = list(executable_args)
+        args.append(temporary_json_filepath)
+        self.log.debug("Executing: {}".format(" ".join(args)))
+
+        # Run burnin script
+        process_kwargs = {
+            "logger": self.log
+        }
+
+        run_openpype_process(*args, **process_kwargs)
+        # Remove the temporary json
+        os.remove(temporary_json_filepath)
+
     def _get_burnin_options(self):
         # Prepare burnin options
         burnin_options = copy.deepcopy(self.default_options)
@@ -5,8 +5,8 @@ import pyblish.api
 
 from openpype.pipeline import publish
 from openpype.lib import (
-
     is_oiio_supported,
+    ProcessScheduler,
 )
 
 from openpype.lib.transcoding import (
@@ -81,6 +81,32 @@ class ExtractOIIOTranscode(publish.Extractor):
         if not profile:
             return
 
+        # Conversions are processed concurrently, running conversions are
+        #   terminated on error and error of first failed is raised
+        with ProcessScheduler(logger=self.log) as scheduler:
+            new_representations = self._submit_conversions(
+                instance, profile, scheduler
+            )
+
+        for repre in tuple(instance.data["representations"]):
+            tags = repre.get("tags") or []
+            if "delete" in tags and "thumbnail" not in tags:
+                instance.data["representations"].remove(repre)
+
+        instance.data["representations"].extend(new_representations)
+
+    def _submit_conversions(self, instance, profile, scheduler):
+        """Submit conversions of representations to scheduler.
+
+        Args:
+            instance (pyblish.api.Instance): Processed instance.
+            profile (dict[str, Any]): Profile with output definitions.
+            scheduler (ProcessScheduler): Scheduler running conversions.
+
+        Returns:
+            list[dict[str, Any]]: New representations filled by conversions.
+        """
+
         new_representations = []
         repres = instance.data["representations"]
         for idx, repre in enumerate(list(repres)):
@@ -149,16 +175,20 @@ class ExtractOIIOTranscode(publish.Extractor):
                     output_path = self._get_output_file_path(input_path,
                                                              new_staging_dir,
                                                              output_extension)
-                    convert_colorspace(
-                        input_path,
-                        output_path,
-                        config_path,
-                        source_colorspace,
-                        target_colorspace,
-                        view,
-                        display,
-                        additional_command_args,
-                        self.log
+                    scheduler.submit(
+                        convert_colorspace,
+                        (
+                            input_path,
+                            output_path,
+                            config_path,
+                            source_colorspace,
+                            target_colorspace,
+                            view,
+                            display,
+                            additional_command_args,
+                            self.log
+                        ),
+                        label=output_path
                     )
 
                 # cleanup temporary transcoded files
@@ -191,12 +221,7 @@ class ExtractOIIOTranscode(publish.Extractor):
                 self._mark_original_repre_for_deletion(repre, profile,
                                                        added_review)
 
-        for repre in tuple(instance.data["representations"]):
-            tags = repre.get("tags") or []
-            if "delete" in tags and "thumbnail" not in tags:
-                instance.data["representations"].remove(repre)
-
-        instance.data["representations"].extend(new_representations)
+        return new_representations
 
     def _rename_in_representation(self, new_repre, files_to_convert,
                                   output_name, output_extension):
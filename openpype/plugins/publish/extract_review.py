@@ -14,7 +14,8 @@ from openpype.lib import (
     get_ffmpeg_tool_path,
     filter_profiles,
     path_to_subprocess_arg,
-    run_subprocess,
+    ProcessScheduler,
+    get_image_job_memory,
 )
 from openpype.lib.transcoding import (
     IMAGE_EXTENSIONS,
@@ -72,6 +73,8 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     # Preset attributes
     profiles = None
+    # Outputs with burnins are rendered by 'ExtractBurnin' in single pass
+    fuse_burnins = False
 
     def process(self, instance):
         self.log.debug(str(instance.data["representations"]))
@@ -285,8 +288,9 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     self.log
                 )
 
+            deferred_repres = []
             try:
-                self._render_output_definitions(
+                deferred_repres = self._render_output_definitions(
                     instance,
                     repre,
                     src_repre_staging_dir,
@@ -300,130 +304,193 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     # Set staging dir of source representation back to previous
                     #   value
                     repre["stagingDir"] = src_repre_staging_dir
-                    if os.path.exists(new_staging_dir):
+                    # Converted files are used by deferred outputs and are
+                    #   removed by 'ExtractReviewDeferred'
+                    if deferred_repres:
+                        instance.data.setdefault(
+                            "reviewCleanupPaths", []
+                        ).append(new_staging_dir)
+                    elif os.path.exists(new_staging_dir):
                         shutil.rmtree(new_staging_dir)
 
     def _render_output_definitions(
         self, instance, repre, src_repre_staging_dir, output_definitions
     ):
-        fill_data = copy.deepcopy(instance.data["anatomyData"])
-        for _output_def in output_definitions:
-            output_def = copy.deepcopy(_output_def)
-            # Make sure output definition has "tags" key
-            if "tags" not in output_def:
-                output_def["tags"] = []
-
-            if "burnins" not in output_def:
-                output_def["burnins"] = []
-
-            # Create copy of representation
-            new_repre = copy.deepcopy(repre)
-            # Make sure new representation has origin staging dir
-            #   - this is because source representation may change
-            #       it's staging dir because of ffmpeg conversion
-            new_repre["stagingDir"] = src_repre_staging_dir
-
-            # Remove "delete" tag from new repre if there is
-            if "delete" in new_repre["tags"]:
-                new_repre["tags"].remove("delete")
-
-            # Add additional tags from output definition to representation
-            for tag in output_def["tags"]:
-                if tag not in new_repre["tags"]:
-                    new_repre["tags"].append(tag)
-
-            # Add burnin link from output definition to representation
-            for burnin in output_def["burnins"]:
-                if burnin not in new_repre.get("burnins", []):
-                    if not new_repre.get("burnins"):
-                        new_repre["burnins"] = []
-                    new_repre["burnins"].append(str(burnin))
+        """Render output definitions of a representation.
 
-            self.log.debug(
-                "Linked burnins: `{}`".format(new_repre.get("burnins"))
-            )
+        Outputs which will be processed by 'ExtractBurnin' are not rendered
+        if 'fuse_burnins' is enabled. Their ffmpeg arguments are stored to
+        representation under "reviewFFmpegArgs" key and burnins are added
+        to the same ffmpeg command.
 
-            self.log.debug(
-                "New representation tags: `{}`".format(
-                    new_repre.get("tags"))
-            )
+        Returns:
+            list[dict[str, Any]]: Representations which were not rendered.
+        """
+
+        deferred_repres = []
+        # Files added to fill gaps by frame range
+        files_to_clean_by_range = {}
+        fill_data = copy.deepcopy(instance.data["anatomyData"])
+        # Outputs are rendered concurrently
+        with ProcessScheduler(logger=self.log) as scheduler:
+            for _output_def in output_definitions:
+                output_def = copy.deepcopy(_output_def)
+                # Make sure output definition has "tags" key
+                if "tags" not in output_def:
+                    output_def["tags"] = []
+
+                if "burnins" not in output_def:
+                    output_def["burnins"] = []
+
+                # Create copy of representation
+                new_repre = copy.deepcopy(repre)
+                # Make sure new representation has origin staging dir
+                #   - this is because source representation may change
+                #       it's staging dir because of ffmpeg conversion
+                new_repre["stagingDir"] = src_repre_staging_dir
+
+                # Remove "delete" tag from new repre if there is
+                if "delete" in new_repre["tags"]:
+                    new_repre["tags"].remove("delete")
+
+                # Add additional tags from output definition to representation
+                for tag in output_def["tags"]:
+                    if tag not in new_repre["tags"]:
+                        new_repre["tags"].append(tag)
+
+                # Add burnin link from output definition to representation
+                for burnin in output_def["burnins"]:
+                    if burnin not in new_repre.get("burnins", []):
+                        if not new_repre.get("burnins"):
+                            new_repre["burnins"] = []
+                        new_repre["burnins"].append(str(burnin))
+
+                self.log.debug(
+                    "Linked burnins: `{}`".format(new_repre.get("burnins"))
+                )
 
-            temp_data = self.prepare_temp_data(instance, repre, output_def)
-            files_to_clean = []
-            if temp_data["input_is_sequence"]:
-                self.log.info("Filling gaps in sequence.")
-                files_to_clean = self.fill_sequence_gaps(
-                    files=temp_data["origin_repre"]["files"],
-                    staging_dir=new_repre["stagingDir"],
-                    start_frame=temp_data["frame_start"],
-                    end_frame=temp_data["frame_end"]
+                self.log.debug(
+                    "New representation tags: `{}`".format(
+                        new_repre.get("tags"))
                 )
 
-            # create or update outputName
-            output_name = new_repre.get("outputName", "")
-            output_ext = new_repre["ext"]
-            if output_name:
-                output_name += "_"
-            output_name += output_def["filename_suffix"]
-            if temp_data["without_handles"]:
-                output_name += "_noHandles"
-
-            # add outputName to anatomy format fill_data
-            fill_data.update({
-                "output": output_name,
-                "ext": output_ext
-            })
-
-            try:  # temporary until oiiotool is supported cross platform
-                ffmpeg_args = self._ffmpeg_arguments(
-                    output_def, instance, new_repre, temp_data, fill_data
+                temp_data = self.prepare_temp_data(
+                    instance, repre, output_def
                 )
-            except ZeroDivisionError:
-                # TODO recalculate width and height using OIIO before
-                #   conversion
-                if 'exr' in temp_data["origin_repre"]["ext"]:
-                    self.log.warning(
-                        (
-                            "Unsupported compression on input files."
-                            " Skipping!!!"
+                files_to_clean = []
+                frame_range = (
+                    temp_data["frame_start"], temp_data["frame_end"]
+                )
+                # Gaps are filled only once per frame range, files may be
+                #   used by running processes
+                if (
+                    temp_data["input_is_sequence"]
+                    and frame_range not in files_to_clean_by_range
+                ):
+                    self.log.info("Filling gaps in sequence.")
+                    files_to_clean = self.fill_sequence_gaps(
+                        files=temp_data["origin_repre"]["files"],
+                        staging_dir=new_repre["stagingDir"],
+                        start_frame=temp_data["frame_start"],
+                        end_frame=temp_data["frame_end"]
+                    )
+                    files_to_clean_by_range[frame_range] = files_to_clean
+
+                # create or update outputName
+                output_name = new_repre.get("outputName", "")
+                output_ext = new_repre["ext"]
+                if output_name:
+                    output_name += "_"
+                output_name += output_def["filename_suffix"]
+                if temp_data["without_handles"]:
+                    output_name += "_noHandles"
+
+                # add outputName to anatomy format fill_data
+                fill_data.update({
+                    "output": output_name,
+                    "ext": output_ext
+                })
+
+                try:  # temporary until oiiotool is supported cross platform
+                    ffmpeg_args = self._ffmpeg_arguments(
+                        output_def, instance, new_repre, temp_data, fill_data
+                    )
+                except ZeroDivisionError:
+                    # TODO recalculate width and height using OIIO before
+                    #   conversion
+                    if 'exr' in temp_data["origin_repre"]["ext"]:
+                        self.log.warning(
+                            (
+                                "Unsupported compression on input files."
+                                " Skipping!!!"
+                            ),
+                            exc_info=True
+                        )
+                        return deferred_repres
+                    raise NotImplementedError
+
+                subprcs_cmd = " ".join(ffmpeg_args)
+
+                if self.fuse_burnins and "burnin" in new_repre["tags"]:
+                    self.log.debug((
+                        "Rendering of \"{}\" is deferred to burnins."
+                    ).format(output_name))
+                    new_repre["reviewFFmpegArgs"] = ffmpeg_args
+                    new_repre["reviewSourcePath"] = (
+                        temp_data["full_input_path_single_file"]
+                    )
+                    deferred_repres.append(new_repre)
+
+                else:
+                    # run subprocess
+                    self.log.debug("Executing: {}".format(subprcs_cmd))
+
+                    scheduler.submit_subprocess(
+                        subprcs_cmd,
+                        memory=get_image_job_memory(
+                            new_repre.get("resolutionWidth") or 0,
+                            new_repre.get("resolutionHeight") or 0
                         ),
-                        exc_info=True
+                        label=output_name,
+                        shell=True
                     )
-                    return
-                raise NotImplementedError
 
-            subprcs_cmd = " ".join(ffmpeg_args)
+                new_repre.update({
+                    "fps": temp_data["fps"],
+                    "name": "{}_{}".format(output_name, output_ext),
+                    "outputName": output_name,
+                    "outputDef": output_def,
+                    "frameStartFtrack": temp_data["output_frame_start"],
+                    "frameEndFtrack": temp_data["output_frame_end"],
+                    "ffmpeg_cmd": subprcs_cmd
+                })
+
+                # Force to pop these key if are in new repre
+                new_repre.pop("thumbnail", None)
+                if "clean_name" in new_repre.get("tags", []):
+                    new_repre.pop("outputName")
+
+                # adding representation
+                self.log.debug(
+                    "Adding new representation: {}".format(new_repre)
+                )
+                instance.data["representations"].append(new_repre)
 
-            # run subprocess
-            self.log.debug("Executing: {}".format(subprcs_cmd))
+        files_to_clean = []
+        for paths in files_to_clean_by_range.values():
+            files_to_clean.extend(paths)
 
-            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+        # Files added to fill gaps are used by deferred outputs
+        if deferred_repres:
+            instance.data.setdefault(
+                "reviewCleanupPaths", []
+            ).extend(files_to_clean)
 
+        else:
             # delete files added to fill gaps
-            if files_to_clean:
-                for f in files_to_clean:
-                    os.unlink(f)
-
-            new_repre.update({
-                "fps": temp_data["fps"],
-                "name": "{}_{}".format(output_name, output_ext),
-                "outputName": output_name,
-                "outputDef": output_def,
-                "frameStartFtrack": temp_data["output_frame_start"],
-                "frameEndFtrack": temp_data["output_frame_end"],
-                "ffmpeg_cmd": subprcs_cmd
-            })
-
-            # Force to pop these key if are in new repre
-            new_repre.pop("thumbnail", None)
-            if "clean_name" in new_repre.get("tags", []):
-                new_repre.pop("outputName")
-
-            # adding representation
-            self.log.debug(
-                "Adding new representation: {}".format(new_repre)
-            )
-            instance.data["representations"].append(new_repre)
+            for f in files_to_clean:
+                os.unlink(f)
+        return deferred_repres
 
     def input_is_sequence(self, repre):
         """Deduce from representation data if input is sequence."""
@@ -0,0 +1,56 @@
+import os
+import shutil
+
+import pyblish.api
+
+from openpype.pipeline import publish
+from openpype.lib import (
+    ProcessScheduler,
+    get_image_job_memory,
+)
+
+
+class ExtractReviewDeferred(publish.Extractor):
+    """Render review outputs which were deferred to burnins.
+
+    'ExtractReview' does not render outputs with "burnin" tag when
+    'fuse_burnins' is enabled and 'ExtractBurnin' renders them with burnins.
+    Outputs which were not processed by 'ExtractBurnin' (plugin is disabled,
+    is not available in host or burnins did not match) are rendered
+    without burnins. Temporary files used by the outputs are removed.
+    """
+
+    label = "Extract deferred review"
+    # Must be processed after burnins and before review slate
+    order = pyblish.api.ExtractorOrder + 0.0305
+    families = ["review"]
+
+    def process(self, instance):
+        deferred_repres = []
+        for repre in instance.data.get("representations") or []:
+            repre.pop("reviewSourcePath", None)
+            ffmpeg_args = repre.pop("reviewFFmpegArgs", None)
+            if ffmpeg_args:
+                deferred_repres.append((repre, ffmpeg_args))
+
+        try:
+            with ProcessScheduler(logger=self.log) as scheduler:
+                for repre, ffmpeg_args in deferred_repres:
+                    subprcs_cmd = " ".join(ffmpeg_args)
+                    self.log.debug("Executing: {}".format(subprcs_cmd))
+                    scheduler.submit_subprocess(
+                        subprcs_cmd,
+                        memory=get_image_job_memory(
+                            repre.get("resolutionWidth") or 0,
+                            repre.get("resolutionHeight") or 0
+                        ),
+                        label=repre["name"],
+                        shell=True
+                    )
+
+        finally:
+            for path in instance.data.pop("reviewCleanupPaths", None) or []:
+                if os.path.isdir(path):
+                    shutil.rmtree(path)
+                elif os.path.exists(path):
+                    os.remove(path)
@@ -2,6 +2,7 @@ import os
 import logging
 import sys
 import copy
+import datetime
 import clique
 import six
 
@@ -385,6 +386,11 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
             # Add the version resource file infos to each representation
             repre_doc["files"] += resource_file_infos
+            # Mark files as modified for sync server queue
+            files_modified_dt = datetime.datetime.utcnow()
+            repre_doc["files_modified_dt"] = files_modified_dt
+            if repre_update_data is not None:
+                repre_update_data["files_modified_dt"] = files_modified_dt
 
             # Set up representation for writing to the database. Since
             # we *might* be overwriting an existing entry if the version
@@ -760,22 +766,19 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             )
 
             # Construct destination collection from template
-            repre_context = None
-            dst_filepaths = []
-            for index in destination_indexes:
-                if is_udim:
-                    template_data["udim"] = index
-                else:
-                    template_data["frame"] = index
-                template_filled = path_template_obj.format_strict(
-                    template_data
-                )
-                dst_filepaths.append(template_filled)
-                if repre_context is None:
-                    self.log.debug(
-                        "Template filled: {}".format(str(template_filled))
-                    )
-                    repre_context = template_filled.used_values
+            index_key = "udim" if is_udim else "frame"
+            dst_filepaths = path_template_obj.format_many(
+                (
+                    dict(template_data, **{index_key: index})
+                    for index in destination_indexes
+                ),
+                strict=True
+            )
+            template_data[index_key] = destination_indexes[-1]
+            self.log.debug(
+                "Template filled: {}".format(str(dst_filepaths[0]))
+            )
+            repre_context = dst_filepaths[0].used_values
 
             # Make sure context contains frame
             # NOTE: Frame would not be available only if template does not
@@ -1,7 +1,6 @@
 import os
 import copy
 import clique
-import errno
 import shutil
 
 import pyblish.api
@@ -18,7 +17,7 @@ from openpype.client.operations import (
     prepare_hero_version_update_data,
     prepare_representation_update_data,
 )
-from openpype.lib import create_hard_link
+from openpype.lib.file_transaction import FileTransaction
 from openpype.pipeline import (
     schema
 )
@@ -443,11 +442,19 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
             # Copy(hardlink) paths of source and destination files
             # TODO should we *only* create hardlinks?
             # TODO should we keep files for deletion until this is successful?
-            for src_path, dst_path in src_to_dst_file_paths:
-                self.copy_file(src_path, dst_path)
-
-            for src_path, dst_path in other_file_paths_mapping:
-                self.copy_file(src_path, dst_path)
+            file_transactions = FileTransaction(
+                log=self.log, allow_queue_replacements=True
+            )
+            for src_path, dst_path in (
+                list(src_to_dst_file_paths) + list(other_file_paths_mapping)
+            ):
+                file_transactions.add(
+                    src_path,
+                    dst_path,
+                    mode=FileTransaction.MODE_HARDLINK_OR_COPY
+                )
+            file_transactions.process()
+            file_transactions.finalize()
 
             # Archive not replaced old representations
             for repre_name_low, repre in old_repres_to_delete.items():
@@ -573,40 +580,6 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
             family = instance.data["families"][0]
         return family
 
-    def copy_file(self, src_path, dst_path):
-        # TODO check drives if are the same to check if cas hardlink
-        dirname = os.path.dirname(dst_path)
-
-        try:
-            os.makedirs(dirname)
-            self.log.debug("Folder(s) created: \"{}\"".format(dirname))
-        except OSError as exc:
-            if exc.errno != errno.EEXIST:
-                self.log.error("An unexpected error occurred.", exc_info=True)
-                raise
-
-            self.log.debug("Folder already exists: \"{}\"".format(dirname))
-
-        self.log.debug("Copying file \"{}\" to \"{}\"".format(
-            src_path, dst_path
-        ))
-
-        # First try hardlink and copy if paths are cross drive
-        try:
-            create_hard_link(src_path, dst_path)
-            # Return when successful
-            return
-
-        except OSError as exc:
-            # re-raise exception if different than
-            # EXDEV - cross drive path
-            # EINVAL - wrong format, must be NTFS
-            self.log.debug("Hardlink failed with errno:'{}'".format(exc.errno))
-            if exc.errno not in [errno.EXDEV, errno.EINVAL]:
-                raise
-
-        shutil.copy(src_path, dst_path)
-
     def version_from_representations(self, project_name, repres):
         for repre in repres:
             version = get_version_by_id(project_name, repre["parent"])
@@ -24,6 +24,7 @@ from openpype.client import (
     get_representations,
     get_archived_representations,
 )
+from openpype.client.operations import update_last_versions
 from openpype.lib import (
     prepare_template_data,
     create_hard_link,
@@ -317,6 +318,7 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
 
         if existing_version is None:
             version_id = legacy_io.insert_one(version).inserted_id
+            update_last_versions(project_name, [subset["_id"]])
         else:
             # Check if instance have set `append` mode which cause that
             # only replicated representations are set to archive
@@ -362,3 +362,57 @@ class PypeCommands:
         from openpype.lib.project_backpack import unpack_project
 
         unpack_project(zip_filepath, new_root, database_only)
+
+    def ensure_mongo_indexes(self, project_names, kinds):
+        from openpype.client.indexes import ensure_all_indexes
+
+        result = ensure_all_indexes(project_names or None, kinds or None)
+        for collection_name, index_names in result.items():
+            if index_names:
+                print("{}: created {}".format(
+                    collection_name, ", ".join(index_names)
+                ))
+            else:
+                print("{}: all indexes exist".format(collection_name))
+
+    def check_mongo_indexes(self, project_names, kinds):
+        from openpype.client.indexes import check_indexes
+
+        report = check_indexes(project_names or None, kinds or None)
+        for item in report:
+            print("{} ({})".format(item["collection"], item["kind"]))
+            if item["missing_indexes"]:
+                print("    Missing indexes: {}".format(
+                    ", ".join(item["missing_indexes"])
+                ))
+            for query in item["queries"]:
+                print((
+                    "    {filter}\n"
+                    "        stages: {stages}, index: {index_name},"
+                    " docs examined: {docs_examined},"
+                    " time: {execution_time_ms}ms"
+                ).format(
+                    filter=query["filter"],
+                    stages=" <- ".join(query["stages"]),
+                    index_name=query["index_name"],
+                    docs_examined=query["docs_examined"],
+                    execution_time_ms=query["execution_time_ms"],
+                ))
+
+    def rebuild_last_versions(self, project_names):
+        from openpype.client import get_projects
+        from openpype.client.operations import rebuild_last_versions
+
+        if not project_names:
+            project_names = [
+                project_doc["name"]
+                for project_doc in get_projects(
+                    inactive=True, fields=["name"]
+                )
+            ]
+
+        for project_name in project_names:
+            count = rebuild_last_versions(project_name)
+            print("{}: stored last version of {} subsets".format(
+                project_name, count
+            ))
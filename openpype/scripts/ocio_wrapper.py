@@ -17,6 +17,12 @@ Providing functionality:
 - _get_views_data - python 3 - module function
                  - returning all available viewers
                    found in input config path.
+- get_config_data - console command - python 2
+                  - returning colorspaces, viewers, roles and file rules
+                    found in input config path.
+- _get_config_data - python 3 - module function
+                   - returning colorspaces, viewers, roles and file rules
+                     found in input config path.
 """
 
 import click
@@ -96,6 +102,10 @@ def _get_colorspace_data(config_path):
 
     config = ocio.Config().CreateFromFile(str(config_path))
 
+    return _get_colorspaces_from_config(config)
+
+
+def _get_colorspaces_from_config(config):
     return {
         c.getName(): c.getFamily()
         for c in config.getColorSpaces()
@@ -157,6 +167,10 @@ def _get_views_data(config_path):
 
     config = ocio.Config().CreateFromFile(str(config_path))
 
+    return _get_views_from_config(config)
+
+
+def _get_views_from_config(config):
     data = {}
     for display in config.getDisplays():
         for view in config.getViews(display):
@@ -174,5 +188,123 @@ def _get_views_data(config_path):
     return data
 
 
+@config.command(
+    name="get_config_data",
+    help=(
+        "return colorspaces, viewers, roles and file rules from config file "
+        "--path input arg is required"
+    )
+)
+@click.option("--in_path", required=True,
+              help="path where to read ocio config file",
+              type=click.Path(exists=True))
+@click.option("--out_path", required=True,
+              help="path where to write output json file",
+              type=click.Path())
+def get_config_data(in_path, out_path):
+    """Aggregate all config data to file.
+
+    Python 2 wrapped console command
+
+    Args:
+        in_path (str): config file path string
+        out_path (str): temp json file path string
+
+    Example of use:
+    > pyton.exe ./ocio_wrapper.py config get_config_data \
+        --in_path=<path> --out_path=<path>
+    """
+    json_path = Path(out_path)
+
+    out_data = _get_config_data(in_path)
+
+    with open(json_path, "w") as f:
+        json.dump(out_data, f)
+
+    print(f"Config data are saved to '{json_path}'")
+
+
+def _get_roles_data(config):
+    """Return roles and their colorspaces.
+
+    Args:
+        config (ocio.Config): Loaded config.
+
+    Returns:
+        dict: role names with colorspace names
+    """
+    return {
+        role_name: colorspace_name
+        for role_name, colorspace_name in config.getRoles()
+    }
+
+
+def _get_file_rules_data(config):
+    """Return file rules of config.
+
+    Args:
+        config (ocio.Config): Loaded config.
+
+    Returns:
+        list: file rules data in order of config
+    """
+    # File rules are available only in OCIO v2 configs
+    if not hasattr(config, "getFileRules"):
+        return []
+
+    file_rules = config.getFileRules()
+    return [
+        {
+            "name": file_rules.getName(idx),
+            "pattern": file_rules.getPattern(idx),
+            "extension": file_rules.getExtension(idx),
+            "regex": file_rules.getRegex(idx),
+            "colorspace": file_rules.getColorSpace(idx)
+        }
+        for idx in range(file_rules.getNumEntries())
+    ]
+
+
+def _get_config_data(config_path):
+    """Return all data of config loaded at once.
+
+    Args:
+        config_path (str): path string leading to config.ocio
+
+    Raises:
+        IOError: Input config does not exist.
+
+    Returns:
+        dict: colorspaces, views, roles and file rules of config
+    """
+    config_path = Path(config_path)
+
+    if not config_path.is_file():
+        raise IOError("Input path should be `config.ocio` file")
+
+    config = ocio.Config().CreateFromFile(str(config_path))
+
+    # Roles and file rules are optional, colorspaces and views must be
+    #   available even if they can't be read
+    try:
+        roles = _get_roles_data(config)
+    except Exception as exc:
+        print(f"Failed to read roles of config '{config_path}': {exc}")
+        roles = {}
+
+    try:
+        file_rules = _get_file_rules_data(config)
+    except Exception as exc:
+        print(f"Failed to read file rules of config '{config_path}': {exc}")
+        file_rules = []
+
+    return {
+        "colorspaces": _get_colorspaces_from_config(config),
+        "views": _get_views_from_config(config),
+        "roles": roles,
+        "file_rules": file_rules
+    }
+
+
 if __name__ == '__main__':
     main()
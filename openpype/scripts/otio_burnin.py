@@ -9,11 +9,13 @@ from string import Formatter
 
 import opentimelineio_contrib.adapters.ffmpeg_burnins as ffmpeg_burnins
 from openpype.lib import (
+    run_subprocess,
     get_ffmpeg_tool_path,
     get_ffmpeg_codec_args,
     get_ffmpeg_format_args,
     convert_ffprobe_fps_value,
 )
+from openpype.lib.media_metadata_cache import get_media_metadata_cache
 
 
 ffmpeg_path = get_ffmpeg_tool_path("ffmpeg")
@@ -85,6 +87,15 @@ def _get_ffprobe_data(source):
     :param str source: source media file
     :rtype: [{}, ...]
     """
+    cache = get_media_metadata_cache()
+    output = cache.get("ffprobe_burnin", source)
+    if output is None:
+        output = _probe_source(source)
+        cache.set("ffprobe_burnin", source, output)
+    return output
+
+
+def _probe_source(source):
     command = [
         ffprobe_path,
         "-v", "quiet",
@@ -372,13 +383,42 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
             'filters': filters
         }).strip()
 
-    def render(self, output, args=None, overwrite=False, **kwargs):
+    def review_command(self, output, review_ffmpeg_args):
+        """
+        Generate FFMPEG command rendering review output with burnins.
+
+        Burnin filters are appended to video filters of the review command
+        so review and burnins are rendered in single decode/encode pass.
+
+        :param str output: output file
+        :param list review_ffmpeg_args: arguments of review command where
+            last item is path to review output
+        :returns: completed command
+        :rtype: str
+        """
+        args = list(review_ffmpeg_args[:-1])
+        filters = self.filter_string
+        if filters:
+            if "-filter:v" in args:
+                idx = args.index("-filter:v") + 1
+                args[idx] = '"{},{}"'.format(args[idx].strip('"'), filters)
+            else:
+                args.extend(["-filter:v", '"{}"'.format(filters)])
+        args.append('"{}"'.format(output))
+        return " ".join(args)
+
+    def render(
+        self, output, args=None, overwrite=False, review_ffmpeg_args=None,
+        **kwargs
+    ):
         """
         Render the media to a specified destination.
 
         :param str output: output file
         :param str args: additional FFMPEG arguments
         :param bool overwrite: overwrite the output if it exists
+        :param list review_ffmpeg_args: arguments of review command which
+            should be rendered with burnins (args are ignored)
         """
         if not overwrite and os.path.exists(output):
             raise RuntimeError("Destination '%s' exists, please "
@@ -386,32 +426,28 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
 
         is_sequence = "%" in output
 
-        command = self.command(
-            output=output,
-            args=args,
-            overwrite=overwrite
-        )
+        if review_ffmpeg_args:
+            command = self.review_command(output, review_ffmpeg_args)
+        else:
+            command = self.command(
+                output=output,
+                args=args,
+                overwrite=overwrite
+            )
         print("Launching command: {}".format(command))
 
-        kwargs = {
-            "stdout": subprocess.PIPE,
-            "stderr": subprocess.PIPE,
-            "shell": True,
-        }
-        proc = subprocess.Popen(command, **kwargs)
-
-        _stdout, _stderr = proc.communicate()
-        if _stdout:
-            print(_stdout.decode("utf-8", errors="backslashreplace"))
-
-        # This will probably never happen as ffmpeg use stdout
-        if _stderr:
-            print(_stderr.decode("utf-8", errors="backslashreplace"))
-
-        if proc.returncode != 0:
+        # Process can be terminated by 'ProcessScheduler' when burnins
+        #   are rendered in publish process
+        try:
+            output_str = run_subprocess(command, shell=True)
+        except RuntimeError as exc:
+            print(exc)
             raise RuntimeError(
                 "Failed to render '{}': {}'".format(output, command)
             )
+        if output_str:
+            print(output_str)
+
         if is_sequence:
             output = output % kwargs.get("duration")
 
@@ -443,7 +479,8 @@ def example(input_path, output_path):
 def burnins_from_data(
     input_path, output_path, data,
     codec_data=None, options=None, burnin_values=None, overwrite=True,
-    full_input_path=None, first_frame=None, source_ffmpeg_cmd=None
+    full_input_path=None, first_frame=None, source_ffmpeg_cmd=None,
+    review_ffmpeg_args=None
 ):
     """This method adds burnins to video/image file based on presets setting.
 
@@ -459,6 +496,9 @@ def burnins_from_data(
         burnin_values (dict): Contain positioned values.
         overwrite (bool): Output will be overwritten if already exists,
             True by default.
+        review_ffmpeg_args (list): Arguments of review command. Review is
+            rendered with burnins from review source and input path is not
+            used (input is probed from 'full_input_path').
 
     Presets must be set separately. Should be dict with 2 keys:
     - "options" - sets look of burnins - colors, opacity,...
@@ -668,7 +708,11 @@ def burnins_from_data(
         burnin.add_text(text, align, frame_start, frame_end, cmd=cmd)
 
     ffmpeg_args = []
-    if codec_data:
+    if review_ffmpeg_args:
+        # Codec arguments are already in review arguments
+        pass
+
+    elif codec_data:
         # Use codec definition from method arguments
         ffmpeg_args = codec_data
         ffmpeg_args.append("-g 1")
@@ -694,17 +738,22 @@ def burnins_from_data(
     # Use group one (same as `-intra` argument, which is deprecated)
     ffmpeg_args_str = " ".join(ffmpeg_args)
     burnin.render(
-        output_path, args=ffmpeg_args_str, overwrite=overwrite, **data
+        output_path,
+        args=ffmpeg_args_str,
+        overwrite=overwrite,
+        review_ffmpeg_args=review_ffmpeg_args,
+        **data
     )
     for path in clean_up_paths:
         os.remove(path)
 
 
-if __name__ == "__main__":
-    print("* Burnin script started")
-    in_data_json_path = sys.argv[-1]
-    with open(in_data_json_path, "r") as file_stream:
-        in_data = json.load(file_stream)
+def burnins_from_script_data(in_data):
+    """Add burnins using data prepared by 'ExtractBurnin' plugin.
+
+    Args:
+        in_data (dict): Data with input, output, burnin data and options.
+    """
 
     burnins_from_data(
         in_data["input"],
@@ -715,6 +764,16 @@ if __name__ == "__main__":
         burnin_values=in_data.get("values"),
         full_input_path=in_data.get("full_input_path"),
         first_frame=in_data.get("first_frame"),
-        source_ffmpeg_cmd=in_data.get("ffmpeg_cmd")
+        source_ffmpeg_cmd=in_data.get("ffmpeg_cmd"),
+        review_ffmpeg_args=in_data.get("review_ffmpeg_args")
     )
+
+
+if __name__ == "__main__":
+    print("* Burnin script started")
+    in_data_json_path = sys.argv[-1]
+    with open(in_data_json_path, "r") as file_stream:
+        in_data = json.load(file_stream)
+
+    burnins_from_script_data(in_data)
     print("* Burnin script has finished")
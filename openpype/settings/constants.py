@@ -17,6 +17,8 @@ SYSTEM_SETTINGS_KEY = "system_settings"
 PROJECT_SETTINGS_KEY = "project_settings"
 PROJECT_ANATOMY_KEY = "project_anatomy"
 LOCAL_SETTING_KEY = "local_settings"
+# Document with revision of studio settings increased on each save
+SETTINGS_REVISION_KEY = "settings_revision"
 
 LEGACY_SETTINGS_VERSION = "legacy"
 
@@ -532,7 +532,7 @@ class SystemSettings(RootEntity):
         return output
 
     def _reset_values(self):
-        default_value = get_default_settings()[SYSTEM_SETTINGS_KEY]
+        default_value = get_default_settings()[SYSTEM_SETTINGS_KEY].to_dict()
         for key, child_obj in self.non_gui_children.items():
             value = default_value.get(key, NOT_SET)
             child_obj.update_default_value(value)
@@ -726,9 +726,14 @@ class ProjectSettings(RootEntity):
         self.set_project_state()
 
     def _reset_values(self):
+        default_settings = get_default_settings()
         default_values = {
-            PROJECT_SETTINGS_KEY: get_default_settings()[PROJECT_SETTINGS_KEY],
-            PROJECT_ANATOMY_KEY: get_default_settings()[PROJECT_ANATOMY_KEY]
+            PROJECT_SETTINGS_KEY: (
+                default_settings[PROJECT_SETTINGS_KEY].to_dict()
+            ),
+            PROJECT_ANATOMY_KEY: (
+                default_settings[PROJECT_ANATOMY_KEY].to_dict()
+            ),
         }
         for key, child_obj in self.non_gui_children.items():
             value = default_values.get(key, NOT_SET)
@@ -1,27 +1,39 @@
 import os
 import json
 import copy
+import time
+import hashlib
 import collections
 import datetime
 from abc import ABCMeta, abstractmethod
 import six
+import appdirs
+import pymongo
 
 import openpype.version
 from openpype.client.mongo import OpenPypeMongoConnection
 from openpype.client.entities import get_project_connection, get_project
+from openpype.client.entity_cache import invalidate_entity_cache
 from openpype.lib.pype_info import get_workstation_info
 
+from .readonly import ReadOnlyDict
 from .constants import (
     GLOBAL_SETTINGS_KEY,
     SYSTEM_SETTINGS_KEY,
     PROJECT_SETTINGS_KEY,
     PROJECT_ANATOMY_KEY,
     LOCAL_SETTING_KEY,
+    SETTINGS_REVISION_KEY,
     M_OVERRIDDEN_KEY,
 
     LEGACY_SETTINGS_VERSION
 )
 
+# Environment variable with last known revision of studio settings. Is set
+#   when revision is received so child processes (e.g. launched hosts) know
+#   the revision without querying mongo.
+SETTINGS_REVISION_ENV_KEY = "OPENPYPE_SETTINGS_REVISION"
+
 
 class SettingsStateInfo:
     """Helper state information about some settings state.
@@ -551,12 +563,19 @@ class LocalSettingsHandler:
 
 
 class CacheValues:
+    """Cached settings data.
+
+    Cache is outdated after 'cache_lifetime' seconds or, when revision of
+    settings is known, when revision of cached data does not match.
+    """
+
     cache_lifetime = 10
 
     def __init__(self):
         self.data = None
         self.creation_time = None
         self.version = None
+        self.revision = None
         self.last_saved_info = None
 
     def data_copy(self):
@@ -564,15 +583,27 @@ class CacheValues:
             return {}
         return copy.deepcopy(self.data)
 
-    def update_data(self, data, version):
+    def data_view(self):
+        """Read only view of cached data.
+
+        Should be used instead of 'data_copy' when data are only read.
+
+        Returns:
+            ReadOnlyDict: View of cached data.
+        """
+
+        return ReadOnlyDict(self.data)
+
+    def update_data(self, data, version, revision=None):
         self.data = data
         self.creation_time = datetime.datetime.now()
         self.version = version
+        self.revision = revision
 
     def update_last_saved_info(self, last_saved_info):
         self.last_saved_info = last_saved_info
 
-    def update_from_document(self, document, version):
+    def update_from_document(self, document, version, revision=None):
         data = {}
         if document:
             if "data" in document:
@@ -582,8 +613,7 @@ class CacheValues:
                 if value:
                     data = json.loads(value)
 
-        self.data = data
-        self.version = version
+        self.update_data(data, version, revision)
 
     def to_json_string(self):
         return json.dumps(self.data or {})
@@ -595,15 +625,41 @@ class CacheValues:
         delta = (datetime.datetime.now() - self.creation_time).seconds
         return delta > self.cache_lifetime
 
+    def is_outdated_for_revision(self, revision):
+        """Cache is outdated for a settings revision.
+
+        Args:
+            revision (Union[int, None]): Current revision of settings. Cache
+                lifetime is used if revision is not known.
+
+        Returns:
+            bool: Data should be loaded again.
+        """
+
+        if revision is None:
+            return self.is_outdated
+        return self.creation_time is None or self.revision != revision
+
     def set_outdated(self):
-        self.create_time = None
+        self.creation_time = None
 
 
 class MongoSettingsHandler(SettingsHandler):
-    """Settings handler that use mongo for storing and loading of settings."""
+    """Settings handler that use mongo for storing and loading of settings.
+
+    Cached studio settings are valid until revision of settings changes.
+    Revision is stored in settings collection and is increased on each
+    save. It is checked at most once per 'revision_check_interval' seconds.
+
+    Cached data are stored to a snapshot file on disk with the revision so
+    new processes which know the revision from environment variable
+    'OPENPYPE_SETTINGS_REVISION' don't have to query mongo at all. Directory
+    of snapshots can be changed with 'OPENPYPE_SETTINGS_SNAPSHOT_DIR'.
+    """
     key_suffix = "_versioned"
     _version_order_key = "versions_order"
     _all_versions_keys = "all_versions"
+    revision_check_interval = 5
 
     def __init__(self):
         # Get mongo connection
@@ -635,6 +691,183 @@ class MongoSettingsHandler(SettingsHandler):
         self.project_settings_cache = collections.defaultdict(CacheValues)
         self.project_anatomy_cache = collections.defaultdict(CacheValues)
 
+        self._revision = None
+        self._revision_check_time = None
+        self._snapshot_loaded = False
+        env_revision = os.environ.get(SETTINGS_REVISION_ENV_KEY)
+        if env_revision:
+            try:
+                self._set_revision(int(env_revision))
+            except ValueError:
+                pass
+
+    def _set_revision(self, revision):
+        self._revision = revision
+        self._revision_check_time = time.time()
+        os.environ[SETTINGS_REVISION_ENV_KEY] = str(revision)
+
+    def get_settings_revision(self):
+        """Current revision of studio settings.
+
+        Returns:
+            int: Revision of settings.
+        """
+
+        if (
+            self._revision_check_time is not None
+            and (
+                time.time() - self._revision_check_time
+                < self.revision_check_interval
+            )
+        ):
+            return self._revision
+
+        revision_doc = self.collection.find_one(
+            {"type": SETTINGS_REVISION_KEY},
+            {"revision": True}
+        )
+        revision = 0
+        if revision_doc:
+            revision = revision_doc.get("revision") or 0
+        self._set_revision(revision)
+        return revision
+
+    def _increment_revision(self):
+        """Increase revision of settings after save.
+
+        Must be called after changed documents are stored so other processes
+        can't cache old data with new revision.
+
+        Returns:
+            int: New revision.
+        """
+
+        revision_doc = self.collection.find_one_and_update(
+            {"type": SETTINGS_REVISION_KEY},
+            {"$inc": {"revision": 1}},
+            upsert=True,
+            return_document=pymongo.ReturnDocument.AFTER
+        )
+        revision = revision_doc["revision"]
+        self._set_revision(revision)
+        return revision
+
+    def _get_revision_caches(self):
+        """Caches which are invalidated by settings revision."""
+
+        output = {
+            "global": self.global_settings_cache,
+            "system": self.system_settings_cache,
+            "studio_anatomy": self.project_anatomy_cache[None],
+        }
+        for project_name, cache in self.project_settings_cache.items():
+            if project_name is None:
+                output["studio_project"] = cache
+            else:
+                output["project/" + project_name] = cache
+        return output
+
+    def _get_snapshot_path(self):
+        snapshot_dir = os.environ.get("OPENPYPE_SETTINGS_SNAPSHOT_DIR")
+        if not snapshot_dir:
+            snapshot_dir = os.path.join(
+                appdirs.user_data_dir("openpype", "pypeclub"),
+                "settings_snapshots"
+            )
+        # Mongo url may contain password so hash is used
+        key = "|".join((
+            OpenPypeMongoConnection.get_default_mongo_url(),
+            self.database_name,
+            self._current_version
+        ))
+        filename = "{}.json".format(
+            hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        )
+        return os.path.join(snapshot_dir, filename)
+
+    def _load_snapshot(self, revision):
+        """Fill caches from snapshot if it was stored with the revision.
+
+        Snapshot is loaded only once per handler.
+        """
+
+        if self._snapshot_loaded or revision is None:
+            return
+        self._snapshot_loaded = True
+
+        snapshot_path = self._get_snapshot_path()
+        if not os.path.exists(snapshot_path):
+            return
+
+        try:
+            with open(snapshot_path, "r") as stream:
+                snapshot = json.load(stream)
+        except (IOError, OSError, ValueError):
+            return
+
+        if snapshot.get("revision") != revision:
+            return
+
+        caches = self._get_revision_caches()
+        for key, item in snapshot.get("caches", {}).items():
+            if key.startswith("project/"):
+                cache = self.project_settings_cache[key[len("project/"):]]
+            elif key == "studio_project":
+                cache = self.project_settings_cache[None]
+            else:
+                cache = caches.get(key)
+            if cache is None or not cache.is_outdated_for_revision(revision):
+                continue
+
+            cache.update_data(item["data"], item["version"], revision)
+            last_saved_info = item.get("last_saved_info")
+            if last_saved_info:
+                cache.update_last_saved_info(
+                    SettingsStateInfo.from_data(last_saved_info)
+                )
+
+    def _store_snapshot(self):
+        """Store caches valid for current revision to snapshot file."""
+
+        revision = self._revision
+        if revision is None:
+            return
+
+        caches = {}
+        for key, cache in self._get_revision_caches().items():
+            if cache.is_outdated_for_revision(revision):
+                continue
+            last_saved_info = None
+            if cache.last_saved_info is not None:
+                last_saved_info = cache.last_saved_info.to_data()
+            caches[key] = {
+                "data": cache.data,
+                "version": cache.version,
+                "last_saved_info": last_saved_info,
+            }
+
+        snapshot_path = self._get_snapshot_path()
+        tmp_path = "{}.{}.tmp".format(snapshot_path, os.getpid())
+        try:
+            snapshot_dir = os.path.dirname(snapshot_path)
+            if not os.path.exists(snapshot_dir):
+                os.makedirs(snapshot_dir)
+            with open(tmp_path, "w") as stream:
+                json.dump({"revision": revision, "caches": caches}, stream)
+            os.replace(tmp_path, snapshot_path)
+        except (IOError, OSError, TypeError, ValueError):
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _is_cache_outdated(self, cache):
+        """Check revision cache and fill it from snapshot if possible."""
+
+        revision = self.get_settings_revision()
+        if not cache.is_outdated_for_revision(revision):
+            return False
+        self._load_snapshot(revision)
+        return cache.is_outdated_for_revision(revision)
+
     def _prepare_project_settings_keys(self):
         from .entities import ProjectSettings
         # Prepare anatomy keys and attribute keys
@@ -664,19 +897,28 @@ class MongoSettingsHandler(SettingsHandler):
             self._prepare_project_settings_keys()
         return self._attribute_keys
 
-    def get_global_settings_doc(self):
-        if self.global_settings_cache.is_outdated:
+    def _update_global_settings_cache(self):
+        if self._is_cache_outdated(self.global_settings_cache):
             global_settings_doc = self.collection.find_one({
                 "type": GLOBAL_SETTINGS_KEY
             }) or {}
-            self.global_settings_cache.update_data(global_settings_doc, None)
+            self.global_settings_cache.update_data(
+                {"data": global_settings_doc.get("data") or {}},
+                None,
+                self._revision
+            )
+            self._store_snapshot()
+
+    def get_global_settings_doc(self):
+        self._update_global_settings_cache()
         return self.global_settings_cache.data_copy()
 
     def get_global_settings(self):
-        global_settings_doc = self.get_global_settings_doc()
+        self._update_global_settings_cache()
+        global_settings_doc = self.global_settings_cache.data_view()
         global_settings = global_settings_doc.get("data", {})
         return {
-            key: global_settings[key]
+            key: copy.deepcopy(global_settings[key])
             for key in self.global_keys
             if key in global_settings
         }
@@ -811,7 +1053,7 @@ class MongoSettingsHandler(SettingsHandler):
             system_settings_data
         )
         self.global_settings_cache.update_data(
-            global_settings,
+            {"data": global_settings},
             None
         )
 
@@ -849,6 +1091,17 @@ class MongoSettingsHandler(SettingsHandler):
             },
             upsert=True
         )
+        self._on_settings_saved(
+            self.system_settings_cache, self.global_settings_cache
+        )
+
+    def _on_settings_saved(self, *caches):
+        """Increase revision and mark saved caches as valid for it."""
+
+        revision = self._increment_revision()
+        for cache in caches:
+            cache.revision = revision
+        self._store_snapshot()
 
     def save_project_settings(self, project_name, overrides):
         """Save studio overrides of project settings.
@@ -883,6 +1136,7 @@ class MongoSettingsHandler(SettingsHandler):
             data_cache,
             last_saved_info
         )
+        self._on_settings_saved(data_cache)
 
     def save_project_anatomy(self, project_name, anatomy_data):
         """Save studio overrides of project anatomy data.
@@ -910,6 +1164,7 @@ class MongoSettingsHandler(SettingsHandler):
                 data_cache,
                 last_saved_info
             )
+            self._on_settings_saved(data_cache)
 
     @classmethod
     def prepare_mongo_update_dict(cls, in_data):
@@ -1014,6 +1269,7 @@ class MongoSettingsHandler(SettingsHandler):
             {"type": "project"},
             {"$set": update_dict}
         )
+        invalidate_entity_cache(project_name, [project_doc["_id"]])
 
     def _save_project_data(
         self, project_name, doc_type, data_cache, last_saved_info
@@ -1341,7 +1597,7 @@ class MongoSettingsHandler(SettingsHandler):
 
     def get_studio_system_settings_overrides(self, return_version):
         """Studio overrides of system settings."""
-        if self.system_settings_cache.is_outdated:
+        if self._is_cache_outdated(self.system_settings_cache):
             globals_document = self.get_global_settings_doc()
             document, version = self._get_system_settings_overrides_doc()
 
@@ -1353,11 +1609,12 @@ class MongoSettingsHandler(SettingsHandler):
             )
 
             self.system_settings_cache.update_from_document(
-                merged_document, version
+                merged_document, version, self._revision
             )
             self.system_settings_cache.update_last_saved_info(
                 last_saved_info
             )
+            self._store_snapshot()
 
         cache = self.system_settings_cache
         data = cache.data_copy()
@@ -1389,12 +1646,12 @@ class MongoSettingsHandler(SettingsHandler):
         return self.system_settings_cache.last_saved_info.copy()
 
     def _get_project_settings_overrides(self, project_name, return_version):
-        if self.project_settings_cache[project_name].is_outdated:
+        if self._is_cache_outdated(self.project_settings_cache[project_name]):
             document, version = self._get_project_settings_overrides_doc(
                 project_name
             )
             self.project_settings_cache[project_name].update_from_document(
-                document, version
+                document, version, self._revision
             )
             last_saved_info = SettingsStateInfo.from_document(
                 version, PROJECT_SETTINGS_KEY, document
@@ -1402,6 +1659,7 @@ class MongoSettingsHandler(SettingsHandler):
             self.project_settings_cache[project_name].update_last_saved_info(
                 last_saved_info
             )
+            self._store_snapshot()
 
         cache = self.project_settings_cache[project_name]
         data = cache.data_copy()
@@ -1494,7 +1752,15 @@ class MongoSettingsHandler(SettingsHandler):
         return output
 
     def _get_project_anatomy_overrides(self, project_name, return_version):
-        if self.project_anatomy_cache[project_name].is_outdated:
+        cache = self.project_anatomy_cache[project_name]
+        # Anatomy of a project is stored in project document which can be
+        #   changed without settings revision change
+        if project_name is None:
+            is_outdated = self._is_cache_outdated(cache)
+        else:
+            is_outdated = cache.is_outdated
+
+        if is_outdated:
             if project_name is None:
                 document = self._get_project_anatomy_overrides_for_version()
                 if document is None:
@@ -1507,8 +1773,9 @@ class MongoSettingsHandler(SettingsHandler):
                     else:
                         version = LEGACY_SETTINGS_VERSION
                 self.project_anatomy_cache[project_name].update_from_document(
-                    document, version
+                    document, version, self._revision
                 )
+                self._store_snapshot()
 
             else:
                 project_doc = get_project(project_name)
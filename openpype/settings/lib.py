@@ -7,6 +7,7 @@ import copy
 from .exceptions import (
     SaveWarningExc
 )
+from .readonly import ReadOnlyDict
 from .constants import (
     M_OVERRIDDEN_KEY,
 
@@ -142,7 +143,7 @@ def save_studio_settings(data):
 
     old_data = get_system_settings()
     default_values = get_default_settings()[SYSTEM_SETTINGS_KEY]
-    new_data = apply_overrides(default_values, copy.deepcopy(data))
+    new_data = apply_overrides(default_values, data).to_dict()
     new_data_with_metadata = copy.deepcopy(new_data)
     clear_metadata_from_settings(new_data)
 
@@ -193,13 +194,15 @@ def save_project_settings(project_name, overrides):
         old_data = get_project_settings(project_name)
 
         studio_overrides = get_studio_project_settings_overrides()
-        studio_values = apply_overrides(default_values, studio_overrides)
+        studio_values = apply_overrides(
+            default_values, studio_overrides
+        ).to_dict()
         clear_metadata_from_settings(studio_values)
-        new_data = apply_overrides(studio_values, copy.deepcopy(overrides))
+        new_data = apply_overrides(studio_values, overrides).to_dict()
 
     else:
         old_data = get_default_project_settings(exclude_locals=True)
-        new_data = apply_overrides(default_values, copy.deepcopy(overrides))
+        new_data = apply_overrides(default_values, overrides).to_dict()
 
     new_data_with_metadata = copy.deepcopy(new_data)
     clear_metadata_from_settings(new_data)
@@ -254,13 +257,15 @@ def save_project_anatomy(project_name, anatomy_data):
         old_data = get_anatomy_settings(project_name)
 
         studio_overrides = get_studio_project_settings_overrides()
-        studio_values = apply_overrides(default_values, studio_overrides)
+        studio_values = apply_overrides(
+            default_values, studio_overrides
+        ).to_dict()
         clear_metadata_from_settings(studio_values)
-        new_data = apply_overrides(studio_values, copy.deepcopy(anatomy_data))
+        new_data = apply_overrides(studio_values, anatomy_data).to_dict()
 
     else:
         old_data = get_default_anatomy_settings(exclude_locals=True)
-        new_data = apply_overrides(default_values, copy.deepcopy(anatomy_data))
+        new_data = apply_overrides(default_values, anatomy_data).to_dict()
 
     new_data_with_metadata = copy.deepcopy(new_data)
     clear_metadata_from_settings(new_data)
@@ -551,16 +556,16 @@ def _get_default_settings():
 def get_default_settings():
     """Get default settings.
 
-    Todo:
-        Cache loaded defaults.
+    Defaults are cached so read only view is returned. Use 'to_dict' on
+    the output to get modifiable copy.
 
     Returns:
-        dict: Loaded default settings.
+        ReadOnlyDict: Loaded default settings.
     """
     global _DEFAULT_SETTINGS
     if _DEFAULT_SETTINGS is None:
         _DEFAULT_SETTINGS = _get_default_settings()
-    return copy.deepcopy(_DEFAULT_SETTINGS)
+    return ReadOnlyDict(_DEFAULT_SETTINGS)
 
 
 def load_json_file(fpath):
@@ -680,11 +685,55 @@ def merge_overrides(source_dict, override_dict):
     return source_dict
 
 
+def _merge_overrides_shared(source_dict, override_dict):
+    """Merge overrides without changing passed data.
+
+    Only dictionaries on paths of overridden values are recreated, other
+    values are shared with source data. Values are read using 'dict' methods
+    so read only views are not wrapping nested values.
+    """
+
+    overridden_keys = set(
+        dict.get(override_dict, M_OVERRIDDEN_KEY) or []
+    )
+    output = dict(dict.items(source_dict))
+    for key, value in dict.items(override_dict):
+        if key == M_OVERRIDDEN_KEY:
+            continue
+
+        source_value = output.get(key)
+        if (
+            key not in overridden_keys
+            and isinstance(value, dict)
+            and isinstance(source_value, dict)
+        ):
+            value = _merge_overrides_shared(source_value, value)
+        output[key] = value
+    return output
+
+
 def apply_overrides(source_data, override_data):
+    """Apply overrides on source data.
+
+    Passed data are not changed and are not copied, output shares values
+    with them. Passed data must not be changed while output is used.
+
+    Args:
+        source_data (dict[str, Any]): Source values.
+        override_data (dict[str, Any]): Overrides with metadata.
+
+    Returns:
+        ReadOnlyDict: Read only view of values with applied overrides. Use
+            'to_dict' to get modifiable copy.
+    """
+
     if not override_data:
-        return source_data
-    _source_data = copy.deepcopy(source_data)
-    return merge_overrides(_source_data, override_data)
+        if isinstance(source_data, ReadOnlyDict):
+            return source_data
+        return ReadOnlyDict(source_data)
+    return ReadOnlyDict(
+        _merge_overrides_shared(source_data, override_data)
+    )
 
 
 def apply_local_settings_on_system_settings(system_settings, local_settings):
@@ -894,7 +943,7 @@ def get_system_settings(clear_metadata=True, exclude_locals=None):
     """System settings with applied studio overrides."""
     default_values = get_default_settings()[SYSTEM_SETTINGS_KEY]
     studio_values = get_studio_system_settings_overrides()
-    result = apply_overrides(default_values, studio_values)
+    result = apply_overrides(default_values, studio_values).to_dict()
 
     # Clear overrides metadata from settings
     if clear_metadata:
@@ -917,7 +966,7 @@ def get_default_project_settings(clear_metadata=True, exclude_locals=None):
     """Project settings with applied studio's default project overrides."""
     default_values = get_default_settings()[PROJECT_SETTINGS_KEY]
     studio_values = get_studio_project_settings_overrides()
-    result = apply_overrides(default_values, studio_values)
+    result = apply_overrides(default_values, studio_values).to_dict()
     # Clear overrides metadata from settings
     if clear_metadata:
         clear_metadata_from_settings(result)
@@ -939,7 +988,7 @@ def get_default_anatomy_settings(clear_metadata=True, exclude_locals=None):
     default_values = get_default_settings()[PROJECT_ANATOMY_KEY]
     studio_values = get_studio_project_anatomy_overrides()
 
-    result = apply_overrides(default_values, studio_values)
+    result = apply_overrides(default_values, studio_values).to_dict()
     # Clear overrides metadata from settings
     if clear_metadata:
         clear_metadata_from_settings(result)
@@ -966,14 +1015,18 @@ def get_anatomy_settings(
             "`get_default_anatomy_settings` to get project defaults."
         )
 
-    studio_overrides = get_default_anatomy_settings(False)
+    studio_overrides = apply_overrides(
+        get_default_settings()[PROJECT_ANATOMY_KEY],
+        get_studio_project_anatomy_overrides()
+    )
     project_overrides = get_project_anatomy_overrides(
         project_name
     )
-    result = copy.deepcopy(studio_overrides)
+    result = dict(dict.items(studio_overrides))
     if project_overrides:
         for key, value in project_overrides.items():
             result[key] = value
+    result = copy.deepcopy(result)
 
     # Clear overrides metadata from settings
     if clear_metadata:
@@ -1002,12 +1055,15 @@ def get_project_settings(
             " Call `get_default_project_settings` to get project defaults."
         )
 
-    studio_overrides = get_default_project_settings(False)
+    studio_overrides = apply_overrides(
+        get_default_settings()[PROJECT_SETTINGS_KEY],
+        get_studio_project_settings_overrides()
+    )
     project_overrides = get_project_settings_overrides(
         project_name
     )
 
-    result = apply_overrides(studio_overrides, project_overrides)
+    result = apply_overrides(studio_overrides, project_overrides).to_dict()
 
     # Clear overrides metadata from settings
     if clear_metadata:
@@ -1067,7 +1123,7 @@ def get_general_environments():
     studio_overrides = get_studio_system_settings_overrides()
 
     result = apply_overrides(system_settings, studio_overrides)
-    environments = result["general"]["environment"]
+    environments = result["general"]["environment"].to_dict()
 
     clear_metadata_from_settings(environments)
 
@@ -0,0 +1,120 @@
+"""Read only views of settings and anatomy data.
+
+Loaded settings and anatomy data are cached and shared, so getters would
+have to return a deep copy to protect the cache from changes made by
+callers. A read only view gives access to the data without copying them.
+Callers that need to change the data must ask for a copy using 'to_dict'.
+"""
+
+import copy
+
+
+def _readonly_error(*args, **kwargs):
+    raise TypeError(
+        "ReadOnlyDict does not support item assignment."
+        " Use 'to_dict' to get a modifiable copy."
+    )
+
+
+def to_readonly(value):
+    """Wrap a value into a read only view if needed.
+
+    Dictionaries are wrapped into 'ReadOnlyDict'. Lists are shallow copied
+    so change of the list does not affect source data, but their items are
+    wrapped too.
+
+    Args:
+        value (Any): Value to wrap.
+
+    Returns:
+        Any: Read only value.
+    """
+
+    if isinstance(value, ReadOnlyDict):
+        return value
+    if isinstance(value, dict):
+        return ReadOnlyDict(value)
+    if isinstance(value, list):
+        return [to_readonly(item) for item in value]
+    return value
+
+
+class ReadOnlyDict(dict):
+    """Read only view of a dictionary.
+
+    Only first level of source dictionary is copied on creation, nested
+    values are wrapped on access. Object is a 'dict' subclass so it can be
+    serialized to json and passes 'isinstance' checks.
+
+    Deep copy of the view returns modifiable 'dict'.
+
+    Args:
+        data (dict[str, Any]): Source data. Source must not be changed while
+            the view is used.
+    """
+
+    def __init__(self, data=None):
+        super(ReadOnlyDict, self).__init__(data or {})
+        self._views = {}
+
+    def _get_view(self, key, value):
+        view = self._views.get(key)
+        if view is None:
+            view = to_readonly(value)
+            # Lists are copied on each access
+            if not isinstance(view, list):
+                self._views[key] = view
+        return view
+
+    def __getitem__(self, key):
+        value = super(ReadOnlyDict, self).__getitem__(key)
+        return self._get_view(key, value)
+
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+        return self[key]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def to_dict(self):
+        """Modifiable deep copy of data.
+
+        Returns:
+            dict[str, Any]: Copy of data.
+        """
+
+        return copy.deepcopy(dict(super(ReadOnlyDict, self).items()))
+
+    def copy(self):
+        return self.to_dict()
+
+    def __copy__(self):
+        return self.to_dict()
+
+    def __deepcopy__(self, memo=None):
+        return self.to_dict()
+
+    def __reduce__(self):
+        return (self.__class__, (self.to_dict(), ))
+
+    def __repr__(self):
+        return "{}({})".format(
+            self.__class__.__name__, super(ReadOnlyDict, self).__repr__()
+        )
+
+    __setitem__ = _readonly_error
+    __delitem__ = _readonly_error
+    clear = _readonly_error
+    pop = _readonly_error
+    popitem = _readonly_error
+    setdefault = _readonly_error
+    update = _readonly_error
+    __ior__ = _readonly_error
@@ -0,0 +1,95 @@
+"""Benchmark of OpenPype modules import and initialization.
+
+Each measurement runs in a new python process so imports are not cached.
+'Cold' runs start without modules manifest, which means all modules are
+imported, 'warm' runs use manifest created by previous run so modules
+disabled in system settings are not imported.
+
+Run from OpenPype environment (requires connection to OpenPype database):
+    python -m openpype.tests.modules_import_performance --runs 5
+"""
+
+import os
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+_CHILD_SCRIPT = """
+import sys
+import json
+import time
+
+start = time.time()
+from openpype.modules import ModulesManager, load_modules
+import_time = time.time() - start
+
+start = time.time()
+load_modules()
+load_time = time.time() - start
+
+start = time.time()
+manager = ModulesManager()
+init_time = time.time() - start
+
+sys.stdout.write(json.dumps({
+    "import": import_time,
+    "load_modules": load_time,
+    "manager": init_time,
+    "imported": len([
+        name
+        for name in sys.modules
+        if name.startswith("openpype_modules.")
+    ])
+}))
+"""
+
+
+def _run_child(manifest_path):
+    env = dict(os.environ)
+    env["OPENPYPE_MODULES_MANIFEST"] = manifest_path
+    output = subprocess.check_output(
+        [sys.executable, "-c", _CHILD_SCRIPT],
+        env=env,
+        universal_newlines=True
+    )
+    # Modules may print to stdout, result is the last line
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def _median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def run(runs):
+    tmp_dir = tempfile.mkdtemp(prefix="openpype_modules_benchmark")
+    manifest_path = os.path.join(tmp_dir, "manifest.json")
+    results = {"cold": [], "warm": []}
+    try:
+        for _ in range(runs):
+            if os.path.exists(manifest_path):
+                os.remove(manifest_path)
+            results["cold"].append(_run_child(manifest_path))
+            results["warm"].append(_run_child(manifest_path))
+    finally:
+        shutil.rmtree(tmp_dir)
+
+    for label, items in results.items():
+        print("{} ({} runs)".format(label, runs))
+        for key in ("import", "load_modules", "manager"):
+            print("    {:<14} {:.3f}s".format(
+                key, _median([item[key] for item in items])
+            ))
+        print("    {:<14} {}".format(
+            "imported", _median([item["imported"] for item in items])
+        ))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    run(args.runs)
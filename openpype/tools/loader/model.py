@@ -446,7 +446,8 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
         last_versions_by_subset_id = get_last_versions(
             project_name,
             subset_ids,
-            fields=["_id", "parent", "name", "type", "data", "schema"]
+            fields=["_id", "parent", "name", "type", "data", "schema"],
+            use_index=True
         )
 
         hero_versions = get_hero_versions(project_name, subset_ids=subset_ids)
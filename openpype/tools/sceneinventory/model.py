@@ -8,11 +8,9 @@ import qtawesome
 
 from openpype.host import ILoadHost
 from openpype.client import (
-    get_asset_by_id,
-    get_subset_by_id,
-    get_version_by_id,
-    get_last_version_by_subset_id,
-    get_representation_by_id,
+    get_versions,
+    get_last_versions,
+    get_representations_hierarchy,
 )
 from openpype.pipeline import (
     legacy_io,
@@ -330,42 +328,72 @@ class InventoryModel(TreeModel):
         for item in items:
             grouped[item["representation"]]["items"].append(item)
 
+        # Query representations with all parents at once
+        hierarchy_by_repre_id = {
+            str(repre_id): hierarchy
+            for repre_id, hierarchy in get_representations_hierarchy(
+                project_name, grouped.keys()
+            ).items()
+        }
+        hero_source_version_ids = set()
+        subset_ids = set()
+        for hierarchy in hierarchy_by_repre_id.values():
+            version = hierarchy.version
+            if not version:
+                continue
+            subset_ids.add(version["parent"])
+            if version["type"] == "hero_version":
+                hero_source_version_ids.add(version["version_id"])
+
+        hero_source_versions_by_id = {}
+        if hero_source_version_ids:
+            hero_source_versions_by_id = {
+                version_doc["_id"]: version_doc
+                for version_doc in get_versions(
+                    project_name,
+                    version_ids=hero_source_version_ids,
+                    fields=["name", "data"]
+                )
+            }
+        last_versions_by_subset_id = get_last_versions(
+            project_name, subset_ids, fields=["name"], use_index=True
+        )
+
         # Add to model
         not_found = defaultdict(list)
         not_found_ids = []
         for repre_id, group_dict in sorted(grouped.items()):
             group_items = group_dict["items"]
             # Get parenthood per group
-            representation = get_representation_by_id(
-                project_name, repre_id
-            )
-            if not representation:
+            hierarchy = hierarchy_by_repre_id.get(repre_id)
+            if not hierarchy:
                 not_found["representation"].extend(group_items)
                 not_found_ids.append(repre_id)
                 continue
 
-            version = get_version_by_id(
-                project_name, representation["parent"]
-            )
+            representation, version, subset, asset = hierarchy
             if not version:
                 not_found["version"].extend(group_items)
                 not_found_ids.append(repre_id)
                 continue
 
             elif version["type"] == "hero_version":
-                _version = get_version_by_id(
-                    project_name, version["version_id"]
+                _version = hero_source_versions_by_id.get(
+                    version["version_id"]
                 )
+                # Source version of hero version was removed
+                if not _version:
+                    not_found["version"].extend(group_items)
+                    not_found_ids.append(repre_id)
+                    continue
                 version["name"] = HeroVersionType(_version["name"])
                 version["data"] = _version["data"]
 
-            subset = get_subset_by_id(project_name, version["parent"])
             if not subset:
                 not_found["subset"].extend(group_items)
                 not_found_ids.append(repre_id)
                 continue
 
-            asset = get_asset_by_id(project_name, subset["parent"])
             if not asset:
                 not_found["asset"].extend(group_items)
                 not_found_ids.append(repre_id)
@@ -426,9 +454,13 @@ class InventoryModel(TreeModel):
 
             # Store the highest available version so the model can know
             # whether current version is currently up-to-date.
-            highest_version = get_last_version_by_subset_id(
-                project_name, version["parent"]
+            highest_version = last_versions_by_subset_id.get(
+                version["parent"]
             )
+            # Use current version if last version is not available
+            highest_version_name = version["name"]
+            if highest_version:
+                highest_version_name = highest_version["name"]
 
             # create the group header
             group_node = Item()
@@ -437,7 +469,7 @@ class InventoryModel(TreeModel):
                                                   representation["name"])
             group_node["representation"] = repre_id
             group_node["version"] = version["name"]
-            group_node["highest_version"] = highest_version["name"]
+            group_node["highest_version"] = highest_version_name
             group_node["family"] = family
             group_node["familyIcon"] = family_icon
             group_node["count"] = len(group_items)
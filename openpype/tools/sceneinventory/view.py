@@ -6,6 +6,7 @@ from qtpy import QtWidgets, QtCore
 import qtawesome
 
 from openpype.client import (
+    entity_cache,
     get_version_by_id,
     get_versions,
     get_hero_versions,
@@ -195,18 +196,19 @@ class SceneInventoryView(QtWidgets.QTreeView):
                     version_name_by_id[version_doc["_id"]] = \
                         version_doc["name"]
 
-                for item in items:
-                    repre_id = item["representation"]
-                    version_id = version_id_by_repre_id.get(repre_id)
-                    version_name = version_name_by_id.get(version_id)
-                    if version_name is not None:
-                        try:
-                            update_container(item, version_name)
-                        except AssertionError:
-                            self._show_version_error_dialog(
-                                version_name, [item]
-                            )
-                            log.warning("Update failed", exc_info=True)
+                with entity_cache(project_name):
+                    for item in items:
+                        repre_id = item["representation"]
+                        version_id = version_id_by_repre_id.get(repre_id)
+                        version_name = version_name_by_id.get(version_id)
+                        if version_name is not None:
+                            try:
+                                update_container(item, version_name)
+                            except AssertionError:
+                                self._show_version_error_dialog(
+                                    version_name, [item]
+                                )
+                                log.warning("Update failed", exc_info=True)
 
                 self.data_changed.emit()
 
@@ -227,12 +229,13 @@ class SceneInventoryView(QtWidgets.QTreeView):
         if has_outdated or has_loaded_hero_versions:
             # update to latest version
             def _on_update_to_latest(items):
-                for item in items:
-                    try:
-                        update_container(item, -1)
-                    except AssertionError:
-                        self._show_version_error_dialog(None, [item])
-                        log.warning("Update failed", exc_info=True)
+                with entity_cache(project_name):
+                    for item in items:
+                        try:
+                            update_container(item, -1)
+                        except AssertionError:
+                            self._show_version_error_dialog(None, [item])
+                            log.warning("Update failed", exc_info=True)
                 self.data_changed.emit()
 
             update_icon = qtawesome.icon(
@@ -252,12 +255,13 @@ class SceneInventoryView(QtWidgets.QTreeView):
         if has_available_hero_version:
             # change to hero version
             def _on_update_to_hero(items):
-                for item in items:
-                    try:
-                        update_container(item, HeroVersionType(-1))
-                    except AssertionError:
-                        self._show_version_error_dialog('hero', [item])
-                        log.warning("Update failed", exc_info=True)
+                with entity_cache(project_name):
+                    for item in items:
+                        try:
+                            update_container(item, HeroVersionType(-1))
+                        except AssertionError:
+                            self._show_version_error_dialog('hero', [item])
+                            log.warning("Update failed", exc_info=True)
                 self.data_changed.emit()
 
             # TODO change icon
@@ -740,12 +744,13 @@ class SceneInventoryView(QtWidgets.QTreeView):
 
         if label:
             version = versions_by_label[label]
-            for item in items:
-                try:
-                    update_container(item, version)
-                except AssertionError:
-                    self._show_version_error_dialog(version, [item])
-                    log.warning("Update failed", exc_info=True)
+            with entity_cache(project_name):
+                for item in items:
+                    try:
+                        update_container(item, version)
+                    except AssertionError:
+                        self._show_version_error_dialog(version, [item])
+                        log.warning("Update failed", exc_info=True)
             # refresh model when done
             self.data_changed.emit()
 
@@ -841,10 +846,12 @@ class SceneInventoryView(QtWidgets.QTreeView):
             return
 
         # Trigger update to latest
-        for item in outdated_items:
-            try:
-                update_container(item, -1)
-            except AssertionError:
-                self._show_version_error_dialog(None, [item])
-                log.warning("Update failed", exc_info=True)
+        project_name = legacy_io.active_project()
+        with entity_cache(project_name):
+            for item in outdated_items:
+                try:
+                    update_container(item, -1)
+                except AssertionError:
+                    self._show_version_error_dialog(None, [item])
+                    log.warning("Update failed", exc_info=True)
         self.data_changed.emit()
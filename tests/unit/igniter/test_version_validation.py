@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""Test suite for validation of OpenPype versions checksums."""
+import hashlib
+import json
+from zipfile import ZipFile
+
+from igniter.version_validation import (
+    ValidationManifest,
+    VersionValidator,
+)
+
+
+def _create_version(path, files):
+    path.mkdir()
+    checksums = ""
+    for file_name, content in files.items():
+        (path / file_name).write_bytes(content)
+        checksums += "{}:{}\n".format(
+            hashlib.sha256(content).hexdigest(), file_name)
+    (path / "checksums").write_text(checksums)
+    return path
+
+
+def test_validate_dir(tmp_path):
+    version_path = _create_version(
+        tmp_path / "version", {"a.py": b"a" * 3000000, "b.py": b"b"})
+    manifest_path = tmp_path / "manifest.json"
+    validator = VersionValidator(
+        ValidationManifest(manifest_path, b"key"), max_workers=2)
+
+    valid, message = validator.validate_dir(version_path)
+    assert valid, message
+    assert message.startswith("All ok")
+
+    # unchanged version is trusted
+    valid, message = validator.validate_dir(version_path)
+    assert valid
+    assert message.startswith("Already validated")
+
+    # manifest signed with different key is ignored
+    other_validator = VersionValidator(
+        ValidationManifest(manifest_path, b"other"))
+    valid, message = other_validator.validate_dir(version_path)
+    assert message.startswith("All ok")
+
+    (version_path / "b.py").write_bytes(b"c")
+    valid, message = validator.validate_dir(version_path)
+    assert not valid
+    assert message.startswith("Invalid checksum on b.py")
+
+
+def test_tampered_manifest(tmp_path):
+    version_path = _create_version(tmp_path / "version", {"a.py": b"a"})
+    manifest_path = tmp_path / "manifest.json"
+    validator = VersionValidator(ValidationManifest(manifest_path, b"key"))
+    assert validator.validate_dir(version_path)[0]
+
+    (version_path / "a.py").write_bytes(b"b")
+    data = json.loads(manifest_path.read_text())
+    stat = (version_path / "a.py").stat()
+    data[version_path.as_posix()]["files"][
+        (version_path / "a.py").as_posix()] = [stat.st_size, stat.st_mtime_ns]
+    manifest_path.write_text(json.dumps(data))
+
+    assert not validator.validate_dir(version_path)[0]
+
+
+def test_validate_zip(tmp_path):
+    version_path = _create_version(
+        tmp_path / "version", {"a.py": b"a", "b.py": b"b"})
+    zip_path = tmp_path / "version.zip"
+    with ZipFile(zip_path, "w") as zip_file:
+        for file_name in ("a.py", "b.py", "checksums"):
+            zip_file.write(version_path / file_name, file_name)
+
+    validator = VersionValidator()
+    valid, message = validator.validate_zip(zip_path)
+    assert valid, message
+
+    with ZipFile(zip_path, "a") as zip_file:
+        zip_file.writestr("c.py", b"c")
+    valid, message = validator.validate_zip(zip_path)
+    assert not valid
+    assert message.startswith("Missing files")
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""Test suite for entity cache."""
+import threading
+
+from bson.objectid import ObjectId
+
+from openpype.client import entities, operations
+from openpype.client.entity_cache import (
+    entity_cache,
+    get_entity_cache,
+    is_entity_cache_enabled,
+)
+
+PROJECT_NAME = "test_project"
+
+
+class FakeCollection(object):
+    def __init__(self, docs):
+        self.docs = {doc["_id"]: doc for doc in docs}
+        self.queries = []
+
+    def find_one(self, query_filter, projection=None):
+        self.queries.append(query_filter)
+        doc = self.docs.get(query_filter.get("_id"))
+        if doc is None or doc["type"] != query_filter.get("type"):
+            return None
+        return dict(doc)
+
+    def find(self, query_filter, projection=None):
+        return []
+
+    def bulk_write(self, bulk_writes):
+        for bulk_write in bulk_writes:
+            doc = self.docs[bulk_write._filter["_id"]]
+            doc.update(bulk_write._doc["$set"])
+
+
+def _get_collection(monkeypatch):
+    asset_doc = {
+        "_id": ObjectId(),
+        "type": "asset",
+        "name": "sh010",
+        "parent": ObjectId(),
+        "data": {"fps": 25}
+    }
+    collection = FakeCollection([asset_doc])
+    for module in (entities, operations):
+        monkeypatch.setattr(
+            module, "get_project_connection", lambda _: collection
+        )
+    return collection, asset_doc["_id"]
+
+
+def test_cache_hits(monkeypatch):
+    collection, asset_id = _get_collection(monkeypatch)
+
+    with entity_cache(PROJECT_NAME) as cache:
+        for _ in range(3):
+            asset_doc = entities.get_asset_by_id(
+                PROJECT_NAME, asset_id, fields=["name"]
+            )
+            assert asset_doc == {"_id": asset_id, "name": "sh010"}
+        assert len(collection.queries) == 1
+
+        # Query with other fields is merged to cached document
+        asset_doc = entities.get_asset_by_id(
+            PROJECT_NAME, asset_id, fields=["data.fps"]
+        )
+        assert asset_doc["data"] == {"fps": 25}
+        entities.get_asset_by_id(PROJECT_NAME, asset_id, fields=["name"])
+        assert len(collection.queries) == 2
+        assert cache.hits == 3
+
+    assert not is_entity_cache_enabled(PROJECT_NAME)
+    entities.get_asset_by_id(PROJECT_NAME, asset_id, fields=["name"])
+    assert len(collection.queries) == 3
+
+
+def test_invalidation_on_commit(monkeypatch):
+    collection, asset_id = _get_collection(monkeypatch)
+
+    with entity_cache(PROJECT_NAME):
+        entities.get_asset_by_id(PROJECT_NAME, asset_id, fields=["name"])
+
+        session = operations.OperationsSession()
+        session.update_entity(
+            PROJECT_NAME, "asset", asset_id, {"name": "sh020"}
+        )
+        session.commit()
+
+        asset_doc = entities.get_asset_by_id(
+            PROJECT_NAME, asset_id, fields=["name"]
+        )
+        assert asset_doc["name"] == "sh020"
+        assert len(collection.queries) == 2
+
+
+def test_thread_isolation(monkeypatch):
+    collection, asset_id = _get_collection(monkeypatch)
+    thread_result = {}
+
+    def thread_func():
+        thread_result["enabled"] = is_entity_cache_enabled(PROJECT_NAME)
+        with entity_cache(PROJECT_NAME) as cache:
+            thread_result["cache"] = cache
+            entities.get_asset_by_id(PROJECT_NAME, asset_id, fields=["name"])
+            entities.get_asset_by_id(PROJECT_NAME, asset_id, fields=["name"])
+
+    with entity_cache(PROJECT_NAME) as cache:
+        thread = threading.Thread(target=thread_func)
+        thread.start()
+        thread.join()
+
+        assert thread_result["enabled"] is False
+        assert thread_result["cache"] is not cache
+        assert get_entity_cache(PROJECT_NAME) is cache
+        assert cache.misses == 0
+        assert len(collection.queries) == 1
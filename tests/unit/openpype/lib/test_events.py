@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""Test suite for event system."""
+import gc
+import time
+
+from openpype.lib.events import EventSystem
+
+
+class Listener(object):
+    def __init__(self, name, calls):
+        self.name = name
+        self.calls = calls
+
+    def callback(self, event):
+        self.calls.append((self.name, event.topic))
+
+
+def test_dispatch_by_topic():
+    calls = []
+    listeners = [
+        Listener(name, calls)
+        for name in ("all", "exact", "prefix", "partial", "other", "middle")
+    ]
+    event_system = EventSystem()
+    for topic, listener in zip(
+        ("*", "a.b", "a.*", "a.b*", "b.*", "a.*.c"), listeners
+    ):
+        event_system.add_callback(topic, listener.callback)
+
+    for topic in ("a.b", "a.bc", "a.b.c", "a", "a.", "b.a"):
+        event_system.emit(topic, {}, None)
+
+    assert calls == [
+        ("all", "a.b"),
+        ("exact", "a.b"),
+        ("prefix", "a.b"),
+        ("all", "a.bc"),
+        ("prefix", "a.bc"),
+        ("partial", "a.bc"),
+        ("all", "a.b.c"),
+        ("prefix", "a.b.c"),
+        ("partial", "a.b.c"),
+        ("middle", "a.b.c"),
+        ("all", "a"),
+        ("all", "a."),
+        ("all", "b.a"),
+        ("other", "b.a"),
+    ]
+
+
+def test_invalid_callbacks_removed():
+    calls = []
+    listener = Listener("listener", calls)
+    other = Listener("other", calls)
+    event_system = EventSystem()
+    event_system.add_callback("a.b", listener.callback)
+    event_system.add_callback("a.*", listener.callback)
+    callback = event_system.add_callback("a.b", other.callback)
+
+    callback.deregister()
+    event_system.emit("a.b", {}, None)
+    assert calls == [("listener", "a.b"), ("listener", "a.b")]
+
+    del listener
+    gc.collect()
+    event_system.emit("a.b", {}, None)
+    assert calls == [("listener", "a.b"), ("listener", "a.b")]
+    assert "a.b" not in event_system._exact_callbacks
+    assert not event_system._wildcard_root.children["a"].callbacks
+
+
+def test_coalesce_events():
+    calls = []
+
+    def callback(event):
+        calls.append((event.topic, event["value"]))
+
+    event_system = EventSystem()
+    event_system.add_callback("*", callback)
+    with event_system.coalesce_events(["progress.*"]):
+        for value in range(3):
+            event_system.emit("progress.changed", {"value": value}, None)
+            event_system.emit("other", {"value": value}, None)
+        event_system.emit("progress.max", {"value": 10}, None)
+        assert calls == [("other", 0), ("other", 1), ("other", 2)]
+
+    assert calls[3:] == [("progress.changed", 2), ("progress.max", 10)]
+
+
+def test_emit_benchmark():
+    """Compare indexed dispatch with matching of all callbacks."""
+
+    calls = []
+    listeners = []
+    event_system = EventSystem()
+    for idx in range(200):
+        listener = Listener(idx, calls)
+        listeners.append(listener)
+        event_system.add_callback(
+            "instance.{}.changed".format(idx), listener.callback
+        )
+        event_system.add_callback(
+            "value.{}.*".format(idx), listener.callback
+        )
+    all_callbacks = [
+        item[1]
+        for items in event_system._exact_callbacks.values()
+        for item in items
+    ] + [
+        item[1]
+        for node in event_system._wildcard_root.children["value"]
+        .children.values()
+        for item in node.callbacks
+    ]
+
+    events = [
+        event_system.create_event(topic.format(idx % 200), {}, None)
+        for idx in range(400)
+        for topic in ("instance.{}.changed", "value.{}.attr")
+    ]
+
+    start = time.time()
+    for event in events:
+        event_system.emit_event(event)
+    indexed_time = time.time() - start
+    indexed_calls = list(calls)
+
+    calls[:] = []
+    start = time.time()
+    for event in events:
+        for callback in all_callbacks:
+            callback.process_event(event)
+    linear_time = time.time() - start
+
+    print("Indexed dispatch: {:.4f}s Linear dispatch: {:.4f}s".format(
+        indexed_time, linear_time
+    ))
+    assert len(indexed_calls) == len(events)
+    assert sorted(indexed_calls) == sorted(calls)
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""Test suite for logging to mongo."""
+import logging
+import threading
+
+from openpype.lib.log import AsyncMongoHandler
+
+
+class FakeCollection(object):
+    def __init__(self):
+        self.batches = []
+        self.block = threading.Event()
+        self.block.set()
+
+    def insert_many(self, documents, ordered=True):
+        self.block.wait()
+        self.batches.append(list(documents))
+
+
+class DocumentFormatter(logging.Formatter):
+    def format(self, record):
+        return {
+            "level": record.levelname,
+            "message": record.getMessage()
+        }
+
+
+def _get_logger(name, handler):
+    logger = logging.getLogger(name)
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+    return logger
+
+
+def test_batched_insert():
+    collection = FakeCollection()
+    handler = AsyncMongoHandler(
+        lambda: collection,
+        batch_size=10,
+        flush_interval=10.0,
+        formatter=DocumentFormatter()
+    )
+    logger = _get_logger("test_batched_insert", handler)
+    try:
+        for idx in range(25):
+            logger.info("message %s", idx)
+        handler.flush()
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+    messages = [
+        document["message"]
+        for batch in collection.batches
+        for document in batch
+    ]
+    assert messages == ["message {}".format(idx) for idx in range(25)]
+    assert all(len(batch) <= 10 for batch in collection.batches)
+    metrics = handler.get_metrics()
+    assert metrics["written"] == 25
+    assert metrics["pending"] == 0
+    assert metrics["dropped"] == 0
+
+
+def test_back_pressure():
+    collection = FakeCollection()
+    collection.block.clear()
+    handler = AsyncMongoHandler(
+        lambda: collection,
+        batch_size=1,
+        flush_interval=0.0,
+        max_queue_size=8,
+        sample_rate=2,
+        formatter=DocumentFormatter()
+    )
+    logger = _get_logger("test_back_pressure", handler)
+    try:
+        # First record is taken by blocked background thread
+        logger.warning("blocked")
+        while handler.get_metrics()["queue_size"]:
+            pass
+
+        for idx in range(20):
+            logger.debug("debug %s", idx)
+        for idx in range(4):
+            logger.warning("warning %s", idx)
+
+        metrics = handler.get_metrics()
+        assert metrics["queue_size"] == 8
+        assert metrics["sampled_out"] > 0
+        assert metrics["dropped"] > 0
+
+        collection.block.set()
+        handler.flush()
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+    messages = [
+        document["message"]
+        for batch in collection.batches
+        for document in batch
+    ]
+    assert messages[0] == "blocked"
+    assert any(
+        message.endswith("log records were dropped because log queue was full")
+        for message in messages
+    )
+    assert handler.get_metrics()["written"] == 10
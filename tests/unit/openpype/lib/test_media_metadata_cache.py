@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""Test suite for media metadata cache."""
+import os
+import sqlite3
+
+from openpype.lib.media_metadata_cache import MediaMetadataCache
+
+
+def _create_file(tmpdir, name, content="data"):
+    path = str(tmpdir.join(name))
+    with open(path, "w") as stream:
+        stream.write(content)
+    return path
+
+
+def test_cache_hit_and_miss(tmpdir):
+    path = _create_file(tmpdir, "file.exr")
+    cache = MediaMetadataCache()
+
+    assert cache.get("ffprobe", path) is None
+    cache.set("ffprobe", path, {"streams": [{"width": 10}]})
+    value = cache.get("ffprobe", path)
+    assert value == {"streams": [{"width": 10}]}
+
+    # Returned value is a copy
+    value["streams"].append({})
+    assert cache.get("ffprobe", path) == {"streams": [{"width": 10}]}
+    assert cache.get_stats()["hits"] == 2
+    assert cache.get_stats()["misses"] == 1
+
+
+def test_changed_file_is_not_cached(tmpdir):
+    path = _create_file(tmpdir, "file.exr")
+    cache = MediaMetadataCache()
+    cache.set("ffprobe", path, {"streams": []})
+
+    _create_file(tmpdir, "file.exr", "changed data")
+    assert cache.get("ffprobe", path) is None
+
+
+def test_lru_limit(tmpdir):
+    paths = [
+        _create_file(tmpdir, "file.{}.exr".format(idx))
+        for idx in range(3)
+    ]
+    cache = MediaMetadataCache(max_items=2)
+    cache.set_for_paths("oiio_info", paths, {"width": 10})
+
+    assert cache.get("oiio_info", paths[0]) is None
+    assert cache.get("oiio_info", paths[2]) == {"width": 10}
+
+
+def test_sqlite_store(tmpdir):
+    path = _create_file(tmpdir, "file.exr")
+    db_path = str(tmpdir.join("cache.db"))
+    MediaMetadataCache(db_path=db_path).set("ffprobe", path, {"a": 1})
+    assert os.path.exists(db_path)
+
+    cache = MediaMetadataCache(db_path=db_path)
+    assert cache.get("ffprobe", path) == {"a": 1}
+    assert cache.get_stats()["disk_hits"] == 1
+
+
+def test_sqlite_store_json(tmpdir):
+    path = _create_file(tmpdir, "file.exr")
+    db_path = str(tmpdir.join("cache.db"))
+    cache = MediaMetadataCache(db_path=db_path)
+    cache.set("ffprobe", path, {"streams": [{"width": 10}]})
+    # Value which is not JSON serializable is cached only in memory
+    cache.set("oiio_info", path, {"attribs": object()})
+
+    rows = sqlite3.connect(db_path).execute(
+        "SELECT kind, data FROM metadata"
+    ).fetchall()
+    assert rows == [("ffprobe", '{"streams": [{"width": 10}]}')]
+
+    cache = MediaMetadataCache(db_path=db_path)
+    assert cache.get("oiio_info", path) is None
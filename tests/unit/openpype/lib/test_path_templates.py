@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Test suite for formatting of templates."""
+import pytest
+
+from openpype.lib.path_templates import (
+    StringTemplate,
+    TemplatesDict,
+    TemplateUnsolved,
+    TemplateResult,
+)
+
+TEMPLATES = {
+    "version": "v{version:0>3}",
+    "publish": {
+        "folder": "{root}/{asset}/v{version:0>3}",
+        "path": "{root}/{asset}/v{version:0>3}/{frame}.exr",
+    },
+    "work": {
+        "folder": "{root}/{asset}/work",
+    }
+}
+
+
+def _get_templates():
+    return TemplatesDict(TEMPLATES)
+
+
+def test_lazy_result():
+    data = {"root": "/mnt", "asset": "sh010", "version": 1}
+    result = _get_templates().format(data)
+
+    # Children are filled only when accessed
+    publish = dict.__getitem__(result, "publish")
+    assert isinstance(dict.__getitem__(publish, "folder"), StringTemplate)
+
+    assert result["version"] == "v001"
+    assert result["publish"]["folder"] == "/mnt/sh010/v001"
+    assert result["work"].get("folder") == "/mnt/sh010/work"
+    assert isinstance(dict.__getitem__(publish, "folder"), TemplateResult)
+
+    with pytest.raises(TemplateUnsolved):
+        result["publish"]["path"]
+
+
+def test_lazy_result_copy():
+    data = {"root": "/mnt", "asset": "sh010", "version": 1}
+    result = _get_templates().format(data)
+
+    # Plain copy and iteration don't raise on unsolved templates
+    publish = dict(result["publish"])
+    assert publish["folder"] == "/mnt/sh010/v001"
+    assert not publish["path"].solved
+    assert set({**result["publish"]}) == {"folder", "path"}
+    assert list(result["publish"]) == ["folder", "path"]
+
+    # Solved values are available in copy of root too
+    work = dict(result)["work"]
+    assert work["folder"] == "/mnt/sh010/work"
+
+    assert "path" not in result["publish"].get_solved()
+
+
+def test_format_many():
+    templates = _get_templates()
+    data_list = [
+        {"root": "/mnt", "asset": "sh010", "version": 1, "frame": frame}
+        for frame in ("1001", "1002")
+    ]
+    results = templates.format_many(data_list, "publish.path")
+    assert results == [
+        "/mnt/sh010/v001/1001.exr",
+        "/mnt/sh010/v001/1002.exr",
+    ]
+    assert templates.format_many(data_list, ["version"]) == ["v001", "v001"]
+
+    with pytest.raises(TemplateUnsolved):
+        templates.format_many([{"root": "/mnt"}], "publish.path")
+
+    results = templates.format_many(
+        [{"root": "/mnt"}], "publish.path", strict=False
+    )
+    assert not results[0].solved
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""Test suite for process scheduler."""
+import sys
+import time
+import threading
+
+import pytest
+
+from openpype.lib.process_scheduler import (
+    ProcessScheduler,
+    JOB_FINISHED,
+    JOB_CANCELLED,
+)
+
+
+def test_jobs_run_concurrently():
+    counter = {"running": 0, "max": 0}
+    lock = threading.Lock()
+
+    def job():
+        with lock:
+            counter["running"] += 1
+            counter["max"] = max(counter["max"], counter["running"])
+        time.sleep(0.1)
+        with lock:
+            counter["running"] -= 1
+
+    with ProcessScheduler(max_workers=3, max_memory=100) as scheduler:
+        for _ in range(6):
+            scheduler.submit(job, memory=10)
+
+    assert counter["max"] == 3
+    assert all(job.state == JOB_FINISHED for job in scheduler.jobs)
+
+
+def test_memory_limit():
+    counter = {"running": 0, "max": 0}
+    lock = threading.Lock()
+
+    def job():
+        with lock:
+            counter["running"] += 1
+            counter["max"] = max(counter["max"], counter["running"])
+        time.sleep(0.1)
+        with lock:
+            counter["running"] -= 1
+
+    with ProcessScheduler(max_workers=4, max_memory=100) as scheduler:
+        for _ in range(4):
+            scheduler.submit(job, memory=60)
+
+    assert counter["max"] == 1
+
+
+def test_failure_cancels_jobs():
+    scheduler = ProcessScheduler(max_workers=2)
+    slow_job = scheduler.submit_subprocess(
+        [sys.executable, "-c", "import time; time.sleep(30)"]
+    )
+    scheduler.submit_subprocess([sys.executable, "-c", "exit(1)"])
+    pending_job = scheduler.submit(time.sleep, (30, ))
+
+    start = time.time()
+    with pytest.raises(RuntimeError):
+        scheduler.wait()
+
+    assert time.time() - start < 10
+    assert slow_job.done
+    assert pending_job.state == JOB_CANCELLED
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""Test suite for profiles filtering."""
+from openpype.lib.profiles_filtering import (
+    ProfileIndex,
+    filter_profiles,
+)
+
+
+def _get_profiles():
+    return [
+        {"hosts": ["nuke"], "families": ["render"], "id": 0},
+        {"hosts": ["maya"], "families": ["render.*"], "id": 1},
+        {"hosts": ["maya"], "families": [], "id": 2},
+        {"hosts": ["*"], "families": ["review"], "id": 3},
+    ]
+
+
+def test_profile_index():
+    profiles = _get_profiles()
+    index = ProfileIndex(profiles)
+
+    assert index.filter(
+        {"hosts": "maya", "families": "renderLayer"})["id"] == 1
+    assert index.filter({"hosts": "maya", "families": "model"})["id"] == 2
+    assert index.filter({"hosts": "nuke", "families": "render"})["id"] == 0
+    assert index.filter({"hosts": "nuke", "families": "review"})["id"] == 3
+    assert index.filter({"hosts": "nuke", "families": "model"}) is None
+    assert index.filter({"hosts": "", "families": "review"})["id"] == 3
+
+    # Same result object is returned from cache
+    key_values = {"hosts": "maya", "families": "render"}
+    assert index.filter(key_values) is index.filter(key_values)
+    assert index.filter(key_values) is profiles[1]
+
+
+def test_filter_profiles_index_invalidation():
+    profiles = _get_profiles()
+    key_values = {"hosts": "nuke", "families": "render"}
+    assert filter_profiles(profiles, key_values)["id"] == 0
+
+    # Replaced value of profile is used in next filtering
+    profiles[0]["hosts"] = ["houdini"]
+    assert filter_profiles(profiles, key_values) is None
+
+    profiles.append({"hosts": ["nuke"], "families": ["render"], "id": 4})
+    assert filter_profiles(profiles, key_values)["id"] == 4
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""Test suite for job queue scheduling and persistence."""
+import datetime
+from uuid import uuid4
+
+from openpype.modules.job_queue.job_server.jobs import JobQueue
+from openpype.modules.job_queue.job_server.job_store import (
+    create_job_store,
+)
+
+
+class FakeWorker:
+    """Worker without websocket connection."""
+    def __init__(self, host_name):
+        self.id = str(uuid4())
+        self.host_name = host_name
+        self.current_job = None
+        self._callback = None
+
+    def set_state_callback(self, callback):
+        self._callback = callback
+
+    def is_idle(self):
+        return self.current_job is None
+
+    def set_working(self):
+        pass
+
+    def set_current_job(self, job):
+        if job is self.current_job:
+            return
+        self.current_job = job
+        if job is not None:
+            job.set_worker(self)
+        if self._callback is not None:
+            self._callback(self)
+
+
+def _finish(job_queue, worker):
+    job_queue.job_done(worker.id, worker.current_job.id, True, None, None)
+
+
+def test_priority_and_fair_share():
+    job_queue = JobQueue()
+    worker = FakeWorker("tvpaint")
+    job_queue.add_worker(worker)
+
+    low = job_queue.create_job("tvpaint", {"priority": 10, "submitter": "a"})
+    a_jobs = [
+        job_queue.create_job("tvpaint", {"submitter": "a"})
+        for _ in range(2)
+    ]
+    b_job = job_queue.create_job("tvpaint", {"submitter": "b"})
+    high = job_queue.create_job("tvpaint", {"priority": 90, "submitter": "b"})
+
+    order = []
+    for _ in range(5):
+        job_queue.assign_jobs()
+        order.append(worker.current_job)
+        _finish(job_queue, worker)
+
+    assert order[0] is high
+    # Submitters alternate on same priority
+    assert order[1:4] == [a_jobs[0], b_job, a_jobs[1]]
+    assert order[4] is low
+
+
+def test_retry_with_backoff():
+    job_queue = JobQueue()
+    worker = FakeWorker("tvpaint")
+    job_queue.add_worker(worker)
+    job = job_queue.create_job("tvpaint", {"max_retries": 1})
+
+    job_queue.assign_jobs()
+    job_queue.heartbeat(worker.id, job.id)
+    job.lease_expire_time = datetime.datetime.now()
+    assert job_queue.check_leases() == [worker]
+    assert job.attempts == 1
+    assert job.not_before is not None
+
+    worker = FakeWorker("tvpaint")
+    job_queue.add_worker(worker)
+    job_queue.assign_jobs()
+    assert worker.current_job is None
+
+    # Backoff elapsed
+    job_queue._release_delayed_jobs(job.not_before)
+    job_queue.assign_jobs()
+    assert worker.current_job is job
+
+    job_queue.remove_worker(worker)
+    assert job.done
+    assert job.status()["state"] == "error"
+
+
+def test_sqlite_store(tmpdir):
+    store_path = str(tmpdir.join("jobs.db"))
+    job_queue = JobQueue(create_job_store(store_path))
+    job = job_queue.create_job("tvpaint", {"priority": 70})
+
+    job_queue = JobQueue(create_job_store(store_path))
+    loaded_job = job_queue.get_job(job.id)
+    assert loaded_job.priority == 70
+
+    worker = FakeWorker("tvpaint")
+    job_queue.add_worker(worker)
+    job_queue.assign_jobs()
+    assert worker.current_job is loaded_job
+
+
+def test_zero_priority():
+    job_queue = JobQueue()
+    job = job_queue.create_job("tvpaint", {"priority": 0})
+    assert job.priority == 0
+
+
+def test_stale_worker_result_ignored():
+    job_queue = JobQueue()
+    stale_worker = FakeWorker("tvpaint")
+    job_queue.add_worker(stale_worker)
+    job = job_queue.create_job("tvpaint", {})
+
+    job_queue.assign_jobs()
+    job.lease_expire_time = datetime.datetime.now()
+    job_queue.check_leases()
+
+    worker = FakeWorker("tvpaint")
+    job_queue.add_worker(worker)
+    job_queue._release_delayed_jobs(job.not_before)
+    job_queue.assign_jobs()
+    assert worker.current_job is job
+
+    assert not job_queue.job_done(stale_worker.id, job.id, True, None, None)
+    assert not job.done
+    assert worker.current_job is job
+
+    assert job_queue.job_done(worker.id, job.id, True, None, None)
+    assert job.done
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""Test suite for incremental sync queue of representations."""
+from bson.objectid import ObjectId
+
+from openpype.modules.sync_server.sync_queue import SyncRepresentationsQueue
+
+
+class FakeModule(object):
+    def __init__(self):
+        self.representations = []
+        self.modified_ids = []
+        self.calls = []
+
+    def get_sync_representations(
+        self, project_name, local_site, remote_site, modified_since=None
+    ):
+        self.calls.append(modified_since)
+        return list(self.representations)
+
+    def get_modified_representation_ids(self, project_name, modified_since):
+        return list(self.modified_ids)
+
+
+def test_incremental_update():
+    module = FakeModule()
+    queue = SyncRepresentationsQueue(module)
+    repre_ids = [ObjectId(), ObjectId()]
+    module.representations = [
+        {"_id": repre_ids[0], "priority": 50},
+        {"_id": repre_ids[1], "priority": 90},
+    ]
+
+    repres = queue.get_representations("project", "studio", "gdrive")
+    assert [repre["_id"] for repre in repres] == [repre_ids[1], repre_ids[0]]
+    # First query is full
+    assert module.calls == [None]
+
+    # Unprocessed representation stays in queue
+    queue.remove("project", "studio", "gdrive", [repre_ids[1]])
+    module.representations = []
+    repres = queue.get_representations("project", "studio", "gdrive")
+    assert [repre["_id"] for repre in repres] == [repre_ids[0]]
+    assert module.calls[-1] is not None
+
+    # Modified representation which should not be synced is removed
+    module.modified_ids = [repre_ids[0]]
+    assert queue.get_representations("project", "studio", "gdrive") == []
+
+
+def test_full_reconciliation():
+    module = FakeModule()
+    queue = SyncRepresentationsQueue(module, full_sync_interval=0)
+    module.representations = [{"_id": ObjectId()}]
+    queue.get_representations("project", "studio", "gdrive")
+
+    module.representations = []
+    assert queue.get_representations("project", "studio", "gdrive") == []
+    assert module.calls == [None, None]
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""Test suite for chunked resumable transfers of sync server providers."""
+import os
+import time
+
+import pytest
+from bson.objectid import ObjectId
+
+from openpype.modules.sync_server.providers import transfer
+from openpype.modules.sync_server.providers.local_drive import (
+    LocalDriveHandler
+)
+from openpype.modules.sync_server.providers.sftp import SFTPHandler
+
+
+class FakeServer(object):
+    LOG_PROGRESS_SEC = 0
+
+    def __init__(self):
+        self.offsets = []
+        self.offset_source = None
+
+    def update_db(self, project_name, new_file_id, file, representation,
+                  site, progress=None, offset=None, offset_source=None):
+        self.offsets.append(offset)
+        self.offset_source = offset_source
+
+
+class FailingStream(object):
+    """Source stream which fails after 'fail_after' bytes."""
+
+    def __init__(self, stream, fail_after):
+        self._stream = stream
+        self._fail_after = fail_after
+
+    def read(self, size):
+        if self._stream.tell() + size > self._fail_after:
+            raise IOError("Connection lost")
+        return self._stream.read(size)
+
+
+class LocalSFTPFile(object):
+    """Stand-in of 'paramiko.SFTPFile' working with local file."""
+
+    def __init__(self, path, mode):
+        self._stream = open(path, mode)
+        self.pipelined = False
+        self.prefetched = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self._stream.close()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+    def set_pipelined(self, pipelined=True):
+        self.pipelined = pipelined
+
+    def prefetch(self, file_size=None):
+        self.prefetched = (self._stream.tell(), file_size)
+
+
+class LocalSFTPConnection(object):
+    """Stand-in of 'pysftp.Connection' working with local files."""
+
+    def __init__(self):
+        self.opened_files = []
+
+    def isfile(self, path):
+        return os.path.isfile(path)
+
+    def stat(self, path):
+        return os.stat(path)
+
+    def truncate(self, path, size):
+        os.truncate(path, size)
+
+    def open(self, path, mode):
+        stream = LocalSFTPFile(path, mode)
+        self.opened_files.append(stream)
+        return stream
+
+    def remove(self, path):
+        os.remove(path)
+
+    def rename(self, src, dst):
+        os.rename(src, dst)
+
+
+def _create_file(path, size):
+    with open(path, "wb") as stream:
+        stream.write(os.urandom(size))
+    return path
+
+
+def _read(path):
+    with open(path, "rb") as stream:
+        return stream.read()
+
+
+def _create_file_doc(site_name, offset=None, offset_source=None):
+    site = {"name": site_name}
+    if offset is not None:
+        site["offset"] = offset
+    if offset_source is not None:
+        site["offset_source"] = offset_source
+    return {"_id": ObjectId(), "sites": [site]}
+
+
+def test_resume_offset():
+    source_info = {"size": 1000, "mtime": 10}
+    file_doc = _create_file_doc("studio", 100, source_info)
+    assert transfer.get_resume_offset(file_doc, "studio", None) == 0
+    assert transfer.get_resume_offset(file_doc, "studio", 50) == 50
+    assert transfer.get_resume_offset(file_doc, "studio", 200) == 100
+    assert transfer.get_resume_offset(file_doc, "remote", 200) == 0
+    assert transfer.get_resume_offset(
+        file_doc, "studio", 200, source_info
+    ) == 100
+
+    # Source changed after offset was stored
+    for changed_info in (
+        {"size": 1001, "mtime": 10},
+        {"size": 1000, "mtime": 11},
+    ):
+        assert transfer.get_resume_offset(
+            file_doc, "studio", 200, changed_info
+        ) == 0
+    assert transfer.get_resume_offset(
+        _create_file_doc("studio", 100), "studio", 200, source_info
+    ) == 0
+
+
+def test_bandwidth_limit():
+    limiter = transfer.BandwidthLimiter(1000)
+    start = time.time()
+    for _ in range(3):
+        limiter.consume(100)
+    assert time.time() - start >= 0.2
+
+
+def test_local_drive_resume(tmpdir):
+    source_path = _create_file(str(tmpdir.join("source.bin")), 1000)
+    target_path = str(tmpdir.join("target.bin"))
+    server = FakeServer()
+    handler = LocalDriveHandler("project", "studio")
+
+    # Interrupted transfer leaves part file and stored offset
+    part_path = transfer.get_part_path(target_path)
+    source_info = transfer.get_source_info(os.stat(source_path))
+    with open(source_path, "rb") as source_stream:
+        with open(part_path, "wb") as target_stream:
+            with pytest.raises(IOError):
+                transfer.copy_stream(
+                    FailingStream(source_stream, 600),
+                    target_stream,
+                    1000,
+                    chunk_size=100,
+                    progress=transfer.TransferProgress(
+                        server, "project", {}, {}, "studio", 1000, "Upload",
+                        source_info
+                    )
+                )
+    offset = server.offsets[-1]
+    assert offset == 600
+
+    assert server.offset_source == source_info
+
+    server = FakeServer()
+    file_doc = _create_file_doc("studio", offset, source_info)
+    handler.upload_file(
+        source_path, target_path, server, "project", file_doc, {},
+        "studio", overwrite=True
+    )
+    assert server.offsets[0] == offset
+    assert _read(source_path) == _read(target_path)
+    assert not os.path.exists(part_path)
+
+
+def test_sftp_resume(tmpdir, monkeypatch):
+    source_path = _create_file(str(tmpdir.join("source.bin")), 1000)
+    target_path = str(tmpdir.join("target.bin"))
+    part_path = transfer.get_part_path(target_path)
+    with open(part_path, "wb") as stream:
+        stream.write(_read(source_path)[:700])
+
+    handler = SFTPHandler("project", "sftp")
+    conn = LocalSFTPConnection()
+    monkeypatch.setattr(handler, "_get_conn", lambda: conn)
+    monkeypatch.setattr(handler, "file_path_exists", os.path.isfile)
+    source_info = transfer.get_source_info(os.stat(source_path))
+    server = FakeServer()
+    handler.upload_file(
+        source_path, target_path, server, "project",
+        _create_file_doc("sftp", 500, source_info), {}, "sftp",
+        overwrite=True
+    )
+    assert server.offsets[0] == 500
+    assert _read(source_path) == _read(target_path)
+    assert conn.opened_files[-1].pipelined
+
+    download_path = str(tmpdir.join("download.bin"))
+    download_part_path = transfer.get_part_path(download_path)
+    with open(download_part_path, "wb") as stream:
+        stream.write(b"x" * 300)
+
+    # Remote file changed since the offset was stored
+    server = FakeServer()
+    handler.download_file(
+        target_path, download_path, server, "project",
+        _create_file_doc("studio", 300, {"size": 1000, "mtime": 0}), {},
+        "studio"
+    )
+    assert server.offsets[0] == 0
+    assert _read(source_path) == _read(download_path)
+    assert conn.opened_files[-1].prefetched == (0, 1000)
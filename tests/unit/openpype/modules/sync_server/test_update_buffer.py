@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Test suite for batched sync state updates of files."""
+from bson.objectid import ObjectId
+
+from openpype.modules.sync_server.update_buffer import SyncUpdatesBuffer
+
+
+class FakeCollection(object):
+    def __init__(self):
+        self.calls = []
+
+    def bulk_write(self, operations, ordered=True):
+        self.calls.append(operations)
+
+
+def _create_buffer(collections):
+    def get_collection(project_name):
+        return collections.setdefault(project_name, FakeCollection())
+    return SyncUpdatesBuffer(get_collection, flush_interval=1000)
+
+
+def test_updates_are_merged_per_representation():
+    collections = {}
+    buffer = _create_buffer(collections)
+    repre_id = ObjectId()
+    file_ids = [ObjectId(), ObjectId()]
+    for idx, file_id in enumerate(file_ids):
+        buffer.add(
+            "test_project", repre_id, file_id, "studio",
+            {"$set": {"files.$[f].sites.$[s].id": idx}}
+        )
+
+    assert buffer.flush() == 1
+    operations = collections["test_project"].calls[0]
+    assert len(operations) == 1
+
+    doc = operations[0]._doc
+    assert doc["$set"] == {
+        "files.$[f0].sites.$[s0].id": 0,
+        "files.$[f1].sites.$[s0].id": 1,
+    }
+    assert operations[0]._array_filters == [
+        {"s0.name": "studio"},
+        {"f0._id": file_ids[0]},
+        {"f1._id": file_ids[1]},
+    ]
+
+
+def test_progress_does_not_replace_result():
+    collections = {}
+    buffer = _create_buffer(collections)
+    repre_id = ObjectId()
+    file_id = ObjectId()
+    progress = {"$set": {"files.$[f].sites.$[s].progress": 0.5}}
+    result = {"$set": {"files.$[f].sites.$[s].id": "id"}}
+
+    buffer.add("test_project", repre_id, file_id, "studio", progress, True)
+    buffer.add("test_project", repre_id, file_id, "studio", result)
+    buffer.add("test_project", repre_id, file_id, "studio", progress, True)
+    assert buffer.updates_count == 1
+
+    buffer.flush()
+    doc = collections["test_project"].calls[0][0]._doc
+    assert doc["$set"] == {"files.$[f0].sites.$[s0].id": "id"}
+
+    # Nothing to write
+    assert buffer.flush() == 0
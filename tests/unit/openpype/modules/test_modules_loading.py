@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""Test suite for lazy loading of OpenPype modules."""
+import os
+import sys
+import types
+import importlib
+
+from openpype.modules.base import (
+    _ModuleClass,
+    _LazyModulesFinder,
+    _ModulesManifest,
+    _are_modules_disabled,
+)
+
+
+class FakeModule(object):
+    name = "fake"
+
+
+def test_lazy_attributes():
+    calls = []
+
+    def loader():
+        calls.append(True)
+        return types.ModuleType("fake")
+
+    modules = _ModuleClass("test_lazy_attributes")
+    modules.add_lazy_attribute("fake", loader)
+    modules.add_lazy_attribute("broken", lambda: None)
+
+    assert modules.keys() == ["fake", "broken"]
+    assert not calls
+
+    assert modules.fake is modules.get("fake")
+    assert len(calls) == 1
+    assert modules.get("broken") is None
+    assert list(modules.values()) == [modules.fake]
+
+
+def test_lazy_modules_finder():
+    modules_key = "test_lazy_modules_finder"
+    module = types.ModuleType("{}.fake".format(modules_key))
+    modules = _ModuleClass(modules_key)
+    modules.add_lazy_attribute("fake", lambda: module)
+
+    finder = _LazyModulesFinder(modules_key)
+    sys.modules[modules_key] = modules
+    sys.meta_path.insert(0, finder)
+    try:
+        imported = importlib.import_module("{}.fake".format(modules_key))
+    finally:
+        sys.meta_path.remove(finder)
+        sys.modules.pop(modules_key)
+        sys.modules.pop("{}.fake".format(modules_key), None)
+
+    assert imported is module
+    assert module.__spec__ is None
+
+
+def test_manifest(tmpdir):
+    module_path = str(tmpdir.join("fake.py"))
+    with open(module_path, "w") as stream:
+        stream.write("")
+    manifest_path = str(tmpdir.join("manifest.json"))
+
+    manifest = _ModulesManifest(manifest_path)
+    manifest.add_module("fake", module_path)
+    assert manifest.get_classes_info("fake") is None
+    manifest.set_classes("fake", [FakeModule])
+    manifest.set_has_settings_defs("fake", False)
+    manifest.save()
+
+    manifest = _ModulesManifest(manifest_path)
+    manifest.add_module("fake", module_path)
+    assert manifest.get_classes_info("fake") == [{
+        "class_name": "FakeModule",
+        "name": "fake",
+        "interfaces": []
+    }]
+    assert manifest.has_settings_defs("fake") is False
+
+    # Changed module invalidates stored information
+    mtime = os.path.getmtime(module_path) + 10
+    os.utime(module_path, (mtime, mtime))
+    manifest = _ModulesManifest(manifest_path)
+    manifest.add_module("fake", module_path)
+    assert manifest.get_classes_info("fake") is None
+
+
+def test_are_modules_disabled():
+    settings = {"fake": {"enabled": False}, "other": {}}
+    assert _are_modules_disabled([{"name": "fake"}], settings)
+    assert _are_modules_disabled([], settings)
+    assert not _are_modules_disabled([{"name": "other"}], settings)
+    assert not _are_modules_disabled([{"name": None}], settings)
+    assert not _are_modules_disabled(
+        [{"name": "fake"}, {"name": "missing"}], settings
+    )
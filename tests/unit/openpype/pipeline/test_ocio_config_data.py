@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""Test suite for reading of OCIO config data."""
+import os
+
+import pytest
+
+from openpype.pipeline import colorspace
+
+CONFIG_CONTENT = """ocio_profile_version: 2
+
+roles:
+  default: raw
+  scene_linear: linear
+
+file_rules:
+  - !<Rule> {name: exr, colorspace: linear, pattern: "*", extension: exr}
+  - !<Rule> {name: Default, colorspace: default}
+
+displays:
+  sRGB:
+    - !<View> {name: Raw, colorspace: raw}
+
+active_displays: []
+active_views: []
+
+colorspaces:
+  - !<ColorSpace>
+    name: raw
+    family: utility
+    isdata: true
+
+  - !<ColorSpace>
+    name: linear
+    family: linear
+"""
+
+
+def _write_config(tmpdir):
+    config_path = str(tmpdir.join("config.ocio"))
+    with open(config_path, "w") as stream:
+        stream.write(CONFIG_CONTENT)
+    return config_path
+
+
+def test_get_config_data(tmpdir):
+    pytest.importorskip("PyOpenColorIO")
+    pytest.importorskip("click")
+    from openpype.scripts.ocio_wrapper import _get_config_data
+
+    config_data = _get_config_data(_write_config(tmpdir))
+
+    assert set(config_data["colorspaces"]) == {"raw", "linear"}
+    assert config_data["views"]["sRGB/Raw"]["colorspace"] == "raw"
+    assert config_data["roles"] == {
+        "default": "raw",
+        "scene_linear": "linear"
+    }
+    assert [
+        file_rule["name"]
+        for file_rule in config_data["file_rules"]
+    ] == ["exr", "Default"]
+
+
+def test_get_ocio_config_data(tmpdir, monkeypatch):
+    config_path = _write_config(tmpdir)
+    calls = []
+
+    def get_data_subprocess(path, data_type):
+        calls.append((path, data_type))
+        return {
+            "colorspaces": {"raw": {"family": "utility"}},
+            "views": {},
+            "roles": {},
+            "file_rules": []
+        }
+
+    monkeypatch.setattr(colorspace, "compatible_python", lambda: False)
+    monkeypatch.setattr(
+        colorspace, "get_data_subprocess", get_data_subprocess
+    )
+
+    assert colorspace.get_ocio_config_colorspaces(config_path) == {
+        "raw": {"family": "utility"}
+    }
+    assert colorspace.get_ocio_config_views(config_path) == {}
+    assert calls == [(config_path, "get_config_data")]
+
+    # Modified config is loaded again
+    mtime = os.path.getmtime(config_path) + 10
+    os.utime(config_path, (mtime, mtime))
+    colorspace.get_ocio_config_roles(config_path)
+    assert len(calls) == 2
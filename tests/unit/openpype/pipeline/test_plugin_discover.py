@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""Test suite for discovery of plugins from paths."""
+import os
+
+from openpype.pipeline.plugin_discover import PluginDiscoverContext
+
+
+class DiscoverPlugin(object):
+    label = None
+
+
+PLUGIN_CONTENT = """
+from {module} import DiscoverPlugin
+
+
+class Plugin(DiscoverPlugin):
+    label = "{label}"
+"""
+
+
+def _write_plugin(path, label):
+    with open(path, "w") as stream:
+        stream.write(PLUGIN_CONTENT.format(module=__name__, label=label))
+
+
+def test_discover_cache(tmpdir):
+    plugin_path = str(tmpdir.join("plugin.py"))
+    _write_plugin(plugin_path, "first")
+
+    context = PluginDiscoverContext()
+    context.register_plugin_path(DiscoverPlugin, str(tmpdir))
+
+    result = context.discover(DiscoverPlugin, return_report=True)
+    plugin = result.plugins[0]
+    assert plugin.label == "first"
+    assert list(result.discover_time_by_path) == [str(tmpdir)]
+
+    # Unchanged file is not imported again but class is reset
+    plugin.label = "changed"
+    plugin.enabled = False
+    plugins = context.discover(DiscoverPlugin)
+    assert plugins[0] is plugin
+    assert plugin.label == "first"
+    assert not hasattr(plugin, "enabled")
+
+    _write_plugin(plugin_path, "second")
+    mtime = os.path.getmtime(plugin_path) + 10
+    os.utime(plugin_path, (mtime, mtime))
+    plugins = context.discover(DiscoverPlugin)
+    assert plugins[0] is not plugin
+    assert plugins[0].label == "second"
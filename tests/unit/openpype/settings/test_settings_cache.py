@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""Test revision based cache of settings handler.
+
+Uses 'mongomock' instead of real mongo database.
+"""
+import os
+
+import pytest
+import mongomock
+
+from openpype.client.mongo import OpenPypeMongoConnection
+from openpype.settings import handlers
+from openpype.settings.handlers import MongoSettingsHandler
+
+
+@pytest.fixture
+def mongo_client(monkeypatch, tmpdir):
+    client = mongomock.MongoClient()
+    monkeypatch.setattr(
+        OpenPypeMongoConnection, "get_mongo_client",
+        classmethod(lambda cls, mongo_url=None: client)
+    )
+    monkeypatch.setenv("OPENPYPE_DATABASE_NAME", "openpype_test")
+    monkeypatch.setenv("OPENPYPE_SETTINGS_SNAPSHOT_DIR", str(tmpdir))
+    monkeypatch.delenv(handlers.SETTINGS_REVISION_ENV_KEY, raising=False)
+    yield client
+    os.environ.pop(handlers.SETTINGS_REVISION_ENV_KEY, None)
+
+
+def _create_handler():
+    handler = MongoSettingsHandler()
+    # Check revision on each call
+    handler.revision_check_interval = 0
+    return handler
+
+
+def _count_finds(handler, monkeypatch):
+    counter = {"count": 0}
+    orig_find_one = handler.collection.find_one
+
+    def find_one(*args, **kwargs):
+        counter["count"] += 1
+        return orig_find_one(*args, **kwargs)
+
+    monkeypatch.setattr(handler.collection, "find_one", find_one)
+    return counter
+
+
+def test_cache_is_valid_until_revision_changes(mongo_client):
+    handler = _create_handler()
+    other_handler = _create_handler()
+
+    assert handler.get_studio_project_settings_overrides(False) == {}
+
+    other_handler.save_project_settings(None, {"global": {"key": 1}})
+    assert other_handler.get_settings_revision() == 1
+    assert handler.get_studio_project_settings_overrides(False) == {
+        "global": {"key": 1}
+    }
+
+
+def test_cache_does_not_query_documents(mongo_client, monkeypatch):
+    handler = _create_handler()
+    handler.save_project_settings(None, {"global": {"key": 1}})
+    handler.get_studio_project_settings_overrides(False)
+
+    counter = _count_finds(handler, monkeypatch)
+    for _ in range(5):
+        handler.get_studio_project_settings_overrides(False)
+    # Only revision document is queried
+    assert counter["count"] == 5
+
+
+def test_snapshot_is_used_with_known_revision(mongo_client, monkeypatch):
+    handler = _create_handler()
+    handler.save_project_settings(None, {"global": {"key": 1}})
+    handler.get_studio_system_settings_overrides(False)
+    assert os.environ[handlers.SETTINGS_REVISION_ENV_KEY] == "1"
+
+    # New process with revision in environment
+    new_handler = MongoSettingsHandler()
+    counter = _count_finds(new_handler, monkeypatch)
+    overrides = new_handler.get_studio_project_settings_overrides(False)
+    assert overrides == {"global": {"key": 1}}
+    assert counter["count"] == 0